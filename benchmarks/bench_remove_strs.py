@@ -0,0 +1,165 @@
+"""Micro-benchmark of the string literal removal in the helper module.
+
+Compares `helper._remove_strs` with the previous character-by-character
+implementation on a synthetic module of 10,000 lines.
+
+Usage
+-----
+$ python benchmarks/bench_remove_strs.py --line_num 10000 --repeat 5
+"""
+
+import argparse
+import os
+import sys
+import timeit
+from typing import Callable, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from numdoclint import helper  # noqa: E402
+
+_UNIT_CODE_STR: str = '''
+def sample_func_{idx}(price: int = 100, name: str = 'apple') -> str:
+    """
+    Sample function.
+
+    Parameters
+    ----------
+    price : int, default 100
+        Sample price.
+    name : str, default 'apple'
+        Sample name.
+
+    Returns
+    -------
+    result_str : str
+        Sample string.
+    """
+    # It's a comment.
+    result_str: str = f'{{name}}: {{price}}' + r'\\d+' + "\\"quoted\\""
+    return result_str
+'''
+
+
+def _legacy_remove_strs(*, code_str: str) -> str:
+    """
+    The previous implementation of `helper._remove_strs`, kept as
+    the reference of this benchmark. The per-character helper calls
+    are inlined, so the measured speedup is a lower bound.
+
+    Parameters
+    ----------
+    code_str : str
+        A target code string.
+
+    Returns
+    -------
+    result_code_str : str
+        A result code string.
+    """
+    is_quoted_area: bool = False
+    quote_str: str = ''
+    result_code_str: str = ''
+    for i, char in enumerate(code_str):
+        prev_char: str = '' if i == 0 else code_str[i - 1]
+        following_3_chars: str = code_str[i:i + 3]
+        if prev_char == '\\':
+            result_code_str += char
+            continue
+
+        if is_quoted_area:
+            if char == quote_str or following_3_chars == quote_str:
+                quote_str = ''
+                is_quoted_area = False
+            continue
+
+        if following_3_chars == "'''":
+            is_quoted_area = True
+            quote_str = "'''"
+            continue
+        if following_3_chars == '"""':
+            is_quoted_area = True
+            quote_str = '"""'
+            continue
+        if char == "'" or char == '"':
+            is_quoted_area = True
+            quote_str = char
+            continue
+
+        result_code_str += char
+    return result_code_str
+
+
+def make_code_str(line_num: int) -> str:
+    """
+    Make a synthetic module string.
+
+    Parameters
+    ----------
+    line_num : int
+        The minimum number of lines of the module.
+
+    Returns
+    -------
+    code_str : str
+        The synthetic module string.
+    """
+    unit_line_num: int = _UNIT_CODE_STR.count('\n')
+    unit_num: int = line_num // unit_line_num + 1
+    code_str_list: List[str] = [
+        _UNIT_CODE_STR.format(idx=idx) for idx in range(unit_num)]
+    return ''.join(code_str_list)
+
+
+def measure(
+        remove_strs_func: Callable[..., str], code_str: str,
+        repeat: int) -> float:
+    """
+    Measure the best elapsed seconds of the target function.
+
+    Parameters
+    ----------
+    remove_strs_func : Callable
+        Target function.
+    code_str : str
+        A target code string.
+    repeat : int
+        The number of measurements.
+
+    Returns
+    -------
+    best_sec : float
+        The best elapsed seconds.
+    """
+    elapsed_sec_list: List[float] = timeit.repeat(
+        lambda: remove_strs_func(code_str=code_str),
+        repeat=repeat, number=1)
+    return min(elapsed_sec_list)
+
+
+def main() -> None:
+    """
+    Run the benchmark when executed via the command line.
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description='Benchmark of the string literal removal.')
+    parser.add_argument('--line_num', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args: argparse.Namespace = parser.parse_args()
+
+    code_str: str = make_code_str(line_num=args.line_num)
+    line_num: int = code_str.count('\n')
+    legacy_sec: float = measure(
+        remove_strs_func=_legacy_remove_strs, code_str=code_str,
+        repeat=args.repeat)
+    current_sec: float = measure(
+        remove_strs_func=helper._remove_strs, code_str=code_str,
+        repeat=args.repeat)
+    print(f'lines   : {line_num}')
+    print(f'legacy  : {legacy_sec * 1000:.2f} ms')
+    print(f'current : {current_sec * 1000:.2f} ms')
+    print(f'speedup : {legacy_sec / current_sec:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
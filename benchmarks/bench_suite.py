@@ -0,0 +1,319 @@
+"""Benchmark suite of the main entry points with a regression gate.
+
+The `run` command measures the elapsed time, the throughput and the
+peak memory of each target on the synthetic corpus and writes the
+results as JSON. The `compare` command compares two result files and
+exits with status 1 if any target regressed beyond the threshold.
+
+Usage
+-----
+$ python benchmarks/bench_suite.py run --output ./current.json
+$ python benchmarks/bench_suite.py compare \\
+    benchmarks/baselines/default.json ./current.json --threshold 0.2
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import corpus  # noqa: E402
+from numdoclint import helper, jupyter_notebook, py_module  # noqa: E402
+from numdoclint.module_index import build_module_index  # noqa: E402
+
+RESULT_KEY_ELAPSED_SEC: str = 'elapsed_sec'
+RESULT_KEY_FUNC_NUM: str = 'func_num'
+RESULT_KEY_BYTE_SIZE: str = 'byte_size'
+RESULT_KEY_FUNCS_PER_SEC: str = 'funcs_per_sec'
+RESULT_KEY_MB_PER_SEC: str = 'mb_per_sec'
+RESULT_KEY_PEAK_MEMORY: str = 'peak_memory_bytes'
+
+
+def _measure_target(
+        target_func: Callable[[], Any], func_num: int, byte_size: int,
+        repeat: int) -> Dict[str, float]:
+    """
+    Measure the elapsed time, throughput and peak memory of a target.
+
+    Parameters
+    ----------
+    target_func : Callable
+        The target function without arguments.
+    func_num : int
+        The number of the functions processed by one call.
+    byte_size : int
+        The number of the bytes processed by one call.
+    repeat : int
+        The number of measurements. The best time is used.
+
+    Returns
+    -------
+    result_dict : dict
+        A dictionary of the measured values.
+
+    Notes
+    -----
+    The peak memory is measured in a separate call, since tracing the
+    memory allocations slows the target down.
+    """
+    elapsed_sec: float = min(
+        timeit.repeat(target_func, repeat=repeat, number=1))
+    tracemalloc.start()
+    target_func()
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    result_dict: Dict[str, float] = {
+        RESULT_KEY_ELAPSED_SEC: elapsed_sec,
+        RESULT_KEY_FUNC_NUM: func_num,
+        RESULT_KEY_BYTE_SIZE: byte_size,
+        RESULT_KEY_FUNCS_PER_SEC: func_num / elapsed_sec,
+        RESULT_KEY_MB_PER_SEC: byte_size / 1024 / 1024 / elapsed_sec,
+        RESULT_KEY_PEAK_MEMORY: peak_memory,
+    }
+    return result_dict
+
+
+def run_benchmarks(
+        file_num: int, func_num: int, docstring_line_num: int,
+        nesting_depth: int, decorator_ratio: float, seed: int,
+        repeat: int) -> Dict[str, Any]:
+    """
+    Run all benchmark targets on the synthetic corpus.
+
+    Parameters
+    ----------
+    file_num : int
+        The number of the modules and notebooks of the corpus.
+    func_num : int
+        The number of the top-level functions of each file.
+    docstring_line_num : int
+        The number of the description lines of each docstring section.
+    nesting_depth : int
+        The number of the nested functions in each top-level function.
+    decorator_ratio : float
+        The probability that each function has a decorator.
+    seed : int
+        The random seed of the corpus.
+    repeat : int
+        The number of measurements of each target.
+
+    Returns
+    -------
+    benchmark_dict : dict
+        A dictionary of the corpus parameters, the environment and the
+        results of each target.
+    """
+    corpus_params_dict: Dict[str, Any] = {
+        'file_num': file_num,
+        'func_num': func_num,
+        'docstring_line_num': docstring_line_num,
+        'nesting_depth': nesting_depth,
+        'decorator_ratio': decorator_ratio,
+        'seed': seed,
+    }
+    all_func_num_per_file: int = func_num * (nesting_depth + 1)
+    tmp_dir_path: str = tempfile.mkdtemp(prefix='numdoclint_bench_')
+    try:
+        corpus.write_corpus(dir_path=tmp_dir_path, **corpus_params_dict)
+        module_path: str = os.path.join(tmp_dir_path, 'sample_module_0.py')
+        module_str: str = helper.read_file_str(file_path=module_path)
+        module_byte_size: int = len(module_str.encode('utf-8'))
+        dir_module_byte_size: int = 0
+        dir_notebook_byte_size: int = 0
+        for file_name in os.listdir(tmp_dir_path):
+            file_size: int = os.path.getsize(
+                os.path.join(tmp_dir_path, file_name))
+            if file_name.endswith('.py'):
+                dir_module_byte_size += file_size
+            else:
+                dir_notebook_byte_size += file_size
+
+        def _get_single_func_info_lists() -> None:
+            """
+            Check each function of the module with a shared index.
+            """
+            module_index: Any = build_module_index(module_str=module_str)
+            for func_name in module_index.func_name_list:
+                py_module.get_single_func_info_list(
+                    path=module_path, code_str=module_str,
+                    func_name=func_name,
+                    enable_default_or_optional_doc_check=False,
+                    skip_decorator_name_list=['Appender'],
+                    ignore_info_id_list=[], module_index=module_index)
+
+        target_list: List[tuple] = [
+            ('get_func_name_list',
+             lambda: helper.get_func_name_list(code_str=module_str),
+             all_func_num_per_file, module_byte_size),
+            ('get_single_func_info_list',
+             _get_single_func_info_lists,
+             all_func_num_per_file, module_byte_size),
+            ('check_python_module',
+             lambda: py_module.check_python_module(
+                 py_module_path=module_path, verbose=0),
+             all_func_num_per_file, module_byte_size),
+            ('check_python_module_ast',
+             lambda: py_module.check_python_module(
+                 py_module_path=module_path, verbose=0, engine='ast'),
+             all_func_num_per_file, module_byte_size),
+            ('check_python_module_recursively',
+             lambda: py_module.check_python_module_recursively(
+                 dir_path=tmp_dir_path, verbose=0),
+             all_func_num_per_file * file_num, dir_module_byte_size),
+            ('check_jupyter_notebook_recursively',
+             lambda: jupyter_notebook.check_jupyter_notebook_recursively(
+                 dir_path=tmp_dir_path, verbose=0),
+             all_func_num_per_file * file_num, dir_notebook_byte_size),
+        ]
+        result_dict: Dict[str, Dict[str, float]] = {}
+        for target_name, target_func, target_func_num, byte_size in \
+                target_list:
+            result_dict[target_name] = _measure_target(
+                target_func=target_func, func_num=target_func_num,
+                byte_size=byte_size, repeat=repeat)
+    finally:
+        shutil.rmtree(tmp_dir_path, ignore_errors=True)
+    benchmark_dict: Dict[str, Any] = {
+        'corpus': corpus_params_dict,
+        'python_version': platform.python_version(),
+        'platform': platform.platform(),
+        'results': result_dict,
+    }
+    return benchmark_dict
+
+
+def compare_benchmarks(
+        baseline_dict: Dict[str, Any], current_dict: Dict[str, Any],
+        threshold: float) -> List[str]:
+    """
+    Compare the current results with the baseline results.
+
+    Parameters
+    ----------
+    baseline_dict : dict
+        The baseline benchmark results.
+    current_dict : dict
+        The current benchmark results.
+    threshold : float
+        The allowed ratio of the slowdown or the memory increase.
+        e.g., 0.2 allows up to 20% regression.
+
+    Returns
+    -------
+    regression_list : list of str
+        A list of the regression messages. If there is no regression,
+        an empty list will be returned.
+
+    Raises
+    ------
+    ValueError
+        If the corpus parameters of the two results are different.
+    """
+    if baseline_dict['corpus'] != current_dict['corpus']:
+        err_msg: str = 'The corpus parameters of the results are different.'
+        raise ValueError(err_msg)
+    regression_list: List[str] = []
+    baseline_result_dict: Dict[str, Dict[str, float]] = \
+        baseline_dict['results']
+    current_result_dict: Dict[str, Dict[str, float]] = \
+        current_dict['results']
+    for target_name, baseline_values in baseline_result_dict.items():
+        if target_name not in current_result_dict:
+            regression_list.append(f'{target_name}: missing in results')
+            continue
+        current_values: Dict[str, float] = current_result_dict[target_name]
+        for key in [RESULT_KEY_ELAPSED_SEC, RESULT_KEY_PEAK_MEMORY]:
+            ratio: float = current_values[key] / baseline_values[key]
+            print(f'{target_name:<36} {key:<18} {ratio:6.2f}x')
+            if ratio > 1 + threshold:
+                regression_list.append(
+                    f'{target_name}: {key} {baseline_values[key]:.6g}'
+                    f' -> {current_values[key]:.6g} ({ratio:.2f}x)')
+    return regression_list
+
+
+def _print_results(benchmark_dict: Dict[str, Any]) -> None:
+    """
+    Print the benchmark results as a table.
+
+    Parameters
+    ----------
+    benchmark_dict : dict
+        The benchmark results.
+    """
+    print(f'{"target":<36} {"ms":>10} {"funcs/s":>12} {"MB/s":>8} '
+          f'{"peak KiB":>10}')
+    for target_name, values in benchmark_dict['results'].items():
+        print(
+            f'{target_name:<36} '
+            f'{values[RESULT_KEY_ELAPSED_SEC] * 1000:10.2f} '
+            f'{values[RESULT_KEY_FUNCS_PER_SEC]:12.0f} '
+            f'{values[RESULT_KEY_MB_PER_SEC]:8.2f} '
+            f'{values[RESULT_KEY_PEAK_MEMORY] / 1024:10.0f}')
+
+
+def main() -> None:
+    """
+    Run the benchmark commands when executed via the command line.
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description='Benchmark suite of numdoclint.')
+    subparsers: Any = parser.add_subparsers(dest='command')
+    subparsers.required = True
+
+    run_parser: argparse.ArgumentParser = subparsers.add_parser(
+        'run', help='Run the benchmarks and write the results as JSON.')
+    run_parser.add_argument('--output', type=str, default='')
+    run_parser.add_argument('--file_num', type=int, default=10)
+    run_parser.add_argument('--func_num', type=int, default=100)
+    run_parser.add_argument('--docstring_line_num', type=int, default=3)
+    run_parser.add_argument('--nesting_depth', type=int, default=1)
+    run_parser.add_argument('--decorator_ratio', type=float, default=0.2)
+    run_parser.add_argument('--seed', type=int, default=0)
+    run_parser.add_argument('--repeat', type=int, default=3)
+
+    compare_parser: argparse.ArgumentParser = subparsers.add_parser(
+        'compare', help='Compare the results with the baseline.')
+    compare_parser.add_argument('baseline_path', type=str)
+    compare_parser.add_argument('current_path', type=str)
+    compare_parser.add_argument('--threshold', type=float, default=0.2)
+
+    args: argparse.Namespace = parser.parse_args()
+    if args.command == 'run':
+        benchmark_dict: Dict[str, Any] = run_benchmarks(
+            file_num=args.file_num, func_num=args.func_num,
+            docstring_line_num=args.docstring_line_num,
+            nesting_depth=args.nesting_depth,
+            decorator_ratio=args.decorator_ratio, seed=args.seed,
+            repeat=args.repeat)
+        _print_results(benchmark_dict=benchmark_dict)
+        if args.output != '':
+            with open(args.output, mode='w', encoding='utf-8') as f:
+                json.dump(benchmark_dict, f, indent=2)
+        return
+
+    with open(args.baseline_path, mode='r', encoding='utf-8') as f:
+        baseline_dict: Dict[str, Any] = json.load(f)
+    with open(args.current_path, mode='r', encoding='utf-8') as f:
+        current_dict: Dict[str, Any] = json.load(f)
+    regression_list: List[str] = compare_benchmarks(
+        baseline_dict=baseline_dict, current_dict=current_dict,
+        threshold=args.threshold)
+    if regression_list:
+        print('Regressions:')
+        for regression in regression_list:
+            print(f'  {regression}')
+        sys.exit(1)
+    print('No regression.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,302 @@
+"""Reproducible synthetic corpus for the benchmarks.
+
+The generated modules and notebooks only depend on the parameters and
+the random seed, so the same corpus is made on every machine.
+
+Usage
+-----
+$ python benchmarks/corpus.py ./tmp_corpus/ --func_num 200 --file_num 10
+"""
+
+import argparse
+import json
+import os
+import random
+from typing import List
+
+_DECORATOR_NAME_LIST: List[str] = [
+    'staticmethod', 'functools.lru_cache()', 'Appender(_shared_doc)',
+    'property',
+]
+
+
+def _make_docstring_str(
+        arg_name_list: List[str], docstring_line_num: int,
+        indent_str: str, rand: random.Random) -> str:
+    """
+    Make a docstring string of the synthetic function.
+
+    Parameters
+    ----------
+    arg_name_list : list of str
+        The argument names of the function.
+    docstring_line_num : int
+        The number of the description lines of each section.
+    indent_str : str
+        The indent string of the function body.
+    rand : random.Random
+        The random number generator.
+
+    Returns
+    -------
+    docstring_str : str
+        The docstring string including the quotes.
+    """
+    description_list: List[str] = [
+        f'{indent_str}Sample description line {i}.'
+        for i in range(docstring_line_num)]
+    line_list: List[str] = [f'{indent_str}"""']
+    line_list.extend(description_list)
+    line_list.append('')
+    line_list.append(f'{indent_str}Parameters')
+    line_list.append(f'{indent_str}----------')
+    for arg_name in arg_name_list:
+        # Some arguments are lacked intentionally to make findings.
+        if rand.random() < 0.1:
+            continue
+        line_list.append(f'{indent_str}{arg_name} : int, default 100')
+        line_list.extend(
+            [f'    {line_str}' for line_str in description_list])
+    line_list.append('')
+    line_list.append(f'{indent_str}Returns')
+    line_list.append(f'{indent_str}-------')
+    line_list.append(f'{indent_str}result_val : int')
+    line_list.extend([f'    {line_str}' for line_str in description_list])
+    line_list.append(f'{indent_str}"""')
+    return '\n'.join(line_list)
+
+
+def _make_func_str(
+        func_name: str, docstring_line_num: int, nesting_depth: int,
+        decorator_ratio: float, indent_num: int,
+        rand: random.Random) -> str:
+    """
+    Make a synthetic function string.
+
+    Parameters
+    ----------
+    func_name : str
+        The function name.
+    docstring_line_num : int
+        The number of the description lines of each docstring section.
+    nesting_depth : int
+        The number of the nested functions.
+    decorator_ratio : float
+        The probability that the function has a decorator.
+    indent_num : int
+        The indent number of the function definition.
+    rand : random.Random
+        The random number generator.
+
+    Returns
+    -------
+    func_str : str
+        The synthetic function string.
+    """
+    indent_str: str = ' ' * indent_num
+    body_indent_str: str = ' ' * (indent_num + 4)
+    arg_num: int = rand.randint(0, 4)
+    arg_name_list: List[str] = [f'arg_{i}' for i in range(arg_num)]
+    args_str: str = ', '.join(
+        [f'{arg_name}: int = 100' for arg_name in arg_name_list])
+    line_list: List[str] = []
+    if rand.random() < decorator_ratio:
+        decorator_name: str = rand.choice(_DECORATOR_NAME_LIST)
+        line_list.append(f'{indent_str}@{decorator_name}')
+    line_list.append(
+        f'{indent_str}def {func_name}({args_str}) -> int:')
+    line_list.append(
+        _make_docstring_str(
+            arg_name_list=arg_name_list,
+            docstring_line_num=docstring_line_num,
+            indent_str=body_indent_str, rand=rand))
+    if nesting_depth > 0:
+        line_list.append(
+            _make_func_str(
+                func_name=f'{func_name}_nested_{nesting_depth}',
+                docstring_line_num=docstring_line_num,
+                nesting_depth=nesting_depth - 1,
+                decorator_ratio=decorator_ratio,
+                indent_num=indent_num + 4, rand=rand))
+    line_list.append(
+        f"{body_indent_str}label_str: str = 'It''s a \"label\".'"
+        '  # comment with a quote \'')
+    line_list.append(f'{body_indent_str}result_val: int = {len(args_str)}')
+    line_list.append(f'{body_indent_str}return result_val')
+    return '\n'.join(line_list) + '\n'
+
+
+def make_module_str(
+        func_num: int, docstring_line_num: int = 3,
+        nesting_depth: int = 0, decorator_ratio: float = 0.2,
+        seed: int = 0) -> str:
+    """
+    Make a synthetic module string.
+
+    Parameters
+    ----------
+    func_num : int
+        The number of the top-level functions.
+    docstring_line_num : int, default 3
+        The number of the description lines of each docstring section.
+    nesting_depth : int, default 0
+        The number of the nested functions in each top-level function.
+    decorator_ratio : float, default 0.2
+        The probability that each function has a decorator.
+    seed : int, default 0
+        The random seed.
+
+    Returns
+    -------
+    module_str : str
+        The synthetic module string.
+    """
+    rand: random.Random = random.Random(seed)
+    func_str_list: List[str] = ['import functools\n']
+    for func_idx in range(func_num):
+        func_str: str = _make_func_str(
+            func_name=f'sample_func_{func_idx}',
+            docstring_line_num=docstring_line_num,
+            nesting_depth=nesting_depth, decorator_ratio=decorator_ratio,
+            indent_num=0, rand=rand)
+        func_str_list.append(func_str)
+    return '\n\n'.join(func_str_list)
+
+
+def make_notebook_str(
+        func_num: int, docstring_line_num: int = 3,
+        nesting_depth: int = 0, decorator_ratio: float = 0.2,
+        seed: int = 0, func_num_per_cell: int = 5) -> str:
+    """
+    Make a synthetic Jupyter notebook string.
+
+    Parameters
+    ----------
+    func_num : int
+        The number of the top-level functions.
+    docstring_line_num : int, default 3
+        The number of the description lines of each docstring section.
+    nesting_depth : int, default 0
+        The number of the nested functions in each top-level function.
+    decorator_ratio : float, default 0.2
+        The probability that each function has a decorator.
+    seed : int, default 0
+        The random seed.
+    func_num_per_cell : int, default 5
+        The number of the functions in each code cell.
+
+    Returns
+    -------
+    notebook_str : str
+        The synthetic notebook JSON string.
+    """
+    rand: random.Random = random.Random(seed)
+    cell_list: List[dict] = []
+    for start_idx in range(0, func_num, func_num_per_cell):
+        end_idx: int = min(start_idx + func_num_per_cell, func_num)
+        func_str_list: List[str] = [
+            _make_func_str(
+                func_name=f'sample_func_{func_idx}',
+                docstring_line_num=docstring_line_num,
+                nesting_depth=nesting_depth,
+                decorator_ratio=decorator_ratio, indent_num=0, rand=rand)
+            for func_idx in range(start_idx, end_idx)]
+        source_str: str = '\n\n'.join(func_str_list)
+        cell_list.append({
+            'cell_type': 'markdown',
+            'metadata': {},
+            'source': [f'## Functions from {start_idx}'],
+        })
+        cell_list.append({
+            'cell_type': 'code',
+            'execution_count': None,
+            'metadata': {},
+            'outputs': [],
+            'source': source_str.splitlines(keepends=True),
+        })
+    notebook_dict: dict = {
+        'cells': cell_list,
+        'metadata': {},
+        'nbformat': 4,
+        'nbformat_minor': 4,
+    }
+    return json.dumps(notebook_dict, indent=1)
+
+
+def write_corpus(
+        dir_path: str, file_num: int, func_num: int,
+        docstring_line_num: int = 3, nesting_depth: int = 0,
+        decorator_ratio: float = 0.2, seed: int = 0) -> List[str]:
+    """
+    Write the synthetic modules and notebooks to the directory.
+
+    Parameters
+    ----------
+    dir_path : str
+        The output directory path. If the directory does not exist,
+        it will be created.
+    file_num : int
+        The number of the modules. The same number of the notebooks
+        will be written.
+    func_num : int
+        The number of the top-level functions of each file.
+    docstring_line_num : int, default 3
+        The number of the description lines of each docstring section.
+    nesting_depth : int, default 0
+        The number of the nested functions in each top-level function.
+    decorator_ratio : float, default 0.2
+        The probability that each function has a decorator.
+    seed : int, default 0
+        The random seed. Each file uses the seed plus the file index.
+
+    Returns
+    -------
+    file_path_list : list of str
+        A list of the written file paths.
+    """
+    os.makedirs(dir_path, exist_ok=True)
+    file_path_list: List[str] = []
+    for file_idx in range(file_num):
+        module_str: str = make_module_str(
+            func_num=func_num, docstring_line_num=docstring_line_num,
+            nesting_depth=nesting_depth, decorator_ratio=decorator_ratio,
+            seed=seed + file_idx)
+        notebook_str: str = make_notebook_str(
+            func_num=func_num, docstring_line_num=docstring_line_num,
+            nesting_depth=nesting_depth, decorator_ratio=decorator_ratio,
+            seed=seed + file_idx)
+        for file_name, file_str in [
+                (f'sample_module_{file_idx}.py', module_str),
+                (f'sample_notebook_{file_idx}.ipynb', notebook_str)]:
+            file_path: str = os.path.join(dir_path, file_name)
+            with open(file_path, mode='w', encoding='utf-8') as f:
+                f.write(file_str)
+            file_path_list.append(file_path)
+    return file_path_list
+
+
+def main() -> None:
+    """
+    Write the synthetic corpus when executed via the command line.
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description='Write the synthetic benchmark corpus.')
+    parser.add_argument('dir_path', type=str)
+    parser.add_argument('--file_num', type=int, default=10)
+    parser.add_argument('--func_num', type=int, default=100)
+    parser.add_argument('--docstring_line_num', type=int, default=3)
+    parser.add_argument('--nesting_depth', type=int, default=0)
+    parser.add_argument('--decorator_ratio', type=float, default=0.2)
+    parser.add_argument('--seed', type=int, default=0)
+    args: argparse.Namespace = parser.parse_args()
+    file_path_list: List[str] = write_corpus(
+        dir_path=args.dir_path, file_num=args.file_num,
+        func_num=args.func_num,
+        docstring_line_num=args.docstring_line_num,
+        nesting_depth=args.nesting_depth,
+        decorator_ratio=args.decorator_ratio, seed=args.seed)
+    print(f'{len(file_path_list)} files written to {args.dir_path}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,15 @@
 # flake8: noqa
 
-from numdoclint.jupyter_notebook import (check_jupyter_notebook,
-                                         check_jupyter_notebook_recursively)
+from numdoclint.git_diff import check_changed_files
+from numdoclint.index_cache import (clear_cache, disable_index_cache,
+                                    enable_index_cache)
+from numdoclint.jupyter_notebook import (NotebookLintResult,
+                                         check_jupyter_notebook,
+                                         check_jupyter_notebook_recursively,
+                                         iter_check_jupyter_notebooks)
+from numdoclint.profiler import (disable_profile, enable_profile,
+                                 format_profile_stats, get_profile_stats,
+                                 reset_profile_stats)
 from numdoclint.py_module import (INFO_ID_DIFFERENT_PARAM_ORDER,
                                   INFO_ID_LACKED_ARG_DEFAULT_VALUE,
                                   INFO_ID_LACKED_ARGUMENT,
@@ -13,8 +21,11 @@ from numdoclint.py_module import (INFO_ID_DIFFERENT_PARAM_ORDER,
                                   INFO_ID_LACKED_DOCSTRING_RETURN_DESCRIPTION,
                                   INFO_ID_LACKED_DOCSTRING_RETURN_TYPE,
                                   INFO_ID_LACKED_FUNC_DESCRIPTION,
-                                  INFO_ID_LACKED_RETURN_VAL,
+                                  INFO_ID_LACKED_RETURN_VAL, LintResult,
                                   check_python_module,
-                                  check_python_module_recursively)
+                                  check_python_module_recursively,
+                                  check_python_source, check_python_sources,
+                                  get_run_stats, iter_check_python_modules,
+                                  reset_run_stats)
 
 __version__: str = '0.1.9'
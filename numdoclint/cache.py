@@ -0,0 +1,373 @@
+"""A module that handles the on-disk cache of check results.
+
+Each cache file stores the check results of a single file and is
+keyed by the hash of the file content and the fingerprint of the lint
+options, so an unchanged file is not parsed again. The results are
+also stored per function (keyed by the fingerprint of the function
+string) in a cache file keyed by the file path and the options, so
+only the changed functions of a changed file are checked again.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import numdoclint
+
+DEFAULT_CACHE_DIR_PATH: str = '.numdoclint_cache'
+DEFAULT_MAX_CACHE_SIZE: int = 100 * 1024 * 1024
+
+_CACHE_FILE_EXTENSION: str = '.json'
+_CACHE_FORMAT_VERSION: int = 3
+_FUNC_CACHE_KEY_SALT: str = 'func'
+
+
+def get_options_fingerprint(options_dict: Dict[str, Any]) -> str:
+    """
+    Get the fingerprint of the lint options, the numdoclint
+    version and the cache format version.
+
+    Parameters
+    ----------
+    options_dict : dict
+        A dictionary of the lint options that affect the check
+        results. The values need to be JSON serializable.
+
+    Returns
+    -------
+    fingerprint : str
+        The fingerprint string.
+    """
+    fingerprint_source_dict: Dict[str, Any] = {
+        'version': numdoclint.__version__,
+        'cache_format_version': _CACHE_FORMAT_VERSION,
+        'options': options_dict,
+    }
+    fingerprint_source_str: str = json.dumps(
+        fingerprint_source_dict, sort_keys=True)
+    fingerprint: str = hashlib.sha256(
+        fingerprint_source_str.encode('utf-8')).hexdigest()
+    return fingerprint
+
+
+def get_cache_key(file_str: str, options_fingerprint: str) -> str:
+    """
+    Get the cache key of the target file.
+
+    Parameters
+    ----------
+    file_str : str
+        The content string of the target file.
+    options_fingerprint : str
+        The fingerprint of the lint options.
+
+    Returns
+    -------
+    cache_key : str
+        The cache key string.
+    """
+    hash_obj: Any = hashlib.sha256(file_str.encode('utf-8'))
+    hash_obj.update(options_fingerprint.encode('utf-8'))
+    cache_key: str = hash_obj.hexdigest()
+    return cache_key
+
+
+def get_func_cache_key(file_path: str, options_fingerprint: str) -> str:
+    """
+    Get the key of the per-function cache of the target file.
+
+    Parameters
+    ----------
+    file_path : str
+        Path of the target file. The key does not depend on the
+        content of the file.
+    options_fingerprint : str
+        The fingerprint of the lint options.
+
+    Returns
+    -------
+    cache_key : str
+        The cache key string.
+    """
+    hash_obj: Any = hashlib.sha256(
+        os.path.abspath(file_path).encode('utf-8'))
+    hash_obj.update(_FUNC_CACHE_KEY_SALT.encode('utf-8'))
+    hash_obj.update(options_fingerprint.encode('utf-8'))
+    cache_key: str = hash_obj.hexdigest()
+    return cache_key
+
+
+def get_func_fingerprint(func_str: str) -> str:
+    """
+    Get the fingerprint of a function.
+
+    Parameters
+    ----------
+    func_str : str
+        The function string including the signature, the docstring
+        and the body.
+
+    Returns
+    -------
+    fingerprint : str
+        The fingerprint string. The trailing whitespace (e.g., the
+        blank lines before the next function) does not change it.
+    """
+    fingerprint: str = hashlib.sha256(
+        func_str.rstrip().encode('utf-8')).hexdigest()
+    return fingerprint
+
+
+def _get_cache_file_path(cache_dir_path: str, cache_key: str) -> str:
+    """
+    Get the path of the cache file.
+
+    Parameters
+    ----------
+    cache_dir_path : str
+        The cache directory path.
+    cache_key : str
+        The cache key string.
+
+    Returns
+    -------
+    cache_file_path : str
+        The path of the cache file.
+    """
+    cache_file_path: str = os.path.join(
+        cache_dir_path, cache_key + _CACHE_FILE_EXTENSION)
+    return cache_file_path
+
+
+def read_cache(
+        cache_dir_path: str, cache_key: str) -> Optional[List[dict]]:
+    """
+    Read the cached check results.
+
+    Parameters
+    ----------
+    cache_dir_path : str
+        The cache directory path.
+    cache_key : str
+        The cache key string.
+
+    Returns
+    -------
+    info_list : list of dicts or None
+        The cached check results. If the cache does not exist or
+        can not be read, None will be set.
+
+    Notes
+    -----
+    The modified time of the cache file is updated on a hit, so that
+    the least recently used files are evicted first.
+    """
+    info_list: Optional[List[dict]] = _read_cache_file(
+        cache_dir_path=cache_dir_path, cache_key=cache_key)
+    return info_list
+
+
+def read_func_cache(
+        cache_dir_path: str,
+        cache_key: str) -> Optional[Dict[str, List[dict]]]:
+    """
+    Read the cached check results per function.
+
+    Parameters
+    ----------
+    cache_dir_path : str
+        The cache directory path.
+    cache_key : str
+        The key of the per-function cache.
+
+    Returns
+    -------
+    func_info_dict : dict or None
+        A dictionary with the function fingerprints as keys and the
+        lists of the check results (without the positions) as values.
+        If the cache does not exist or can not be read, None will be
+        set.
+    """
+    func_info_dict: Optional[Dict[str, List[dict]]] = _read_cache_file(
+        cache_dir_path=cache_dir_path, cache_key=cache_key)
+    return func_info_dict
+
+
+def _read_cache_file(cache_dir_path: str, cache_key: str) -> Any:
+    """
+    Read the cache file.
+
+    Parameters
+    ----------
+    cache_dir_path : str
+        The cache directory path.
+    cache_key : str
+        The cache key string.
+
+    Returns
+    -------
+    cache_data : *
+        The loaded JSON data. If the cache does not exist or can not
+        be read, None will be set.
+
+    Notes
+    -----
+    The modified time of the cache file is updated on a hit, so that
+    the least recently used files are evicted first.
+    """
+    cache_file_path: str = _get_cache_file_path(
+        cache_dir_path=cache_dir_path, cache_key=cache_key)
+    try:
+        with open(cache_file_path, mode='r', encoding='utf-8') as f:
+            cache_data: Any = json.load(f)
+        os.utime(cache_file_path)
+    except (OSError, ValueError):
+        return None
+    return cache_data
+
+
+def write_cache(
+        cache_dir_path: str, cache_key: str,
+        info_list: List[Mapping]) -> None:
+    """
+    Write the check results to the cache.
+
+    Parameters
+    ----------
+    cache_dir_path : str
+        The cache directory path. If the directory does not exist,
+        it will be created.
+    cache_key : str
+        The cache key string.
+    info_list : list of Mapping
+        The check results to cache (e.g., the dictionaries or the
+        result records).
+    """
+    _write_cache_file(
+        cache_dir_path=cache_dir_path, cache_key=cache_key,
+        cache_data=[dict(info_dict) for info_dict in info_list])
+
+
+def write_func_cache(
+        cache_dir_path: str, cache_key: str,
+        func_info_dict: Dict[str, List[Mapping]]) -> None:
+    """
+    Write the check results per function to the cache.
+
+    Parameters
+    ----------
+    cache_dir_path : str
+        The cache directory path. If the directory does not exist,
+        it will be created.
+    cache_key : str
+        The key of the per-function cache.
+    func_info_dict : dict
+        A dictionary with the function fingerprints as keys and the
+        lists of the check results as values. The previous cache of
+        the file is replaced, so the functions that no longer exist
+        are dropped.
+    """
+    _write_cache_file(
+        cache_dir_path=cache_dir_path, cache_key=cache_key,
+        cache_data={
+            fingerprint: [dict(info_dict) for info_dict in info_list]
+            for fingerprint, info_list in func_info_dict.items()})
+
+
+def _write_cache_file(
+        cache_dir_path: str, cache_key: str, cache_data: Any) -> None:
+    """
+    Write the cache file.
+
+    Parameters
+    ----------
+    cache_dir_path : str
+        The cache directory path. If the directory does not exist,
+        it will be created.
+    cache_key : str
+        The cache key string.
+    cache_data : *
+        The JSON serializable data to cache.
+
+    Notes
+    -----
+    The cache file is written to a temporary file first and then
+    replaced, so that parallel processes never read a partial file.
+    If the cache directory can not be created or written (e.g., a
+    read-only directory or a full disk), the cache is not written and
+    the temporary file is removed, so the check is not stopped.
+    """
+    tmp_file_path: Optional[str] = None
+    try:
+        os.makedirs(cache_dir_path, exist_ok=True)
+        gitignore_path: str = os.path.join(cache_dir_path, '.gitignore')
+        if not os.path.exists(gitignore_path):
+            with open(gitignore_path, mode='w', encoding='utf-8') as f:
+                f.write('*\n')
+        fd, tmp_file_path = tempfile.mkstemp(
+            dir=cache_dir_path, suffix='.tmp')
+        # The one-shot `json.dumps` uses the C encoder, while
+        # `json.dump` encodes the data in chunks in Python.
+        with os.fdopen(fd, mode='w', encoding='utf-8') as f:
+            f.write(json.dumps(cache_data))
+        os.replace(
+            tmp_file_path,
+            _get_cache_file_path(
+                cache_dir_path=cache_dir_path, cache_key=cache_key))
+        tmp_file_path = None
+    except OSError:
+        pass
+    finally:
+        if tmp_file_path is not None:
+            try:
+                os.remove(tmp_file_path)
+            except OSError:
+                pass
+
+
+def evict_cache(
+        cache_dir_path: str,
+        max_cache_size: int = DEFAULT_MAX_CACHE_SIZE) -> List[str]:
+    """
+    Remove the least recently used cache files until the total size
+    of the cache files becomes the maximum size or less.
+
+    Parameters
+    ----------
+    cache_dir_path : str
+        The cache directory path.
+    max_cache_size : int, default 104857600
+        The maximum total size of the cache files in bytes.
+
+    Returns
+    -------
+    removed_file_path_list : list of str
+        A list of the removed cache file paths.
+    """
+    if not os.path.isdir(cache_dir_path):
+        return []
+    cache_file_info_list: List[Tuple[float, int, str]] = []
+    total_size: int = 0
+    for dir_entry in os.scandir(cache_dir_path):
+        if not dir_entry.name.endswith(_CACHE_FILE_EXTENSION):
+            continue
+        stat_result: os.stat_result = dir_entry.stat()
+        cache_file_info_list.append(
+            (stat_result.st_mtime, stat_result.st_size, dir_entry.path))
+        total_size += stat_result.st_size
+    if total_size <= max_cache_size:
+        return []
+    cache_file_info_list.sort()
+    removed_file_path_list: List[str] = []
+    for _, file_size, file_path in cache_file_info_list:
+        if total_size <= max_cache_size:
+            break
+        try:
+            os.remove(file_path)
+        except OSError:
+            continue
+        total_size -= file_size
+        removed_file_path_list.append(file_path)
+    return removed_file_path_list
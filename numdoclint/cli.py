@@ -3,10 +3,14 @@
 
 import argparse
 import os
-from typing import List, Optional
+import sys
+from typing import Any, List, Mapping, Optional
 
 import numdoclint
-from numdoclint import py_module
+from numdoclint import (cache, helper, jupyter_notebook, module_index,
+                        output, profiler, py_module, server)
+
+COMMAND_SERVE: str = 'serve'
 
 
 def _get_list_of_str_from_csv(csv: str) -> List[str]:
@@ -30,7 +34,8 @@ def _get_list_of_str_from_csv(csv: str) -> List[str]:
 
 def _validate_args(
         path: str, ignore_info_id_list: List[int],
-        check_recursively: bool) -> None:
+        check_recursively: bool, since: Optional[str] = None,
+        jobs: int = 1) -> None:
     """
     Check whether the specified argument is valid or not.
 
@@ -42,15 +47,21 @@ def _validate_args(
         List of specified information IDs to ignore.
     check_recursively : bool
         A boolean value of whether to check recursively.
+    since : str or None, default None
+        The git ref specified to check only the changed files.
+    jobs : int, default 1
+        The specified number of processes.
 
     Raises
     ------
     Exception
-        - If the path argument is None.
+        - If the path argument is None and the since argument
+          is not specified.
         - If specified invalid information id.
         - If specified `-r` and a path is not directory.
+        - If specified `--since` and the number of processes.
     """
-    if path is None:
+    if path is None and since is None:
         err_msg: str = 'A path is not specified in the argument. '\
             'Please set the `-p` or `--path` argument.'
         raise Exception(err_msg)
@@ -63,12 +74,16 @@ def _validate_args(
             '`-i` or `--ignore_info_id_list` argument : %s' \
             % ignore_info_id
         raise Exception(err_msg)
-    if check_recursively:
-        if not os.path.isdir(path):
+    if check_recursively or since is not None:
+        if path is not None and not os.path.isdir(path):
             err_msg = 'If the `-r` or `--check_recursively`'\
-                ' argument is specified, the path argument'\
-                ' must specify a directory.'
+                ' or `--since` argument is specified, the path'\
+                ' argument must specify a directory.'
             raise Exception(err_msg)
+    if since is not None and jobs != 1:
+        err_msg = 'The `-J` or `--jobs` argument can not be used with'\
+            ' the `--since` argument.'
+        raise Exception(err_msg)
 
 
 def _get_list_of_int_from_csv(csv: str) -> List[int]:
@@ -101,7 +116,15 @@ def _exec_numdoclint(
         ignore_func_name_prefix_list: List[str],
         ignore_info_id_list: List[int],
         enable_default_or_optional_doc_check: bool,
-        skip_decorator_name_list: List[str]) -> List[dict]:
+        skip_decorator_name_list: List[str],
+        engine: str = module_index.ENGINE_LEGACY,
+        jobs: int = 1,
+        cache_dir_path: Optional[str] = None,
+        since: Optional[str] = None,
+        changed_funcs_only: bool = False,
+        server_socket_path: Optional[str] = None,
+        exclude_pattern_list: List[str] = [],
+        combine_code_cells: bool = False) -> List[Mapping]:
     """
     Execute Numdoc Lint function.
 
@@ -125,28 +148,83 @@ def _exec_numdoclint(
     skip_decorator_name_list : list of str
         If a decorator name in this list is set to function,
         that function will not bo checked.
+    engine : str, default 'legacy'
+        The engine to extract functions' information. Only
+        used when checking Python modules.
+    jobs : int, default 1
+        The number of processes to check files in parallel. Only
+        used when checking recursively.
+    cache_dir_path : str or None, default None
+        The directory path to cache the check results. If None,
+        the cache will not be used. Only used when checking Python
+        modules.
+    since : str or None, default None
+        If a git ref is specified, only the Python modules and
+        Jupyter notebooks changed since the ref under the path
+        will be checked. `check_recursively`, `is_jupyter` and
+        `jobs` are not used in that case.
+    changed_funcs_only : bool, default False
+        If True, only the functions intersecting the changed lines
+        will be reported. Only used with the `since` argument.
+    server_socket_path : str or None, default None
+        If the socket path of the server started by `numdoclint serve`
+        is specified, the check will be requested to the server. Not
+        used with the `since` argument.
+    exclude_pattern_list : list of str, default []
+        A list of the glob patterns of the directory and file paths
+        to exclude. Only used when checking recursively or with the
+        `since` argument.
+    combine_code_cells : bool, default False
+        If True, the code cells of a Jupyter notebook are joined
+        into one virtual module and indexed at once. Not used with
+        the `since` and `server_socket_path` arguments.
 
     Returns
     -------
-    info_list : list of dicts
+    info_list : list of LintResult or NotebookLintResult
         List of check results.
     """
     enable_def_or_opt_check: bool = enable_default_or_optional_doc_check
+    if since is None and server_socket_path is not None:
+        info_list: List[Mapping] = _request_check_to_server(
+            path=path, check_recursively=check_recursively,
+            is_jupyter=is_jupyter,
+            ignore_func_name_prefix_list=ignore_func_name_prefix_list,
+            ignore_info_id_list=ignore_info_id_list,
+            enable_default_or_optional_doc_check=enable_def_or_opt_check,
+            skip_decorator_name_list=skip_decorator_name_list,
+            engine=engine, server_socket_path=server_socket_path,
+            exclude_pattern_list=exclude_pattern_list)
+        return info_list
+    if since is not None:
+        info_list = numdoclint.check_changed_files(
+            since_ref=since, dir_path=path,
+            ignore_func_name_prefix_list=ignore_func_name_prefix_list,
+            ignore_info_id_list=ignore_info_id_list,
+            enable_default_or_optional_doc_check=enable_def_or_opt_check,
+            skip_decorator_name_list=skip_decorator_name_list,
+            engine=engine, changed_funcs_only=changed_funcs_only,
+            cache_dir_path=cache_dir_path,
+            exclude_pattern_list=exclude_pattern_list)
+        return info_list
     if not is_jupyter:
         if not check_recursively:
-            info_list: List[dict] = numdoclint.check_python_module(
+            info_list = numdoclint.check_python_module(
                 py_module_path=path,
                 ignore_func_name_prefix_list=ignore_func_name_prefix_list,
                 ignore_info_id_list=ignore_info_id_list,
                 enable_default_or_optional_doc_check=enable_def_or_opt_check,
-                skip_decorator_name_list=skip_decorator_name_list)
+                skip_decorator_name_list=skip_decorator_name_list,
+                engine=engine, cache_dir_path=cache_dir_path)
             return info_list
         info_list = numdoclint.check_python_module_recursively(
             dir_path=path,
             ignore_func_name_prefix_list=ignore_func_name_prefix_list,
             ignore_info_id_list=ignore_info_id_list,
             enable_default_or_optional_doc_check=enable_def_or_opt_check,
-            skip_decorator_name_list=skip_decorator_name_list)
+            skip_decorator_name_list=skip_decorator_name_list,
+            engine=engine, jobs=jobs, cache_dir_path=cache_dir_path,
+            exclude_pattern_list=exclude_pattern_list)
         return info_list
 
     if not check_recursively:
@@ -154,19 +232,148 @@ def _exec_numdoclint(
             notebook_path=path,
             ignore_func_name_prefix_list=ignore_func_name_prefix_list,
             ignore_info_id_list=ignore_info_id_list,
-            enable_default_or_optional_doc_check=enable_def_or_opt_check)
+            enable_default_or_optional_doc_check=enable_def_or_opt_check,
+            combine_code_cells=combine_code_cells)
         return info_list
     info_list = numdoclint.check_jupyter_notebook_recursively(
         dir_path=path,
         ignore_func_name_prefix_list=ignore_func_name_prefix_list,
         ignore_info_id_list=ignore_info_id_list,
-        enable_default_or_optional_doc_check=enable_def_or_opt_check)
+        enable_default_or_optional_doc_check=enable_def_or_opt_check,
+        jobs=jobs, exclude_pattern_list=exclude_pattern_list,
+        combine_code_cells=combine_code_cells)
+    return info_list
+
+
+def _request_check_to_server(
+        path: str,
+        check_recursively: bool,
+        is_jupyter: bool,
+        ignore_func_name_prefix_list: List[str],
+        ignore_info_id_list: List[int],
+        enable_default_or_optional_doc_check: bool,
+        skip_decorator_name_list: List[str],
+        engine: str,
+        server_socket_path: str,
+        exclude_pattern_list: List[str] = []) -> List[Mapping]:
+    """
+    Request the running server to check the files.
+
+    Parameters
+    ----------
+    path : str
+        Python module file path, Jupyter notebook path, or
+        directory path.
+    check_recursively : bool
+        If True, check files recursively.
+    is_jupyter : bool
+        If True, check target will become Jupyter notebook.
+        If not, Python module will be checked.
+    ignore_func_name_prefix_list : list of str
+        A prefix list of function name conditions to ignore.
+    ignore_info_id_list : list of int
+        List of IDs to ignore lint checking.
+    enable_default_or_optional_doc_check : bool
+        If True, the `default` and `optional` string in
+        docstring will be checked.
+    skip_decorator_name_list : list of str
+        If a decorator name in this list is set to function,
+        that function will not bo checked.
+    engine : str
+        The engine to extract functions' information.
+    server_socket_path : str
+        The Unix socket path of the server.
+    exclude_pattern_list : list of str, default []
+        A list of the glob patterns of the directory and file paths
+        to exclude. Only used when checking recursively.
+
+    Returns
+    -------
+    info_list : list of LintResult or NotebookLintResult
+        List of check results.
+    """
+    file_path_list: List[str] = [path]
+    if check_recursively:
+        extension: str = '.py'
+        if is_jupyter:
+            extension = '.ipynb'
+        file_path_list = [
+            file_path for file_path
+            in helper.iter_file_path_recursively(
+                dir_path=path, extension=extension,
+                exclude_pattern_list=exclude_pattern_list)
+            if '.ipynb_checkpoints' not in file_path]
+    info_list: List[Mapping] = []
+    for file_path in file_path_list:
+        unit_info_list: List[Mapping] = server.request_check(
+            path=file_path, socket_path=server_socket_path,
+            ignore_func_name_prefix_list=ignore_func_name_prefix_list,
+            ignore_info_id_list=ignore_info_id_list,
+            enable_default_or_optional_doc_check=(
+                enable_default_or_optional_doc_check),
+            skip_decorator_name_list=skip_decorator_name_list,
+            engine=engine)
+        if is_jupyter:
+            jupyter_notebook._print_info_list(
+                info_list=unit_info_list,
+                verbose=jupyter_notebook.VERBOSE_ENABLED)
+        else:
+            py_module._print_info_list(
+                info_list=unit_info_list, verbose=py_module.VERBOSE_ENABLED)
+        info_list.extend(unit_info_list)
     return info_list
 
 
+def _add_serve_parser(subparsers: Any) -> None:
+    """
+    Add the parser of the `numdoclint serve` command.
+
+    Parameters
+    ----------
+    subparsers : argparse._SubParsersAction
+        The subparsers of the main parser.
+    """
+    description: str = 'Start the numdoclint server that keeps the '\
+        'check results in memory. Stop it with Ctrl+C or '\
+        '`numdoclint serve --stop`.'
+    parser: argparse.ArgumentParser = subparsers.add_parser(
+        COMMAND_SERVE, description=description, help=description)
+    parser.add_argument(
+        '--socket', type=str, default=server.DEFAULT_SOCKET_PATH,
+        help='The Unix socket path to listen on. The default is '
+             'numdoclint.sock in $XDG_RUNTIME_DIR, or in the per-user '
+             'numdoclint-<uid> directory in the temporary directory.')
+    parser.add_argument(
+        '--max-result-num', type=int,
+        default=server.DEFAULT_MAX_RESULT_NUM,
+        help='The maximum number of the check results kept in memory.')
+    parser.add_argument(
+        '--stop', action='store_true',
+        help='If specified, stop the running server instead.')
+
+
+def _serve(args: argparse.Namespace) -> None:
+    """
+    Start the server of the `numdoclint serve` command.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Object that stores data of the `serve` command's arguments.
+    """
+    if args.stop:
+        server.request_shutdown(socket_path=args.socket)
+        return
+    try:
+        server.serve(
+            socket_path=args.socket, max_result_num=args.max_result_num)
+    except KeyboardInterrupt:
+        pass
+
+
 def main(
         args: Optional[argparse.Namespace] = None,
-        return_list: bool = False) -> Optional[List[dict]]:
+        return_list: bool = False) -> Optional[List[Mapping]]:
     """
     The function of command line entry point.
 
@@ -181,8 +388,13 @@ def main(
 
     Returns
     -------
-    info_list : list of dicts or None
+    info_list : list of LintResult or NotebookLintResult, or None
         List of check results.
+
+    Notes
+    -----
+    If the `serve` command is specified, the server will be started
+    instead of checking.
     """
     description: str = 'NumPy style docstring checking in Python code.'
     parser: argparse.ArgumentParser = argparse.ArgumentParser(
@@ -231,24 +443,150 @@ def main(
              'necessary for docstring-related decorators. '
              'Note: only available when check Python module, '
              'not supported Jupyter notebook.')
+    parser.add_argument(
+        '--engine', type=str,
+        choices=module_index.ENGINE_LIST,
+        default=module_index.ENGINE_LEGACY,
+        help='The engine to extract functions\' information. '
+             'The `ast` engine parses the module once with the '
+             'ast module. Note: only available when check Python '
+             'module, not supported Jupyter notebook.')
+    parser.add_argument(
+        '--exclude',
+        type=_get_list_of_str_from_csv,
+        default='',
+        help='A list of the glob patterns of the directory and file '
+             'paths to exclude when checking recursively or with '
+             '`--since`. The excluded directories are not entered.'
+             '\ne.g., build,*/migrations,*_pb2.py.'
+             '\nComma separated string is acceptable. The directories '
+             'such as .git, __pycache__, node_modules and virtual '
+             'environments are always excluded.')
+    parser.add_argument(
+        '--combine-cells', action='store_true',
+        help='If specified, the code cells of a Jupyter notebook are '
+             'joined into one virtual module and indexed at once '
+             'instead of cell by cell. Note: only available when check '
+             'Jupyter notebook, and not used with `--since` and '
+             '`--server-socket`.')
+    parser.add_argument(
+        '-J', '--jobs', type=int, default=1,
+        help='The number of processes to check files in parallel '
+             'when checking recursively. If 0 or less is specified, '
+             'the number of CPUs will be used. Not used with `--since`.')
+    parser.add_argument(
+        '--no-cache', action='store_true',
+        help='If specified, the check results will not be cached.')
+    parser.add_argument(
+        '--cache-dir', type=str, default=cache.DEFAULT_CACHE_DIR_PATH,
+        help='The directory path to cache the check results. The '
+             'default is .numdoclint_cache in the current directory, '
+             'which is created at the first run unless `--no-cache` is '
+             'specified. The results are cached per file and per '
+             'function, so only '
+             'the changed functions of a changed file are checked '
+             'again. Note: only available when check Python module, '
+             'not supported Jupyter notebook.')
+    parser.add_argument(
+        '--since', type=str, default=None,
+        help='If a git ref is specified (e.g., origin/main), only the '
+             'Python modules and Jupyter notebooks changed since the '
+             'ref under the path will be checked. If the path is not '
+             'specified, the current directory will be used.')
+    parser.add_argument(
+        '--changed-funcs-only', action='store_true',
+        help='If specified with `--since`, only the functions whose '
+             'lines intersect the changed lines will be reported. '
+             'Note: only available when check Python module, '
+             'not supported Jupyter notebook.')
+    parser.add_argument(
+        '--server-socket', type=str, nargs='?', default=None,
+        const=server.DEFAULT_SOCKET_PATH,
+        help='If specified, the check will be requested to the server '
+             'started by `numdoclint serve`, which keeps the results '
+             'of unchanged files in memory. The socket path can be '
+             'specified optionally.')
+    parser.add_argument(
+        '--output', type=str, default=None,
+        help='The file path to write the check results to. If not '
+             'specified, the standard output will be used.')
+    parser.add_argument(
+        '--flush-interval', type=int, default=output.DEFAULT_FLUSH_INTERVAL,
+        help='The number of the written check results to flush the '
+             'output after. If 0 or less is specified, the output will '
+             'be flushed only at the end.')
+    parser.add_argument(
+        '--format', type=str, default=output.FORMAT_TEXT,
+        choices=output.FORMAT_LIST,
+        help='The format of the check results. The jsonl, sarif and '
+             'msgpack formats have the stable keys of path, lineno, '
+             'end_lineno, func_name, info_id, info and code_cell_index.')
+    parser.add_argument(
+        '--profile', action='store_true',
+        help='If specified, the wall time and the number of calls per '
+             'phase, check, file and function will be measured, and the '
+             'summary will be printed to the standard error at the end. '
+             'Note: the checks run by the server are not measured.')
+    parser.add_argument(
+        '--profile-top', type=int, default=profiler.DEFAULT_TOP_N,
+        help='The number of the slowest files and functions to print '
+             'with `--profile`.')
+
+    subparsers: Any = parser.add_subparsers(
+        dest='command', title='commands')
+    _add_serve_parser(subparsers=subparsers)
 
     if args is None:
         args = parser.parse_args()
+    if getattr(args, 'command', None) == COMMAND_SERVE:
+        _serve(args=args)
+        return None
 
     _validate_args(
         path=args.path,
         ignore_info_id_list=args.ignore_info_id_list,
-        check_recursively=args.check_recursively)
+        check_recursively=args.check_recursively,
+        since=args.since,
+        jobs=args.jobs)
 
     enable_def_or_opt_check: bool = args.enable_default_or_optional_doc_check
-    info_list: List[dict] = _exec_numdoclint(
-        path=args.path,
-        check_recursively=args.check_recursively,
-        is_jupyter=args.is_jupyter,
-        ignore_func_name_prefix_list=args.ignore_func_name_prefix_list,
-        ignore_info_id_list=args.ignore_info_id_list,
-        enable_default_or_optional_doc_check=enable_def_or_opt_check,
-        skip_decorator_name_list=args.skip_decorator_name_list,
-    )
+    cache_dir_path: Optional[str] = args.cache_dir
+    if args.no_cache:
+        cache_dir_path = None
+    path: str = args.path
+    if path is None:
+        path = '.'
+    output_writer: output.OutputWriter = output.open_output_writer(
+        output_path=args.output, flush_interval=args.flush_interval,
+        output_format=args.format)
+    output.set_output_writer(output_writer=output_writer)
+    if args.profile:
+        profiler.reset_profile_stats()
+        profiler.enable_profile()
+    try:
+        info_list: List[Mapping] = _exec_numdoclint(
+            path=path,
+            check_recursively=args.check_recursively,
+            is_jupyter=args.is_jupyter,
+            ignore_func_name_prefix_list=args.ignore_func_name_prefix_list,
+            ignore_info_id_list=args.ignore_info_id_list,
+            enable_default_or_optional_doc_check=enable_def_or_opt_check,
+            skip_decorator_name_list=args.skip_decorator_name_list,
+            engine=args.engine,
+            jobs=args.jobs,
+            cache_dir_path=cache_dir_path,
+            since=args.since,
+            changed_funcs_only=args.changed_funcs_only,
+            server_socket_path=args.server_socket,
+            exclude_pattern_list=args.exclude,
+            combine_code_cells=args.combine_cells,
+        )
+    finally:
+        output_writer.close()
+        output.set_output_writer(output_writer=None)
+        if args.profile:
+            profiler.disable_profile()
+            sys.stderr.write(
+                profiler.format_profile_stats(top_n=args.profile_top))
     if return_list:
         return info_list
@@ -0,0 +1,339 @@
+"""A module that checks only the files changed since a git ref.
+"""
+
+import os
+import re
+import subprocess
+from typing import List, Mapping, Optional, Pattern, Tuple
+
+from numdoclint import cache, helper, jupyter_notebook, profiler, py_module
+from numdoclint.module_index import ENGINE_LEGACY
+
+_HUNK_HEADER_PATTERN: Pattern = re.compile(
+    pattern=r'^@@ -\d+(?:,\d+)? \+(?P<start>\d+)(?:,(?P<count>\d+))? @@',
+    flags=re.MULTILINE)
+
+_TARGET_EXTENSION_LIST: List[str] = ['.py', '.ipynb']
+
+
+def check_changed_files(
+        since_ref: str, dir_path: str = '.', verbose: int = 1,
+        ignore_func_name_prefix_list: List[str] = ['test_'],
+        ignore_info_id_list: List[int] = [],
+        enable_default_or_optional_doc_check: bool = False,
+        skip_decorator_name_list: List[str] = ['Appender'],
+        engine: str = ENGINE_LEGACY,
+        changed_funcs_only: bool = False,
+        cache_dir_path: Optional[str] = None,
+        max_cache_size: int = cache.DEFAULT_MAX_CACHE_SIZE,
+        exclude_pattern_list: List[str] = []) -> List[Mapping]:
+    """
+    Check docstring of the Python modules and Jupyter notebooks
+    changed since the git ref.
+
+    Parameters
+    ----------
+    since_ref : str
+        The git ref to compare with. e.g., `origin/main`, `HEAD~3`.
+    dir_path : str, default '.'
+        Target directory path. It needs to be inside of a git
+        repository. Only the changed files under this directory
+        will be checked.
+    verbose : int, default 1
+        Log settings of stdout. Specify one of the following numbers:
+        - 0 -> Do not output log.
+        - 1 -> Output the check result.
+    ignore_func_name_prefix_list : list of str, default ['test_']
+        A prefix list of function name conditions to ignore.
+    ignore_info_id_list : list of int, default []
+        List of IDs to ignore lint checking. A constant with a
+        prefix of `INFO_ID_` can be specified.
+    enable_default_or_optional_doc_check : bool, default False
+        If True specified, the `default` and `optional` string
+        in docstring will be checked.
+    skip_decorator_name_list : list of str, default ['Appender']
+        If a decorator name in this list is set to function, that
+        function will not be checked. Only used for Python modules.
+    engine : str, default 'legacy'
+        The engine to extract functions' information. Only used for
+        Python modules.
+    changed_funcs_only : bool, default False
+        If True, only the check results of the functions whose lines
+        intersect the changed lines will be returned. Only used for
+        Python modules; Jupyter notebooks are always checked as a
+        whole.
+    cache_dir_path : str or None, default None
+        The directory path to cache the check results (e.g.,
+        '.numdoclint_cache'). If None, the cache will not be used.
+        Only used for Python modules.
+    max_cache_size : int, default 104857600
+        The maximum total size of the cache files in bytes. The least
+        recently used cache files are removed beyond this size.
+    exclude_pattern_list : list of str, default []
+        A list of the glob patterns of the directory and file paths
+        to exclude (e.g., `build`, `*/migrations`). The changed files
+        under the excluded directories are not checked either.
+
+    Returns
+    -------
+    info_list : list of LintResult or NotebookLintResult
+        A list containing information on check results. The results
+        of Python modules are the same as the `check_python_module`
+        and the ones of Jupyter notebooks are the same as the
+        `check_jupyter_notebook`.
+
+    Raises
+    ------
+    Exception
+        If the git command failed.
+    """
+    changed_file_path_list: List[str] = get_changed_file_path_list(
+        since_ref=since_ref, dir_path=dir_path)
+    exclude_pattern: Optional[Pattern] = helper._get_exclude_pattern(
+        exclude_pattern_list=exclude_pattern_list)
+    info_list: List[Mapping] = []
+    for file_path in changed_file_path_list:
+        if exclude_pattern is not None and _is_excluded_path(
+                file_path=file_path, dir_path=dir_path,
+                exclude_pattern=exclude_pattern):
+            continue
+        if file_path.endswith('.ipynb'):
+            if '.ipynb_checkpoints' in file_path:
+                continue
+            info_list.extend(
+                jupyter_notebook.check_jupyter_notebook(
+                    notebook_path=file_path, verbose=verbose,
+                    ignore_func_name_prefix_list=ignore_func_name_prefix_list,
+                    ignore_info_id_list=ignore_info_id_list,
+                    enable_default_or_optional_doc_check=(
+                        enable_default_or_optional_doc_check)))
+            continue
+        unit_info_list: List[py_module.LintResult] = \
+            profiler.call_with_time(
+                profile_key=profiler.PROFILE_KEY_FILE, name=file_path,
+                func=lambda: py_module._check_python_module(
+                    py_module_path=file_path,
+                    verbose=py_module.VERBOSE_DISABLED,
+                    ignore_func_name_prefix_list=(
+                        ignore_func_name_prefix_list),
+                    ignore_info_id_list=ignore_info_id_list,
+                    enable_default_or_optional_doc_check=(
+                        enable_default_or_optional_doc_check),
+                    skip_decorator_name_list=skip_decorator_name_list,
+                    engine=engine, cache_dir_path=cache_dir_path))
+        if changed_funcs_only and unit_info_list:
+            line_range_list: List[Tuple[int, int]] = \
+                get_changed_line_range_list(
+                    since_ref=since_ref, file_path=file_path)
+            unit_info_list = filter_info_list_by_line_range(
+                info_list=unit_info_list, line_range_list=line_range_list)
+        py_module._print_info_list(info_list=unit_info_list, verbose=verbose)
+        info_list.extend(unit_info_list)
+    if cache_dir_path is not None:
+        cache.evict_cache(
+            cache_dir_path=cache_dir_path, max_cache_size=max_cache_size)
+    return info_list
+
+
+def get_changed_file_path_list(
+        since_ref: str, dir_path: str = '.') -> List[str]:
+    """
+    Get a list of the Python module and Jupyter notebook paths
+    changed since the git ref.
+
+    Parameters
+    ----------
+    since_ref : str
+        The git ref to compare with.
+    dir_path : str, default '.'
+        Target directory path.
+
+    Returns
+    -------
+    file_path_list : list of str
+        A list of the changed file paths under the directory,
+        including the uncommitted changes. Deleted files and
+        untracked files are not included.
+
+    Raises
+    ------
+    Exception
+        If the git command failed.
+    """
+    stdout_str: str = _run_git_command(
+        arg_list=[
+            'diff', '--name-only', '--diff-filter=d', '--relative',
+            since_ref, '--'],
+        cwd=dir_path)
+    file_path_list: List[str] = []
+    for relative_path in stdout_str.splitlines():
+        is_target: bool = False
+        for extension in _TARGET_EXTENSION_LIST:
+            if relative_path.endswith(extension):
+                is_target = True
+                break
+        if not is_target:
+            continue
+        file_path: str = os.path.join(dir_path, relative_path)
+        file_path = file_path.replace('\\', '/')
+        file_path_list.append(file_path)
+    return file_path_list
+
+
+def get_changed_line_range_list(
+        since_ref: str, file_path: str) -> List[Tuple[int, int]]:
+    """
+    Get a list of the line ranges of the file changed since the
+    git ref.
+
+    Parameters
+    ----------
+    since_ref : str
+        The git ref to compare with.
+    file_path : str
+        Target file path.
+
+    Returns
+    -------
+    line_range_list : list of tuple of int
+        A list of the pairs of the start line index (start with zero)
+        and the end line index (not included). If lines are only
+        deleted, the lines before and after the deletion are set.
+
+    Raises
+    ------
+    Exception
+        If the git command failed.
+    """
+    dir_path: str = os.path.dirname(file_path) or '.'
+    stdout_str: str = _run_git_command(
+        arg_list=[
+            'diff', '--unified=0', since_ref, '--',
+            os.path.basename(file_path)],
+        cwd=dir_path)
+    line_range_list: List[Tuple[int, int]] = []
+    for match in _HUNK_HEADER_PATTERN.finditer(stdout_str):
+        start_line_num: int = int(match.group('start'))
+        count_str: Optional[str] = match.group('count')
+        line_count: int = 1 if count_str is None else int(count_str)
+        if line_count == 0:
+            line_range_list.append(
+                (max(start_line_num - 1, 0), start_line_num + 1))
+            continue
+        line_range_list.append(
+            (start_line_num - 1, start_line_num - 1 + line_count))
+    return line_range_list
+
+
+def filter_info_list_by_line_range(
+        info_list: List[py_module.LintResult],
+        line_range_list: List[Tuple[int, int]]
+        ) -> List[py_module.LintResult]:
+    """
+    Filter the check results to the functions whose lines intersect
+    the line ranges.
+
+    Parameters
+    ----------
+    info_list : list of LintResult
+        A list of the check results of the Python module.
+    line_range_list : list of tuple of int
+        A list of the pairs of the start line index and the end line
+        index (not included).
+
+    Returns
+    -------
+    info_list : list of LintResult
+        A list of the filtered check results.
+
+    Notes
+    -----
+    The lines from the `lineno` to the `end_lineno` of each result
+    (from the `def` statement to the last non-blank line of the
+    function body) are used, so the blank lines and the module-level
+    code after the function are not included.
+    """
+    filtered_info_list: List[py_module.LintResult] = []
+    for info_dict in info_list:
+        if info_dict.lineno <= 0:
+            continue
+        for start_line_idx, end_line_idx in line_range_list:
+            if start_line_idx >= info_dict.end_lineno:
+                continue
+            if end_line_idx < info_dict.lineno:
+                continue
+            filtered_info_list.append(info_dict)
+            break
+    return filtered_info_list
+
+
+def _is_excluded_path(
+        file_path: str, dir_path: str, exclude_pattern: Pattern) -> bool:
+    """
+    Get a boolean value of whether the file or one of its
+    directories under the target directory matches the pattern
+    to exclude.
+
+    Parameters
+    ----------
+    file_path : str
+        Target file path under the directory.
+    dir_path : str
+        Target directory path.
+    exclude_pattern : Pattern
+        The compiled pattern of the glob patterns to exclude.
+
+    Returns
+    -------
+    result_bool : bool
+        True if the file or one of its directories is excluded.
+
+    Notes
+    -----
+    The same names and paths as `helper.iter_file_path_recursively`
+    are matched, so the files excluded from the recursive check are
+    excluded here as well.
+    """
+    path: str = dir_path.replace('\\', '/')
+    relative_path: str = os.path.relpath(file_path, dir_path)
+    for name in relative_path.replace('\\', '/').split('/'):
+        path = os.path.join(path, name).replace('\\', '/')
+        if exclude_pattern.match(name) or exclude_pattern.match(path):
+            return True
+    return False
+
+
+def _run_git_command(arg_list: List[str], cwd: str) -> str:
+    """
+    Run the git command and get the standard output.
+
+    Parameters
+    ----------
+    arg_list : list of str
+        A list of the git command arguments.
+    cwd : str
+        The directory path to run the command.
+
+    Returns
+    -------
+    stdout_str : str
+        The standard output string.
+
+    Raises
+    ------
+    Exception
+        If the git command is not found or failed.
+    """
+    try:
+        completed_process: subprocess.CompletedProcess = subprocess.run(
+            ['git', '-c', 'core.quotePath=false'] + arg_list, cwd=cwd,
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            universal_newlines=True)
+    except OSError as e:
+        err_msg: str = f'The git command could not be executed: {e}'
+        raise Exception(err_msg)
+    if completed_process.returncode != 0:
+        err_msg = 'The git command failed: %s' \
+            % completed_process.stderr.strip()
+        raise Exception(err_msg)
+    return completed_process.stdout
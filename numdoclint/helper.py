@@ -1,8 +1,15 @@
 """A module that defines common helper functions etc.
 """
 
+import fnmatch
+import functools
+import os
 import re
-from typing import Dict, List, Match, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import (Any, Callable, Dict, Iterator, List, Match, Optional,
+                    Pattern, Tuple)
+
+from numdoclint import profiler
 
 ARGS_OR_KWARGS_NAME_LIST: List[str] = [
     '*args',
@@ -24,11 +31,87 @@ ADDITIONAL_INFO_PREFIX_LIST: List[str] = [
     '.. versionchanged',
 ]
 
+DEFAULT_EXCLUDE_DIR_NAME_LIST: List[str] = [
+    '.git',
+    '.hg',
+    '.svn',
+    '.tox',
+    '.nox',
+    '.venv',
+    'venv',
+    '__pycache__',
+    '.mypy_cache',
+    '.pytest_cache',
+    '.ipynb_checkpoints',
+    'node_modules',
+]
+
+_VIRTUALENV_MARKER_FILE_NAME: str = 'pyvenv.cfg'
+
+_CHUNK_NUM_PER_JOB: int = 4
+
+_FUNC_DEF_PATTERN: Pattern = re.compile(pattern=r'def .*?\(.*?\)')
+
+_STR_OR_COMMENT_START_PATTERN: Pattern = re.compile(
+    pattern=r'(?P<comment>#[^\n]*)'
+            r'|(?P<prefix>\b[rRbBuUfF]{1,2})?'
+            r'(?P<quote>\'\'\'|"""|\'|")')
+
+_STR_START_CHARS: str = '\'"rRbBuUfF'
+
+_STR_BODY_PATTERN_DICT: Dict[str, Pattern] = {
+    "'": re.compile(
+        pattern=r"[^'\\]*(?:\\.[^'\\]*)*(?:'|\Z)", flags=re.DOTALL),
+    '"': re.compile(
+        pattern=r'[^"\\]*(?:\\.[^"\\]*)*(?:"|\Z)', flags=re.DOTALL),
+    "'''": re.compile(
+        pattern=r"[^'\\]*(?:(?:\\.|'(?!''))[^'\\]*)*(?:'''|\Z)",
+        flags=re.DOTALL),
+    '"""': re.compile(
+        pattern=r'[^"\\]*(?:(?:\\.|"(?!""))[^"\\]*)*(?:"""|\Z)',
+        flags=re.DOTALL),
+}
+
+_DOUBLE_QUOTE_DOCSTRING_PATTERN: Pattern = re.compile(
+    pattern=r'""".*?"""', flags=re.DOTALL)
+_SINGLE_QUOTE_DOCSTRING_PATTERN: Pattern = re.compile(
+    pattern=r"'''.*?'''", flags=re.DOTALL)
+_INDENT_PATTERN: Pattern = re.compile(pattern=r'^    ', flags=re.MULTILINE)
+_RETURN_PREFIX_PATTERN: Pattern = re.compile(pattern=r'^.*return')
+
+# The patterns of a single function (e.g., `def sample_func`) are
+# compiled once per function name and reused by the facts of the
+# function instead of being looked up in the small cache of the `re`
+# module on every call. The oldest pattern is dropped at the limit.
+FUNC_PATTERN_CACHE_NAME: str = 'func_pattern'
+_FUNC_PATTERN_CACHE_MAX_SIZE: int = 4096
+_func_pattern_dict: Dict[str, Pattern] = {}
+
 
 def read_file_str(file_path: str) -> str:
     """
     Read the target file string.
 
+    Parameters
+    ----------
+    file_path : str
+        Path of target file.
+
+    Returns
+    -------
+    file_str : str
+        The target string read.
+    """
+    file_str: str = profiler.call_with_time(
+        profile_key=profiler.PROFILE_KEY_PHASE, name=profiler.PHASE_READ,
+        func=lambda: _read_text(file_path=file_path))
+    return file_str
+
+
+def _read_text(file_path: str) -> str:
+    """
+    Read the target file string with the UTF-8 encoding.
+
     Parameters
     ----------
     file_path : str
@@ -44,6 +127,200 @@ def read_file_str(file_path: str) -> str:
     return file_str
 
 
+def get_file_path_list_recursively(
+        dir_path: str, extension: str,
+        exclude_pattern_list: List[str] = []) -> List[str]:
+    """
+    Get a list of the file paths with the target extension under
+    the directory.
+
+    Parameters
+    ----------
+    dir_path : str
+        Target directory path.
+    extension : str
+        Target file extension (e.g., `.py`).
+    exclude_pattern_list : list of str, default []
+        A list of the glob patterns of the directory and file paths
+        to exclude, in addition to `DEFAULT_EXCLUDE_DIR_NAME_LIST`.
+
+    Returns
+    -------
+    file_path_list : list of str
+        A list of the file paths. The order is the same as the
+        order of the directory traversal.
+    """
+    file_path_list: List[str] = list(iter_file_path_recursively(
+        dir_path=dir_path, extension=extension,
+        exclude_pattern_list=exclude_pattern_list))
+    return file_path_list
+
+
+def iter_file_path_recursively(
+        dir_path: str, extension: str,
+        exclude_pattern_list: List[str] = []) -> Iterator[str]:
+    """
+    Yield the file paths with the target extension under the
+    directory in the order of the directory traversal.
+
+    Parameters
+    ----------
+    dir_path : str
+        Target directory path.
+    extension : str
+        Target file extension (e.g., `.py`).
+    exclude_pattern_list : list of str, default []
+        A list of the glob patterns of the directory and file paths
+        to exclude (e.g., `build`, `*/migrations`, `*_pb2.py`). Each
+        pattern is matched against both the name and the path. The
+        excluded directories are not entered.
+
+    Yields
+    ------
+    file_path : str
+        The path of the file.
+
+    Notes
+    -----
+    The directories in `DEFAULT_EXCLUDE_DIR_NAME_LIST` and the
+    virtual environments (directories containing `pyvenv.cfg`) are
+    always excluded. The directory tree is walked iteratively with
+    `os.scandir`, and the file types cached in the directory entries
+    are used instead of calling stat for each path.
+    """
+    exclude_pattern: Optional[Pattern] = _get_exclude_pattern(
+        exclude_pattern_list=exclude_pattern_list)
+    dir_path = dir_path.replace('\\', '/')
+    entry_iter_stack: List[Iterator[os.DirEntry]] = [
+        iter(_scan_dir(dir_path=dir_path))]
+    while entry_iter_stack:
+        entry: Optional[os.DirEntry] = next(entry_iter_stack[-1], None)
+        if entry is None:
+            entry_iter_stack.pop()
+            continue
+        path: str = entry.path.replace('\\', '/')
+        if exclude_pattern is not None and (
+                exclude_pattern.match(entry.name)
+                or exclude_pattern.match(path)):
+            continue
+        if entry.is_dir():
+            if entry.name in DEFAULT_EXCLUDE_DIR_NAME_LIST:
+                continue
+            entry_list: List[os.DirEntry] = _scan_dir(dir_path=path)
+            if any(sub_entry.name == _VIRTUALENV_MARKER_FILE_NAME
+                   for sub_entry in entry_list):
+                continue
+            entry_iter_stack.append(iter(entry_list))
+            continue
+        if not entry.name.endswith(extension):
+            continue
+        yield path
+
+
+def _scan_dir(dir_path: str) -> List[os.DirEntry]:
+    """
+    Get a list of the entries of the directory.
+
+    Parameters
+    ----------
+    dir_path : str
+        Target directory path.
+
+    Returns
+    -------
+    entry_list : list of os.DirEntry
+        A list of the entries in the order of `os.scandir`.
+    """
+    with os.scandir(dir_path) as entry_iter:
+        entry_list: List[os.DirEntry] = list(entry_iter)
+    return entry_list
+
+
+def _get_exclude_pattern(
+        exclude_pattern_list: List[str]) -> Optional[Pattern]:
+    """
+    Get the compiled pattern matching any of the glob patterns
+    to exclude.
+
+    Parameters
+    ----------
+    exclude_pattern_list : list of str
+        A list of the glob patterns.
+
+    Returns
+    -------
+    exclude_pattern : Pattern or None
+        The compiled pattern. If the list is empty, None will be
+        returned.
+    """
+    if not exclude_pattern_list:
+        return None
+    exclude_pattern: Pattern = re.compile(pattern='|'.join(
+        '(?:%s)' % fnmatch.translate(glob_pattern.rstrip('/'))
+        for glob_pattern in exclude_pattern_list))
+    return exclude_pattern
+
+
+def get_jobs_num(jobs: int) -> int:
+    """
+    Get the number of processes to use.
+
+    Parameters
+    ----------
+    jobs : int
+        The specified number of jobs. If 0 or less is specified,
+        the number of CPUs will be used.
+
+    Returns
+    -------
+    jobs_num : int
+        The number of processes (1 or more).
+    """
+    if jobs > 0:
+        return jobs
+    return os.cpu_count() or 1
+
+
+def map_in_order(
+        func: Callable[[str], Any], path_list: List[str],
+        jobs: int) -> Iterator[Any]:
+    """
+    Apply the function to each path, in parallel processes if
+    needed, and yield the results in the order of the paths.
+
+    Parameters
+    ----------
+    func : Callable
+        A picklable function (e.g., a module-level function or its
+        `functools.partial`) that accepts one path.
+    path_list : list of str
+        A list of target paths.
+    jobs : int
+        The number of processes. If 1 is specified, the function will
+        be applied in the current process. If 0 or less is specified,
+        the number of CPUs will be used.
+
+    Yields
+    ------
+    result : Any
+        The result of each path.
+
+    Notes
+    -----
+    The paths are submitted to the process pool in chunks to reduce
+    the inter-process communication.
+    """
+    jobs_num: int = get_jobs_num(jobs=jobs)
+    if jobs_num == 1 or len(path_list) <= 1:
+        yield from map(func, path_list)
+        return
+    jobs_num = min(jobs_num, len(path_list))
+    chunk_size: int = max(
+        1, len(path_list) // (jobs_num * _CHUNK_NUM_PER_JOB))
+    with ProcessPoolExecutor(max_workers=jobs_num) as executor:
+        yield from executor.map(func, path_list, chunksize=chunk_size)
+
+
 def get_func_name_list(code_str: str) -> List[str]:
     """
     Get a list of function names in the Python module.
@@ -58,13 +335,14 @@ def get_func_name_list(code_str: str) -> List[str]:
     func_name_list : list of str
         List containing function names.
     """
-    code_str = _remove_strs(code_str=code_str)
+    code_str = profiler.call_with_time(
+        profile_key=profiler.PROFILE_KEY_PHASE,
+        name=profiler.PHASE_REMOVE_STRS,
+        func=lambda: _remove_strs(code_str=code_str))
     code_str = code_str.replace('\n', '')
-    search_pattern: str = r'def .*?\(.*?\)'
-    searched_result_list: List[str] = re.findall(
-        pattern=search_pattern, string=code_str)
     func_name_list: List[str] = []
-    for searched_result_str in searched_result_list:
+    for match in _FUNC_DEF_PATTERN.finditer(code_str):
+        searched_result_str: str = match.group(0)
         func_name: str = searched_result_str.replace('def ', '')
         func_name = func_name.split('(')[0]
         not_func_str: bool = False
@@ -74,9 +352,16 @@ def get_func_name_list(code_str: str) -> List[str]:
                 break
         if not_func_str:
             continue
-        match: Optional[Match] = _get_func_match(
-            py_module_str=code_str, func_name=func_name)
-        if match is None:
+        # Validate the hit at its own offset instead of searching the
+        # whole module again for each function name.
+        def_idx: int = match.start() + searched_result_str.rfind(
+            'def ', 0, searched_result_str.index('('))
+        if not code_str.startswith(f'def {func_name}(', def_idx):
+            continue
+        is_interactive_shell_example_line_: bool = \
+            is_interactive_shell_example_line(
+                func_start_index=def_idx, py_module_str=code_str)
+        if is_interactive_shell_example_line_:
             continue
         func_name_list.append(func_name)
     return func_name_list
@@ -95,87 +380,106 @@ def _remove_strs(*, code_str: str) -> str:
     -------
     result_code_str : str
         A result code string.
-    """
-    is_quoted_area: bool = False
-    quote_str: str = ''
-    result_code_str: str = ''
-    for i, char in enumerate(code_str):
-        prev_char: str = _get_prev_char(code_str=code_str, index=i)
-        following_3_chars: str = _get_following_3_chars(
-            code_str=code_str, index=i)
-        if prev_char == '\\':
-            result_code_str += char
-            continue
-
-        if is_quoted_area:
-            if char == quote_str or following_3_chars == quote_str:
-                quote_str = ''
-                is_quoted_area = False
-            continue
 
-        if following_3_chars == "'''":
-            is_quoted_area = True
-            quote_str = "'''"
-            continue
-        if following_3_chars == '"""':
-            is_quoted_area = True
-            quote_str = '"""'
-            continue
-        if char == "'" or char == '"':
-            is_quoted_area = True
-            quote_str = char
+    Notes
+    -----
+    - String literals are removed together with their prefixes
+        (e.g., `r`, `b` or `f`). Raw strings, escaped backslashes
+        and strings nested in f-string replacement fields are
+        supported.
+    - Quotes in comments do not start string literals.
+    - An unterminated string literal is removed up to the end of
+        the code string.
+    """
+    result_str_list: List[str] = []
+    current_idx: int = 0
+    while True:
+        match: Optional[Match] = _STR_OR_COMMENT_START_PATTERN.search(
+            code_str, current_idx)
+        if match is None:
+            break
+        if match.group('comment') is not None:
+            result_str_list.append(code_str[current_idx:match.end()])
+            current_idx = match.end()
             continue
-
-        result_code_str += char
+        result_str_list.append(code_str[current_idx:match.start()])
+        current_idx = _get_str_end_idx(code_str=code_str, match=match)
+    result_str_list.append(code_str[current_idx:])
+    result_code_str: str = ''.join(result_str_list)
     return result_code_str
 
 
-def _get_prev_char(*, code_str: str, index: int) -> str:
-    """
-    Get a previous index's character in a code string.
-
-    Parameters
-    ----------
-    code_str : str
-        A target code string.
-    index : int
-        A target index. This interface returns a blank string
-        if a specified index is zero.
-
-    Returns
-    -------
-    char : str
-        A target character.
-    """
-    if index == 0:
-        return ''
-    return code_str[index - 1]
-
-
-def _get_following_3_chars(*, code_str: str, index: int) -> str:
+def _get_str_end_idx(*, code_str: str, match: Match) -> int:
     """
-    Get following characters (including a specified index)
-    from a code string.
+    Get the index just after the closing quote of a string literal.
 
     Parameters
     ----------
     code_str : str
         A target code string.
-    index : int
-        A target index.
+    match : Match
+        The match object of the string literal's prefix and
+        opening quote.
 
     Returns
     -------
-    three_chars : str
-        An extracted three characters.
+    end_idx : int
+        The index just after the closing quote. If the string
+        literal is not terminated, the length of the code string
+        will be set.
     """
+    quote_str: str = match.group('quote')
+    prefix: str = (match.group('prefix') or '').lower()
+    body_match: Match = _STR_BODY_PATTERN_DICT[quote_str].match(
+        code_str, match.end())  # type: ignore
+    if 'f' not in prefix:
+        return body_match.end()
+    body_str: str = body_match.group()
+    if body_str.count('{') == body_str.count('}'):
+        return body_match.end()
+
+    # A quote in an unclosed replacement field (e.g., f"{d["key"]}").
+    is_raw_str: bool = 'r' in prefix
     str_len: int = len(code_str)
-    three_chars: str = code_str[index]
-    if index + 1 < str_len:
-        three_chars += code_str[index + 1]
-    if index + 2 < str_len:
-        three_chars += code_str[index + 2]
-    return three_chars
+    brace_depth: int = 0
+    idx: int = match.end()
+    while idx < str_len:
+        char: str = code_str[idx]
+        if char == '\\':
+            if not is_raw_str and code_str.startswith('\\N{', idx):
+                idx = code_str.find('}', idx)
+                if idx == -1:
+                    return str_len
+                idx += 1
+                continue
+            if code_str.startswith('{', idx + 1):
+                idx += 1
+                continue
+            idx += 2
+            continue
+        if brace_depth == 0:
+            if code_str.startswith(quote_str, idx):
+                return idx + len(quote_str)
+            if code_str.startswith('{{', idx):
+                idx += 2
+                continue
+            if char == '{':
+                brace_depth = 1
+            idx += 1
+            continue
+        if char == '{':
+            brace_depth += 1
+        elif char == '}':
+            brace_depth -= 1
+        elif char in _STR_START_CHARS:
+            nested_match: Optional[Match] = \
+                _STR_OR_COMMENT_START_PATTERN.match(code_str, idx)
+            if nested_match is not None \
+                    and nested_match.group('quote') is not None:
+                idx = _get_str_end_idx(code_str=code_str, match=nested_match)
+                continue
+        idx += 1
+    return str_len
 
 
 def _get_args_str(code_str: str, func_name: str) -> str:
@@ -194,11 +498,10 @@ def _get_args_str(code_str: str, func_name: str) -> str:
     args_str : str
         String of arguments. e.g., 'location_id, price=100'
     """
-    search_pattern: str = f'def {func_name}'
-    search_pattern = search_pattern + r'.*?\(.*?\)'
-    code_str = re.sub(pattern=r'\n', repl='', string=code_str)
-    searched_result_list: List[str] = re.findall(
-        pattern=search_pattern, string=code_str)
+    search_pattern: Pattern = get_func_pattern(
+        pattern_str=f'def {func_name}' + r'.*?\(.*?\)')
+    code_str = code_str.replace('\n', '')
+    searched_result_list: List[str] = search_pattern.findall(code_str)
     searched_result_str: str = ''
     for searched_str_unit in searched_result_list:
         searched_func_name: str = searched_str_unit.split('(')[0]
@@ -243,6 +546,30 @@ def get_arg_name_list(
     """
     args_str: str = _get_args_str(
         code_str=py_module_str, func_name=func_name)
+    arg_name_list: List[str] = get_arg_name_list_from_args_str(
+        args_str=args_str, exclude_ignoring_args=exclude_ignoring_args)
+    return arg_name_list
+
+
+def get_arg_name_list_from_args_str(
+        args_str: str,
+        exclude_ignoring_args: Optional[bool] = True) -> List[str]:
+    """
+    Get a list of argument names from the string of the arguments.
+
+    Parameters
+    ----------
+    args_str : str
+        String of arguments. e.g., 'location_id, price=100'
+    exclude_ignoring_args : bool, default True
+        Whether to exclude the argument of the ignoring argument
+        name setting.
+
+    Returns
+    -------
+    arg_name_list : list of str
+        List of argument names.
+    """
     args_str = _remove_type_bracket_block_from_args_str(args_str=args_str)
     splitted_arg_name_list: List[str] = args_str.split(',')
     arg_name_list: List[str] = []
@@ -423,15 +750,11 @@ def get_func_overall_docstring(
 
     docstring: str = ''
     if double_quote_doc_exists:
-        match = re.search(
-            pattern=r'""".*?"""',
-            string=func_str, flags=re.DOTALL)
+        match = _DOUBLE_QUOTE_DOCSTRING_PATTERN.search(func_str)
         docstring = match.group()
         docstring = docstring.replace('"""', '')
     elif single_quote_doc_exists:
-        match = re.search(
-            pattern=r"'''.*?'''",
-            string=func_str, flags=re.DOTALL)
+        match = _SINGLE_QUOTE_DOCSTRING_PATTERN.search(func_str)
         docstring = match.group()
         docstring = docstring.replace("'''", '')
     docstring = docstring.strip()
@@ -457,7 +780,9 @@ def is_end_of_signature(line_str: str) -> bool:
 
     Returns
     -------
-    bool
+    result_bool : bool
+        If the line is the end of a function signature (e.g., `):`
+        or `) -> int:`), True will be set.
     """
 
     try:
@@ -508,8 +833,8 @@ def _get_func_match(py_module_str: str, func_name: str) -> Optional[Match]:
     match : Match or None
         Search result. If not found, None will be set.
     """
-    pattern: str = f'def {func_name}'
-    for match in re.finditer(pattern=pattern, string=py_module_str):
+    pattern: Pattern = get_func_pattern(pattern_str=f'def {func_name}')
+    for match in pattern.finditer(py_module_str):
         match_start_idx: int = match.start()
         match_end_idx: int = match.end()
 
@@ -530,6 +855,35 @@ def _get_func_match(py_module_str: str, func_name: str) -> Optional[Match]:
     return None
 
 
+def get_func_pattern(pattern_str: str) -> Pattern:
+    """
+    Get the compiled pattern of a single function. The pattern is
+    compiled only at the first call and the hit or miss is added to
+    the profiling stats (if the measurement is enabled).
+
+    Parameters
+    ----------
+    pattern_str : str
+        The pattern string including the function name (e.g.,
+        `def sample_func`).
+
+    Returns
+    -------
+    pattern : Pattern
+        The compiled pattern.
+    """
+    pattern: Optional[Pattern] = _func_pattern_dict.get(pattern_str)
+    profiler.add_cache_result(
+        cache_name=FUNC_PATTERN_CACHE_NAME, is_hit=pattern is not None)
+    if pattern is not None:
+        return pattern
+    while len(_func_pattern_dict) >= _FUNC_PATTERN_CACHE_MAX_SIZE:
+        del _func_pattern_dict[next(iter(_func_pattern_dict))]
+    pattern = re.compile(pattern=pattern_str)
+    _func_pattern_dict[pattern_str] = pattern
+    return pattern
+
+
 def is_interactive_shell_example_line(
         func_start_index: int, py_module_str: str) -> bool:
     """
@@ -580,9 +934,7 @@ def _set_docstring_indent_number_to_one(
     if indent_num == 1:
         return docstring
     while indent_num > 1:
-        docstring = re.sub(
-            pattern=r'^    ', repl='', string=docstring,
-            flags=re.MULTILINE)
+        docstring = _INDENT_PATTERN.sub('', docstring)
         indent_num -= 1
     return docstring
 
@@ -592,6 +944,366 @@ DOC_PARAM_INFO_KEY_TYPE_NAME: str = 'type_name'
 DOC_PARAM_INFO_KEY_DEFAULT_VAL: str = 'default_value'
 DOC_PARAM_INFO_KEY_DESCRIPTION: str = 'description'
 
+_PARAM_SECTION_HEADER_LINE: str = '    Parameters'
+
+
+class Docstring:
+    """
+    The NumPy style docstring parsed in a single pass over its lines.
+    The attributes can not be reassigned, so that one parsed object
+    can be shared by all checks of the same docstring.
+
+    Parameters
+    ----------
+    docstring : str
+        Target docstring string. The indent is expected to be set
+        to one (see `get_func_overall_docstring`).
+
+    Attributes
+    ----------
+    docstring : str
+        Target docstring string.
+    line_splitted_list : tuple of str
+        The docstring's strings separated by line.
+    section_dict : dict
+        A dictionary with the section names (e.g., 'Parameters' or
+        'Returns') as keys and the line index ranges of the section
+        bodies as values. Each range is a tuple of the start index
+        and the end index (exclusive, the header line of the next
+        section). If the same name appears more than once, the first
+        section will be set.
+    description : str
+        Description of the function.
+    param_docstring : str
+        Argument part docstring.
+    splitted_param_doc_list : tuple of str
+        The argument part split into each argument.
+    param_info_list : tuple of dicts
+        Argument information. The keys are the same as the
+        `get_docstring_param_info_list`.
+    optional_arg_name_list : tuple of str
+        Argument names specified as optional.
+    return_value_docstring : str
+        Return value part docstring without additional information
+        (e.g., versionadded).
+    return_val_info_list : tuple of dicts
+        Return value information. The keys are the same as the
+        `get_docstring_return_val_info_list`.
+    """
+
+    __slots__: Tuple[str, ...] = (
+        'docstring', 'line_splitted_list', 'section_dict', 'description',
+        'param_docstring', 'splitted_param_doc_list', 'param_info_list',
+        'optional_arg_name_list', 'return_value_docstring',
+        'return_val_info_list',
+    )
+
+    docstring: str
+    line_splitted_list: Tuple[str, ...]
+    section_dict: Dict[str, Tuple[int, int]]
+    description: str
+    param_docstring: str
+    splitted_param_doc_list: Tuple[str, ...]
+    param_info_list: Tuple[Dict[str, str], ...]
+    optional_arg_name_list: Tuple[str, ...]
+    return_value_docstring: str
+    return_val_info_list: Tuple[Dict[str, str], ...]
+
+    def __init__(self, docstring: str) -> None:
+        line_splitted_list: Tuple[str, ...] = tuple(docstring.split('\n'))
+        hyphen_line_idx_list: List[int] = []
+        param_header_line_idx: int = -1
+        for i, line_str in enumerate(line_splitted_list):
+            if line_str == _PARAM_SECTION_HEADER_LINE:
+                if param_header_line_idx == -1:
+                    param_header_line_idx = i
+                continue
+            if '----' in line_str:
+                hyphen_line_idx_list.append(i)
+
+        section_dict: Dict[str, Tuple[int, int]] = {}
+        for i, hyphen_line_idx in enumerate(hyphen_line_idx_list):
+            if hyphen_line_idx == 0:
+                continue
+            section_name: str = \
+                line_splitted_list[hyphen_line_idx - 1].strip()
+            end_line_idx: int = len(line_splitted_list)
+            if i + 1 < len(hyphen_line_idx_list):
+                end_line_idx = hyphen_line_idx_list[i + 1] - 1
+            section_dict.setdefault(
+                section_name, (hyphen_line_idx + 1, end_line_idx))
+
+        param_line_list: List[str] = _get_param_line_list(
+            line_splitted_list=line_splitted_list,
+            hyphen_line_idx_list=hyphen_line_idx_list,
+            param_header_line_idx=param_header_line_idx)
+        splitted_param_doc_list: List[str] = _split_param_line_list(
+            param_line_list=param_line_list)
+        param_info_list: List[Dict[str, str]] = []
+        optional_arg_name_list: List[str] = []
+        if docstring != '' and _parameters_exists_in_docstring(
+                docstring=docstring):
+            for splitted_param_doc in splitted_param_doc_list:
+                arg_name: str = _get_docstring_var_name(
+                    var_doc=splitted_param_doc)
+                param_info_list = _append_param_info_to_list(
+                    param_info_list=param_info_list,
+                    arg_name=arg_name,
+                    type_name=_get_docstring_type_name(
+                        var_doc=splitted_param_doc),
+                    default_val=_get_docstring_default_value(
+                        var_doc=splitted_param_doc),
+                    description=_get_docstring_var_description(
+                        var_doc=splitted_param_doc))
+                if 'optional' in splitted_param_doc.split('\n')[0]:
+                    optional_arg_name_list.append(arg_name)
+
+        return_value_docstring: str = ''
+        return_span: Optional[Tuple[int, int]] = _get_return_value_span(
+            line_splitted_list=line_splitted_list,
+            hyphen_line_idx_list=hyphen_line_idx_list)
+        if docstring != '' and return_span is not None:
+            return_value_docstring = _join_return_value_lines(
+                line_list=line_splitted_list[
+                    return_span[0]:return_span[1]],
+                drop_additional_info=True)
+
+        set_attr: Callable[[str, Any], None] = functools.partial(
+            object.__setattr__, self)
+        set_attr('docstring', docstring)
+        set_attr('line_splitted_list', line_splitted_list)
+        set_attr('section_dict', section_dict)
+        set_attr('description', _get_description_from_lines(
+            line_splitted_list=line_splitted_list,
+            hyphen_line_idx_list=hyphen_line_idx_list))
+        set_attr('param_docstring', '\n'.join(param_line_list))
+        set_attr('splitted_param_doc_list', tuple(splitted_param_doc_list))
+        set_attr('param_info_list', tuple(param_info_list))
+        set_attr('optional_arg_name_list', tuple(optional_arg_name_list))
+        set_attr('return_value_docstring', return_value_docstring)
+        set_attr('return_val_info_list', tuple(
+            _get_return_val_info_list_from_str(
+                return_value_docstring=return_value_docstring)))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Reject the reassignment of the attributes.
+
+        Parameters
+        ----------
+        name : str
+            Target attribute name.
+        value : *
+            The value to set.
+
+        Raises
+        ------
+        AttributeError
+            Always, because the parsed docstring is read-only.
+        """
+        raise AttributeError(f'Docstring is read-only: {name}')
+
+
+@functools.lru_cache(maxsize=256)
+def parse_docstring(docstring: str) -> Docstring:
+    """
+    Parse the docstring. The parsed objects of the recent docstrings
+    are cached, so that the helpers that read the different parts
+    of the same docstring parse it only once.
+
+    Parameters
+    ----------
+    docstring : str
+        Target docstring string.
+
+    Returns
+    -------
+    parsed_docstring : Docstring
+        The parsed docstring.
+    """
+    return Docstring(docstring=docstring)
+
+
+def _get_description_from_lines(
+        line_splitted_list: Tuple[str, ...],
+        hyphen_line_idx_list: List[int]) -> str:
+    """
+    Get the string of the function's description from the lines
+    before the first section.
+
+    Parameters
+    ----------
+    line_splitted_list : tuple of str
+        The docstring's strings separated by line.
+    hyphen_line_idx_list : list of int
+        The indexes of the lines that contain hyphens.
+
+    Returns
+    -------
+    func_description : str
+        Description of the function in docstring.
+    """
+    if line_splitted_list == ('',):
+        return ''
+    last_line_num: int = len(line_splitted_list)
+    if hyphen_line_idx_list:
+        last_line_num = hyphen_line_idx_list[0] - 1
+    if last_line_num <= 0:
+        return ''
+    func_description: str = '\n'.join(line_splitted_list[:last_line_num])
+    func_description = func_description.strip()
+    if func_description.replace(' ', '') == '':
+        return ''
+    if not func_description.startswith('    '):
+        func_description = '    %s' % func_description
+    return func_description
+
+
+def _get_param_line_list(
+        line_splitted_list: Tuple[str, ...],
+        hyphen_line_idx_list: List[int],
+        param_header_line_idx: int) -> List[str]:
+    """
+    Get the lines of the argument part.
+
+    Parameters
+    ----------
+    line_splitted_list : tuple of str
+        The docstring's strings separated by line.
+    hyphen_line_idx_list : list of int
+        The indexes of the lines that contain hyphens.
+    param_header_line_idx : int
+        The index of the first `Parameters` line. -1 if the line
+        does not exist.
+
+    Returns
+    -------
+    param_line_list : list of str
+        The lines between the hyphens of the `Parameters` section
+        and the header of the next section. The blank lines are
+        removed except the last line of the docstring.
+    """
+    if param_header_line_idx == -1:
+        return []
+    start_line_idx: int = -1
+    end_line_idx: int = len(line_splitted_list)
+    for hyphen_line_idx in hyphen_line_idx_list:
+        if hyphen_line_idx < param_header_line_idx:
+            continue
+        if start_line_idx == -1:
+            start_line_idx = hyphen_line_idx + 1
+            continue
+        end_line_idx = hyphen_line_idx
+        break
+    if start_line_idx == -1:
+        return []
+    section_line_list: List[str] = [
+        line_str for line_str in line_splitted_list[
+            start_line_idx:end_line_idx]
+        if line_str != _PARAM_SECTION_HEADER_LINE]
+    if not section_line_list:
+        return []
+    param_line_list: List[str] = [
+        line_str for line_str in section_line_list[:-1] if line_str != '']
+    if end_line_idx == len(line_splitted_list):
+        param_line_list.append(section_line_list[-1])
+    return param_line_list
+
+
+def _split_param_line_list(param_line_list: List[str]) -> List[str]:
+    """
+    Split the lines of the argument part into each argument.
+
+    Parameters
+    ----------
+    param_line_list : list of str
+        The lines of the argument part.
+
+    Returns
+    -------
+    splitted_param_doc_list : list of str
+        List of splitted arugment information.
+    """
+    single_param_doc: str = ''
+    splitted_param_doc_list: List[str] = []
+    for line_str in param_line_list:
+        indent_num: int = get_line_indent_num(line_str=line_str)
+        if indent_num == 1:
+            if single_param_doc.strip() != '':
+                splitted_param_doc_list.append(single_param_doc)
+            single_param_doc = ''
+        if single_param_doc != '':
+            single_param_doc += '\n'
+        single_param_doc += line_str
+    if single_param_doc.strip() != '':
+        splitted_param_doc_list.append(single_param_doc)
+    return splitted_param_doc_list
+
+
+def _get_return_value_span(
+        line_splitted_list: Tuple[str, ...],
+        hyphen_line_idx_list: List[int]) -> Optional[Tuple[int, int]]:
+    """
+    Get the line index range of the return value part.
+
+    Parameters
+    ----------
+    line_splitted_list : tuple of str
+        The docstring's strings separated by line.
+    hyphen_line_idx_list : list of int
+        The indexes of the lines that contain hyphens.
+
+    Returns
+    -------
+    return_span : tuple of int or None
+        The start index and the end index (exclusive) of the lines
+        after the hyphens of the first `Returns` section. The header
+        and the blank line of the next section are not included.
+        None if the section does not exist.
+    """
+    for i, hyphen_line_idx in enumerate(hyphen_line_idx_list):
+        if hyphen_line_idx == 0:
+            continue
+        if 'Returns' not in line_splitted_list[hyphen_line_idx - 1]:
+            continue
+        end_line_idx: int = len(line_splitted_list)
+        if i + 1 < len(hyphen_line_idx_list):
+            end_line_idx = hyphen_line_idx_list[i + 1] - 2
+        return hyphen_line_idx + 1, end_line_idx
+    return None
+
+
+def _join_return_value_lines(
+        line_list: Tuple[str, ...], drop_additional_info: bool) -> str:
+    """
+    Join the lines of the return value part.
+
+    Parameters
+    ----------
+    line_list : tuple of str
+        The lines of the return value part.
+    drop_additional_info : bool
+        Whether to drop additional information (e.g., versionadded).
+
+    Returns
+    -------
+    return_value_docstring : str
+        String of docstring return value information.
+    """
+    return_value_docstring: str = '\n'.join(line_list)
+    return_value_docstring = return_value_docstring.strip()
+    if drop_additional_info:
+        for additional_info_prefix in ADDITIONAL_INFO_PREFIX_LIST:
+            is_in: bool = additional_info_prefix in return_value_docstring
+            if not is_in:
+                continue
+            return_value_docstring = return_value_docstring.split(
+                additional_info_prefix)[0]
+            return_value_docstring = return_value_docstring.strip()
+    if not return_value_docstring.startswith('    '):
+        return_value_docstring = '    %s' % return_value_docstring
+    return return_value_docstring
+
 
 def get_docstring_param_info_list(docstring: str) -> List[Dict[str, str]]:
     """
@@ -614,27 +1326,9 @@ def get_docstring_param_info_list(docstring: str) -> List[Dict[str, str]]:
         - DOC_PARAM_INFO_KEY_DESCRIPTION : str -> Description of the
             argument.
     """
-    if docstring == '':
-        return []
-    if not _parameters_exists_in_docstring(docstring=docstring):
-        return []
-    splitted_param_doc_list: List[str] = get_splitted_param_doc_list(
-        docstring=docstring
-    )
-    param_info_list: List[Dict[str, str]] = []
-    for splitted_param_doc in splitted_param_doc_list:
-        arg_name: str = _get_docstring_var_name(var_doc=splitted_param_doc)
-        type_name: str = _get_docstring_type_name(var_doc=splitted_param_doc)
-        default_val: str = _get_docstring_default_value(
-            var_doc=splitted_param_doc)
-        description: str = _get_docstring_var_description(
-            var_doc=splitted_param_doc)
-        param_info_list = _append_param_info_to_list(
-            param_info_list=param_info_list,
-            arg_name=arg_name,
-            type_name=type_name,
-            default_val=default_val,
-            description=description)
+    param_info_list: List[Dict[str, str]] = [
+        dict(param_info_dict) for param_info_dict
+        in parse_docstring(docstring=docstring).param_info_list]
     return param_info_list
 
 
@@ -816,21 +1510,8 @@ def get_splitted_param_doc_list(docstring: str) -> List[str]:
     splitted_param_doc_list : list of str
         List of splitted arugment information.
     """
-    param_docstring: str = get_param_docstring(docstring=docstring)
-    line_splitted_param_doc_list: List[str] = param_docstring.split('\n')
-    single_param_doc: str = ''
-    splitted_param_doc_list: List[str] = []
-    for line_str in line_splitted_param_doc_list:
-        indent_num: int = get_line_indent_num(line_str=line_str)
-        if indent_num == 1:
-            if single_param_doc.strip() != '':
-                splitted_param_doc_list.append(single_param_doc)
-            single_param_doc = ''
-        if single_param_doc != '':
-            single_param_doc += '\n'
-        single_param_doc += line_str
-    if single_param_doc.strip() != '':
-        splitted_param_doc_list.append(single_param_doc)
+    splitted_param_doc_list: List[str] = list(
+        parse_docstring(docstring=docstring).splitted_param_doc_list)
     return splitted_param_doc_list
 
 
@@ -848,38 +1529,8 @@ def get_param_docstring(docstring: str) -> str:
     param_docstring : str
         Argument part docstring.
     """
-    param_part_started: bool = False
-    initial_hyphen_appeared: bool = False
-    line_splitted_docstring_list: List[str] = docstring.split('\n')
-    param_docstring: str = ''
-    pre_line_str: str = ''
-    second_hyphen_exists: bool = False
-    for line_str in line_splitted_docstring_list:
-        if line_str == '    Parameters':
-            param_part_started = True
-            continue
-        is_hyphen_line: bool = '----' in line_str
-        if (param_part_started
-                and not initial_hyphen_appeared
-                and is_hyphen_line):
-            initial_hyphen_appeared = True
-            continue
-        if not initial_hyphen_appeared:
-            continue
-        if is_hyphen_line:
-            second_hyphen_exists = True
-            break
-
-        if pre_line_str != '':
-            if param_docstring != '':
-                param_docstring += '\n'
-            param_docstring += pre_line_str
-        pre_line_str = line_str
-
-    if not second_hyphen_exists:
-        if param_docstring != '':
-            param_docstring += '\n'
-        param_docstring += pre_line_str
+    param_docstring: str = parse_docstring(
+        docstring=docstring).param_docstring
     return param_docstring
 
 
@@ -897,24 +1548,8 @@ def get_func_description_from_docstring(docstring: str) -> str:
     func_description : str
         Description of the function in docstring.
     """
-    if docstring == '':
-        return ''
-    last_line_num: int = 0
-    line_splitted_list: List[str] = docstring.split('\n')
-    for line_str in line_splitted_list:
-        is_hyphen_line: bool = '----' in line_str
-        if is_hyphen_line:
-            last_line_num -= 1
-            break
-        last_line_num += 1
-    if last_line_num <= 0:
-        return ''
-    func_description: str = '\n'.join(line_splitted_list[:last_line_num])
-    func_description = func_description.strip()
-    if func_description.replace(' ', '') == '':
-        return ''
-    if not func_description.startswith('    '):
-        func_description = '    %s' % func_description
+    func_description: str = parse_docstring(
+        docstring=docstring).description
     return func_description
 
 
@@ -944,6 +1579,28 @@ def get_arg_default_val_info_dict(
     """
     args_str: str = _get_args_str(
         code_str=py_module_str, func_name=func_name)
+    default_val_info_dict: Dict[str, str] = \
+        get_arg_default_val_info_dict_from_args_str(args_str=args_str)
+    return default_val_info_dict
+
+
+def get_arg_default_val_info_dict_from_args_str(
+        args_str: str) -> Dict[str, str]:
+    """
+    Get a dictionary containing information on default values
+    of arguments from the string of the arguments.
+
+    Parameters
+    ----------
+    args_str : str
+        String of arguments. e.g., 'location_id, price=100'
+
+    Returns
+    -------
+    default_val_info_dict : dict
+        A dctionary that stores argument names in keys and default
+        values in values.
+    """
     args_str = _remove_type_bracket_block_from_args_str(args_str=args_str)
     if args_str == '':
         return {}
@@ -1055,8 +1712,28 @@ def get_docstring_return_val_info_list(
         - DOC_RETURN_INFO_KEY_DESCRIPTION : str -> Description of
             the return value.
     """
-    return_value_docstring: str = _get_return_value_docstring(
-        docstring=docstring)
+    return_val_info_list: List[Dict[str, str]] = [
+        dict(return_val_info_dict) for return_val_info_dict
+        in parse_docstring(docstring=docstring).return_val_info_list]
+    return return_val_info_list
+
+
+def _get_return_val_info_list_from_str(
+        return_value_docstring: str) -> List[Dict[str, str]]:
+    """
+    Get a list of return value information from the return value
+    part of docstring.
+
+    Parameters
+    ----------
+    return_value_docstring : str
+        String of docstring return value information.
+
+    Returns
+    -------
+    return_val_info_list : list of dicts
+        List containing return value information.
+    """
     if return_value_docstring == '':
         return []
     line_splitted_list: List[str] = return_value_docstring.split('\n')
@@ -1218,52 +1895,22 @@ def _get_return_value_docstring(
     """
     if docstring == '':
         return ''
-    start_line_idx: int = 0
-    last_line_idx: int = 0
-    line_splitted_list: List[str] = docstring.split('\n')
-    for i, line_str in enumerate(line_splitted_list):
-        is_in: bool = 'Returns' in line_str
-        if not is_in:
-            continue
-        hyphens_exists_next_line: bool = _hyphens_exists_next_line(
-            line_splitted_list=line_splitted_list,
-            next_line_idx=i + 1)
-        if not hyphens_exists_next_line:
-            continue
-        start_line_idx = i + 2
-        break
-    if start_line_idx == 0:
-        return ''
-
-    second_hyphen_exists: bool = False
-    for i, line_str in enumerate(line_splitted_list):
-        if i < start_line_idx:
-            continue
-        last_line_idx = i
-        is_hyphen_line: bool = '----' in line_str
-        if not is_hyphen_line:
-            continue
-        last_line_idx -= 2
-        second_hyphen_exists = True
-        break
-    if not second_hyphen_exists:
-        last_line_idx += 1
-    docstring = '\n'.join(
-        line_splitted_list[start_line_idx:last_line_idx])
-    docstring = docstring.strip()
-
+    parsed_docstring: Docstring = parse_docstring(docstring=docstring)
     if drop_additional_info:
-        for additional_info_prefix in ADDITIONAL_INFO_PREFIX_LIST:
-            is_in = additional_info_prefix in docstring
-            if not is_in:
-                continue
-            docstring = docstring.split(additional_info_prefix)[0]
-            docstring = docstring.strip()
-
-    if not docstring.startswith('    '):
-        docstring = '    %s' % docstring
-
-    return docstring
+        return parsed_docstring.return_value_docstring
+    return_span: Optional[Tuple[int, int]] = _get_return_value_span(
+        line_splitted_list=parsed_docstring.line_splitted_list,
+        hyphen_line_idx_list=[
+            line_idx for line_idx, line_str
+            in enumerate(parsed_docstring.line_splitted_list)
+            if '----' in line_str])
+    if return_span is None:
+        return ''
+    return_value_docstring: str = _join_return_value_lines(
+        line_list=parsed_docstring.line_splitted_list[
+            return_span[0]:return_span[1]],
+        drop_additional_info=False)
+    return return_value_docstring
 
 
 def _hyphens_exists_next_line(
@@ -1383,8 +2030,7 @@ def return_val_exists_in_func(module_str: str, func_name: str) -> bool:
         return_statement_exists: bool = ' return ' in line_str
         if not return_statement_exists:
             continue
-        return_val_str: str = re.sub(
-            pattern=r'^.*return', repl='', string=line_str)
+        return_val_str: str = _RETURN_PREFIX_PATTERN.sub('', line_str)
         return_val_str = return_val_str.strip()
         if return_val_str == '':
             continue
@@ -1525,20 +2171,8 @@ def get_optional_arg_name_list(docstring: str) -> List[str]:
     optional_arg_name_list : list of str
         A list of argument names specified as optional.
     """
-    if docstring == '':
-        return []
-    if not _parameters_exists_in_docstring(docstring=docstring):
-        return []
-    splitted_param_doc_list: List[str] = get_splitted_param_doc_list(
-        docstring=docstring)
-    optional_arg_name_list: List[str] = []
-    for splitted_param_doc in splitted_param_doc_list:
-        first_line_str: str = splitted_param_doc.split('\n')[0]
-        optional_str_exists: bool = 'optional' in first_line_str
-        if not optional_str_exists:
-            continue
-        arg_name: str = _get_docstring_var_name(var_doc=splitted_param_doc)
-        optional_arg_name_list.append(arg_name)
+    optional_arg_name_list: List[str] = list(
+        parse_docstring(docstring=docstring).optional_arg_name_list)
     return optional_arg_name_list
 
 
@@ -1588,6 +2222,31 @@ def get_decorator_names(py_module_str: str, func_name: str) -> List[str]:
         line_splitted_list=line_splitted_list, func_name=func_name)
     if func_start_line_index == -1:
         return []
+    decorator_names: List[str] = get_decorator_names_by_line_index(
+        line_splitted_list=line_splitted_list,
+        func_start_line_index=func_start_line_index)
+    return decorator_names
+
+
+def get_decorator_names_by_line_index(
+        line_splitted_list: List[str],
+        func_start_line_index: int) -> List[str]:
+    """
+    Get a list of decorator names set in the function that starts
+    at the specified line.
+
+    Parameters
+    ----------
+    line_splitted_list : list of str
+        A list of strings separated by line.
+    func_start_line_index : int
+        The start line index of the target function.
+
+    Returns
+    -------
+    decorator_names : list of str
+        A list of decorator names.
+    """
     decorator_names: List[str] = []
     current_target_line_idx: int = func_start_line_index - 1
 
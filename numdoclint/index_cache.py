@@ -0,0 +1,180 @@
+"""A module that keeps the parsed indexes of Python modules in memory.
+
+The cache is disabled by default. While it is enabled, the index of a
+module (with the facts of the functions computed so far) is reused
+while the path, the modified time and the size of the file are not
+changed, so the repeated checks of the same file with different lint
+options do not read and parse the file again. The total size of the
+cached files is limited, and the least recently used indexes are
+discarded first.
+"""
+
+import os
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from numdoclint import helper, profiler
+from numdoclint.module_index import ModuleIndex, build_module_index
+
+DEFAULT_MAX_CACHE_BYTES: int = 64 * 1024 * 1024
+
+INDEX_CACHE_NAME: str = 'module_index'
+
+# The file state is held as (modified time in nanoseconds, size).
+_FileState = Tuple[int, int]
+
+_is_enabled: bool = False
+_max_cache_bytes: int = DEFAULT_MAX_CACHE_BYTES
+_total_bytes: int = 0
+_index_dict: 'OrderedDict[Tuple[str, str], Tuple[_FileState, ModuleIndex]]' \
+    = OrderedDict()
+
+
+def enable_index_cache(max_cache_bytes: int = DEFAULT_MAX_CACHE_BYTES) -> None:
+    """
+    Enable the in-memory cache of the module indexes.
+
+    Parameters
+    ----------
+    max_cache_bytes : int, default 67108864
+        The maximum total size of the cached files in bytes. The
+        least recently used indexes are discarded beyond this size.
+    """
+    global _is_enabled, _max_cache_bytes
+    _is_enabled = True
+    _max_cache_bytes = max_cache_bytes
+    _evict_index_cache()
+
+
+def disable_index_cache() -> None:
+    """
+    Disable the in-memory cache of the module indexes and discard
+    the cached indexes.
+    """
+    global _is_enabled
+    _is_enabled = False
+    clear_cache()
+
+
+def is_index_cache_enabled() -> bool:
+    """
+    Get whether the in-memory cache of the module indexes is enabled.
+
+    Returns
+    -------
+    result_bool : bool
+        True if the cache is enabled.
+    """
+    return _is_enabled
+
+
+def clear_cache() -> None:
+    """
+    Discard the module indexes cached in memory. The cache stays
+    enabled if it is enabled.
+    """
+    global _total_bytes
+    _index_dict.clear()
+    _total_bytes = 0
+
+
+def get_cache_size() -> int:
+    """
+    Get the total size of the files whose indexes are cached.
+
+    Returns
+    -------
+    total_bytes : int
+        The total size in bytes.
+    """
+    return _total_bytes
+
+
+def get_module_index(py_module_path: str, engine: str) -> ModuleIndex:
+    """
+    Get the index of the Python module, reading and parsing the file
+    only if its index is not cached or the file has been changed. If
+    the cache is disabled, the file is always read and parsed.
+
+    Parameters
+    ----------
+    py_module_path : str
+        Path of target module.
+    engine : str
+        The engine to extract functions' information.
+
+    Returns
+    -------
+    module_index : ModuleIndex
+        The index of the module. The same object is returned while
+        the file is not changed.
+
+    Raises
+    ------
+    ValueError
+        If an invalid engine is specified.
+
+    Notes
+    -----
+    The file state is got before the file is read, so a file changed
+    while it is read is read again at the next call.
+    """
+    global _total_bytes
+    if not _is_enabled:
+        return _read_module_index(py_module_path=py_module_path, engine=engine)
+    stat_result: os.stat_result = os.stat(py_module_path)
+    file_state: _FileState = (stat_result.st_mtime_ns, stat_result.st_size)
+    index_key: Tuple[str, str] = (py_module_path, engine)
+    cached_index: Optional[Tuple[_FileState, ModuleIndex]] = \
+        _index_dict.get(index_key)
+    is_hit: bool = cached_index is not None and cached_index[0] == file_state
+    profiler.add_cache_result(cache_name=INDEX_CACHE_NAME, is_hit=is_hit)
+    if cached_index is not None and is_hit:
+        _index_dict.move_to_end(index_key)
+        return cached_index[1]
+
+    module_index: ModuleIndex = _read_module_index(
+        py_module_path=py_module_path, engine=engine)
+    if cached_index is not None:
+        _total_bytes -= cached_index[0][1]
+    _index_dict[index_key] = (file_state, module_index)
+    _index_dict.move_to_end(index_key)
+    _total_bytes += file_state[1]
+    _evict_index_cache()
+    return module_index
+
+
+def _read_module_index(py_module_path: str, engine: str) -> ModuleIndex:
+    """
+    Read the Python module and build its index.
+
+    Parameters
+    ----------
+    py_module_path : str
+        Path of target module.
+    engine : str
+        The engine to extract functions' information.
+
+    Returns
+    -------
+    module_index : ModuleIndex
+        The built index.
+    """
+    module_str: str = helper.read_file_str(file_path=py_module_path)
+    module_index: ModuleIndex = profiler.call_with_time(
+        profile_key=profiler.PROFILE_KEY_PHASE, name=profiler.PHASE_INDEX,
+        func=lambda: build_module_index(
+            module_str=module_str, engine=engine))
+    return module_index
+
+
+def _evict_index_cache() -> None:
+    """
+    Discard the least recently used indexes until the total size of
+    the cached files is within the limit.
+    """
+    global _total_bytes
+    while _index_dict and _total_bytes > _max_cache_bytes:
+        file_state: _FileState
+        file_state, _ = _index_dict.popitem(last=False)[1]
+        _total_bytes -= file_state[1]
@@ -1,11 +1,16 @@
 """A module that checks docstring in Jupyter notebook.
 """
 
+import functools
 import json
+import mmap
 import os
-from typing import List
+import re
+from typing import Any, Callable, Dict, Iterator, List, Pattern, Tuple
 
-from numdoclint import helper, py_module
+from numdoclint import helper, output, profiler, py_module
+from numdoclint.module_index import (CombinedModuleIndex, FuncEntry,
+                                     ModuleIndex)
 
 INFO_KEY_NOTEBOOK_PATH: str = 'notebook_path'
 INFO_KEY_CODE_CELL_INDEX: str = 'code_cell_index'
@@ -16,12 +21,64 @@ INFO_KEY_INFO: str = py_module.INFO_KEY_INFO
 VERBOSE_ENABLED: int = py_module.VERBOSE_ENABLED
 VERBOSE_DISABLED: int = py_module.VERBOSE_DISABLED
 
+_JSON_WHITESPACE_PATTERN: Pattern = re.compile(pattern=rb'[ \t\n\r]*')
+_BACKSLASH_ORD: int = ord('\\')
+
+_SCAN_NOTEBOOK_MIN_SIZE: int = 1024 * 1024
+_JSON_STRUCT_CHAR_PATTERN: Pattern = re.compile(pattern=rb'[\[\]{}"]')
+_JSON_SCALAR_PATTERN: Pattern = re.compile(pattern=rb'[^,\]}\s]+')
+
+
+class NotebookLintResult(py_module._ResultRecord):
+    """
+    The check result of a function in a Jupyter notebook.
+
+    Parameters
+    ----------
+    func_name : str
+        Target function name.
+    info_id : int
+        Identification number of which information.
+    info : str
+        Information of check result.
+    notebook_path : str
+        Path of target Jupyter notebook.
+    code_cell_index : int
+        Notebook code cell index number (start with zero). Not
+        include markdown cells.
+    lineno : int, default 0
+        The line number in the code cell (starting from 1) of the
+        function's `def` statement. If unknown, 0 will be set.
+    end_lineno : int, default 0
+        The line number in the code cell of the last line of the
+        function's body. If unknown, 0 will be set.
+    """
+
+    __slots__: Tuple[str, ...] = (
+        'func_name', 'info_id', 'info', 'notebook_path', 'code_cell_index',
+        'lineno', 'end_lineno')
+    _KEY_TUPLE: Tuple[str, ...] = __slots__[:5]
+    _PATH_KEY: str = 'notebook_path'
+
+    def __init__(
+            self, func_name: str, info_id: int, info: str,
+            notebook_path: str, code_cell_index: int,
+            lineno: int = 0, end_lineno: int = 0) -> None:
+        self.func_name: str = func_name
+        self.info_id: int = info_id
+        self.info: str = info
+        self.notebook_path: str = notebook_path
+        self.code_cell_index: int = code_cell_index
+        self.lineno: int = lineno
+        self.end_lineno: int = end_lineno
+
 
 def check_jupyter_notebook(
         notebook_path: str, verbose: int = 1,
         ignore_func_name_prefix_list: List[str] = ['test_'],
         ignore_info_id_list: List[int] = [],
-        enable_default_or_optional_doc_check: bool = False) -> List[dict]:
+        enable_default_or_optional_doc_check: bool = False,
+        combine_code_cells: bool = False) -> List[NotebookLintResult]:
     """
     Check docstring of single Jupyter notebook.
 
@@ -45,10 +102,15 @@ def check_jupyter_notebook(
         docstring's argument needs to describe default or optional.
         e.g., `price : int, default is 100`, `price : int, default 100`,
         `price : int, optional`.
+    combine_code_cells : bool, default False
+        If True specified, the code cells are joined into one
+        virtual module and indexed at once instead of cell by
+        cell. Each of the functions with the same name in the
+        different cells is checked separately in both cases.
 
     Returns
     -------
-    info_list : list of dicts
+    info_list : list of NotebookLintResult
         A list containing information on check results.
         The following values are set in the dictionary key:
         - notebook_path : str -> Path of target Jupyter notebook.
@@ -69,32 +131,87 @@ def check_jupyter_notebook(
         return []
     _check_notebook_exists(notebook_path=notebook_path)
     _check_notebook_extension(notebook_path=notebook_path)
-    notebook_data_dict: dict = _read_notebook_data_dict(
-        notebook_path=notebook_path)
-    code_cell_str_list: List[str] = _get_code_cell_str_list(
-        notebook_data_dict=notebook_data_dict)
-    if not code_cell_str_list:
-        return []
-    info_list: List[dict] = []
-    enable_def_or_opt_check: bool = enable_default_or_optional_doc_check
+    info_list: List[NotebookLintResult] = profiler.call_with_time(
+        profile_key=profiler.PROFILE_KEY_FILE, name=notebook_path,
+        func=lambda: list(_iter_notebook_info(
+            notebook_path=notebook_path,
+            ignore_func_name_prefix_list=ignore_func_name_prefix_list,
+            ignore_info_id_list=ignore_info_id_list,
+            enable_default_or_optional_doc_check=(
+                enable_default_or_optional_doc_check),
+            combine_code_cells=combine_code_cells)))
+    _print_info_list(info_list=info_list, verbose=verbose)
+    return info_list
+
+
+def _iter_notebook_info(
+        notebook_path: str,
+        ignore_func_name_prefix_list: List[str],
+        ignore_info_id_list: List[int],
+        enable_default_or_optional_doc_check: bool,
+        combine_code_cells: bool = False
+        ) -> Iterator[NotebookLintResult]:
+    """
+    Check the code cells of the notebook one by one and yield the
+    check results of each function as soon as it is checked.
+
+    Parameters
+    ----------
+    notebook_path : str
+        Path of target Jupyter notebook.
+    ignore_func_name_prefix_list : list of str
+        A prefix list of function name conditions to ignore.
+    ignore_info_id_list : list of int
+        List of IDs to ignore lint checking.
+    enable_default_or_optional_doc_check : bool
+        If True specified, the `default` and `optional` string
+        in docstring will be checked.
+    combine_code_cells : bool, default False
+        If True specified, the code cells are joined into one
+        virtual module and indexed at once.
+
+    Yields
+    ------
+    info_dict : NotebookLintResult
+        A record of the check result. The following values are
+        set in the dictionary key:
+        - notebook_path : str
+        - code_cell_index : int
+        - func_name : str
+        - info_id : int
+        - info : str
+    """
+    code_cell_str_list: List[str] = profiler.call_with_time(
+        profile_key=profiler.PROFILE_KEY_PHASE, name=profiler.PHASE_READ,
+        func=lambda: _read_code_cell_str_list(notebook_path=notebook_path))
+    if combine_code_cells:
+        yield from _iter_combined_code_cell_info(
+            notebook_path=notebook_path,
+            code_cell_str_list=code_cell_str_list,
+            ignore_func_name_prefix_list=ignore_func_name_prefix_list,
+            ignore_info_id_list=ignore_info_id_list,
+            enable_default_or_optional_doc_check=(
+                enable_default_or_optional_doc_check))
+        return
     for i, code_cell_str in enumerate(code_cell_str_list):
-        info_list_unit: List[dict] = _check_unit_code_cell_str(
+        yield from _iter_unit_code_cell_info(
             notebook_path=notebook_path,
             code_cell_idx=i,
             code_cell_str=code_cell_str,
             ignore_func_name_prefix_list=ignore_func_name_prefix_list,
             ignore_info_id_list=ignore_info_id_list,
-            enable_default_or_optional_doc_check=enable_def_or_opt_check)
-        info_list.extend(info_list_unit)
-    _print_info_list(info_list=info_list, verbose=verbose)
-    return info_list
+            enable_default_or_optional_doc_check=(
+                enable_default_or_optional_doc_check))
 
 
 def check_jupyter_notebook_recursively(
         dir_path: str, verbose: int = 1,
         ignore_func_name_prefix_list: List[str] = ['test_'],
         ignore_info_id_list: List[int] = [],
-        enable_default_or_optional_doc_check: bool = False) -> List[dict]:
+        enable_default_or_optional_doc_check: bool = False,
+        jobs: int = 1,
+        exclude_pattern_list: List[str] = [],
+        combine_code_cells: bool = False) -> List[NotebookLintResult]:
     """
     Check docstring of Jupyter notebook recursively.
 
@@ -118,10 +235,25 @@ def check_jupyter_notebook_recursively(
         docstring's argument needs to describe default or optional.
         e.g., `price : int, default is 100`, `price : int, default 100`,
         `price : int, optional`.
+    jobs : int, default 1
+        The number of processes to check notebooks in parallel. If 0
+        or less is specified, the number of CPUs will be used. The
+        order of the results is the same as the order of a single
+        process.
+    exclude_pattern_list : list of str, default []
+        A list of the glob patterns of the directory and file paths
+        to exclude (e.g., `build`, `*/migrations`). The excluded
+        directories are not entered. The directories such as `.git`,
+        `__pycache__` and virtual environments are always excluded.
+    combine_code_cells : bool, default False
+        If True specified, the code cells are joined into one
+        virtual module and indexed at once instead of cell by
+        cell. Each of the functions with the same name in the
+        different cells is checked separately in both cases.
 
     Returns
     -------
-    info_list : list of dicts
+    info_list : list of NotebookLintResult
         A list containing information on check results.
         The following values are set in the dictionary key:
         - notebook_path : str -> Path of target Jupyter notebook.
@@ -132,21 +264,99 @@ def check_jupyter_notebook_recursively(
         - info : str -> Information of check result.
     """
     enable_def_or_opt_check: bool = enable_default_or_optional_doc_check
-    info_list: List[dict] = _check_jupyter_notebook_recursively(
+    info_list: List[NotebookLintResult] = _check_jupyter_notebook_recursively(
         dir_path=dir_path,
         info_list=[],
         verbose=verbose,
         ignore_func_name_prefix_list=ignore_func_name_prefix_list,
         ignore_info_id_list=ignore_info_id_list,
-        enable_default_or_optional_doc_check=enable_def_or_opt_check)
+        enable_default_or_optional_doc_check=enable_def_or_opt_check,
+        jobs=jobs, exclude_pattern_list=exclude_pattern_list,
+        combine_code_cells=combine_code_cells)
     return info_list
 
 
+def iter_check_jupyter_notebooks(
+        dir_path: str, verbose: int = 1,
+        ignore_func_name_prefix_list: List[str] = ['test_'],
+        ignore_info_id_list: List[int] = [],
+        enable_default_or_optional_doc_check: bool = False,
+        exclude_pattern_list: List[str] = [],
+        combine_code_cells: bool = False
+        ) -> Iterator[NotebookLintResult]:
+    """
+    Check docstring of Jupyter notebook recursively and yield each
+    check result as soon as each function is checked.
+
+    Parameters
+    ----------
+    dir_path : str
+        Target directory path.
+    verbose : int, default 1
+        Log settings of stdout. Specify one of the following numbers:
+        - 0 -> Do not output log.
+        - 1 -> Output the check result.
+    ignore_func_name_prefix_list : list of str, default ['test_']
+        A prefix list of function name conditions to ignore.
+    ignore_info_id_list : list of int, default []
+        List of IDs to ignore lint checking. A constant with a
+        prefix of `INFO_ID_` can be specified.
+    enable_default_or_optional_doc_check : bool, default False
+        If True specified, the `default` and `optional` string
+        in docstring will be checked.
+    exclude_pattern_list : list of str, default []
+        A list of the glob patterns of the directory and file paths
+        to exclude (e.g., `build`, `*/migrations`). The excluded
+        directories are not entered. The directories such as `.git`,
+        `__pycache__` and virtual environments are always excluded.
+    combine_code_cells : bool, default False
+        If True specified, the code cells are joined into one
+        virtual module and indexed at once instead of cell by
+        cell. Each of the functions with the same name in the
+        different cells is checked separately in both cases.
+
+    Yields
+    ------
+    info_dict : NotebookLintResult
+        A record of the check result. The following values are
+        set in the dictionary key:
+        - notebook_path : str -> Path of target Jupyter notebook.
+        - code_cell_index : int -> Notebook code cell index number
+            (start with zero). Not include markdown cells.
+        - func_name : str -> Target function name.
+        - info_id : int -> Identification number of which information.
+        - info : str -> Information of check result.
+
+    Notes
+    -----
+    The results are the same as `check_jupyter_notebook_recursively`,
+    but neither the results nor the notebook paths are held in
+    memory. The parallel processes are not used.
+    """
+    for notebook_path in helper.iter_file_path_recursively(
+            dir_path=dir_path, extension='.ipynb',
+            exclude_pattern_list=exclude_pattern_list):
+        if '.ipynb_checkpoints' in notebook_path:
+            continue
+        for info_dict in _iter_notebook_info(
+                notebook_path=notebook_path,
+                ignore_func_name_prefix_list=ignore_func_name_prefix_list,
+                ignore_info_id_list=ignore_info_id_list,
+                enable_default_or_optional_doc_check=(
+                    enable_default_or_optional_doc_check),
+                combine_code_cells=combine_code_cells):
+            _print_info_list(info_list=[info_dict], verbose=verbose)
+            yield info_dict
+
+
 def _check_jupyter_notebook_recursively(
-        dir_path: str, info_list: List[dict], verbose: int,
+        dir_path: str, info_list: List[NotebookLintResult], verbose: int,
         ignore_func_name_prefix_list: List[str],
         ignore_info_id_list: List[int],
-        enable_default_or_optional_doc_check: bool) -> List[dict]:
+        enable_default_or_optional_doc_check: bool,
+        jobs: int = 1,
+        exclude_pattern_list: List[str] = [],
+        combine_code_cells: bool = False) -> List[NotebookLintResult]:
     """
     Check docstring of Jupyter notebook recursively.
 
@@ -154,7 +364,7 @@ def _check_jupyter_notebook_recursively(
     ----------
     dir_path : str
         Target directory path.
-    info_list : list of dicts
+    info_list : list of NotebookLintResult
         A list containing information on check results.
     verbose : int
         Log settings of stdout. Specify one of the following numbers:
@@ -172,47 +382,53 @@ def _check_jupyter_notebook_recursively(
         docstring's argument needs to describe default or optional.
         e.g., `price : int, default is 100`, `price : int, default 100`,
         `price : int, optional`.
+    jobs : int, default 1
+        The number of processes to check notebooks in parallel.
+    exclude_pattern_list : list of str, default []
+        A list of the glob patterns of the directory and file paths
+        to exclude.
+    combine_code_cells : bool, default False
+        If True specified, the code cells are joined into one
+        virtual module and indexed at once.
 
     Returns
     -------
-    info_list : list of dicts
+    info_list : list of NotebookLintResult
         A list containing information on check results.
     """
-    file_or_folder_name_list: List[str] = os.listdir(dir_path)
-    if not file_or_folder_name_list:
-        return info_list
-    enable_def_or_opt_check: bool = enable_default_or_optional_doc_check
-    for file_or_folder_name in file_or_folder_name_list:
-        path: str = os.path.join(dir_path, file_or_folder_name)
-        path = path.replace('\\', '/')
-        if os.path.isdir(path):
-            info_list = _check_jupyter_notebook_recursively(
-                dir_path=path,
-                info_list=info_list,
-                verbose=verbose,
-                ignore_func_name_prefix_list=ignore_func_name_prefix_list,
-                ignore_info_id_list=ignore_info_id_list,
-                enable_default_or_optional_doc_check=enable_def_or_opt_check)
-            continue
-        if not path.endswith('.ipynb'):
-            continue
-        unit_info_list: List[dict] = check_jupyter_notebook(
-            notebook_path=path,
-            verbose=verbose,
-            ignore_func_name_prefix_list=ignore_func_name_prefix_list,
-            ignore_info_id_list=ignore_info_id_list,
-            enable_default_or_optional_doc_check=enable_def_or_opt_check)
+    notebook_path_list: List[str] = helper.get_file_path_list_recursively(
+        dir_path=dir_path, extension='.ipynb',
+        exclude_pattern_list=exclude_pattern_list)
+    check_func: Callable[[str], List[NotebookLintResult]] = functools.partial(
+        check_jupyter_notebook,
+        verbose=VERBOSE_DISABLED,
+        ignore_func_name_prefix_list=ignore_func_name_prefix_list,
+        ignore_info_id_list=ignore_info_id_list,
+        enable_default_or_optional_doc_check=(
+            enable_default_or_optional_doc_check),
+        combine_code_cells=combine_code_cells)
+    profile_check_func: Callable[
+        [str], Tuple[List[NotebookLintResult], Any]] = functools.partial(
+            profiler.call_with_profile_stats, func=check_func,
+            is_enabled=profiler.is_profile_enabled())
+    for unit_info_list, unit_profile_stats in helper.map_in_order(
+            func=profile_check_func, path_list=notebook_path_list,
+            jobs=jobs):
+        if unit_profile_stats is not None:
+            profiler.merge_profile_stats(profile_stats=unit_profile_stats)
+        _print_info_list(info_list=unit_info_list, verbose=verbose)
         info_list.extend(unit_info_list)
     return info_list
 
 
-def _print_info_list(info_list: List[dict], verbose: int) -> str:
+def _print_info_list(info_list: List[NotebookLintResult], verbose: int) -> str:
     """
-    Print check result.
+    Print check result, writing each result to the output writer
+    as soon as it is formatted.
 
     Parameters
     ----------
-    info_list : list of dicts
+    info_list : list of NotebookLintResult
         A list containing information on check results.
         The following values are necessary in the dictionary key:
         - notebook_path : str
@@ -232,17 +448,40 @@ def _print_info_list(info_list: List[dict], verbose: int) -> str:
         return ''
     if verbose != VERBOSE_ENABLED:
         return ''
-    printed_str: str = ''
+    printed_str: str = profiler.call_with_time(
+        profile_key=profiler.PROFILE_KEY_PHASE, name=profiler.PHASE_OUTPUT,
+        func=lambda: _write_info_list(info_list=info_list))
+    return printed_str
+
+
+def _write_info_list(info_list: List[NotebookLintResult]) -> str:
+    """
+    Write check result to the output writer.
+
+    Parameters
+    ----------
+    info_list : list of NotebookLintResult
+        A list containing information on check results.
+
+    Returns
+    -------
+    printed_str : str
+        Printed string.
+    """
+    output_writer: output.OutputWriter = output.get_output_writer()
+    result_str_list: List[str] = []
     for info_dict in info_list:
-        if printed_str != '':
-            printed_str += '\n'
-        printed_str += '{notebook_path}::code cell index:{code_cell_index}'\
+        result_str: str = \
+            '{notebook_path}::code cell index:{code_cell_index}'\
             '::{func_name}\n{info}\n'.format(
                 notebook_path=info_dict['notebook_path'],
                 code_cell_index=info_dict['code_cell_index'],
                 func_name=info_dict['func_name'],
                 info=info_dict['info'])
-    print(printed_str)
+        output_writer.write_result(
+            info_dict=info_dict, result_str=result_str + '\n')
+        result_str_list.append(result_str)
+    printed_str: str = '\n'.join(result_str_list)
     return printed_str
 
 
@@ -250,7 +489,8 @@ def _check_unit_code_cell_str(
         notebook_path: str, code_cell_idx: int, code_cell_str: str,
         ignore_func_name_prefix_list: List[str],
         ignore_info_id_list: List[int],
-        enable_default_or_optional_doc_check: bool) -> List[dict]:
+        enable_default_or_optional_doc_check: bool
+        ) -> List[NotebookLintResult]:
     """
     Check the single code cell.
 
@@ -273,7 +513,7 @@ def _check_unit_code_cell_str(
 
     Returns
     -------
-    info_list : list of dicts
+    info_list : list of NotebookLintResult
         A list containing information on check results.
         The following values are set in the dictionary key:
         - notebook_path : str -> Path of target Jupyter notebook.
@@ -283,11 +523,61 @@ def _check_unit_code_cell_str(
         - info_id : int -> Identification number of which information.
         - info : str -> Information of check result.
     """
-    func_name_list: List[str] = helper.get_func_name_list(
-        code_str=code_cell_str)
-    if not func_name_list:
-        return []
-    info_list: List[dict] = []
+    info_list: List[NotebookLintResult] = list(_iter_unit_code_cell_info(
+        notebook_path=notebook_path,
+        code_cell_idx=code_cell_idx,
+        code_cell_str=code_cell_str,
+        ignore_func_name_prefix_list=ignore_func_name_prefix_list,
+        ignore_info_id_list=ignore_info_id_list,
+        enable_default_or_optional_doc_check=(
+            enable_default_or_optional_doc_check)))
+    return info_list
+
+
+def _iter_unit_code_cell_info(
+        notebook_path: str, code_cell_idx: int, code_cell_str: str,
+        ignore_func_name_prefix_list: List[str],
+        ignore_info_id_list: List[int],
+        enable_default_or_optional_doc_check: bool
+        ) -> Iterator[NotebookLintResult]:
+    """
+    Check the functions in the single code cell one by one and
+    yield the check results of each function.
+
+    Parameters
+    ----------
+    notebook_path : str
+        Path of target Jupyter notebook.
+    code_cell_idx : int
+        Index of target code cell.
+    code_cell_str : str
+        Code string of target cell.
+    ignore_func_name_prefix_list : list of str
+        A prefix list of function name conditions to ignore.
+    ignore_info_id_list : list of int
+        List of IDs to ignore lint checking.
+    enable_default_or_optional_doc_check : bool
+        If True specified, the `default` and `optional` string
+        in docstring will be checked.
+
+    Yields
+    ------
+    info_dict : NotebookLintResult
+        A record of the check result. The following values are
+        set in the dictionary key:
+        - notebook_path : str
+        - code_cell_index : int
+        - func_name : str
+        - info_id : int
+        - info : str
+    """
+    module_index: ModuleIndex = profiler.call_with_time(
+        profile_key=profiler.PROFILE_KEY_PHASE, name=profiler.PHASE_INDEX,
+        func=lambda: ModuleIndex(module_str=code_cell_str))
+    func_name_list: List[str] = profiler.call_with_time(
+        profile_key=profiler.PROFILE_KEY_PHASE,
+        name=profiler.PHASE_DISCOVERY,
+        func=lambda: module_index.func_name_list)
     enable_def_or_opt_check: bool = enable_default_or_optional_doc_check
     for func_name in func_name_list:
         is_func_name_to_ignore: bool = py_module.is_func_name_to_ignore(
@@ -295,104 +585,400 @@ def _check_unit_code_cell_str(
             ignore_func_name_prefix_list=ignore_func_name_prefix_list)
         if is_func_name_to_ignore:
             continue
-        single_func_info_list: List[dict] = \
+        single_func_info_list: List[py_module.LintResult] = \
             py_module.get_single_func_info_list(
                 path=notebook_path,
                 code_str=code_cell_str,
                 func_name=func_name,
                 enable_default_or_optional_doc_check=enable_def_or_opt_check,
                 skip_decorator_name_list=[],
+                ignore_info_id_list=ignore_info_id_list,
+                module_index=module_index)
+        for lint_result in single_func_info_list:
+            yield NotebookLintResult(
+                func_name=lint_result.func_name,
+                info_id=lint_result.info_id,
+                info=lint_result.info,
+                notebook_path=notebook_path,
+                code_cell_index=code_cell_idx,
+                lineno=lint_result.lineno,
+                end_lineno=lint_result.end_lineno)
+
+
+def _iter_combined_code_cell_info(
+        notebook_path: str, code_cell_str_list: List[str],
+        ignore_func_name_prefix_list: List[str],
+        ignore_info_id_list: List[int],
+        enable_default_or_optional_doc_check: bool
+        ) -> Iterator[NotebookLintResult]:
+    """
+    Check the functions in the code cells joined into one virtual
+    module, and yield the check results of each function with the
+    position mapped back to the code cell.
+
+    Parameters
+    ----------
+    notebook_path : str
+        Path of target Jupyter notebook.
+    code_cell_str_list : list of str
+        A list of code cell strings.
+    ignore_func_name_prefix_list : list of str
+        A prefix list of function name conditions to ignore.
+    ignore_info_id_list : list of int
+        List of IDs to ignore lint checking.
+    enable_default_or_optional_doc_check : bool
+        If True specified, the `default` and `optional` string
+        in docstring will be checked.
+
+    Yields
+    ------
+    info_dict : NotebookLintResult
+        A record of the check result. The `code_cell_index`, the
+        `lineno` and the `end_lineno` are the positions in the code
+        cell.
+    """
+    module_index: CombinedModuleIndex = profiler.call_with_time(
+        profile_key=profiler.PROFILE_KEY_PHASE, name=profiler.PHASE_INDEX,
+        func=lambda: CombinedModuleIndex(code_str_list=code_cell_str_list))
+    func_entry_list: List[FuncEntry] = profiler.call_with_time(
+        profile_key=profiler.PROFILE_KEY_PHASE,
+        name=profiler.PHASE_DISCOVERY,
+        func=module_index.get_func_entry_list)
+    for func_entry in func_entry_list:
+        is_func_name_to_ignore: bool = py_module.is_func_name_to_ignore(
+            func_name=func_entry.func_name,
+            ignore_func_name_prefix_list=ignore_func_name_prefix_list)
+        if is_func_name_to_ignore:
+            continue
+        single_func_info_list: List[py_module.LintResult] = \
+            py_module._get_func_entry_info_list(
+                path=notebook_path,
+                func_entry=func_entry,
+                enable_default_or_optional_doc_check=(
+                    enable_default_or_optional_doc_check),
+                skip_decorator_name_list=[],
                 ignore_info_id_list=ignore_info_id_list)
-        info_list.extend(single_func_info_list)
-    info_list = _rename_dict_key(info_list=info_list)
-    info_list = _add_code_cell_index(
-        info_list=info_list, code_cell_idx=code_cell_idx)
-    return info_list
+        if not single_func_info_list:
+            continue
+        code_cell_idx: int = 0
+        cell_line_idx: int = -1
+        cell_last_line_idx: int = -1
+        if func_entry.start_line_idx != -1:
+            code_cell_idx, cell_line_idx = module_index.get_cell_position(
+                line_idx=func_entry.start_line_idx)
+            cell_last_line_idx = cell_line_idx + (
+                func_entry.last_line_idx - func_entry.start_line_idx)
+        for lint_result in single_func_info_list:
+            yield NotebookLintResult(
+                func_name=lint_result.func_name,
+                info_id=lint_result.info_id,
+                info=lint_result.info,
+                notebook_path=notebook_path,
+                code_cell_index=code_cell_idx,
+                lineno=cell_line_idx + 1,
+                end_lineno=cell_last_line_idx + 1)
 
 
-def _add_code_cell_index(info_list: List[dict], code_cell_idx: int):
+def _get_code_cell_str_list(notebook_data_dict: dict) -> List[str]:
     """
-    Add cell index value to the dictionaries in the list.
+    Get a list of code cell strings.
 
     Parameters
     ----------
-    info_list : list of dicts
-        A list containing information on check results.
-    code_cell_idx : int
-        A code cell index to be set.
+    notebook_data_dict : dict
+        A dictionary of notebook data.
 
     Returns
     -------
-    info_list : list of dicts
-        A list containing a dictionary with the following
-        added key.
-        - code_cell_index : int
+    code_str_list : list of str
+        A list of code cell strings.
     """
-    for info_dict in info_list:
-        info_dict[INFO_KEY_CODE_CELL_INDEX] = code_cell_idx
-    return info_list
+    code_str_list: List[str] = []
+    has_key: bool = 'cells' in notebook_data_dict
+    if not has_key:
+        return []
+    cells_list: List[dict] = notebook_data_dict['cells']
+    for cell_dict in cells_list:
+        cell_type: str = cell_dict['cell_type']
+        if cell_type != 'code':
+            continue
+        source_list: List[str] = cell_dict['source']
+        source = ''.join(source_list)
+        code_str_list.append(source)
+    return code_str_list
 
 
-def _rename_dict_key(info_list: List[dict]) -> List[dict]:
+def _read_code_cell_str_list(notebook_path: str) -> List[str]:
     """
-    Rename dictionary key names in the list.
+    Read a list of code cell strings of the notebook without
+    loading the other data such as the cell outputs.
 
     Parameters
     ----------
-    info_list : list of dict
-        A list of check results. The following keys are necessary
-        in the dictionary:
-        - module_path : str
-        - func_name : str
-        - info_id : int
-        - info : str
+    notebook_path : str
+        Path of target notebook.
 
     Returns
     -------
-    info_list : list of dicts
-        A list containing the renamed dictionary.
-        The following keys will be set.
-        - notebook_path : str
-        - func_name : str
-        - info_id : int
-        - info : str
+    code_str_list : list of str
+        A list of code cell strings.
+
+    Notes
+    -----
+    The notebook file is memory-mapped and scanned as bytes, and
+    only the `cell_type` and `source` values of the cells are
+    decoded. The other values (e.g., base64 images of the outputs)
+    are skipped without being converted to Python objects, so the
+    memory use depends on the code size rather than the output
+    size. The notebooks smaller than `_SCAN_NOTEBOOK_MIN_SIZE` are
+    loaded with the `json` module, which is faster for the small
+    values than the scan. If the file can not be scanned (e.g., a
+    broken file), the whole file is loaded with the `json` module
+    as well.
     """
-    for info_dict in info_list:
-        path_str: str = info_dict[py_module.INFO_KEY_MODULE_PATH]
-        info_dict[INFO_KEY_NOTEBOOK_PATH] = path_str
-        del info_dict[py_module.INFO_KEY_MODULE_PATH]
-    return info_list
+    code_str_list: List[str]
+    if os.path.getsize(notebook_path) >= _SCAN_NOTEBOOK_MIN_SIZE:
+        try:
+            with open(notebook_path, 'rb') as f:
+                with mmap.mmap(
+                        f.fileno(), length=0,
+                        access=mmap.ACCESS_READ) as buffer:
+                    code_str_list = _scan_code_cell_str_list(buffer=buffer)
+            return code_str_list
+        except (ValueError, IndexError, KeyError):
+            pass
+    notebook_data_dict: dict = _read_notebook_data_dict(
+        notebook_path=notebook_path)
+    code_str_list = _get_code_cell_str_list(
+        notebook_data_dict=notebook_data_dict)
+    return code_str_list
 
 
-def _get_code_cell_str_list(notebook_data_dict: dict) -> List[str]:
+def _scan_code_cell_str_list(buffer: bytes) -> List[str]:
     """
-    Get a list of code cell strings.
+    Scan the bytes of the notebook and get a list of code cell
+    strings.
 
     Parameters
     ----------
-    notebook_data_dict : dict
-        A dictionary of notebook data.
+    buffer : bytes or mmap.mmap
+        The bytes of the notebook JSON.
 
     Returns
     -------
     code_str_list : list of str
         A list of code cell strings.
+
+    Raises
+    ------
+    ValueError
+        If the bytes are not a JSON object, or the `cells` value
+        is not an array of the objects.
     """
-    code_str_list: List[str] = []
-    has_key: bool = 'cells' in notebook_data_dict
-    if not has_key:
+    span_dict: Dict[str, Tuple[int, int]]
+    span_dict, _ = _get_json_object_span_dict(buffer=buffer, pos=0)
+    if 'cells' not in span_dict:
         return []
-    cells_list: List[dict] = notebook_data_dict['cells']
-    for cell_dict in cells_list:
-        cell_type: str = cell_dict['cell_type']
+    pos: int = _skip_json_whitespace(
+        buffer=buffer, pos=span_dict['cells'][0])
+    if buffer[pos:pos + 1] != b'[':
+        raise ValueError('The cells value is not an array.')
+    pos += 1
+    code_str_list: List[str] = []
+    while True:
+        pos = _skip_json_whitespace(buffer=buffer, pos=pos)
+        if buffer[pos:pos + 1] == b']':
+            break
+        cell_span_dict: Dict[str, Tuple[int, int]]
+        cell_span_dict, pos = _get_json_object_span_dict(
+            buffer=buffer, pos=pos)
+        pos = _skip_json_whitespace(buffer=buffer, pos=pos)
+        if buffer[pos:pos + 1] == b',':
+            pos += 1
+        cell_type: str = _load_json_span(
+            buffer=buffer, span=cell_span_dict['cell_type'])
         if cell_type != 'code':
             continue
-        source_list: List[str] = cell_dict['source']
-        source = ''.join(source_list)
+        source: Any = _load_json_span(
+            buffer=buffer, span=cell_span_dict['source'])
+        if isinstance(source, list):
+            source = ''.join(source)
         code_str_list.append(source)
     return code_str_list
 
 
+def _get_json_object_span_dict(
+        buffer: bytes, pos: int
+        ) -> Tuple[Dict[str, Tuple[int, int]], int]:
+    """
+    Get the spans of the member values of the JSON object without
+    decoding the values.
+
+    Parameters
+    ----------
+    buffer : bytes or mmap.mmap
+        The bytes of the JSON.
+    pos : int
+        The position of the object (or the whitespace before it).
+
+    Returns
+    -------
+    span_dict : dict
+        A dictionary with the member names as keys and the (start,
+        end) positions of the values as values.
+    end_pos : int
+        The position after the closing brace of the object.
+
+    Raises
+    ------
+    ValueError
+        If the value at the position is not a valid object.
+    """
+    pos = _skip_json_whitespace(buffer=buffer, pos=pos)
+    if buffer[pos:pos + 1] != b'{':
+        raise ValueError(f'The JSON object is not found at {pos}.')
+    pos += 1
+    span_dict: Dict[str, Tuple[int, int]] = {}
+    while True:
+        pos = _skip_json_whitespace(buffer=buffer, pos=pos)
+        char: bytes = buffer[pos:pos + 1]
+        if char == b'}':
+            return span_dict, pos + 1
+        if char == b',':
+            pos = _skip_json_whitespace(buffer=buffer, pos=pos + 1)
+        key_end_pos: int = _skip_json_value(buffer=buffer, pos=pos)
+        key: str = _load_json_span(buffer=buffer, span=(pos, key_end_pos))
+        pos = _skip_json_whitespace(buffer=buffer, pos=key_end_pos)
+        if buffer[pos:pos + 1] != b':':
+            raise ValueError(f'The colon is not found at {pos}.')
+        value_start_pos: int = _skip_json_whitespace(
+            buffer=buffer, pos=pos + 1)
+        pos = _skip_json_value(buffer=buffer, pos=value_start_pos)
+        span_dict[key] = (value_start_pos, pos)
+
+
+def _skip_json_value(buffer: bytes, pos: int) -> int:
+    """
+    Skip the JSON value without decoding it.
+
+    Parameters
+    ----------
+    buffer : bytes or mmap.mmap
+        The bytes of the JSON.
+    pos : int
+        The start position of the value.
+
+    Returns
+    -------
+    end_pos : int
+        The position after the value.
+
+    Raises
+    ------
+    ValueError
+        If the value is not closed.
+    """
+    char: bytes = buffer[pos:pos + 1]
+    if char == b'"':
+        return _skip_json_str(buffer=buffer, pos=pos)
+    if char not in (b'{', b'['):
+        scalar_match = _JSON_SCALAR_PATTERN.match(buffer, pos)
+        if scalar_match is None:
+            raise ValueError(f'The JSON value is not found at {pos}.')
+        return scalar_match.end()
+    depth: int = 0
+    while True:
+        struct_match = _JSON_STRUCT_CHAR_PATTERN.search(buffer, pos)
+        if struct_match is None:
+            raise ValueError('The JSON value is not closed.')
+        pos = struct_match.start()
+        char = buffer[pos:pos + 1]
+        if char == b'"':
+            pos = _skip_json_str(buffer=buffer, pos=pos)
+            continue
+        pos += 1
+        if char in (b'{', b'['):
+            depth += 1
+            continue
+        depth -= 1
+        if depth == 0:
+            return pos
+
+
+def _skip_json_str(buffer: bytes, pos: int) -> int:
+    """
+    Skip the JSON string without decoding it. The closing quote
+    is searched with `find` (not a regular expression), which is
+    much faster for the long strings such as base64 images.
+
+    Parameters
+    ----------
+    buffer : bytes or mmap.mmap
+        The bytes of the JSON.
+    pos : int
+        The position of the opening quote.
+
+    Returns
+    -------
+    end_pos : int
+        The position after the closing quote.
+
+    Raises
+    ------
+    ValueError
+        If the string is not closed.
+    """
+    end_pos: int = pos + 1
+    while True:
+        end_pos = buffer.find(b'"', end_pos)
+        if end_pos == -1:
+            raise ValueError(f'The JSON string is not closed at {pos}.')
+        backslash_num: int = 0
+        while buffer[end_pos - backslash_num - 1] == _BACKSLASH_ORD:
+            backslash_num += 1
+        end_pos += 1
+        if backslash_num % 2 == 0:
+            return end_pos
+
+
+def _skip_json_whitespace(buffer: bytes, pos: int) -> int:
+    """
+    Skip the JSON whitespace.
+
+    Parameters
+    ----------
+    buffer : bytes or mmap.mmap
+        The bytes of the JSON.
+    pos : int
+        The start position.
+
+    Returns
+    -------
+    end_pos : int
+        The position of the next non-whitespace character.
+    """
+    return _JSON_WHITESPACE_PATTERN.match(buffer, pos).end()
+
+
+def _load_json_span(buffer: bytes, span: Tuple[int, int]) -> Any:
+    """
+    Decode the JSON value of the span.
+
+    Parameters
+    ----------
+    buffer : bytes or mmap.mmap
+        The bytes of the JSON.
+    span : tuple of int
+        The (start, end) positions of the value.
+
+    Returns
+    -------
+    value : *
+        The decoded value.
+    """
+    return json.loads(buffer[span[0]:span[1]].decode('utf-8'))
+
+
 def _read_notebook_data_dict(notebook_path: str) -> dict:
     """
     Read a dictionary of notebook data.
@@ -0,0 +1,1152 @@
+"""A module that builds an index of the functions in a Python module.
+
+The index is built once per module and holds each function's span,
+signature, docstring, body, indent and decorators, so that the check
+of every function only needs to read the function's own part of the
+module instead of rescanning the whole module string.
+"""
+
+import ast
+import re
+import time
+from bisect import bisect_right
+from typing import (Any, Callable, Dict, Iterator, List, Optional, Pattern,
+                    Tuple, Union)
+
+from numdoclint import helper, profiler
+
+ENGINE_LEGACY: str = 'legacy'
+ENGINE_AST: str = 'ast'
+ENGINE_LIST: List[str] = [ENGINE_LEGACY, ENGINE_AST]
+
+_DEF_PATTERN: Pattern = re.compile(pattern=r'def (\w+)')
+
+_BOUNDARY_PREFIX_TUPLE: Tuple[str, ...] = (
+    'def ',
+    'async def ',
+    'class ',
+    '@',
+)
+
+_FACT_NAME_LIST: List[str] = [
+    'indent_num',
+    'args_str',
+    'docstring',
+    'arg_name_list',
+    'default_val_info_dict',
+    'kwargs_exists',
+    'return_val_exists',
+    'param_info_list',
+    'optional_arg_name_list',
+    'return_val_info_list',
+    'last_line_idx',
+]
+
+
+class FuncEntry:
+    """
+    The indexed information of a single function.
+
+    Parameters
+    ----------
+    func_name : str
+        Target function name.
+    func_str : str
+        The function's span string, from the line of the `def`
+        statement to the line before the next function or class
+        at the same or lower indent. A blank string is set if the
+        function can not be found.
+    start_line_idx : int
+        The line index of the `def` statement (starting from 0).
+        If the function can not be found, -1 will be set.
+    end_line_idx : int
+        The line index after the last line of the span.
+    decorator_names : list of str
+        A list of decorator names set in the function.
+
+    Attributes
+    ----------
+    indent_num : int
+        The baseline number of the function's indents.
+    args_str : str
+        String of the function's arguments.
+    docstring : str
+        The function's docstring (the indent is set to one).
+    arg_name_list : list of str
+        List of argument names (excluding the ignoring arguments
+        such as `self`).
+    default_val_info_dict : dict
+        A dctionary that stores argument names in keys and default
+        values in values.
+    kwargs_exists : bool
+        A boolean value of whether `**kwargs` exists in the arguments.
+    return_val_exists : bool
+        A boolean value of whether there is a return value in
+        the function.
+    param_info_list : list of dicts
+        A list of the parameters' information of the docstring.
+    optional_arg_name_list : list of str
+        A list of the argument names described as optional in the
+        docstring.
+    return_val_info_list : list of dicts
+        A list of the return values' information of the docstring.
+    last_line_idx : int
+        The line index of the last non-blank line of the function
+        body. If the function can not be found, -1 will be set.
+
+    Notes
+    -----
+    Each fact attribute is computed on the first access and kept,
+    so the facts that no check needs are never computed.
+    """
+
+    indent_num: int
+    args_str: str
+    docstring: str
+    arg_name_list: List[str]
+    default_val_info_dict: Dict[str, str]
+    kwargs_exists: bool
+    return_val_exists: bool
+    param_info_list: List[dict]
+    optional_arg_name_list: List[str]
+    return_val_info_list: List[dict]
+    last_line_idx: int
+
+    def __init__(
+            self, func_name: str, func_str: str, start_line_idx: int,
+            end_line_idx: int, decorator_names: List[str]) -> None:
+        self.func_name: str = func_name
+        self.func_str: str = func_str
+        self.start_line_idx: int = start_line_idx
+        self.end_line_idx: int = end_line_idx
+        self.decorator_names: List[str] = decorator_names
+        if func_str == '':
+            self.indent_num = 0
+            self.args_str = ''
+            self.docstring = ''
+            self.arg_name_list = []
+            self.default_val_info_dict = {}
+            self.kwargs_exists = False
+            self.return_val_exists = False
+            self.last_line_idx = -1
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Compute the fact on the first access. This is only called
+        when the attribute is not set yet, so the computed fact is
+        read as a plain attribute after that.
+
+        Parameters
+        ----------
+        name : str
+            Target attribute name.
+
+        Returns
+        -------
+        fact : *
+            The value of the fact.
+
+        Raises
+        ------
+        AttributeError
+            If the name is not a fact name.
+        """
+        if name not in _FACT_NAME_LIST:
+            raise AttributeError(name)
+        if not profiler.is_profile_enabled():
+            self._compute_fact(fact_name=name)
+            return self.__dict__[name]
+        start_time: float = time.perf_counter()
+        self._compute_fact(fact_name=name)
+        profiler.add_time(
+            profile_key=profiler.PROFILE_KEY_PHASE,
+            name=profiler.PHASE_FACT_PREFIX + name,
+            elapsed_time=time.perf_counter() - start_time)
+        return self.__dict__[name]
+
+    def _compute_fact(self, fact_name: str) -> None:
+        """
+        Compute the fact and set it to the memo. The facts computed
+        in the same pass may be set together.
+
+        Parameters
+        ----------
+        fact_name : str
+            Target fact name.
+        """
+        func_name: str = self.func_name
+        func_str: str = self.func_str
+        if fact_name == 'indent_num':
+            self.__dict__[fact_name] = helper.get_func_indent_num(
+                py_module_str=func_str, func_name=func_name)
+        elif fact_name == 'args_str':
+            self.__dict__[fact_name] = helper._get_args_str(
+                code_str=func_str, func_name=func_name)
+        elif fact_name == 'docstring':
+            self.__dict__[fact_name] = helper.get_func_overall_docstring(
+                py_module_str=func_str, func_name=func_name)
+        elif fact_name == 'arg_name_list':
+            self.__dict__[fact_name] = \
+                helper.get_arg_name_list_from_args_str(
+                    args_str=self.args_str)
+        elif fact_name == 'default_val_info_dict':
+            self.__dict__[fact_name] = \
+                helper.get_arg_default_val_info_dict_from_args_str(
+                    args_str=self.args_str)
+        elif fact_name == 'kwargs_exists':
+            all_arg_name_list: List[str] = \
+                helper.get_arg_name_list_from_args_str(
+                    args_str=self.args_str, exclude_ignoring_args=False)
+            self.__dict__[fact_name] = '**kwargs' in all_arg_name_list
+        elif fact_name == 'return_val_exists':
+            self.__dict__[fact_name] = helper.return_val_exists_in_func(
+                module_str=func_str, func_name=func_name)
+        elif fact_name == 'param_info_list':
+            self.__dict__[fact_name] = \
+                helper.get_docstring_param_info_list(
+                    docstring=self.docstring)
+        elif fact_name == 'optional_arg_name_list':
+            self.__dict__[fact_name] = \
+                helper.get_optional_arg_name_list(docstring=self.docstring)
+        elif fact_name == 'return_val_info_list':
+            self.__dict__[fact_name] = \
+                helper.get_docstring_return_val_info_list(
+                    docstring=self.docstring)
+        elif fact_name == 'last_line_idx':
+            self.__dict__[fact_name] = _get_last_line_idx(
+                func_str=func_str, start_line_idx=self.start_line_idx)
+        else:
+            err_msg: str = f'Invalid fact name is specified: {fact_name}'
+            raise ValueError(err_msg)
+
+
+class ModuleIndex:
+    """
+    The index of the functions in a single Python module.
+
+    Parameters
+    ----------
+    module_str : str
+        String of target Python module.
+
+    Attributes
+    ----------
+    line_splitted_list : list of str
+        A list of the module's strings separated by line.
+    """
+
+    def __init__(self, module_str: str) -> None:
+        self.module_str: str = module_str
+        self.line_splitted_list: List[str] = module_str.split('\n')
+        self._func_name_list: Optional[List[str]] = None
+        self._def_line_idx_dict: Dict[str, int] = \
+            _get_def_line_idx_dict(module_str=module_str)
+        self._boundary_list: List[Tuple[int, int]] = _get_boundary_list(
+            line_splitted_list=self.line_splitted_list)
+        self._boundary_line_idx_list: List[int] = [
+            line_idx for line_idx, _ in self._boundary_list]
+        self._func_entry_dict: Dict[str, FuncEntry] = {}
+
+    @property
+    def func_name_list(self) -> List[str]:
+        """
+        Get a list of function names in the module.
+
+        Returns
+        -------
+        func_name_list : list of str
+            List containing function names.
+        """
+        if self._func_name_list is None:
+            self._func_name_list = helper.get_func_name_list(
+                code_str=self.module_str)
+        return self._func_name_list
+
+    def get_func_entry(self, func_name: str) -> FuncEntry:
+        """
+        Get the indexed information of the target function.
+
+        Parameters
+        ----------
+        func_name : str
+            Target function name.
+
+        Returns
+        -------
+        func_entry : FuncEntry
+            The indexed information of the target function. If
+            there are multiple functions with the same name, the
+            first one will be set.
+        """
+        func_entry: Optional[FuncEntry] = self._func_entry_dict.get(
+            func_name)
+        if func_entry is not None:
+            return func_entry
+        start_line_idx: int = self._def_line_idx_dict.get(func_name, -1)
+        func_entry = self._build_func_entry(
+            func_name=func_name, start_line_idx=start_line_idx)
+        self._func_entry_dict[func_name] = func_entry
+        return func_entry
+
+    def _build_func_entry(
+            self, func_name: str, start_line_idx: int) -> FuncEntry:
+        """
+        Build the indexed information of the function that starts
+        at the specified line.
+
+        Parameters
+        ----------
+        func_name : str
+            Target function name.
+        start_line_idx : int
+            The line index of the `def` statement. If -1 is
+            specified, the entry of a blank function will be built.
+
+        Returns
+        -------
+        func_entry : FuncEntry
+            The indexed information of the function.
+        """
+        if start_line_idx == -1:
+            return FuncEntry(
+                func_name=func_name, func_str='', start_line_idx=-1,
+                end_line_idx=-1, decorator_names=[])
+        end_line_idx: int = self._get_span_end_line_idx(
+            start_line_idx=start_line_idx)
+        func_str: str = '\n'.join(
+            self.line_splitted_list[start_line_idx:end_line_idx])
+        decorator_names: List[str] = helper.get_decorator_names_by_line_index(
+            line_splitted_list=self.line_splitted_list,
+            func_start_line_index=start_line_idx)
+        func_entry: FuncEntry = FuncEntry(
+            func_name=func_name, func_str=func_str,
+            start_line_idx=start_line_idx, end_line_idx=end_line_idx,
+            decorator_names=decorator_names)
+        return func_entry
+
+    def get_func_entry_list(
+            self, skip_decorator_name_list: Optional[List[str]] = None
+    ) -> List[FuncEntry]:
+        """
+        Get a list of the indexed information of all functions
+        in the module.
+
+        Parameters
+        ----------
+        skip_decorator_name_list : list of str or None, default None
+            If a decorator name in this list is set to a function,
+            that function will be left out of the list. The entry of
+            a skipped function is not built, so its span is not
+            extracted.
+
+        Returns
+        -------
+        func_entry_list : list of FuncEntry
+            A list in the order of the module. If there are multiple
+            functions with the same name, the first one will be set
+            to each of them.
+        """
+        func_entry_list: List[FuncEntry] = []
+        for func_name in self.func_name_list:
+            if skip_decorator_name_list:
+                decorator_names: List[str] = self._get_decorator_names(
+                    func_name=func_name)
+                if has_decorator_to_skip(
+                        decorator_names=decorator_names,
+                        skip_decorator_name_list=skip_decorator_name_list):
+                    continue
+            func_entry_list.append(self.get_func_entry(func_name=func_name))
+        return func_entry_list
+
+    def _get_decorator_names(self, func_name: str) -> List[str]:
+        """
+        Get a list of decorator names of the target function
+        without building the function's entry.
+
+        Parameters
+        ----------
+        func_name : str
+            Target function name.
+
+        Returns
+        -------
+        decorator_names : list of str
+            A list of decorator names. If the function can not be
+            found, a blank list will be set.
+        """
+        func_entry: Optional[FuncEntry] = self._func_entry_dict.get(
+            func_name)
+        if func_entry is not None:
+            return func_entry.decorator_names
+        start_line_idx: int = self._def_line_idx_dict.get(func_name, -1)
+        if start_line_idx == -1:
+            return []
+        decorator_names: List[str] = helper.get_decorator_names_by_line_index(
+            line_splitted_list=self.line_splitted_list,
+            func_start_line_index=start_line_idx)
+        return decorator_names
+
+    def _get_span_end_line_idx(self, start_line_idx: int) -> int:
+        """
+        Get the line index after the last line of the function span.
+
+        Parameters
+        ----------
+        start_line_idx : int
+            The line index of the `def` statement.
+
+        Returns
+        -------
+        end_line_idx : int
+            The line index of the next function or class statement
+            (or decorator) at the same or lower indent. If not exists,
+            the number of lines will be set.
+        """
+        func_indent_num: int = helper.get_line_indent_num(
+            line_str=self.line_splitted_list[start_line_idx])
+        boundary_idx: int = bisect_right(
+            self._boundary_line_idx_list, start_line_idx)
+        while boundary_idx < len(self._boundary_list):
+            line_idx, indent_num = self._boundary_list[boundary_idx]
+            if indent_num <= func_indent_num:
+                return line_idx
+            boundary_idx += 1
+        return len(self.line_splitted_list)
+
+
+class CombinedModuleIndex(ModuleIndex):
+    """
+    The index of the functions in the code cells of a Jupyter
+    notebook, combined into one virtual module so that the cells
+    are scanned and indexed at once.
+
+    Parameters
+    ----------
+    code_str_list : list of str
+        A list of the code strings of the cells.
+
+    Attributes
+    ----------
+    cell_start_line_idx_list : list of int
+        The cell-offset map. The line index in the combined module
+        where each cell starts.
+
+    Notes
+    -----
+    A function span never continues into the next cell, and each
+    of the multiple functions with the same name (e.g., a function
+    redefined in a later cell) is indexed separately. The strings
+    are removed and the functions are searched in each cell, so an
+    unclosed quote in a cell (e.g., a cell magic of the shell
+    command) does not hide the functions of the later cells.
+    """
+
+    def __init__(self, code_str_list: List[str]) -> None:
+        self._code_str_list: List[str] = code_str_list
+        self.cell_start_line_idx_list: List[int] = []
+        self._def_line_idx_list_dict: Dict[str, List[int]] = {}
+        line_num: int = 0
+        for code_str in code_str_list:
+            self.cell_start_line_idx_list.append(line_num)
+            cell_def_line_idx_list_dict: Dict[str, List[int]] = \
+                _get_def_line_idx_list_dict(module_str=code_str)
+            for func_name, def_line_idx_list in \
+                    cell_def_line_idx_list_dict.items():
+                self._def_line_idx_list_dict.setdefault(
+                    func_name, []).extend(
+                        line_num + line_idx for line_idx in def_line_idx_list)
+            line_num += code_str.count('\n') + 1
+        self.module_str: str = '\n'.join(code_str_list)
+        self.line_splitted_list: List[str] = self.module_str.split('\n')
+        self._func_name_list: Optional[List[str]] = None
+        self._def_line_idx_dict: Dict[str, int] = {
+            func_name: def_line_idx_list[0]
+            for func_name, def_line_idx_list
+            in self._def_line_idx_list_dict.items()}
+        boundary_list: List[Tuple[int, int]] = _get_boundary_list(
+            line_splitted_list=self.line_splitted_list)
+        boundary_list.extend(
+            (line_idx, -1) for line_idx in self.cell_start_line_idx_list[1:])
+        boundary_list.sort()
+        self._boundary_list: List[Tuple[int, int]] = boundary_list
+        self._boundary_line_idx_list: List[int] = [
+            line_idx for line_idx, _ in boundary_list]
+        self._func_entry_dict: Dict[str, FuncEntry] = {}
+
+    @property
+    def func_name_list(self) -> List[str]:
+        """
+        Get a list of function names in the cells.
+
+        Returns
+        -------
+        func_name_list : list of str
+            List containing function names in the order of the
+            cells.
+        """
+        if self._func_name_list is None:
+            func_name_list: List[str] = []
+            for code_str in self._code_str_list:
+                func_name_list.extend(
+                    helper.get_func_name_list(code_str=code_str))
+            self._func_name_list = func_name_list
+        return self._func_name_list
+
+    def get_func_entry_list(
+            self, skip_decorator_name_list: Optional[List[str]] = None
+    ) -> List[FuncEntry]:
+        """
+        Get a list of the indexed information of all functions
+        in the cells.
+
+        Parameters
+        ----------
+        skip_decorator_name_list : list of str or None, default None
+            If a decorator name in this list is set to a function,
+            that function will be left out of the list.
+
+        Returns
+        -------
+        func_entry_list : list of FuncEntry
+            A list in the order of the cells. Each of the multiple
+            functions with the same name is set separately.
+        """
+        func_entry_list: List[FuncEntry] = []
+        occurrence_num_dict: Dict[str, int] = {}
+        for func_name in self.func_name_list:
+            occurrence_idx: int = occurrence_num_dict.get(func_name, 0)
+            occurrence_num_dict[func_name] = occurrence_idx + 1
+            def_line_idx_list: List[int] = \
+                self._def_line_idx_list_dict.get(func_name, [-1])
+            start_line_idx: int = def_line_idx_list[
+                min(occurrence_idx, len(def_line_idx_list) - 1)]
+            func_entry: FuncEntry = self._build_func_entry(
+                func_name=func_name, start_line_idx=start_line_idx)
+            if skip_decorator_name_list and has_decorator_to_skip(
+                    decorator_names=func_entry.decorator_names,
+                    skip_decorator_name_list=skip_decorator_name_list):
+                continue
+            func_entry_list.append(func_entry)
+        return func_entry_list
+
+    def get_cell_position(self, line_idx: int) -> Tuple[int, int]:
+        """
+        Get the position in the cell of the line of the combined
+        module.
+
+        Parameters
+        ----------
+        line_idx : int
+            The line index in the combined module.
+
+        Returns
+        -------
+        cell_idx : int
+            The index of the code cell that contains the line.
+        cell_line_idx : int
+            The line index in the code cell (starting from 0).
+        """
+        cell_idx: int = bisect_right(
+            self.cell_start_line_idx_list, line_idx) - 1
+        cell_line_idx: int = \
+            line_idx - self.cell_start_line_idx_list[cell_idx]
+        return cell_idx, cell_line_idx
+
+
+def _get_def_line_idx_dict(module_str: str) -> Dict[str, int]:
+    """
+    Get a dictionary of the `def` statement line index of each
+    function, scanning the module only once.
+
+    Parameters
+    ----------
+    module_str : str
+        String of target Python module.
+
+    Returns
+    -------
+    def_line_idx_dict : dict
+        A dictionary that stores function names in keys and line
+        indexes (starting from 0) in values. If there are multiple
+        functions with the same name, the first one will be set.
+
+    Notes
+    -----
+    The same conditions as the `helper._get_func_match` are used
+    (e.g., interactive shell example lines are skipped).
+    """
+    def_line_idx_dict: Dict[str, int] = {}
+    for func_name, line_idx in _iter_def_line_idx(
+            module_str=module_str,
+            is_func_name_to_skip=def_line_idx_dict.__contains__):
+        def_line_idx_dict[func_name] = line_idx
+    return def_line_idx_dict
+
+
+def _get_def_line_idx_list_dict(module_str: str) -> Dict[str, List[int]]:
+    """
+    Get a dictionary of the `def` statement line indexes of all
+    the functions, including the functions with the same name.
+
+    Parameters
+    ----------
+    module_str : str
+        String of target Python module.
+
+    Returns
+    -------
+    def_line_idx_list_dict : dict
+        A dictionary that stores function names in keys and lists
+        of line indexes (starting from 0, in the order of the
+        module) in values.
+    """
+    def_line_idx_list_dict: Dict[str, List[int]] = {}
+    for func_name, line_idx in _iter_def_line_idx(module_str=module_str):
+        def_line_idx_list_dict.setdefault(func_name, []).append(line_idx)
+    return def_line_idx_list_dict
+
+
+def _iter_def_line_idx(
+        module_str: str,
+        is_func_name_to_skip: Callable[[str], bool] = lambda _: False
+        ) -> Iterator[Tuple[str, int]]:
+    """
+    Yield the function name and the `def` statement line index of
+    each function in the module.
+
+    Parameters
+    ----------
+    module_str : str
+        String of target Python module.
+    is_func_name_to_skip : callable, default always False
+        The function that returns True if the `def` statement of the
+        function name does not need to be validated and yielded
+        (e.g., the function is already found).
+
+    Yields
+    ------
+    func_name : str
+        The function name.
+    line_idx : int
+        The line index (starting from 0) of the `def` statement.
+    """
+    line_idx: int = 0
+    prev_start_idx: int = 0
+    for match in _DEF_PATTERN.finditer(module_str):
+        match_start_idx: int = match.start()
+        line_idx += module_str.count('\n', prev_start_idx, match_start_idx)
+        prev_start_idx = match_start_idx
+        func_name: str = match.group(1)
+        if is_func_name_to_skip(func_name):
+            continue
+        func_str: str = module_str[match_start_idx:match.end() + 10]
+        func_str = func_str.replace('\n', '')
+        is_in: bool = f'def {func_name}(' in func_str
+        if not is_in:
+            continue
+        is_interactive_shell_example_line: bool = \
+            helper.is_interactive_shell_example_line(
+                func_start_index=match_start_idx,
+                py_module_str=module_str)
+        if is_interactive_shell_example_line:
+            continue
+        yield func_name, line_idx
+
+
+def _get_last_line_idx(func_str: str, start_line_idx: int) -> int:
+    """
+    Get the line index of the last non-blank line of the function
+    body in the span.
+
+    Parameters
+    ----------
+    func_str : str
+        The function's span string.
+    start_line_idx : int
+        The line index of the `def` statement.
+
+    Returns
+    -------
+    last_line_idx : int
+        The line index in the module. The body ends before the first
+        line at the same or lower indent than the `def` statement
+        (except the end of a multi-line signature), in the same way
+        as the `helper.get_func_str`.
+    """
+    line_splitted_list: List[str] = func_str.split('\n')
+    func_indent_num: int = helper.get_line_indent_num(
+        line_str=line_splitted_list[0])
+    last_line_offset: int = 0
+    for i in range(1, len(line_splitted_list)):
+        line_str: str = line_splitted_list[i]
+        stripped_line_str: str = line_str.strip()
+        if stripped_line_str == '':
+            continue
+        if (helper.get_line_indent_num(line_str=line_str) <= func_indent_num
+                and not helper.is_end_of_signature(stripped_line_str)):
+            break
+        last_line_offset = i
+    return start_line_idx + last_line_offset
+
+
+def _get_boundary_list(line_splitted_list: List[str]) -> List[Tuple[int, int]]:
+    """
+    Get a list of lines that can be a boundary of function spans.
+
+    Parameters
+    ----------
+    line_splitted_list : list of str
+        A list of strings separated by line.
+
+    Returns
+    -------
+    boundary_list : list of tuple
+        A list of tuples of line index and indent number of the
+        function, class and decorator lines.
+    """
+    boundary_list: List[Tuple[int, int]] = []
+    for line_idx, line_str in enumerate(line_splitted_list):
+        stripped_line_str: str = line_str.lstrip()
+        if not stripped_line_str.startswith(_BOUNDARY_PREFIX_TUPLE):
+            continue
+        indent_num: int = helper.get_line_indent_num(line_str=line_str)
+        boundary_list.append((line_idx, indent_num))
+    return boundary_list
+
+
+def has_decorator_to_skip(
+        decorator_names: List[str],
+        skip_decorator_name_list: List[str]) -> bool:
+    """
+    Get a boolean value of whether a decorator to skip the check
+    is set to the function.
+
+    Parameters
+    ----------
+    decorator_names : list of str
+        A list of decorator names of the target function.
+    skip_decorator_name_list : list of str
+        If a decorator name in this list is included in the
+        function's decorators, True will be returned.
+
+    Returns
+    -------
+    result_bool : bool
+        True will be set if the function should be skipped.
+    """
+    joined_decorator_names: str = ' '.join(decorator_names)
+    for skip_decorator_name in skip_decorator_name_list:
+        is_in: bool = skip_decorator_name in joined_decorator_names
+        if is_in:
+            return True
+    return False
+
+
+def build_module_index(
+        module_str: str, engine: str = ENGINE_LEGACY) -> 'ModuleIndex':
+    """
+    Build the index of the functions in a Python module.
+
+    Parameters
+    ----------
+    module_str : str
+        String of target Python module.
+    engine : str, default 'legacy'
+        The extraction engine. Specify one of the following:
+        - 'legacy' -> The string scanning engine.
+        - 'ast' -> The engine that parses the module with the `ast`
+            module. If the module can not be parsed (e.g., a syntax
+            error), the legacy engine will be used instead.
+
+    Returns
+    -------
+    module_index : ModuleIndex
+        The built index.
+
+    Raises
+    ------
+    ValueError
+        If an invalid engine is specified.
+    """
+    if engine == ENGINE_LEGACY:
+        return ModuleIndex(module_str=module_str)
+    if engine != ENGINE_AST:
+        err_msg: str = f'Invalid engine is specified: {engine}'
+        err_msg += f'\nAvailable engines: {ENGINE_LIST}'
+        raise ValueError(err_msg)
+    try:
+        module_node: ast.Module = ast.parse(module_str)
+    except (SyntaxError, ValueError):
+        return ModuleIndex(module_str=module_str)
+    return AstModuleIndex(module_str=module_str, module_node=module_node)
+
+
+_FuncNode = Union[ast.FunctionDef, ast.AsyncFunctionDef]
+
+_AST_ARG_FACT_NAME_LIST: List[str] = [
+    'args_str', 'arg_name_list', 'default_val_info_dict', 'kwargs_exists',
+]
+
+
+class AstFuncEntry(FuncEntry):
+    """
+    The indexed information of a single function extracted from
+    the syntax tree.
+
+    Parameters
+    ----------
+    func_node : ast.FunctionDef or ast.AsyncFunctionDef
+        The node of the target function.
+    line_splitted_list : list of str
+        A list of the module's strings separated by line.
+    """
+
+    def __init__(
+            self, func_node: _FuncNode,
+            line_splitted_list: List[str]) -> None:
+        start_line_idx: int = func_node.lineno - 1
+        end_line_idx: int = func_node.end_lineno or func_node.lineno
+        decorator_names: List[str] = _get_decorator_names(
+            func_node=func_node, line_splitted_list=line_splitted_list)
+        super().__init__(
+            func_name=func_node.name,
+            func_str='\n'.join(
+                line_splitted_list[start_line_idx:end_line_idx]),
+            start_line_idx=start_line_idx, end_line_idx=end_line_idx,
+            decorator_names=decorator_names)
+        self._func_node: _FuncNode = func_node
+        self._line_splitted_list: List[str] = line_splitted_list
+        self.__dict__['indent_num'] = func_node.col_offset // 4 + 1
+        self.__dict__['last_line_idx'] = end_line_idx - 1
+
+    def _compute_fact(self, fact_name: str) -> None:
+        """
+        Compute the fact from the syntax tree and set it to the memo.
+        The facts of the arguments are set together.
+
+        Parameters
+        ----------
+        fact_name : str
+            Target fact name.
+        """
+        func_node: _FuncNode = self._func_node
+        if fact_name == 'docstring':
+            self.__dict__[fact_name] = _get_docstring(func_node=func_node)
+        elif fact_name == 'return_val_exists':
+            self.__dict__[fact_name] = _return_val_exists(
+                func_node=func_node)
+        elif fact_name in _AST_ARG_FACT_NAME_LIST:
+            all_arg_name_list: List[str] = []
+            arg_str_list: List[str] = []
+            default_val_info_dict: Dict[str, str] = {}
+            for arg_name, arg_str, default_val in _get_arg_info_list(
+                    args_node=func_node.args,
+                    line_splitted_list=self._line_splitted_list):
+                all_arg_name_list.append(arg_name)
+                arg_str_list.append(arg_str)
+                default_val_info_dict[arg_name] = default_val
+            self.__dict__['args_str'] = ', '.join(arg_str_list)
+            self.__dict__['arg_name_list'] = [
+                arg_name for arg_name in all_arg_name_list
+                if arg_name not in helper.ARG_NAME_LIST_TO_IGNORE]
+            self.__dict__['default_val_info_dict'] = default_val_info_dict
+            self.__dict__['kwargs_exists'] = \
+                '**kwargs' in all_arg_name_list
+        else:
+            super()._compute_fact(fact_name=fact_name)
+
+
+class AstModuleIndex(ModuleIndex):
+    """
+    The index of the functions in a single Python module, built
+    from the syntax tree in one parse.
+
+    Parameters
+    ----------
+    module_str : str
+        String of target Python module.
+    module_node : ast.Module
+        The parsed node of the module.
+
+    Notes
+    -----
+    Unlike the legacy index, each of the multiple functions with
+    the same name is indexed separately.
+    """
+
+    def __init__(self, module_str: str, module_node: ast.Module) -> None:
+        self.module_str: str = module_str
+        self.line_splitted_list: List[str] = module_str.split('\n')
+        func_node_list: List[_FuncNode] = [
+            node for node in ast.walk(module_node)
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))]
+        func_node_list.sort(key=lambda node: (node.lineno, node.col_offset))
+        self._func_node_list: List[_FuncNode] = func_node_list
+        self._func_name_list: Optional[List[str]] = [
+            func_node.name for func_node in func_node_list]
+        self._func_entry_list: List[Optional[FuncEntry]] = [
+            None for _ in func_node_list]
+        self._first_node_idx_dict: Dict[str, int] = {}
+        for node_idx, func_node in enumerate(func_node_list):
+            self._first_node_idx_dict.setdefault(func_node.name, node_idx)
+
+    def get_func_entry(self, func_name: str) -> FuncEntry:
+        """
+        Get the indexed information of the target function.
+
+        Parameters
+        ----------
+        func_name : str
+            Target function name.
+
+        Returns
+        -------
+        func_entry : FuncEntry
+            The indexed information of the target function. If
+            there are multiple functions with the same name, the
+            first one will be set.
+        """
+        node_idx: int = self._first_node_idx_dict.get(func_name, -1)
+        if node_idx == -1:
+            return FuncEntry(
+                func_name=func_name, func_str='', start_line_idx=-1,
+                end_line_idx=-1, decorator_names=[])
+        return self._get_func_entry_by_node_idx(node_idx=node_idx)
+
+    def get_func_entry_list(
+            self, skip_decorator_name_list: Optional[List[str]] = None
+    ) -> List[FuncEntry]:
+        """
+        Get a list of the indexed information of all functions
+        in the module.
+
+        Parameters
+        ----------
+        skip_decorator_name_list : list of str or None, default None
+            If a decorator name in this list is set to a function,
+            that function will be left out of the list. The entry of
+            a skipped function is not built.
+
+        Returns
+        -------
+        func_entry_list : list of FuncEntry
+            A list in the order of the module.
+        """
+        func_entry_list: List[FuncEntry] = []
+        for node_idx, func_node in enumerate(self._func_node_list):
+            if skip_decorator_name_list and func_node.decorator_list:
+                decorator_names: List[str] = _get_decorator_names(
+                    func_node=func_node,
+                    line_splitted_list=self.line_splitted_list)
+                if has_decorator_to_skip(
+                        decorator_names=decorator_names,
+                        skip_decorator_name_list=skip_decorator_name_list):
+                    continue
+            func_entry_list.append(
+                self._get_func_entry_by_node_idx(node_idx=node_idx))
+        return func_entry_list
+
+    def _get_func_entry_by_node_idx(self, node_idx: int) -> FuncEntry:
+        """
+        Get the indexed information of the function, building it
+        on the first access.
+
+        Parameters
+        ----------
+        node_idx : int
+            The index of the function node in the order of the
+            module.
+
+        Returns
+        -------
+        func_entry : FuncEntry
+            The indexed information of the function.
+        """
+        func_entry: Optional[FuncEntry] = self._func_entry_list[node_idx]
+        if func_entry is None:
+            func_entry = AstFuncEntry(
+                func_node=self._func_node_list[node_idx],
+                line_splitted_list=self.line_splitted_list)
+            self._func_entry_list[node_idx] = func_entry
+        return func_entry
+
+
+def _get_decorator_names(
+        func_node: _FuncNode, line_splitted_list: List[str]) -> List[str]:
+    """
+    Get a list of decorator names of the target function in the
+    same format as `helper.get_decorator_names_by_line_index`.
+
+    Parameters
+    ----------
+    func_node : ast.FunctionDef or ast.AsyncFunctionDef
+        The node of the target function.
+    line_splitted_list : list of str
+        A list of the module's strings separated by line.
+
+    Returns
+    -------
+    decorator_names : list of str
+        A list of decorator names.
+    """
+    decorator_names: List[str] = [
+        '@' + _get_node_source(
+            node=decorator_node, line_splitted_list=line_splitted_list)
+        for decorator_node in func_node.decorator_list]
+    return decorator_names
+
+
+def _get_node_source(node: ast.AST, line_splitted_list: List[str]) -> str:
+    """
+    Get the source string of the target node.
+
+    Parameters
+    ----------
+    node : ast.AST
+        Target node.
+    line_splitted_list : list of str
+        A list of the module's strings separated by line.
+
+    Returns
+    -------
+    source_str : str
+        The source string of the node.
+
+    Notes
+    -----
+    `ast.get_source_segment` splits the whole module on every call,
+    so the already splitted lines are sliced here instead.
+    """
+    lineno: Optional[int] = getattr(node, 'lineno', None)
+    end_lineno: Optional[int] = getattr(node, 'end_lineno', None)
+    if lineno is None or end_lineno is None:
+        return ast.unparse(node)
+    col_offset: int = node.col_offset  # type: ignore
+    end_col_offset: int = node.end_col_offset  # type: ignore
+    encoded_line_list: List[bytes] = [
+        line_str.encode('utf-8')
+        for line_str in line_splitted_list[lineno - 1:end_lineno]]
+    if len(encoded_line_list) == 1:
+        return encoded_line_list[0][col_offset:end_col_offset].decode(
+            'utf-8')
+    encoded_line_list[0] = encoded_line_list[0][col_offset:]
+    encoded_line_list[-1] = encoded_line_list[-1][:end_col_offset]
+    return b'\n'.join(encoded_line_list).decode('utf-8')
+
+
+def _get_docstring(func_node: _FuncNode) -> str:
+    """
+    Get the docstring of the target function in the same format
+    as `helper.get_func_overall_docstring`.
+
+    Parameters
+    ----------
+    func_node : ast.FunctionDef or ast.AsyncFunctionDef
+        The node of the target function.
+
+    Returns
+    -------
+    docstring : str
+        Target docstring string. Each line is indented by one level.
+    """
+    docstring: Optional[str] = ast.get_docstring(func_node, clean=True)
+    if not docstring:
+        return ''
+    line_splitted_list: List[str] = docstring.split('\n')
+    line_splitted_list = [
+        '    ' + line_str if line_str != '' else line_str
+        for line_str in line_splitted_list]
+    return '\n'.join(line_splitted_list)
+
+
+def _get_arg_info_list(
+        args_node: ast.arguments,
+        line_splitted_list: List[str]) -> List[Tuple[str, str, str]]:
+    """
+    Get the information of each argument in the order of the
+    signature.
+
+    Parameters
+    ----------
+    args_node : ast.arguments
+        The arguments node of the target function.
+    line_splitted_list : list of str
+        A list of the module's strings separated by line.
+
+    Returns
+    -------
+    arg_info_list : list of tuple
+        A list of tuples of the argument name (e.g., `*args`), the
+        argument string (e.g., `price: int = 100`) and the default
+        value string (a blank string if not exists). The bare `*`
+        of keyword-only arguments is also included.
+    """
+    positional_arg_list: List[ast.arg] = \
+        list(args_node.posonlyargs) + list(args_node.args)
+    positional_default_list: List[Optional[ast.expr]] = \
+        [None] * (len(positional_arg_list) - len(args_node.defaults))
+    positional_default_list.extend(args_node.defaults)
+    arg_list: List[Tuple[str, Optional[ast.arg], Optional[ast.expr]]] = [
+        ('', arg_node, default_node)
+        for arg_node, default_node in zip(
+            positional_arg_list, positional_default_list)]
+    if args_node.vararg is not None:
+        arg_list.append(('*', args_node.vararg, None))
+    elif args_node.kwonlyargs:
+        arg_list.append(('*', None, None))
+    arg_list.extend(
+        ('', arg_node, default_node)
+        for arg_node, default_node in zip(
+            args_node.kwonlyargs, args_node.kw_defaults))
+    if args_node.kwarg is not None:
+        arg_list.append(('**', args_node.kwarg, None))
+
+    arg_info_list: List[Tuple[str, str, str]] = []
+    for prefix, arg_node, default_node in arg_list:
+        if arg_node is None:
+            arg_info_list.append((prefix, prefix, ''))
+            continue
+        arg_name: str = prefix + arg_node.arg
+        arg_str: str = arg_name
+        if arg_node.annotation is not None:
+            arg_str += ': ' + _get_node_source(
+                node=arg_node.annotation,
+                line_splitted_list=line_splitted_list)
+        default_val: str = ''
+        if default_node is not None:
+            default_val = _get_node_source(
+                node=default_node, line_splitted_list=line_splitted_list)
+            arg_str += ' = ' + default_val
+        arg_info_list.append((arg_name, arg_str, default_val))
+    return arg_info_list
+
+
+def _return_val_exists(func_node: _FuncNode) -> bool:
+    """
+    Get a boolean value of whether or not there is a return
+    value in the function (excluding nested functions and classes).
+
+    Parameters
+    ----------
+    func_node : ast.FunctionDef or ast.AsyncFunctionDef
+        The node of the target function.
+
+    Returns
+    -------
+    result_bool : bool
+        If there is no return statement, or if the return
+        statement does not return a value, False will be set.
+    """
+    node_list: List[ast.AST] = list(func_node.body)
+    while node_list:
+        node: ast.AST = node_list.pop()
+        if isinstance(node, ast.Return):
+            if node.value is not None:
+                return True
+            continue
+        if isinstance(node, (
+                ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef,
+                ast.Lambda)):
+            continue
+        node_list.extend(ast.iter_child_nodes(node))
+    return False
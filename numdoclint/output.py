@@ -0,0 +1,513 @@
+"""A module that writes the check results to the output stream.
+
+Each check result is written to the buffered stream as soon as it is
+formatted, instead of concatenating the whole report into one string
+first, so the time to write a report is linear in the number of
+the results. Besides the human-readable text, the results can be
+written in the machine-readable formats (JSON Lines, SARIF and
+MessagePack) with the stable schema of the `OUTPUT_KEY_*` keys.
+"""
+
+import json
+import struct
+import sys
+from typing import IO, Any, Dict, List, Mapping, Optional, Union
+
+import numdoclint
+
+DEFAULT_FLUSH_INTERVAL: int = 100
+
+FORMAT_TEXT: str = 'text'
+FORMAT_JSONL: str = 'jsonl'
+FORMAT_SARIF: str = 'sarif'
+FORMAT_MSGPACK: str = 'msgpack'
+FORMAT_LIST: List[str] = [
+    FORMAT_TEXT, FORMAT_JSONL, FORMAT_SARIF, FORMAT_MSGPACK]
+
+OUTPUT_KEY_PATH: str = 'path'
+OUTPUT_KEY_LINENO: str = 'lineno'
+OUTPUT_KEY_END_LINENO: str = 'end_lineno'
+OUTPUT_KEY_FUNC_NAME: str = 'func_name'
+OUTPUT_KEY_INFO_ID: str = 'info_id'
+OUTPUT_KEY_INFO: str = 'info'
+OUTPUT_KEY_CODE_CELL_INDEX: str = 'code_cell_index'
+
+SARIF_VERSION: str = '2.1.0'
+SARIF_SCHEMA_URI: str = 'https://json.schemastore.org/sarif-2.1.0.json'
+_TOOL_INFORMATION_URI: str = 'https://github.com/simon-ritchie/numdoclint'
+
+_OUTPUT_BUFFER_SIZE: int = 1024 * 1024
+
+
+class OutputWriter:
+    """
+    The writer of the check results to a buffered stream.
+
+    Parameters
+    ----------
+    stream : IO or None, default None
+        The stream to write to. If None, the current `sys.stdout`
+        will be used on each write.
+    flush_interval : int, default DEFAULT_FLUSH_INTERVAL
+        The number of the written results to flush the stream after.
+        If 0 or less is specified, the stream will be flushed only
+        when the `flush` or the `close` is called.
+    close_stream : bool, default False
+        If True, the stream will be closed by the `close`.
+    """
+
+    def __init__(
+            self, stream: Optional[IO] = None,
+            flush_interval: int = DEFAULT_FLUSH_INTERVAL,
+            close_stream: bool = False) -> None:
+        self._stream: Optional[IO] = stream
+        self.flush_interval: int = flush_interval
+        self._close_stream: bool = close_stream
+        self._unflushed_num: int = 0
+
+    @property
+    def stream(self) -> IO:
+        """
+        Get the stream to write to.
+
+        Returns
+        -------
+        stream : IO
+            The specified stream, or the current `sys.stdout` if
+            the stream is not specified.
+        """
+        if self._stream is None:
+            return sys.stdout
+        return self._stream
+
+    def write(self, result_str: str) -> None:
+        """
+        Write the string of a single check result.
+
+        Parameters
+        ----------
+        result_str : str
+            The formatted string of the check result, including the
+            trailing line break.
+        """
+        self._write_data(data=result_str)
+
+    def write_result(self, info_dict: Mapping, result_str: str) -> None:
+        """
+        Write a single check result in the format of the writer.
+
+        Parameters
+        ----------
+        info_dict : LintResult or NotebookLintResult
+            The record of the check result.
+        result_str : str
+            The human-readable string of the check result, including
+            the trailing line break. Only used by the text format.
+        """
+        self.write(result_str=result_str)
+
+    def _write_data(self, data: Union[str, bytes]) -> None:
+        """
+        Write the data of a single check result to the stream and
+        flush the stream at the interval.
+
+        Parameters
+        ----------
+        data : str or bytes
+            The data to write.
+        """
+        self.stream.write(data)
+        self._unflushed_num += 1
+        if 0 < self.flush_interval <= self._unflushed_num:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Flush the stream.
+        """
+        self.stream.flush()
+        self._unflushed_num = 0
+
+    def close(self) -> None:
+        """
+        Flush the stream, and close it if the writer owns it.
+        """
+        self.flush()
+        if self._close_stream:
+            self.stream.close()
+
+
+class JsonLinesWriter(OutputWriter):
+    """
+    The writer of the check results in the JSON Lines format. One
+    JSON object of the `OUTPUT_KEY_*` keys is written per line.
+    """
+
+    def write_result(self, info_dict: Mapping, result_str: str) -> None:
+        """
+        Write a single check result as a JSON line.
+
+        Parameters
+        ----------
+        info_dict : LintResult or NotebookLintResult
+            The record of the check result.
+        result_str : str
+            Not used in this format.
+        """
+        self._write_data(
+            data=json.dumps(
+                info_dict.to_output_dict(),  # type: ignore
+                ensure_ascii=False) + '\n')
+
+
+class SarifWriter(OutputWriter):
+    """
+    The writer of the check results in the SARIF format. The log
+    header is written on the initialization, each result is written
+    to the `results` array as soon as it is produced, and the log is
+    closed by the `close`.
+    """
+
+    def __init__(
+            self, stream: Optional[IO] = None,
+            flush_interval: int = DEFAULT_FLUSH_INTERVAL,
+            close_stream: bool = False) -> None:
+        super().__init__(
+            stream=stream, flush_interval=flush_interval,
+            close_stream=close_stream)
+        self._result_num: int = 0
+        tool_dict: Dict[str, Any] = {
+            'driver': {
+                'name': 'numdoclint',
+                'version': numdoclint.__version__,
+                'informationUri': _TOOL_INFORMATION_URI,
+            },
+        }
+        self.stream.write(
+            '{"$schema": %s, "version": %s, "runs": [{"tool": %s, '
+            '"results": [\n' % (
+                json.dumps(SARIF_SCHEMA_URI), json.dumps(SARIF_VERSION),
+                json.dumps(tool_dict)))
+
+    def write_result(self, info_dict: Mapping, result_str: str) -> None:
+        """
+        Write a single check result to the `results` array.
+
+        Parameters
+        ----------
+        info_dict : LintResult or NotebookLintResult
+            The record of the check result.
+        result_str : str
+            Not used in this format.
+        """
+        sarif_result_dict: Dict[str, Any] = get_sarif_result_dict(
+            output_dict=info_dict.to_output_dict())  # type: ignore
+        separator: str = ',\n' if self._result_num > 0 else ''
+        self._result_num += 1
+        self._write_data(
+            data=separator + json.dumps(
+                sarif_result_dict, ensure_ascii=False))
+
+    def close(self) -> None:
+        """
+        Close the log, and then flush (or close) the stream.
+        """
+        self.stream.write('\n]}]}\n')
+        super().close()
+
+
+class MsgpackWriter(OutputWriter):
+    """
+    The writer of the check results in the MessagePack format. One
+    map of the `OUTPUT_KEY_*` keys is written per result, so the
+    output can be read with any MessagePack stream unpacker.
+    """
+
+    @property
+    def stream(self) -> IO:
+        """
+        Get the binary stream to write to.
+
+        Returns
+        -------
+        stream : IO
+            The specified stream, or the binary buffer of the current
+            `sys.stdout` if the stream is not specified.
+        """
+        if self._stream is None:
+            return sys.stdout.buffer
+        return self._stream
+
+    def write_result(self, info_dict: Mapping, result_str: str) -> None:
+        """
+        Write a single check result as a MessagePack map.
+
+        Parameters
+        ----------
+        info_dict : LintResult or NotebookLintResult
+            The record of the check result.
+        result_str : str
+            Not used in this format.
+        """
+        self._write_data(
+            data=pack_msgpack(
+                value=info_dict.to_output_dict()))  # type: ignore
+
+
+_WRITER_CLASS_DICT: Dict[str, type] = {
+    FORMAT_TEXT: OutputWriter,
+    FORMAT_JSONL: JsonLinesWriter,
+    FORMAT_SARIF: SarifWriter,
+    FORMAT_MSGPACK: MsgpackWriter,
+}
+
+_output_writer: OutputWriter = OutputWriter()
+
+
+def get_sarif_result_dict(output_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Get the SARIF result object of a single check result.
+
+    Parameters
+    ----------
+    output_dict : dict
+        The dictionary of the check result with the `OUTPUT_KEY_*`
+        keys.
+
+    Returns
+    -------
+    sarif_result_dict : dict
+        The SARIF result object. The info ID is set to the rule ID
+        and the function name is set to the logical location. If
+        the line number is unknown (0), the region is not set.
+        The end line of the region is set if it is known.
+    """
+    physical_location_dict: Dict[str, Any] = {
+        'artifactLocation': {
+            'uri': output_dict[OUTPUT_KEY_PATH].replace('\\', '/'),
+        },
+    }
+    if output_dict[OUTPUT_KEY_LINENO] > 0:
+        physical_location_dict['region'] = {
+            'startLine': output_dict[OUTPUT_KEY_LINENO],
+        }
+        if output_dict[OUTPUT_KEY_END_LINENO] >= output_dict[
+                OUTPUT_KEY_LINENO]:
+            physical_location_dict['region']['endLine'] = output_dict[
+                OUTPUT_KEY_END_LINENO]
+    sarif_result_dict: Dict[str, Any] = {
+        'ruleId': str(output_dict[OUTPUT_KEY_INFO_ID]),
+        'level': 'warning',
+        'message': {'text': output_dict[OUTPUT_KEY_INFO]},
+        'locations': [{
+            'physicalLocation': physical_location_dict,
+            'logicalLocations': [{
+                'name': output_dict[OUTPUT_KEY_FUNC_NAME],
+                'kind': 'function',
+            }],
+        }],
+        'properties': output_dict,
+    }
+    return sarif_result_dict
+
+
+def pack_msgpack(value: Any) -> bytes:
+    """
+    Pack the value in the MessagePack format.
+
+    Parameters
+    ----------
+    value : *
+        The value to pack. None, bool, int, str, list and dict
+        (and their nesting) are supported.
+
+    Returns
+    -------
+    packed_bytes : bytes
+        The packed bytes.
+
+    Raises
+    ------
+    ValueError
+        If the type of the value is not supported, or the integer
+        is out of the 64-bit range.
+    """
+    if value is None:
+        return b'\xc0'
+    if isinstance(value, bool):
+        return b'\xc3' if value else b'\xc2'
+    if isinstance(value, int):
+        return _pack_msgpack_int(value=value)
+    if isinstance(value, str):
+        encoded_bytes: bytes = value.encode('utf-8')
+        return _pack_msgpack_header(
+            length=len(encoded_bytes), fix_prefix=0xa0, fix_max_length=31,
+            prefix_tuple=(0xd9, 0xda, 0xdb)) + encoded_bytes
+    if isinstance(value, (list, tuple)):
+        return _pack_msgpack_header(
+            length=len(value), fix_prefix=0x90, fix_max_length=15,
+            prefix_tuple=(0, 0xdc, 0xdd)) + b''.join(
+                pack_msgpack(value=item) for item in value)
+    if isinstance(value, dict):
+        return _pack_msgpack_header(
+            length=len(value), fix_prefix=0x80, fix_max_length=15,
+            prefix_tuple=(0, 0xde, 0xdf)) + b''.join(
+                pack_msgpack(value=key) + pack_msgpack(value=item)
+                for key, item in value.items())
+    err_msg: str = f'Unsupported type is specified: {type(value)}'
+    raise ValueError(err_msg)
+
+
+def _pack_msgpack_int(value: int) -> bytes:
+    """
+    Pack the integer in the smallest MessagePack integer format.
+
+    Parameters
+    ----------
+    value : int
+        The integer to pack.
+
+    Returns
+    -------
+    packed_bytes : bytes
+        The packed bytes.
+
+    Raises
+    ------
+    ValueError
+        If the integer is out of the 64-bit range.
+    """
+    if 0 <= value <= 0x7f:
+        return struct.pack('B', value)
+    if -32 <= value < 0:
+        return struct.pack('b', value)
+    if 0 <= value <= 0xffffffffffffffff:
+        for prefix, fmt, max_value in (
+                (0xcc, '>B', 0xff), (0xcd, '>H', 0xffff),
+                (0xce, '>I', 0xffffffff)):
+            if value <= max_value:
+                return bytes([prefix]) + struct.pack(fmt, value)
+        return b'\xcf' + struct.pack('>Q', value)
+    if -0x8000000000000000 <= value < 0:
+        for prefix, fmt, min_value in (
+                (0xd0, '>b', -0x80), (0xd1, '>h', -0x8000),
+                (0xd2, '>i', -0x80000000)):
+            if value >= min_value:
+                return bytes([prefix]) + struct.pack(fmt, value)
+        return b'\xd3' + struct.pack('>q', value)
+    err_msg: str = f'The integer is out of the 64-bit range: {value}'
+    raise ValueError(err_msg)
+
+
+def _pack_msgpack_header(
+        length: int, fix_prefix: int, fix_max_length: int,
+        prefix_tuple: tuple) -> bytes:
+    """
+    Pack the header of the MessagePack string, array or map.
+
+    Parameters
+    ----------
+    length : int
+        The length of the string bytes, or the number of the items.
+    fix_prefix : int
+        The prefix of the fixed-length format (e.g., fixstr).
+    fix_max_length : int
+        The maximum length of the fixed-length format.
+    prefix_tuple : tuple of int
+        The prefixes of the 8, 16 and 32-bit length formats. 0 means
+        the format does not exist (e.g., array 8).
+
+    Returns
+    -------
+    header_bytes : bytes
+        The packed header bytes.
+    """
+    if length <= fix_max_length:
+        return bytes([fix_prefix | length])
+    if prefix_tuple[0] != 0 and length <= 0xff:
+        return bytes([prefix_tuple[0]]) + struct.pack('>B', length)
+    if length <= 0xffff:
+        return bytes([prefix_tuple[1]]) + struct.pack('>H', length)
+    return bytes([prefix_tuple[2]]) + struct.pack('>I', length)
+
+
+def open_output_writer(
+        output_path: Optional[str] = None,
+        flush_interval: int = DEFAULT_FLUSH_INTERVAL,
+        output_format: str = FORMAT_TEXT) -> OutputWriter:
+    """
+    Open the writer of the check results.
+
+    Parameters
+    ----------
+    output_path : str or None, default None
+        The file path to write to. If None, the standard output
+        will be used.
+    flush_interval : int, default DEFAULT_FLUSH_INTERVAL
+        The number of the written results to flush the stream after.
+    output_format : str, default 'text'
+        The output format. Specify one of the following:
+        - 'text' -> The human-readable text.
+        - 'jsonl' -> JSON Lines of the `OUTPUT_KEY_*` keys.
+        - 'sarif' -> The SARIF 2.1.0 log.
+        - 'msgpack' -> The stream of the MessagePack maps of the
+            `OUTPUT_KEY_*` keys.
+
+    Returns
+    -------
+    output_writer : OutputWriter
+        The opened writer. Call the `close` after writing.
+
+    Raises
+    ------
+    ValueError
+        If an invalid format is specified.
+    """
+    if output_format not in _WRITER_CLASS_DICT:
+        err_msg: str = f'Invalid output format is specified: {output_format}'
+        raise ValueError(err_msg)
+    writer_class: type = _WRITER_CLASS_DICT[output_format]
+    if output_path is None:
+        output_writer: OutputWriter = writer_class(
+            flush_interval=flush_interval)
+        return output_writer
+    stream: IO
+    if output_format == FORMAT_MSGPACK:
+        stream = open(
+            output_path, mode='wb', buffering=_OUTPUT_BUFFER_SIZE)
+    else:
+        stream = open(
+            output_path, mode='w', encoding='utf-8',
+            buffering=_OUTPUT_BUFFER_SIZE)
+    output_writer = writer_class(
+        stream=stream, flush_interval=flush_interval, close_stream=True)
+    return output_writer
+
+
+def get_output_writer() -> OutputWriter:
+    """
+    Get the writer that the check results are printed with.
+
+    Returns
+    -------
+    output_writer : OutputWriter
+        The current writer. The writer of the standard output is
+        set by default.
+    """
+    return _output_writer
+
+
+def set_output_writer(output_writer: Optional[OutputWriter]) -> None:
+    """
+    Set the writer that the check results are printed with.
+
+    Parameters
+    ----------
+    output_writer : OutputWriter or None
+        The writer to set. If None, the writer of the standard
+        output will be set.
+    """
+    global _output_writer
+    if output_writer is None:
+        output_writer = OutputWriter()
+    _output_writer = output_writer
@@ -0,0 +1,358 @@
+"""A module that measures the wall time of the lint run.
+
+The measurement is disabled by default. While it is disabled, each
+instrumented point only checks the `is_profile_enabled` flag, so the
+cost of the lint run is almost unchanged. While it is enabled, the
+wall time and the number of calls are added up per phase (e.g.,
+reading files, discovering functions and extracting docstrings), per
+check, per file and per function. The hits and misses of the
+internal caches (e.g., the compiled patterns of the functions) are
+counted in the same way.
+"""
+
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+PHASE_READ: str = 'read'
+PHASE_INDEX: str = 'index'
+PHASE_DISCOVERY: str = 'discovery'
+PHASE_REMOVE_STRS: str = 'remove_strs'
+PHASE_FACT_PREFIX: str = 'fact:'
+PHASE_OUTPUT: str = 'output'
+
+PROFILE_KEY_PHASE: str = 'phase'
+PROFILE_KEY_CHECK: str = 'check'
+PROFILE_KEY_FILE: str = 'file'
+PROFILE_KEY_FUNC: str = 'func'
+PROFILE_KEY_CACHE: str = 'cache'
+PROFILE_KEY_LIST: List[str] = [
+    PROFILE_KEY_PHASE, PROFILE_KEY_CHECK, PROFILE_KEY_FILE, PROFILE_KEY_FUNC,
+    PROFILE_KEY_CACHE]
+
+CACHE_RESULT_HIT: str = 'hit'
+CACHE_RESULT_MISS: str = 'miss'
+
+STAT_KEY_TIME: str = 'time'
+STAT_KEY_COUNT: str = 'count'
+
+DEFAULT_TOP_N: int = 10
+
+# The stats are held as {profile key: {name: [time, count]}} so that
+# the lists can be updated in place while measuring.
+_ProfileStats = Dict[str, Dict[str, List[Any]]]
+
+_is_enabled: bool = False
+_profile_stats: _ProfileStats = {
+    profile_key: {} for profile_key in PROFILE_KEY_LIST}
+
+
+def enable_profile() -> None:
+    """
+    Enable the measurement of the wall time.
+    """
+    global _is_enabled
+    _is_enabled = True
+
+
+def disable_profile() -> None:
+    """
+    Disable the measurement of the wall time. The measured stats
+    are kept until the `reset_profile_stats` is called.
+    """
+    global _is_enabled
+    _is_enabled = False
+
+
+def is_profile_enabled() -> bool:
+    """
+    Get whether the measurement is enabled.
+
+    Returns
+    -------
+    result_bool : bool
+        True if the measurement is enabled.
+    """
+    return _is_enabled
+
+
+def reset_profile_stats() -> None:
+    """
+    Reset the measured stats.
+    """
+    for name_dict in _profile_stats.values():
+        name_dict.clear()
+
+
+def add_time(
+        profile_key: str, name: str, elapsed_time: float,
+        count: int = 1) -> None:
+    """
+    Add the measured wall time to the stats.
+
+    Parameters
+    ----------
+    profile_key : str
+        The kind of the measured target. One of the `PROFILE_KEY_*`
+        constants.
+    name : str
+        The name of the measured target (e.g., a phase name, a
+        check name, a file path or a `path::function name`).
+    elapsed_time : float
+        The wall time in seconds.
+    count : int, default 1
+        The number of calls.
+    """
+    stat_list: Optional[List[Any]] = _profile_stats[profile_key].get(name)
+    if stat_list is None:
+        _profile_stats[profile_key][name] = [elapsed_time, count]
+        return
+    stat_list[0] += elapsed_time
+    stat_list[1] += count
+
+
+def add_cache_result(cache_name: str, is_hit: bool) -> None:
+    """
+    Count a hit or a miss of the cache if the measurement is enabled.
+
+    Parameters
+    ----------
+    cache_name : str
+        The name of the cache.
+    is_hit : bool
+        True if the value was found in the cache.
+
+    Notes
+    -----
+    The counts are added to the 'cache' stats with the
+    `<cache name>:hit` and `<cache name>:miss` names (and the wall
+    time of zero).
+    """
+    if not _is_enabled:
+        return
+    result_name: str = CACHE_RESULT_HIT if is_hit else CACHE_RESULT_MISS
+    add_time(
+        profile_key=PROFILE_KEY_CACHE, name=f'{cache_name}:{result_name}',
+        elapsed_time=0.0)
+
+
+def get_profile_stats() -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    Get the measured stats.
+
+    Returns
+    -------
+    profile_stat_dict : dict
+        A dictionary with the `PROFILE_KEY_*` keys ('phase',
+        'check', 'file', 'func' and 'cache'). Each value is a dictionary
+        with the measured names as keys and dictionaries of the
+        total wall time in seconds ('time') and the number of
+        calls ('count') as values. The phases can be nested (e.g.,
+        the 'remove_strs' is a part of the 'discovery').
+    """
+    profile_stat_dict: Dict[str, Dict[str, Dict[str, Any]]] = {
+        profile_key: {
+            name: {STAT_KEY_TIME: stat_list[0], STAT_KEY_COUNT: stat_list[1]}
+            for name, stat_list in name_dict.items()}
+        for profile_key, name_dict in _profile_stats.items()}
+    return profile_stat_dict
+
+
+def merge_profile_stats(profile_stats: _ProfileStats) -> None:
+    """
+    Add the stats measured separately (e.g., in a parallel process)
+    to the stats of the current process.
+
+    Parameters
+    ----------
+    profile_stats : dict
+        The stats returned by the `call_with_profile_stats`.
+    """
+    for profile_key, name_dict in profile_stats.items():
+        for name, stat_list in name_dict.items():
+            add_time(
+                profile_key=profile_key, name=name,
+                elapsed_time=stat_list[0], count=stat_list[1])
+
+
+def call_with_time(
+        profile_key: str, name: str, func: Callable[[], Any]) -> Any:
+    """
+    Call the function and add its wall time to the stats if the
+    measurement is enabled.
+
+    Parameters
+    ----------
+    profile_key : str
+        The kind of the measured target. One of the `PROFILE_KEY_*`
+        constants.
+    name : str
+        The name of the measured target.
+    func : callable
+        The function to call without arguments.
+
+    Returns
+    -------
+    result : *
+        The return value of the function.
+    """
+    if not _is_enabled:
+        return func()
+    start_time: float = time.perf_counter()
+    try:
+        return func()
+    finally:
+        add_time(
+            profile_key=profile_key, name=name,
+            elapsed_time=time.perf_counter() - start_time)
+
+
+def call_with_profile_stats(
+        path: str, func: Callable[[str], Any], is_enabled: bool
+        ) -> Tuple[Any, Optional[_ProfileStats]]:
+    """
+    Call the check function of a single file and measure it
+    separately, so that the stats measured in a parallel process
+    can be added up in the main process.
+
+    Parameters
+    ----------
+    path : str
+        Path of target file.
+    func : callable
+        The check function that takes the path.
+    is_enabled : bool
+        Whether the measurement is enabled in the main process.
+
+    Returns
+    -------
+    result : *
+        The return value of the check function.
+    profile_stats : dict or None
+        The stats measured in this call. None if the measurement
+        is disabled. Add them with the `merge_profile_stats`.
+    """
+    if not is_enabled:
+        return func(path), None
+    global _is_enabled, _profile_stats
+    saved_is_enabled: bool = _is_enabled
+    saved_profile_stats: _ProfileStats = _profile_stats
+    _is_enabled = True
+    _profile_stats = {profile_key: {} for profile_key in PROFILE_KEY_LIST}
+    try:
+        result: Any = func(path)
+        profile_stats: _ProfileStats = _profile_stats
+    finally:
+        _is_enabled = saved_is_enabled
+        _profile_stats = saved_profile_stats
+    return result, profile_stats
+
+
+def format_profile_stats(top_n: int = DEFAULT_TOP_N) -> str:
+    """
+    Format the measured stats as the summary tables.
+
+    Parameters
+    ----------
+    top_n : int, default 10
+        The number of the slowest files and functions to show.
+
+    Returns
+    -------
+    profile_str : str
+        The tables of the phases and the checks (sorted by the
+        total wall time), the top-N slowest files and functions, and
+        the hits and misses of the caches.
+    """
+    table_str_list: List[str] = [
+        _format_stat_table(
+            title='Phase', name_dict=_profile_stats[PROFILE_KEY_PHASE]),
+        _format_stat_table(
+            title='Check', name_dict=_profile_stats[PROFILE_KEY_CHECK]),
+        _format_stat_table(
+            title=f'Slowest files (top {top_n})',
+            name_dict=_profile_stats[PROFILE_KEY_FILE], top_n=top_n),
+        _format_stat_table(
+            title=f'Slowest functions (top {top_n})',
+            name_dict=_profile_stats[PROFILE_KEY_FUNC], top_n=top_n),
+        _format_cache_table(name_dict=_profile_stats[PROFILE_KEY_CACHE]),
+    ]
+    profile_str: str = '\n\n'.join(table_str_list) + '\n'
+    return profile_str
+
+
+def _format_stat_table(
+        title: str, name_dict: Dict[str, List[Any]],
+        top_n: Optional[int] = None) -> str:
+    """
+    Format the stats of a kind of the measured targets as a table.
+
+    Parameters
+    ----------
+    title : str
+        The title of the name column.
+    name_dict : dict
+        A dictionary with the measured names as keys and [time,
+        count] lists as values.
+    top_n : int or None, default None
+        The number of the rows to show. If None, all rows will be
+        shown.
+
+    Returns
+    -------
+    table_str : str
+        The table sorted by the total wall time in descending order.
+    """
+    sorted_item_list: List[Tuple[str, List[Any]]] = sorted(
+        name_dict.items(), key=lambda item: item[1][0], reverse=True)
+    if top_n is not None:
+        sorted_item_list = sorted_item_list[:top_n]
+    name_width: int = max(
+        [len(title)] + [len(name) for name, _ in sorted_item_list])
+    line_str_list: List[str] = [
+        f'{title:<{name_width}}  {"time (s)":>10} {"calls":>8} '
+        f'{"avg (ms)":>10}']
+    for name, (elapsed_time, count) in sorted_item_list:
+        avg_ms: float = elapsed_time / count * 1000 if count else 0.0
+        line_str_list.append(
+            f'{name:<{name_width}}  {elapsed_time:>10.4f} {count:>8} '
+            f'{avg_ms:>10.3f}')
+    table_str: str = '\n'.join(line_str_list)
+    return table_str
+
+
+def _format_cache_table(name_dict: Dict[str, List[Any]]) -> str:
+    """
+    Format the hits and misses of the caches as a table.
+
+    Parameters
+    ----------
+    name_dict : dict
+        A dictionary with the `<cache name>:hit` and
+        `<cache name>:miss` names as keys and [time, count] lists as
+        values.
+
+    Returns
+    -------
+    table_str : str
+        The table sorted by the cache name.
+    """
+    count_dict: Dict[str, Dict[str, int]] = {}
+    for name, (_, count) in name_dict.items():
+        cache_name, result_name = name.rsplit(':', 1)
+        count_dict.setdefault(
+            cache_name, {CACHE_RESULT_HIT: 0, CACHE_RESULT_MISS: 0})
+        count_dict[cache_name][result_name] += count
+    title: str = 'Cache'
+    name_width: int = max([len(title)] + [len(name) for name in count_dict])
+    line_str_list: List[str] = [
+        f'{title:<{name_width}}  {"hits":>10} {"misses":>8} '
+        f'{"hit rate":>10}']
+    for cache_name in sorted(count_dict):
+        hit_count: int = count_dict[cache_name][CACHE_RESULT_HIT]
+        miss_count: int = count_dict[cache_name][CACHE_RESULT_MISS]
+        hit_rate: float = hit_count / (hit_count + miss_count)
+        line_str_list.append(
+            f'{cache_name:<{name_width}}  {hit_count:>10} {miss_count:>8} '
+            f'{hit_rate:>10.1%}')
+    table_str: str = '\n'.join(line_str_list)
+    return table_str
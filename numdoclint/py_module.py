@@ -1,23 +1,230 @@
 """A module that checks docstrings in Python files.
 """
 
+import functools
 import inspect
 import os
 import sys
-from typing import Any, Dict, List, Tuple
+import time
+from collections.abc import Mapping
+from typing import (Any, Callable, Dict, Iterable, Iterator, List, Optional,
+                    Tuple)
 
-from numdoclint import helper
+from numdoclint import cache, helper, index_cache, output, profiler
+from numdoclint.module_index import (ENGINE_LEGACY, FuncEntry, ModuleIndex,
+                                     build_module_index,
+                                     has_decorator_to_skip)
 
 VERBOSE_DISABLED: int = 0
 VERBOSE_ENABLED: int = 1
 
 
+class _ResultRecord(Mapping):
+    """
+    The base class of the slotted check result records.
+
+    A record can be read in the same way as the dictionary of the
+    check result (e.g., `info_dict['func_name']`), but it holds no
+    dictionary per record. The key names are set to the
+    `_KEY_TUPLE` of each subclass in the order of the dictionary.
+    The position of the result (e.g., `lineno`) is held as the
+    attribute that is not included in the keys, so the keys stay
+    the same as the former dictionary.
+    """
+
+    __slots__: Tuple[str, ...] = ()
+    _KEY_TUPLE: Tuple[str, ...] = ()
+    _POSITION_KEY_TUPLE: Tuple[str, ...] = ('lineno', 'end_lineno')
+    _PATH_KEY: str = ''
+
+    def __getitem__(self, key: str) -> Any:
+        """
+        Get the value of the key.
+
+        Parameters
+        ----------
+        key : str
+            Target key name.
+
+        Returns
+        -------
+        value : *
+            The value of the key.
+
+        Raises
+        ------
+        KeyError
+            If the key does not exist in the record.
+        """
+        if key not in self._KEY_TUPLE:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterate the key names.
+
+        Returns
+        -------
+        key_iterator : Iterator
+            An iterator of the key names.
+        """
+        return iter(self._KEY_TUPLE)
+
+    def __len__(self) -> int:
+        """
+        Get the number of keys.
+
+        Returns
+        -------
+        key_num : int
+            The number of keys.
+        """
+        return len(self._KEY_TUPLE)
+
+    def __repr__(self) -> str:
+        """
+        Get the string representation of the record.
+
+        Returns
+        -------
+        repr_str : str
+            The representation string.
+        """
+        return f'{type(self).__name__}({self.to_dict()!r})'
+
+    def __reduce__(self) -> Tuple[type, tuple]:
+        """
+        Get the values to pickle the record (e.g., to pass it from
+        parallel processes).
+
+        Returns
+        -------
+        reduce_tuple : tuple
+            A tuple of the class and the values of the keys and the
+            position.
+        """
+        return type(self), tuple(
+            getattr(self, key)
+            for key in self._KEY_TUPLE + self._POSITION_KEY_TUPLE)
+
+    def to_dict(self, include_position: bool = False) -> dict:
+        """
+        Convert the record to the dictionary of the check result
+        (e.g., to serialize it to JSON).
+
+        Parameters
+        ----------
+        include_position : bool, default False
+            If True, the position of the result (e.g., `lineno`)
+            will be set to the dictionary as well.
+
+        Returns
+        -------
+        info_dict : dict
+            The dictionary of the check result.
+        """
+        info_dict: dict = {
+            key: getattr(self, key) for key in self._KEY_TUPLE}
+        if include_position:
+            for key in self._POSITION_KEY_TUPLE:
+                info_dict[key] = getattr(self, key)
+        return info_dict
+
+    def to_output_dict(self) -> dict:
+        """
+        Convert the record to the dictionary of the stable output
+        schema of the machine-readable formats.
+
+        Returns
+        -------
+        output_dict : dict
+            The dictionary with the keys of the `OUTPUT_KEY_*`
+            constants of the `output` module. The code cell index
+            is None for the results of Python modules.
+        """
+        output_dict: dict = {
+            output.OUTPUT_KEY_PATH: getattr(self, self._PATH_KEY),
+            output.OUTPUT_KEY_LINENO: getattr(self, 'lineno'),
+            output.OUTPUT_KEY_END_LINENO: getattr(self, 'end_lineno'),
+            output.OUTPUT_KEY_FUNC_NAME: getattr(self, 'func_name'),
+            output.OUTPUT_KEY_INFO_ID: getattr(self, 'info_id'),
+            output.OUTPUT_KEY_INFO: getattr(self, 'info'),
+            output.OUTPUT_KEY_CODE_CELL_INDEX: getattr(
+                self, 'code_cell_index', None),
+        }
+        return output_dict
+
+    @classmethod
+    def from_dict(cls, info_dict: dict) -> Any:
+        """
+        Make the record from the dictionary of the check result.
+
+        Parameters
+        ----------
+        info_dict : dict
+            The dictionary of the check result. If the position of
+            the result is not set, 0 will be set to it.
+
+        Returns
+        -------
+        record : _ResultRecord
+            The record of the subclass.
+        """
+        return cls(
+            *[info_dict[key] for key in cls._KEY_TUPLE],
+            *[info_dict.get(key, 0) for key in cls._POSITION_KEY_TUPLE])
+
+
+class LintResult(_ResultRecord):
+    """
+    The check result of a function in a Python module.
+
+    Parameters
+    ----------
+    module_path : str
+        Path of target module.
+    func_name : str
+        Target function name.
+    info_id : int
+        Identification number of which information.
+    info : str
+        Information of check result.
+    lineno : int, default 0
+        The line number (starting from 1) of the function's `def`
+        statement. If unknown, 0 will be set.
+    end_lineno : int, default 0
+        The line number of the last line of the function's body.
+        If unknown, 0 will be set.
+    """
+
+    __slots__: Tuple[str, ...] = (
+        'module_path', 'func_name', 'info_id', 'info', 'lineno',
+        'end_lineno')
+    _KEY_TUPLE: Tuple[str, ...] = __slots__[:4]
+    _PATH_KEY: str = 'module_path'
+
+    def __init__(
+            self, module_path: str, func_name: str, info_id: int,
+            info: str, lineno: int = 0, end_lineno: int = 0) -> None:
+        self.module_path: str = module_path
+        self.func_name: str = func_name
+        self.info_id: int = info_id
+        self.info: str = info
+        self.lineno: int = lineno
+        self.end_lineno: int = end_lineno
+
+
 def check_python_module(
         py_module_path: str, verbose: int = 1,
         ignore_func_name_prefix_list: List[str] = ['test_'],
         ignore_info_id_list: List[int] = [],
         enable_default_or_optional_doc_check: bool = False,
-        skip_decorator_name_list: List[str] = ['Appender']) -> List[dict]:
+        skip_decorator_name_list: List[str] = ['Appender'],
+        engine: str = ENGINE_LEGACY,
+        cache_dir_path: Optional[str] = None,
+        max_cache_size: int = cache.DEFAULT_MAX_CACHE_SIZE
+        ) -> List[LintResult]:
     """
     Check docstring of single Python module.
 
@@ -45,6 +252,19 @@ def check_python_module(
         If a decorator name in this list is set to function, that
         function will not be checked. Specify if necessary for
         docstring-related decorators (`Appender` is used by Pandas).
+    engine : str, default 'legacy'
+        The engine to extract functions' information. Specify one of
+        the following:
+        - 'legacy' -> The string scanning engine.
+        - 'ast' -> The engine that parses the module once with the
+            `ast` module. If the module can not be parsed, the legacy
+            engine will be used instead.
+    cache_dir_path : str or None, default None
+        The directory path to cache the check results (e.g.,
+        '.numdoclint_cache'). If None, the cache will not be used.
+    max_cache_size : int, default 104857600
+        The maximum total size of the cache files in bytes. The least
+        recently used cache files are removed beyond this size.
 
     Notes
     -----
@@ -52,7 +272,7 @@ def check_python_module(
 
     Returns
     -------
-    info_list : list of dicts
+    info_list : list of LintResult
         A list containing information on check results.
         The following values are set in the dictionary key:
         - module_path : str -> Path of target module.
@@ -64,35 +284,412 @@ def check_python_module(
     ------
     IOError
         If the target module can not be found.
+    ValueError
+        If an invalid engine is specified.
 
     Notes
     ------
     - Currently, if there are multiple functions with the same name
-        in the module, only the first function will be checked.
+        in the module, only the first function will be checked
+        (only when the legacy engine is used).
+    """
+    info_list: List[LintResult] = profiler.call_with_time(
+        profile_key=profiler.PROFILE_KEY_FILE, name=py_module_path,
+        func=lambda: _check_python_module(
+            py_module_path=py_module_path, verbose=verbose,
+            ignore_func_name_prefix_list=ignore_func_name_prefix_list,
+            ignore_info_id_list=ignore_info_id_list,
+            enable_default_or_optional_doc_check=(
+                enable_default_or_optional_doc_check),
+            skip_decorator_name_list=skip_decorator_name_list,
+            engine=engine, cache_dir_path=cache_dir_path))
+    if cache_dir_path is not None:
+        cache.evict_cache(
+            cache_dir_path=cache_dir_path, max_cache_size=max_cache_size)
+    return info_list
+
+
+def check_python_source(
+        code_str: str, virtual_path: str = '<string>', verbose: int = 1,
+        ignore_func_name_prefix_list: List[str] = ['test_'],
+        ignore_info_id_list: List[int] = [],
+        enable_default_or_optional_doc_check: bool = False,
+        skip_decorator_name_list: List[str] = ['Appender'],
+        engine: str = ENGINE_LEGACY) -> List[LintResult]:
+    """
+    Check docstring of a Python source string in memory.
+
+    Parameters
+    ----------
+    code_str : str
+        String of target Python code.
+    virtual_path : str, default '<string>'
+        The path set to the `module_path` of the results. The file
+        does not need to exist.
+    verbose : int, default 1
+        Log settings of stdout. Specify one of the following numbers:
+        - 0 -> Do not output log.
+        - 1 -> Output the check result.
+    ignore_func_name_prefix_list : list of str, default ['test_']
+        A prefix list of function name conditions to ignore.
+    ignore_info_id_list : list of int, default []
+        List of IDs to ignore lint checking. A constant with a
+        prefix of `INFO_ID_` can be specified.
+    enable_default_or_optional_doc_check : bool, default False
+        If True specified, the `default` and `optional` string
+        in docstring will be checked.
+    skip_decorator_name_list : list, default ['Appender']
+        If a decorator name in this list is set to function, that
+        function will not be checked.
+    engine : str, default 'legacy'
+        The engine to extract functions' information ('legacy' or
+        'ast').
+
+    Returns
+    -------
+    info_list : list of LintResult
+        A list containing information on check results. The keys
+        are the same as the `check_python_module`.
+
+    Raises
+    ------
+    ValueError
+        If an invalid engine is specified.
+    """
+    info_list: List[LintResult] = list(_iter_module_info(
+        py_module_path=virtual_path, module_str=code_str,
+        ignore_func_name_prefix_list=ignore_func_name_prefix_list,
+        ignore_info_id_list=ignore_info_id_list,
+        enable_default_or_optional_doc_check=(
+            enable_default_or_optional_doc_check),
+        skip_decorator_name_list=skip_decorator_name_list,
+        engine=engine))
+    _print_info_list(info_list=info_list, verbose=verbose)
+    return info_list
+
+
+def check_python_sources(
+        path_and_code_iterable: Iterable[Tuple[str, str]],
+        verbose: int = 1,
+        ignore_func_name_prefix_list: List[str] = ['test_'],
+        ignore_info_id_list: List[int] = [],
+        enable_default_or_optional_doc_check: bool = False,
+        skip_decorator_name_list: List[str] = ['Appender'],
+        engine: str = ENGINE_LEGACY) -> List[LintResult]:
+    """
+    Check docstring of multiple Python source strings in memory.
+
+    Parameters
+    ----------
+    path_and_code_iterable : iterable of tuple of str
+        An iterable of the pairs of the virtual path and the code
+        string. e.g., `[('gen/a.py', code_str_a), ...]`.
+    verbose : int, default 1
+        Log settings of stdout. Specify one of the following numbers:
+        - 0 -> Do not output log.
+        - 1 -> Output the check result.
+    ignore_func_name_prefix_list : list of str, default ['test_']
+        A prefix list of function name conditions to ignore.
+    ignore_info_id_list : list of int, default []
+        List of IDs to ignore lint checking. A constant with a
+        prefix of `INFO_ID_` can be specified.
+    enable_default_or_optional_doc_check : bool, default False
+        If True specified, the `default` and `optional` string
+        in docstring will be checked.
+    skip_decorator_name_list : list, default ['Appender']
+        If a decorator name in this list is set to function, that
+        function will not be checked.
+    engine : str, default 'legacy'
+        The engine to extract functions' information ('legacy' or
+        'ast').
+
+    Returns
+    -------
+    info_list : list of LintResult
+        A list containing information on check results in the order
+        of the iterable. The keys are the same as the
+        `check_python_module`.
+
+    Raises
+    ------
+    ValueError
+        If an invalid engine is specified.
+    """
+    info_list: List[LintResult] = []
+    for virtual_path, code_str in path_and_code_iterable:
+        info_list.extend(
+            check_python_source(
+                code_str=code_str, virtual_path=virtual_path,
+                verbose=verbose,
+                ignore_func_name_prefix_list=ignore_func_name_prefix_list,
+                ignore_info_id_list=ignore_info_id_list,
+                enable_default_or_optional_doc_check=(
+                    enable_default_or_optional_doc_check),
+                skip_decorator_name_list=skip_decorator_name_list,
+                engine=engine))
+    return info_list
+
+
+def _check_python_module(
+        py_module_path: str, verbose: int,
+        ignore_func_name_prefix_list: List[str],
+        ignore_info_id_list: List[int],
+        enable_default_or_optional_doc_check: bool,
+        skip_decorator_name_list: List[str],
+        engine: str, cache_dir_path: Optional[str]) -> List[LintResult]:
+    """
+    Check docstring of single Python module, reading and writing the
+    cache if the cache directory is specified.
+
+    Parameters
+    ----------
+    py_module_path : str
+        Path of target module.
+    verbose : int
+        Log settings of stdout.
+    ignore_func_name_prefix_list : list of str
+        A prefix list of function name conditions to ignore.
+    ignore_info_id_list : list of int
+        List of IDs to ignore lint checking.
+    enable_default_or_optional_doc_check : bool
+        If True specified, the `default` and `optional` string
+        in docstring will be checked.
+    skip_decorator_name_list : list
+        If a decorator name in this list is set to function, that
+        function will not be checked.
+    engine : str
+        The engine to extract functions' information.
+    cache_dir_path : str or None
+        The directory path to cache the check results. If None, the
+        cache will not be used.
+
+    Returns
+    -------
+    info_list : list of LintResult
+        A list containing information on check results.
+
+    Notes
+    -----
+    The cache files are not evicted in this function, so that the
+    eviction runs only once in a recursive check. If the module has
+    been changed, only the functions whose fingerprint is not in the
+    per-function cache are checked. If the cache can not be written
+    (e.g., a read-only cache directory), the results are returned
+    without being cached.
     """
     _check_module_exists(py_module_path=py_module_path)
-    module_str: str = helper.read_file_str(file_path=py_module_path)
-    func_name_list: List[str] = helper.get_func_name_list(code_str=module_str)
-    if not func_name_list:
-        return []
-    info_list: List[dict] = []
+    module_index: Optional[ModuleIndex] = None
+    if index_cache.is_index_cache_enabled():
+        module_index = index_cache.get_module_index(
+            py_module_path=py_module_path, engine=engine)
+        module_str: str = module_index.module_str
+    else:
+        module_str = helper.read_file_str(file_path=py_module_path)
+    cache_key: str = ''
+    func_cache_key: str = ''
+    cached_func_info_dict: Optional[Dict[str, List[dict]]] = None
+    func_info_dict: Optional[Dict[str, List[dict]]] = None
+    if cache_dir_path is not None:
+        options_fingerprint: str = cache.get_options_fingerprint(
+            options_dict={
+                'ignore_func_name_prefix_list': ignore_func_name_prefix_list,
+                'ignore_info_id_list': ignore_info_id_list,
+                'enable_default_or_optional_doc_check': (
+                    enable_default_or_optional_doc_check),
+                'skip_decorator_name_list': skip_decorator_name_list,
+                'engine': engine,
+            })
+        cache_key = cache.get_cache_key(
+            file_str=module_str, options_fingerprint=options_fingerprint)
+        cached_info_list: Optional[List[dict]] = cache.read_cache(
+            cache_dir_path=cache_dir_path, cache_key=cache_key)
+        if cached_info_list is not None:
+            info_list: List[LintResult] = [
+                LintResult(
+                    module_path=py_module_path,
+                    func_name=info_dict[INFO_KEY_FUNC_NAME],
+                    info_id=info_dict[INFO_KEY_INFO_ID],
+                    info=info_dict[INFO_KEY_INFO],
+                    lineno=info_dict.get(INFO_KEY_LINENO, 0),
+                    end_lineno=info_dict.get(INFO_KEY_END_LINENO, 0))
+                for info_dict in cached_info_list]
+            _print_info_list(info_list=info_list, verbose=verbose)
+            return info_list
+        func_cache_key = cache.get_func_cache_key(
+            file_path=py_module_path,
+            options_fingerprint=options_fingerprint)
+        cached_func_info_dict = cache.read_func_cache(
+            cache_dir_path=cache_dir_path, cache_key=func_cache_key)
+        func_info_dict = {}
+
+    info_list = list(_iter_module_info(
+        py_module_path=py_module_path, module_str=module_str,
+        ignore_func_name_prefix_list=ignore_func_name_prefix_list,
+        ignore_info_id_list=ignore_info_id_list,
+        enable_default_or_optional_doc_check=(
+            enable_default_or_optional_doc_check),
+        skip_decorator_name_list=skip_decorator_name_list,
+        engine=engine, module_index=module_index,
+        cached_func_info_dict=cached_func_info_dict,
+        func_info_dict=func_info_dict))
+    if cache_dir_path is not None and func_info_dict is not None:
+        cache.write_cache(
+            cache_dir_path=cache_dir_path, cache_key=cache_key,
+            info_list=[
+                info_dict.to_dict(include_position=True)
+                for info_dict in info_list])
+        cache.write_func_cache(
+            cache_dir_path=cache_dir_path, cache_key=func_cache_key,
+            func_info_dict=func_info_dict)
+    _print_info_list(info_list=info_list, verbose=verbose)
+    return info_list
+
+
+def _iter_module_info(
+        py_module_path: str, module_str: str,
+        ignore_func_name_prefix_list: List[str],
+        ignore_info_id_list: List[int],
+        enable_default_or_optional_doc_check: bool,
+        skip_decorator_name_list: List[str],
+        engine: str,
+        module_index: Optional[ModuleIndex] = None,
+        cached_func_info_dict: Optional[Dict[str, List[dict]]] = None,
+        func_info_dict: Optional[Dict[str, List[dict]]] = None
+        ) -> Iterator[LintResult]:
+    """
+    Check the functions in the module one by one and yield the
+    check results of each function as soon as it is checked.
+
+    Parameters
+    ----------
+    py_module_path : str
+        Path of target module.
+    module_str : str
+        String of target module.
+    ignore_func_name_prefix_list : list of str
+        A prefix list of function name conditions to ignore.
+    ignore_info_id_list : list of int
+        List of IDs to ignore lint checking.
+    enable_default_or_optional_doc_check : bool
+        If True specified, the `default` and `optional` string
+        in docstring will be checked.
+    skip_decorator_name_list : list
+        If a decorator name in this list is set to function, that
+        function will not be checked.
+    engine : str
+        The engine to extract functions' information.
+    module_index : ModuleIndex or None, default None
+        The index of the module built beforehand (e.g., the one in
+        the in-memory cache). If None, the index will be built from
+        the module string.
+    cached_func_info_dict : dict or None, default None
+        The per-function cache read from the cache directory (see
+        `cache.read_func_cache`). The results of the functions whose
+        fingerprint is in it are reused instead of checking them.
+    func_info_dict : dict or None, default None
+        If a dictionary is specified, the results of all checked
+        functions (without the positions) are set to it with the
+        function fingerprints as keys, to be written as the new
+        per-function cache.
+
+    Yields
+    ------
+    info_dict : LintResult
+        A record of the check result. The following values are
+        set in the dictionary key:
+        - module_path : str -> Path of target module.
+        - func_name : str -> Target function name.
+        - info_id : int -> Identification number of which information.
+        - info : str -> Information of check result.
+    """
+    if module_index is None:
+        module_index = profiler.call_with_time(
+            profile_key=profiler.PROFILE_KEY_PHASE,
+            name=profiler.PHASE_INDEX,
+            func=lambda: build_module_index(
+                module_str=module_str, engine=engine))
+    func_entry_list: List[FuncEntry] = profiler.call_with_time(
+        profile_key=profiler.PROFILE_KEY_PHASE,
+        name=profiler.PHASE_DISCOVERY,
+        func=lambda: module_index.get_func_entry_list(
+            skip_decorator_name_list=skip_decorator_name_list))
+    _run_stat_dict[RUN_STAT_KEY_SKIPPED_FUNC_NUM] += \
+        len(module_index.func_name_list) - len(func_entry_list)
     enable_def_or_opt_check: bool = enable_default_or_optional_doc_check
-    for func_name in func_name_list:
+    for func_entry in func_entry_list:
         is_func_name_to_ignore_: bool = is_func_name_to_ignore(
-            func_name=func_name,
+            func_name=func_entry.func_name,
             ignore_func_name_prefix_list=ignore_func_name_prefix_list)
         if is_func_name_to_ignore_:
             continue
-        single_func_info_list: List[dict] = get_single_func_info_list(
-            path=py_module_path,
-            code_str=module_str,
-            func_name=func_name,
-            enable_default_or_optional_doc_check=enable_def_or_opt_check,
-            skip_decorator_name_list=skip_decorator_name_list,
-            ignore_info_id_list=ignore_info_id_list,
-        )
-        info_list.extend(single_func_info_list)
-    _print_info_list(info_list=info_list, verbose=verbose)
+        if func_info_dict is None:
+            yield from _get_func_entry_info_list(
+                path=py_module_path,
+                func_entry=func_entry,
+                enable_default_or_optional_doc_check=enable_def_or_opt_check,
+                skip_decorator_name_list=[],
+                ignore_info_id_list=ignore_info_id_list,
+            )
+            continue
+        fingerprint: str = cache.get_func_fingerprint(
+            func_str=func_entry.func_str)
+        cached_info_list: Optional[List[dict]] = None
+        if cached_func_info_dict:
+            cached_info_list = cached_func_info_dict.get(fingerprint)
+        profiler.add_cache_result(
+            cache_name=FUNC_RESULT_CACHE_NAME,
+            is_hit=cached_info_list is not None)
+        single_func_info_list: List[LintResult]
+        if cached_info_list is not None:
+            single_func_info_list = _get_info_list_from_func_cache(
+                path=py_module_path, func_entry=func_entry,
+                cached_info_list=cached_info_list)
+        else:
+            single_func_info_list = _get_func_entry_info_list(
+                path=py_module_path,
+                func_entry=func_entry,
+                enable_default_or_optional_doc_check=enable_def_or_opt_check,
+                skip_decorator_name_list=[],
+                ignore_info_id_list=ignore_info_id_list,
+            )
+        func_info_dict[fingerprint] = [
+            info_dict.to_dict() for info_dict in single_func_info_list]
+        yield from single_func_info_list
+
+
+def _get_info_list_from_func_cache(
+        path: str, func_entry: FuncEntry,
+        cached_info_list: List[dict]) -> List[LintResult]:
+    """
+    Get the check results of the function from the per-function
+    cache, setting the current positions of the function.
+
+    Parameters
+    ----------
+    path : str
+        Path of target module file.
+    func_entry : FuncEntry
+        The indexed information of the target function.
+    cached_info_list : list of dicts
+        The cached check results of the function.
+
+    Returns
+    -------
+    info_list : list of LintResult
+        A list of check results for one function.
+    """
+    if not cached_info_list:
+        return []
+    lineno: int = func_entry.start_line_idx + 1
+    end_lineno: int = func_entry.last_line_idx + 1
+    info_list: List[LintResult] = [
+        LintResult(
+            module_path=path,
+            func_name=info_dict[INFO_KEY_FUNC_NAME],
+            info_id=info_dict[INFO_KEY_INFO_ID],
+            info=info_dict[INFO_KEY_INFO],
+            lineno=lineno, end_lineno=end_lineno)
+        for info_dict in cached_info_list]
     return info_list
 
 
@@ -101,7 +698,11 @@ def check_python_module_recursively(
         ignore_func_name_prefix_list: List[str] = ['test_'],
         ignore_info_id_list: List[int] = [],
         enable_default_or_optional_doc_check: bool = False,
-        skip_decorator_name_list: List[str] = ['Appender']) -> List[dict]:
+        skip_decorator_name_list: List[str] = ['Appender'],
+        engine: str = ENGINE_LEGACY, jobs: int = 1,
+        cache_dir_path: Optional[str] = None,
+        max_cache_size: int = cache.DEFAULT_MAX_CACHE_SIZE,
+        exclude_pattern_list: List[str] = []) -> List[LintResult]:
     """
     Check Python module docstring recursively.
 
@@ -129,10 +730,29 @@ def check_python_module_recursively(
         If a decorator name in this list is set to function, that
         function will not be checked. Specify if necessary for
         docstring-related decorators (`Appender` is used by Pandas).
+    engine : str, default 'legacy'
+        The engine to extract functions' information ('legacy' or
+        'ast').
+    jobs : int, default 1
+        The number of processes to check modules in parallel. If 0
+        or less is specified, the number of CPUs will be used. The
+        order of the results is the same as the order of a single
+        process.
+    cache_dir_path : str or None, default None
+        The directory path to cache the check results (e.g.,
+        '.numdoclint_cache'). If None, the cache will not be used.
+    max_cache_size : int, default 104857600
+        The maximum total size of the cache files in bytes. The least
+        recently used cache files are removed beyond this size.
+    exclude_pattern_list : list of str, default []
+        A list of the glob patterns of the directory and file paths
+        to exclude (e.g., `build`, `*/migrations`). The excluded
+        directories are not entered. The directories such as `.git`,
+        `__pycache__` and virtual environments are always excluded.
 
     Returns
     -------
-    info_list : list of dicts
+    info_list : list of LintResult
         A list containing information on check results.
         The following values are set in the dictionary key:
         - module_path : str -> Path of target module.
@@ -146,10 +766,87 @@ def check_python_module_recursively(
         ignore_func_name_prefix_list=ignore_func_name_prefix_list,
         ignore_info_id_list=ignore_info_id_list,
         enable_default_or_optional_doc_check=enable_def_or_opt_check,
-        skip_decorator_name_list=skip_decorator_name_list)
+        skip_decorator_name_list=skip_decorator_name_list,
+        engine=engine, jobs=jobs, cache_dir_path=cache_dir_path,
+        exclude_pattern_list=exclude_pattern_list)
+    if cache_dir_path is not None:
+        cache.evict_cache(
+            cache_dir_path=cache_dir_path, max_cache_size=max_cache_size)
     return info_list
 
 
+def iter_check_python_modules(
+        dir_path: str, verbose: int = 1,
+        ignore_func_name_prefix_list: List[str] = ['test_'],
+        ignore_info_id_list: List[int] = [],
+        enable_default_or_optional_doc_check: bool = False,
+        skip_decorator_name_list: List[str] = ['Appender'],
+        engine: str = ENGINE_LEGACY,
+        exclude_pattern_list: List[str] = []) -> Iterator[LintResult]:
+    """
+    Check Python module docstring recursively and yield each check
+    result as soon as each function is checked.
+
+    Parameters
+    ----------
+    dir_path : str
+        Target directory path.
+    verbose : int, default 1
+        Log settings of stdout. Specify one of the following numbers:
+        - 0 -> Do not output log.
+        - 1 -> Output the check result.
+    ignore_func_name_prefix_list : list of str, default ['test_']
+        A prefix list of function name conditions to ignore.
+    ignore_info_id_list : list of int, default []
+        List of IDs to ignore lint checking. A constant with a
+        prefix of `INFO_ID_` can be specified.
+    enable_default_or_optional_doc_check : bool, default False
+        If True specified, the `default` and `optional` string
+        in docstring will be checked.
+    skip_decorator_name_list : list, default ['Appender']
+        If a decorator name in this list is set to function, that
+        function will not be checked.
+    engine : str, default 'legacy'
+        The engine to extract functions' information ('legacy' or
+        'ast').
+    exclude_pattern_list : list of str, default []
+        A list of the glob patterns of the directory and file paths
+        to exclude (e.g., `build`, `*/migrations`). The excluded
+        directories are not entered. The directories such as `.git`,
+        `__pycache__` and virtual environments are always excluded.
+
+    Yields
+    ------
+    info_dict : LintResult
+        A record of the check result. The following values are
+        set in the dictionary key:
+        - module_path : str -> Path of target module.
+        - func_name : str -> Target function name.
+        - info_id : int -> Identification number of which information.
+        - info : str -> Information of check result.
+
+    Notes
+    -----
+    The results are the same as `check_python_module_recursively`,
+    but neither the results nor the module paths are held in memory.
+    The cache and the parallel processes are not used.
+    """
+    for py_module_path in helper.iter_file_path_recursively(
+            dir_path=dir_path, extension='.py',
+            exclude_pattern_list=exclude_pattern_list):
+        module_str: str = helper.read_file_str(file_path=py_module_path)
+        for info_dict in _iter_module_info(
+                py_module_path=py_module_path, module_str=module_str,
+                ignore_func_name_prefix_list=ignore_func_name_prefix_list,
+                ignore_info_id_list=ignore_info_id_list,
+                enable_default_or_optional_doc_check=(
+                    enable_default_or_optional_doc_check),
+                skip_decorator_name_list=skip_decorator_name_list,
+                engine=engine):
+            _print_info_list(info_list=[info_dict], verbose=verbose)
+            yield info_dict
+
+
 def is_func_name_to_ignore(
         func_name: str,
         ignore_func_name_prefix_list: List[str]) -> bool:
@@ -174,13 +871,14 @@ def is_func_name_to_ignore(
     return False
 
 
-def _print_info_list(info_list: List[dict], verbose: int) -> str:
+def _print_info_list(info_list: List[LintResult], verbose: int) -> str:
     """
-    Print check result.
+    Print check result, writing each result to the output writer
+    as soon as it is formatted.
 
     Parameters
     ----------
-    info_list : list of dicts
+    info_list : list of LintResult
         A list containing information on check results.
         The following values are necessary in the dictionary key:
         - module_path : str -> Path of target module.
@@ -199,24 +897,49 @@ def _print_info_list(info_list: List[dict], verbose: int) -> str:
         return ''
     if verbose != VERBOSE_ENABLED:
         return ''
-    printed_str: str = ''
+    printed_str: str = profiler.call_with_time(
+        profile_key=profiler.PROFILE_KEY_PHASE, name=profiler.PHASE_OUTPUT,
+        func=lambda: _write_info_list(info_list=info_list))
+    return printed_str
+
+
+def _write_info_list(info_list: List[LintResult]) -> str:
+    """
+    Write check result to the output writer.
+
+    Parameters
+    ----------
+    info_list : list of LintResult
+        A list containing information on check results.
+
+    Returns
+    -------
+    printed_str : str
+        Printed string.
+    """
+    output_writer: output.OutputWriter = output.get_output_writer()
+    result_str_list: List[str] = []
     for info_dict in info_list:
-        if printed_str != '':
-            printed_str += '\n'
-        printed_str += '{module_path}::{func_name}\n{info}\n'.format(
+        result_str: str = '{module_path}::{func_name}\n{info}\n'.format(
             module_path=info_dict[INFO_KEY_MODULE_PATH],
             func_name=info_dict[INFO_KEY_FUNC_NAME],
             info=info_dict[INFO_KEY_INFO])
-    print(printed_str)
+        output_writer.write_result(
+            info_dict=info_dict, result_str=result_str + '\n')
+        result_str_list.append(result_str)
+    printed_str: str = '\n'.join(result_str_list)
     return printed_str
 
 
 def _check_python_module_recursively(
-        dir_path: str, info_list: List[dict], verbose: int = 1,
+        dir_path: str, info_list: List[LintResult], verbose: int = 1,
         ignore_func_name_prefix_list: List[str] = ['test_'],
         ignore_info_id_list: List[int] = [],
         enable_default_or_optional_doc_check: bool = False,
-        skip_decorator_name_list: List[str] = ['Appender']) -> List[dict]:
+        skip_decorator_name_list: List[str] = ['Appender'],
+        engine: str = ENGINE_LEGACY, jobs: int = 1,
+        cache_dir_path: Optional[str] = None,
+        exclude_pattern_list: List[str] = []) -> List[LintResult]:
     """
     Check Python module docstring recursively.
 
@@ -224,7 +947,7 @@ def _check_python_module_recursively(
     ----------
     dir_path : str
         Target directory path.
-    info_list : list of dicts
+    info_list : list of LintResult
         List to add check results to.
     verbose : int, default 1
         Log settings of stdout. Specify one of the following numbers:
@@ -241,10 +964,24 @@ def _check_python_module_recursively(
     skip_decorator_name_list : list, default ['Appender']
         If a decorator name in this list is set to function, that
         function will not be checked.
+    engine : str, default 'legacy'
+        The engine to extract functions' information ('legacy' or
+        'ast').
+    jobs : int, default 1
+        The number of processes to check modules in parallel. If 0
+        or less is specified, the number of CPUs will be used. The
+        order of the results is the same as the order of a single
+        process.
+    cache_dir_path : str or None, default None
+        The directory path to cache the check results. If None, the
+        cache will not be used.
+    exclude_pattern_list : list of str, default []
+        A list of the glob patterns of the directory and file paths
+        to exclude.
 
     Returns
     -------
-    info_list : list of dicts
+    info_list : list of LintResult
         A list containing information on check results.
         The following values are set in the dictionary key:
         - module_path : str -> Path of target module.
@@ -252,33 +989,71 @@ def _check_python_module_recursively(
         - info_id : int -> Identification number of which information.
         - info : str -> Information of check result.
     """
-    file_or_folder_name_list: List[str] = os.listdir(dir_path)
-    if not file_or_folder_name_list:
-        return info_list
-    enable_def_or_opt_check: bool = enable_default_or_optional_doc_check
-    for file_or_folder_name in file_or_folder_name_list:
-        path: str = os.path.join(dir_path, file_or_folder_name)
-        path = path.replace('\\', '/')
-        if os.path.isdir(path):
-            info_list = _check_python_module_recursively(
-                dir_path=path, info_list=info_list, verbose=verbose,
-                ignore_func_name_prefix_list=ignore_func_name_prefix_list,
-                ignore_info_id_list=ignore_info_id_list,
-                enable_default_or_optional_doc_check=enable_def_or_opt_check,
-                skip_decorator_name_list=skip_decorator_name_list)
-            continue
-        if not path.endswith('.py'):
-            continue
-        unit_info_list: List[dict] = check_python_module(
-            py_module_path=path, verbose=verbose,
+    module_path_list: List[str] = helper.get_file_path_list_recursively(
+        dir_path=dir_path, extension='.py',
+        exclude_pattern_list=exclude_pattern_list)
+    check_func: Callable[[str], Tuple[List[LintResult], Dict[str, int]]] = \
+        functools.partial(
+            _check_python_module_with_run_stats,
+            verbose=VERBOSE_DISABLED,
             ignore_func_name_prefix_list=ignore_func_name_prefix_list,
             ignore_info_id_list=ignore_info_id_list,
-            enable_default_or_optional_doc_check=enable_def_or_opt_check,
-            skip_decorator_name_list=skip_decorator_name_list)
+            enable_default_or_optional_doc_check=(
+                enable_default_or_optional_doc_check),
+            skip_decorator_name_list=skip_decorator_name_list,
+            engine=engine, cache_dir_path=cache_dir_path)
+    profile_check_func: Callable[
+        [str], Tuple[Tuple[List[LintResult], Dict[str, int]], Any]] = \
+        functools.partial(
+            profiler.call_with_profile_stats, func=check_func,
+            is_enabled=profiler.is_profile_enabled())
+    for (unit_info_list, unit_stat_dict), unit_profile_stats in \
+            helper.map_in_order(
+                func=profile_check_func, path_list=module_path_list,
+                jobs=jobs):
+        _add_run_stats(stat_dict=unit_stat_dict)
+        if unit_profile_stats is not None:
+            profiler.merge_profile_stats(profile_stats=unit_profile_stats)
+        _print_info_list(info_list=unit_info_list, verbose=verbose)
         info_list.extend(unit_info_list)
     return info_list
 
 
+def _check_python_module_with_run_stats(
+        py_module_path: str, **kwargs: Any
+) -> Tuple[List[LintResult], Dict[str, int]]:
+    """
+    Check docstring of single Python module and get the run stats
+    of the check together, so that the stats counted in a parallel
+    process can be added up in the main process.
+
+    Parameters
+    ----------
+    py_module_path : str
+        Path of target module.
+    **kwargs : dict
+        The other keyword arguments of `_check_python_module`.
+
+    Returns
+    -------
+    info_list : list of LintResult
+        A list containing information on check results.
+    stat_dict : dict
+        The run stats counted in this check. The stats of the
+        current process are restored to the values before the check.
+    """
+    before_stat_dict: Dict[str, int] = get_run_stats()
+    info_list: List[LintResult] = profiler.call_with_time(
+        profile_key=profiler.PROFILE_KEY_FILE, name=py_module_path,
+        func=lambda: _check_python_module(
+            py_module_path=py_module_path, **kwargs))
+    stat_dict: Dict[str, int] = {
+        stat_key: stat_val - before_stat_dict[stat_key]
+        for stat_key, stat_val in _run_stat_dict.items()}
+    _run_stat_dict.update(before_stat_dict)
+    return info_list, stat_dict
+
+
 INFO_ID_LACKED_ARGUMENT: int = 1
 INFO_ID_LACKED_DOCSTRING_PARAM: int = 2
 INFO_ID_LACKED_DOCSTRING_PARAM_TYPE: int = 3
@@ -296,6 +1071,54 @@ INFO_KEY_MODULE_PATH: str = 'module_path'
 INFO_KEY_FUNC_NAME: str = 'func_name'
 INFO_KEY_INFO_ID: str = 'info_id'
 INFO_KEY_INFO: str = 'info'
+INFO_KEY_LINENO: str = 'lineno'
+INFO_KEY_END_LINENO: str = 'end_lineno'
+
+FUNC_RESULT_CACHE_NAME: str = 'func_result'
+
+RUN_STAT_KEY_SKIPPED_FUNC_NUM: str = 'skipped_func_num'
+
+_run_stat_dict: Dict[str, int] = {
+    RUN_STAT_KEY_SKIPPED_FUNC_NUM: 0,
+}
+
+
+def get_run_stats() -> Dict[str, int]:
+    """
+    Get the stats of the checks run in the current process since
+    the start or the last reset.
+
+    Returns
+    -------
+    stat_dict : dict
+        A copied dictionary of the stats. The following keys are set:
+        - skipped_func_num : int -> The number of functions skipped
+            by the decorators of `skip_decorator_name_list`. The
+            functions of the modules read from the cache are not
+            counted.
+    """
+    return dict(_run_stat_dict)
+
+
+def reset_run_stats() -> None:
+    """
+    Reset all of the run stats to zero.
+    """
+    for stat_key in _run_stat_dict:
+        _run_stat_dict[stat_key] = 0
+
+
+def _add_run_stats(stat_dict: Dict[str, int]) -> None:
+    """
+    Add the stats counted in another process to the run stats.
+
+    Parameters
+    ----------
+    stat_dict : dict
+        The stats to add.
+    """
+    for stat_key, stat_val in stat_dict.items():
+        _run_stat_dict[stat_key] += stat_val
 
 
 def get_info_id_list() -> List[int]:
@@ -323,7 +1146,8 @@ def get_single_func_info_list(
         path: str, code_str: str, func_name: str,
         enable_default_or_optional_doc_check: bool,
         skip_decorator_name_list: List[str],
-        ignore_info_id_list: List[int]) -> List[dict]:
+        ignore_info_id_list: List[int],
+        module_index: Optional[ModuleIndex] = None) -> List[LintResult]:
     """
     Get a list that stores the check result information for
     one function.
@@ -345,10 +1169,15 @@ def get_single_func_info_list(
     ignore_info_id_list : list of int
         List of IDs to ignore lint checking. A constant with a
         prefix of `INFO_ID_` can be specified.
+    module_index : ModuleIndex or None, default None
+        The index of the target code. Specify the same index when
+        checking multiple functions of the same code so that the
+        code is not scanned again for each function. If None, the
+        index will be built from `code_str`.
 
     Returns
     -------
-    info_list : list of dict
+    info_list : list of LintResult
         A list of check results for one function.
         The following keys are set in the dictionary:
         - module_path : str
@@ -356,99 +1185,111 @@ def get_single_func_info_list(
         - info_id : int
         - info : str
     """
-    info_list: List[dict] = []
-    docstring: str = helper.get_func_overall_docstring(
-        py_module_str=code_str, func_name=func_name)
-    arg_name_list: List[str] = helper.get_arg_name_list(
-        py_module_str=code_str, func_name=func_name)
-    default_val_info_dict: Dict[str, str] = \
-        helper.get_arg_default_val_info_dict(
-            py_module_str=code_str, func_name=func_name)
-    param_info_list: List[Dict[str, str]] = \
-        helper.get_docstring_param_info_list(
-            docstring=docstring)
-    optional_arg_name_list: List[str] = helper.get_optional_arg_name_list(
-        docstring=docstring)
-    return_val_info_list: List[Dict[str, str]] = \
-        helper.get_docstring_return_val_info_list(
-            docstring=docstring)
-    return_val_exists_in_func: bool = helper.return_val_exists_in_func(
-        module_str=code_str, func_name=func_name)
-    kwargs_exists: bool = helper.kwargs_exists(
-        py_module_str=code_str, func_name=func_name)
-    decorator_names: List[str] = helper.get_decorator_names(
-        py_module_str=code_str, func_name=func_name)
-    joined_decorator_names: str = ' '.join(decorator_names)
-    for skip_decorator_name in skip_decorator_name_list:
-        is_in: bool = skip_decorator_name in joined_decorator_names
-        if is_in:
-            return []
+    if module_index is None:
+        module_index = ModuleIndex(module_str=code_str)
+    func_entry: FuncEntry = module_index.get_func_entry(func_name=func_name)
+    info_list: List[LintResult] = _get_func_entry_info_list(
+        path=path, func_entry=func_entry,
+        enable_default_or_optional_doc_check=(
+            enable_default_or_optional_doc_check),
+        skip_decorator_name_list=skip_decorator_name_list,
+        ignore_info_id_list=ignore_info_id_list)
+    return info_list
 
-    unit_info_list: List[dict] = _check_func_description(
-        module_path=path, func_name=func_name,
-        docstring=docstring)
-    info_list.extend(unit_info_list)
-
-    unit_info_list = _check_lacked_param(
-        module_path=path, func_name=func_name,
-        arg_name_list=arg_name_list, param_info_list=param_info_list,
-        kwargs_exists=kwargs_exists)
-    info_list.extend(unit_info_list)
-
-    unit_info_list = _check_lacked_docstring_param_type(
-        module_path=path, func_name=func_name,
-        param_info_list=param_info_list)
-    info_list.extend(unit_info_list)
-
-    unit_info_list = _check_lacked_docstring_param_description(
-        module_path=path, func_name=func_name,
-        param_info_list=param_info_list)
-    info_list.extend(unit_info_list)
-
-    unit_info_list = _check_docstring_param_order(
-        module_path=path, func_name=func_name,
-        arg_name_list=arg_name_list, param_info_list=param_info_list)
-    info_list.extend(unit_info_list)
-
-    if enable_default_or_optional_doc_check:
-        unit_info_list = _check_lacked_default_value(
-            module_path=path, func_name=func_name,
-            param_info_list=param_info_list,
-            default_val_info_dict=default_val_info_dict,
-            optional_arg_name_list=optional_arg_name_list)
-        info_list.extend(unit_info_list)
 
-    unit_info_list = _check_lacked_return(
-        module_path=path, func_name=func_name,
-        return_val_info_list=return_val_info_list,
-        return_val_exists_in_func=return_val_exists_in_func)
-    info_list.extend(unit_info_list)
+def _get_func_entry_info_list(
+        path: str, func_entry: FuncEntry,
+        enable_default_or_optional_doc_check: bool,
+        skip_decorator_name_list: List[str],
+        ignore_info_id_list: List[int]) -> List[LintResult]:
+    """
+    Get a list that stores the check result information for
+    one indexed function.
 
-    unit_info_list = _check_lacked_return_docstring_type(
-        module_path=path, func_name=func_name,
-        return_val_info_list=return_val_info_list)
-    info_list.extend(unit_info_list)
+    Parameters
+    ----------
+    path : str
+        Path of target module file.
+    func_entry : FuncEntry
+        The indexed information of the target function.
+    enable_default_or_optional_doc_check : bool
+        If True specified, the `default` and `optional` string
+        in docstring will be checked.
+    skip_decorator_name_list : list
+        If a decorator name in this list is set to function, that
+        function will not be checked.
+    ignore_info_id_list : list of int
+        List of IDs to ignore lint checking. A constant with a
+        prefix of `INFO_ID_` can be specified.
 
-    unit_info_list = _check_lacked_return_docstring_description(
-        module_path=path, func_name=func_name,
-        return_val_info_list=return_val_info_list)
-    info_list.extend(unit_info_list)
+    Returns
+    -------
+    info_list : list of LintResult
+        A list of check results for one function.
+        The following keys are set in the dictionary:
+        - module_path : str
+        - func_name : str
+        - info_id : int
+        - info : str
+    """
+    func_name: str = func_entry.func_name
+    if has_decorator_to_skip(
+            decorator_names=func_entry.decorator_names,
+            skip_decorator_name_list=skip_decorator_name_list):
+        return []
+    is_profile_enabled: bool = profiler.is_profile_enabled()
+    func_start_time: float = time.perf_counter() if is_profile_enabled \
+        else 0.0
+
+    active_check_spec_list: List[_CheckSpec] = _get_active_check_spec_list(
+        ignore_info_id_tuple=tuple(ignore_info_id_list),
+        enable_default_or_optional_doc_check=(
+            enable_default_or_optional_doc_check))
+    info_list: List[LintResult] = []
+    for check_func, _, fact_name_dict in active_check_spec_list:
+        fact_kwargs: Dict[str, Any] = {
+            arg_name: getattr(func_entry, fact_name)
+            for arg_name, fact_name in fact_name_dict.items()}
+        if not is_profile_enabled:
+            info_list.extend(check_func(
+                module_path=path, func_name=func_name, **fact_kwargs))
+            continue
+        start_time: float = time.perf_counter()
+        unit_info_list: List[LintResult] = check_func(
+            module_path=path, func_name=func_name, **fact_kwargs)
+        profiler.add_time(
+            profile_key=profiler.PROFILE_KEY_CHECK,
+            name=_CHECK_PROFILE_NAME_DICT[check_func],
+            elapsed_time=time.perf_counter() - start_time)
+        info_list.extend(unit_info_list)
 
     info_list = _remove_info_to_ignore_by_id(
         info_list=info_list,
         ignore_info_id_list=ignore_info_id_list)
+    if info_list:
+        lineno: int = func_entry.start_line_idx + 1
+        end_lineno: int = func_entry.last_line_idx + 1
+        for info_dict in info_list:
+            info_dict.lineno = lineno
+            info_dict.end_lineno = end_lineno
+    if is_profile_enabled:
+        profiler.add_time(
+            profile_key=profiler.PROFILE_KEY_FUNC,
+            name=f'{path}::{func_name}',
+            elapsed_time=time.perf_counter() - func_start_time)
 
     return info_list
 
 
 def _remove_info_to_ignore_by_id(
-        info_list: List[dict], ignore_info_id_list: List[int]) -> List[dict]:
+        info_list: List[LintResult], ignore_info_id_list: List[int]
+        ) -> List[LintResult]:
     """
     Remove information from list if specified to ignore.
 
     Parameters
     ----------
-    info_list : list of dicts
+    info_list : list of LintResult
         A list of check results. The following keys are set
         in the dictionary:
         - module_path : str
@@ -461,12 +1302,12 @@ def _remove_info_to_ignore_by_id(
 
     Returns
     ----------
-    after_info_list : list of dicts
+    after_info_list : list of LintResult
         A list after removed information to ignore.
     """
     if not info_list:
         return info_list
-    after_info_list: List[dict] = []
+    after_info_list: List[LintResult] = []
     for info_dict in info_list:
         is_in: bool = info_dict[INFO_KEY_INFO_ID] in ignore_info_id_list
         if is_in:
@@ -477,7 +1318,7 @@ def _remove_info_to_ignore_by_id(
 
 def _check_lacked_return_docstring_description(
         module_path: str, func_name: str,
-        return_val_info_list: List[dict]) -> List[dict]:
+        return_val_info_list: List[dict]) -> List[LintResult]:
     """
     Check if the docstring description for the return value is lacked.
 
@@ -508,7 +1349,7 @@ def _check_lacked_return_docstring_description(
     """
     if not return_val_info_list:
         return []
-    info_list: List[dict] = []
+    info_list: List[LintResult] = []
     for return_val_info_dict in return_val_info_list:
         name: str = return_val_info_dict[helper.DOC_RETURN_INFO_KEY_NAME]
         type_name: str = return_val_info_dict[
@@ -520,7 +1361,7 @@ def _check_lacked_return_docstring_description(
         info: str = 'Docstring description of return value is missing.'
         info += '\nReturn value name: %s' % name
         info += '\nReturn value type: %s' % type_name
-        info_dict: dict = _make_info_dict(
+        info_dict: LintResult = _make_info_dict(
             module_path=module_path,
             func_name=func_name,
             info_id=INFO_ID_LACKED_DOCSTRING_RETURN_DESCRIPTION,
@@ -531,7 +1372,7 @@ def _check_lacked_return_docstring_description(
 
 def _check_lacked_docstring_param_description(
         module_path: str, func_name: str,
-        param_info_list: List[dict]) -> List[dict]:
+        param_info_list: List[dict]) -> List[LintResult]:
     """
     Check that the docstring argument description is not lacked.
 
@@ -562,7 +1403,7 @@ def _check_lacked_docstring_param_description(
     if not param_info_list:
         return []
 
-    info_list: List[dict] = []
+    info_list: List[LintResult] = []
     for param_info_dict in param_info_list:
         arg_name: str = param_info_dict[helper.DOC_PARAM_INFO_KEY_ARG_NAME]
         description: str = param_info_dict[
@@ -571,7 +1412,7 @@ def _check_lacked_docstring_param_description(
             continue
         info: str = 'Missing docstring argument information.'
         info += f'\nArgument name: {arg_name}'
-        info_dict: dict = _make_info_dict(
+        info_dict: LintResult = _make_info_dict(
             module_path=module_path,
             func_name=func_name,
             info_id=INFO_ID_LACKED_DOCSTRING_PARAM_DESCRIPTION,
@@ -582,7 +1423,7 @@ def _check_lacked_docstring_param_description(
 
 def _check_lacked_return_docstring_type(
         module_path: str, func_name: str,
-        return_val_info_list: List[dict]) -> List[dict]:
+        return_val_info_list: List[dict]) -> List[LintResult]:
     """
     Check that the type specification is not lacked in the
     return value's docstring.
@@ -604,7 +1445,7 @@ def _check_lacked_return_docstring_type(
 
     Returns
     -------
-    info_list : list of dicts
+    info_list : list of LintResult
         A list of check results for one function.
         The following keys are set in the dictionary:
         - module_path : str
@@ -614,7 +1455,7 @@ def _check_lacked_return_docstring_type(
     """
     if not return_val_info_list:
         return []
-    info_list: List[dict] = []
+    info_list: List[LintResult] = []
     for return_val_info_dict in return_val_info_list:
         return_value_name: str = return_val_info_dict[
             helper.DOC_RETURN_INFO_KEY_NAME]
@@ -625,7 +1466,7 @@ def _check_lacked_return_docstring_type(
         info: str = 'Missing docstring type information, or maybe missing '\
             'return value name (colon not exists).'
         info += f'\nReturn value name: {return_value_name}'
-        info_dict: dict = _make_info_dict(
+        info_dict: LintResult = _make_info_dict(
             module_path=module_path,
             func_name=func_name,
             info_id=INFO_ID_LACKED_DOCSTRING_RETURN_TYPE,
@@ -637,7 +1478,7 @@ def _check_lacked_return_docstring_type(
 def _check_lacked_return(
         module_path: str, func_name: str,
         return_val_info_list: List[dict],
-        return_val_exists_in_func: bool) -> List[dict]:
+        return_val_exists_in_func: bool) -> List[LintResult]:
     """
     Check if the return value or docstring is lacked.
 
@@ -660,7 +1501,7 @@ def _check_lacked_return(
 
     Returns
     -------
-    info_list : list of dicts
+    info_list : list of LintResult
         A list of check results for one function.
         The following keys are set in the dictionary:
         - module_path : str
@@ -677,7 +1518,7 @@ def _check_lacked_return(
     if return_val_exists_in_func and not return_val_info_list:
         info: str = 'While the return value exists in the function, '\
             'the return value document does not exist in docstring.'
-        info_dict: dict = _make_info_dict(
+        info_dict: LintResult = _make_info_dict(
             module_path=module_path, func_name=func_name,
             info_id=INFO_ID_LACKED_DOCSTRING_RETURN,
             info=info)
@@ -698,7 +1539,7 @@ def _check_lacked_return(
 def _check_lacked_default_value(
         module_path: str, func_name: str, param_info_list: List[dict],
         default_val_info_dict: Dict[str, str],
-        optional_arg_name_list: List[str]) -> List[dict]:
+        optional_arg_name_list: List[str]) -> List[LintResult]:
     """
     Check that the default value of the argument is not missing.
 
@@ -723,7 +1564,7 @@ def _check_lacked_default_value(
 
     Returns
     -------
-    info_list : list of dicts
+    info_list : list of LintResult
         A list of check results for one function.
         The following keys are set in the dictionary:
         - module_path : str
@@ -731,7 +1572,7 @@ def _check_lacked_default_value(
         - info_id : int
         - info : str
     """
-    info_list: List[dict] = []
+    info_list: List[LintResult] = []
     for param_info_dict in param_info_list:
         param_info_arg_name: str = param_info_dict[
             helper.DOC_PARAM_INFO_KEY_ARG_NAME]
@@ -754,7 +1595,7 @@ def _check_lacked_default_value(
             info += f'\nArgument name: {param_info_arg_name}'
             info += '\nArgument default value: %s' \
                 % default_val_info_dict[param_info_arg_name]
-            info_dict: dict = _make_info_dict(
+            info_dict: LintResult = _make_info_dict(
                 module_path=module_path,
                 func_name=func_name,
                 info_id=INFO_ID_LACKED_DOC_DEFAULT_VALUE,
@@ -778,7 +1619,7 @@ def _check_lacked_default_value(
 
 
 def _check_func_description(
-        module_path: str, func_name: str, docstring: str) -> List[dict]:
+        module_path: str, func_name: str, docstring: str) -> List[LintResult]:
     """
     Check that the target docstring has a function description.
 
@@ -793,7 +1634,7 @@ def _check_func_description(
 
     Returns
     -------
-    info_list : list of dict
+    info_list : list of LintResult
         A list of check results for one function.
         The following keys are set in the dictionary:
         - module_path : str
@@ -812,7 +1653,7 @@ def _check_func_description(
     if func_description != '':
         return []
     info: str = 'The function description is not set to docstring.'
-    info_dict: dict = _make_info_dict(
+    info_dict: LintResult = _make_info_dict(
         module_path=module_path,
         func_name=func_name,
         info_id=INFO_ID_LACKED_FUNC_DESCRIPTION,
@@ -822,7 +1663,7 @@ def _check_func_description(
 
 def _check_docstring_param_order(
         module_path: str, func_name: str, arg_name_list: List[str],
-        param_info_list: List[dict]) -> List[dict]:
+        param_info_list: List[dict]) -> List[LintResult]:
     """
     Check that the order of arguments and docstring is the same.
 
@@ -844,7 +1685,7 @@ def _check_docstring_param_order(
 
     Returns
     -------
-    info_list : list of dict
+    info_list : list of LintResult
         A list of check results for one function.
         The following keys are set in the dictionary:
         - module_path : str
@@ -857,7 +1698,7 @@ def _check_docstring_param_order(
     param_info_arg_name_list: List[str] = [
         param_info_dict[helper.DOC_PARAM_INFO_KEY_ARG_NAME]
         for param_info_dict in param_info_list]
-    info_list: List[dict] = []
+    info_list: List[LintResult] = []
     for i, arg_name in enumerate(arg_name_list):
         param_info_arg_name: str = param_info_arg_name_list[i]
         if arg_name == param_info_arg_name:
@@ -865,7 +1706,7 @@ def _check_docstring_param_order(
         info: str = 'The order of the argument and docstring is different.'
         info += f'\nOrder of arguments: {arg_name_list}'
         info += f'\nOrder of docstring parameters: {param_info_arg_name_list}'
-        info_dict: dict = _make_info_dict(
+        info_dict: LintResult = _make_info_dict(
             module_path=module_path,
             func_name=func_name,
             info_id=INFO_ID_DIFFERENT_PARAM_ORDER,
@@ -877,7 +1718,7 @@ def _check_docstring_param_order(
 
 def _check_lacked_docstring_param_type(
         module_path: str, func_name: str,
-        param_info_list: List[dict]) -> List[dict]:
+        param_info_list: List[dict]) -> List[LintResult]:
     """
     Check that the docstring argument type is not lacked.
 
@@ -897,7 +1738,7 @@ def _check_lacked_docstring_param_type(
 
     Returns
     -------
-    info_list : list of dict
+    info_list : list of LintResult
         A list of check results for one function.
         The following keys are set in the dictionary:
         - module_path : str
@@ -905,7 +1746,7 @@ def _check_lacked_docstring_param_type(
         - info_id : int
         - info : str
     """
-    info_list: List[dict] = []
+    info_list: List[LintResult] = []
     for param_info_dict in param_info_list:
         arg_name: str = param_info_dict[helper.DOC_PARAM_INFO_KEY_ARG_NAME]
         type_name: str = param_info_dict[helper.DOC_PARAM_INFO_KEY_TYPE_NAME]
@@ -917,7 +1758,7 @@ def _check_lacked_docstring_param_type(
             continue
         info: str = 'Missing docstring argument type information.'
         info += f'\nTarget argument: {arg_name}'
-        info_dict: dict = _make_info_dict(
+        info_dict: LintResult = _make_info_dict(
             module_path=module_path,
             func_name=func_name,
             info_id=INFO_ID_LACKED_DOCSTRING_PARAM_TYPE,
@@ -928,7 +1769,7 @@ def _check_lacked_docstring_param_type(
 
 def _check_lacked_param(
         module_path: str, func_name: str, arg_name_list: List[str],
-        param_info_list: List[dict], kwargs_exists: bool) -> List[dict]:
+        param_info_list: List[dict], kwargs_exists: bool) -> List[LintResult]:
     """
     Check for missing arguments between arguments and docstring.
 
@@ -952,7 +1793,7 @@ def _check_lacked_param(
 
     Returns
     -------
-    info_list : list of dict
+    info_list : list of LintResult
         A list of check results for one function.
         The following keys are set in the dictionary:
         - module_path : str
@@ -960,7 +1801,7 @@ def _check_lacked_param(
         - info_id : int
         - info : str
     """
-    info_list: List[dict] = []
+    info_list: List[LintResult] = []
 
     for param_info_dict in param_info_list:
         if kwargs_exists:
@@ -1007,9 +1848,9 @@ def _check_lacked_param(
 
 def _make_info_dict(
         module_path: str, func_name: str, info_id: int,
-        info: str) -> dict:
+        info: str) -> LintResult:
     """
-    Make a dictionaly of check result information.
+    Make a record of check result information.
 
     Parameters
     ----------
@@ -1025,23 +1866,109 @@ def _make_info_dict(
 
     Returns
     -------
-    info_dict : dict
-        Dictionary with check results information. The keys with
-        the following constants will be set.
+    info_dict : LintResult
+        The record with check results information. The keys with
+        the following constants can be read.
         - INFO_KEY_MODULE_PATH : str
         - INFO_KEY_FUNC_NAME : str
         - INFO_KEY_INFO_ID : int
         - INFO_KEY_INFO : str
     """
-    info_dict: dict = {
-        INFO_KEY_MODULE_PATH: module_path,
-        INFO_KEY_FUNC_NAME: func_name,
-        INFO_KEY_INFO_ID: info_id,
-        INFO_KEY_INFO: info,
-    }
+    info_dict: LintResult = LintResult(
+        module_path=module_path, func_name=func_name, info_id=info_id,
+        info=info)
     return info_dict
 
 
+_DEFAULT_VALUE_INFO_ID_LIST: List[int] = [
+    INFO_ID_LACKED_ARG_DEFAULT_VALUE,
+    INFO_ID_LACKED_DOC_DEFAULT_VALUE,
+]
+
+_CheckSpec = Tuple[Callable[..., List[LintResult]], List[int], Dict[str, str]]
+
+# Each check is declared with the information IDs it can return and
+# the facts it needs (the check's argument name -> the attribute name
+# of the FuncEntry), in the order of the check results.
+_CHECK_SPEC_LIST: List[_CheckSpec] = [
+    (_check_func_description,
+     [INFO_ID_LACKED_FUNC_DESCRIPTION],
+     {'docstring': 'docstring'}),
+    (_check_lacked_param,
+     [INFO_ID_LACKED_ARGUMENT, INFO_ID_LACKED_DOCSTRING_PARAM],
+     {'arg_name_list': 'arg_name_list',
+      'param_info_list': 'param_info_list',
+      'kwargs_exists': 'kwargs_exists'}),
+    (_check_lacked_docstring_param_type,
+     [INFO_ID_LACKED_DOCSTRING_PARAM_TYPE],
+     {'param_info_list': 'param_info_list'}),
+    (_check_lacked_docstring_param_description,
+     [INFO_ID_LACKED_DOCSTRING_PARAM_DESCRIPTION],
+     {'param_info_list': 'param_info_list'}),
+    (_check_docstring_param_order,
+     [INFO_ID_DIFFERENT_PARAM_ORDER],
+     {'arg_name_list': 'arg_name_list',
+      'param_info_list': 'param_info_list'}),
+    (_check_lacked_default_value,
+     _DEFAULT_VALUE_INFO_ID_LIST,
+     {'param_info_list': 'param_info_list',
+      'default_val_info_dict': 'default_val_info_dict',
+      'optional_arg_name_list': 'optional_arg_name_list'}),
+    (_check_lacked_return,
+     [INFO_ID_LACKED_DOCSTRING_RETURN, INFO_ID_LACKED_RETURN_VAL],
+     {'return_val_info_list': 'return_val_info_list',
+      'return_val_exists_in_func': 'return_val_exists'}),
+    (_check_lacked_return_docstring_type,
+     [INFO_ID_LACKED_DOCSTRING_RETURN_TYPE],
+     {'return_val_info_list': 'return_val_info_list'}),
+    (_check_lacked_return_docstring_description,
+     [INFO_ID_LACKED_DOCSTRING_RETURN_DESCRIPTION],
+     {'return_val_info_list': 'return_val_info_list'}),
+]
+
+# The names of the checks in the profiling stats, e.g.,
+# `check_lacked_param (ID 1, 2)`.
+_CHECK_PROFILE_NAME_DICT: Dict[Callable, str] = {
+    check_func: '{check_name} (ID {info_ids})'.format(
+        check_name=check_func.__name__.lstrip('_'),
+        info_ids=', '.join(str(info_id) for info_id in info_id_list))
+    for check_func, info_id_list, _ in _CHECK_SPEC_LIST}
+
+
+@functools.lru_cache(maxsize=64)
+def _get_active_check_spec_list(
+        ignore_info_id_tuple: Tuple[int, ...],
+        enable_default_or_optional_doc_check: bool) -> List[_CheckSpec]:
+    """
+    Get a list of the checks that can return any information
+    not to ignore.
+
+    Parameters
+    ----------
+    ignore_info_id_tuple : tuple of int
+        The IDs to ignore lint checking.
+    enable_default_or_optional_doc_check : bool
+        If False, the check of the default value will be excluded.
+
+    Returns
+    -------
+    active_check_spec_list : list of tuple
+        A list of the check declarations in the order of the check
+        results.
+    """
+    active_check_spec_list: List[_CheckSpec] = []
+    for check_spec in _CHECK_SPEC_LIST:
+        for info_id in check_spec[1]:
+            if info_id in ignore_info_id_tuple:
+                continue
+            if (not enable_default_or_optional_doc_check
+                    and info_id in _DEFAULT_VALUE_INFO_ID_LIST):
+                continue
+            active_check_spec_list.append(check_spec)
+            break
+    return active_check_spec_list
+
+
 def _check_module_exists(py_module_path: str) -> None:
     """
     Check that the target module exists.
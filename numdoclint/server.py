@@ -0,0 +1,592 @@
+"""A module that serves the check results from a long-running process.
+
+The server listens on a local Unix socket and keeps the check results
+in memory, so that editor integrations and hooks can skip the start
+up and the re-parsing of unchanged files. One JSON request is sent per
+line and one JSON response is returned per line.
+"""
+
+import getpass
+import json
+import os
+import socket
+import socketserver
+import stat
+import tempfile
+from collections import OrderedDict
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from numdoclint import cache, index_cache, jupyter_notebook, py_module
+from numdoclint.module_index import ENGINE_LEGACY
+
+SOCKET_FILE_NAME: str = 'numdoclint.sock'
+
+COMMAND_CHECK: str = 'check'
+COMMAND_PING: str = 'ping'
+COMMAND_SHUTDOWN: str = 'shutdown'
+
+REQUEST_KEY_COMMAND: str = 'command'
+REQUEST_KEY_PATH: str = 'path'
+REQUEST_KEY_CODE_STR: str = 'code_str'
+REQUEST_KEY_OPTIONS: str = 'options'
+
+RESPONSE_KEY_INFO_LIST: str = 'info_list'
+RESPONSE_KEY_ERROR: str = 'error'
+
+DEFAULT_MAX_RESULT_NUM: int = 4096
+
+DEFAULT_TIMEOUT_SEC: float = 60.0
+
+_NOTEBOOK_OPTION_KEY_LIST: List[str] = [
+    'ignore_func_name_prefix_list',
+    'ignore_info_id_list',
+    'enable_default_or_optional_doc_check',
+]
+
+
+def _get_private_socket_dir_path() -> str:
+    """
+    Get the path of the per-user directory in the temporary directory
+    to place the socket in.
+
+    Returns
+    -------
+    socket_dir_path : str
+        The directory path containing the user id (or the user name
+        on the platforms without the user id).
+    """
+    user_id: str
+    if hasattr(os, 'getuid'):
+        user_id = str(os.getuid())
+    else:
+        user_id = getpass.getuser()
+    socket_dir_path: str = os.path.join(
+        tempfile.gettempdir(), f'numdoclint-{user_id}')
+    return socket_dir_path
+
+
+def _get_default_socket_path() -> str:
+    """
+    Get the default socket path of the current user.
+
+    Returns
+    -------
+    socket_path : str
+        The socket path in the `XDG_RUNTIME_DIR` directory if it is
+        set. Otherwise, the socket path in the per-user directory in
+        the temporary directory.
+
+    Notes
+    -----
+    The socket path is not shared by the users, so the client of a
+    user does not connect to the server of another user.
+    """
+    runtime_dir_path: str = os.environ.get('XDG_RUNTIME_DIR', '')
+    if runtime_dir_path and os.path.isdir(runtime_dir_path):
+        return os.path.join(runtime_dir_path, SOCKET_FILE_NAME)
+    return os.path.join(_PRIVATE_SOCKET_DIR_PATH, SOCKET_FILE_NAME)
+
+
+_PRIVATE_SOCKET_DIR_PATH: str = _get_private_socket_dir_path()
+
+DEFAULT_SOCKET_PATH: str = _get_default_socket_path()
+
+
+class CheckServer(socketserver.UnixStreamServer):
+    """
+    The server that checks the files and keeps the results in memory.
+
+    Parameters
+    ----------
+    socket_path : str
+        The Unix socket path to listen on. If a stale socket file
+        exists at the path, it will be replaced.
+    max_result_num : int, default 4096
+        The maximum number of the check results kept in memory. The
+        least recently used results are discarded first.
+
+    Attributes
+    ----------
+    is_shutdown_requested : bool
+        True if the shutdown command has been received.
+
+    Raises
+    ------
+    IOError
+        - If a file other than a socket exists at the path.
+        - If the per-user socket directory is not private to the
+          current user.
+    Exception
+        If another server is already running at the path.
+
+    Notes
+    -----
+    The per-user socket directory in the temporary directory is
+    created with the 0700 mode if it does not exist, and the socket
+    file is set to the 0600 mode, so the other users can not connect.
+    """
+
+    def __init__(
+            self, socket_path: str,
+            max_result_num: int = DEFAULT_MAX_RESULT_NUM) -> None:
+        socket_dir_path: str = os.path.dirname(socket_path)
+        if socket_dir_path == _PRIVATE_SOCKET_DIR_PATH:
+            os.makedirs(socket_dir_path, mode=0o700, exist_ok=True)
+            _check_private_dir(dir_path=socket_dir_path)
+        if os.path.exists(socket_path):
+            if not stat.S_ISSOCK(os.stat(socket_path).st_mode):
+                err_msg: str = 'A file other than a socket exists at '\
+                    f'the socket path: {socket_path}'
+                raise IOError(err_msg)
+            if is_server_running(socket_path=socket_path):
+                err_msg = 'The numdoclint server is already running at '\
+                    f'{socket_path}'
+                raise Exception(err_msg)
+            os.remove(socket_path)
+        super().__init__(socket_path, _RequestHandler)
+        self.socket_path: str = socket_path
+        self.max_result_num: int = max_result_num
+        self.is_shutdown_requested: bool = False
+        self._result_dict: 'OrderedDict[Tuple[str, str], Any]' = \
+            OrderedDict()
+
+    def server_bind(self) -> None:
+        """
+        Bind the socket and make the socket file accessible only by
+        the current user.
+        """
+        super().server_bind()
+        os.chmod(self.server_address, 0o600)
+
+    def check(
+            self, path: str, options_dict: Dict[str, Any],
+            code_str: Optional[str] = None) -> List[Mapping]:
+        """
+        Check the file or buffer, using the result in memory if the
+        target is not changed.
+
+        Parameters
+        ----------
+        path : str
+            Path of target Python module or Jupyter notebook. If the
+            `code_str` is specified, it is only used in the results.
+        options_dict : dict
+            The keyword arguments of the `check_python_module` except
+            the path, verbose and cache settings.
+        code_str : str or None, default None
+            String of target Python code to check instead of the
+            file content, e.g., an unsaved editor buffer.
+
+        Returns
+        -------
+        info_list : list of LintResult or NotebookLintResult
+            A list containing information on check results.
+
+        Raises
+        ------
+        IOError
+            If the target file does not exist.
+        ValueError
+            If a buffer of Jupyter notebook is specified.
+
+        Notes
+        -----
+        The result of a file is reused while the modified time and
+        the size of the file are not changed, and the result of a
+        buffer is reused while its content is not changed.
+        """
+        options_fingerprint: str = cache.get_options_fingerprint(
+            options_dict=options_dict)
+        if code_str is None:
+            if not os.path.exists(path):
+                err_msg: str = f'The target file does not exist: {path}'
+                raise IOError(err_msg)
+            stat_result: os.stat_result = os.stat(path)
+            file_state: Any = (stat_result.st_mtime_ns, stat_result.st_size)
+        else:
+            file_state = cache.get_cache_key(
+                file_str=code_str, options_fingerprint=options_fingerprint)
+        result_key: Tuple[str, str] = (path, options_fingerprint)
+        cached_result: Optional[Tuple[Any, List[Mapping]]] = \
+            self._result_dict.get(result_key)
+        if cached_result is not None and cached_result[0] == file_state:
+            self._result_dict.move_to_end(result_key)
+            return cached_result[1]
+
+        info_list: List[Mapping] = _check_target(
+            path=path, options_dict=options_dict, code_str=code_str)
+        self._result_dict[result_key] = (file_state, info_list)
+        self._result_dict.move_to_end(result_key)
+        while len(self._result_dict) > self.max_result_num:
+            self._result_dict.popitem(last=False)
+        return info_list
+
+    def server_close(self) -> None:
+        """
+        Close the server and remove the socket file.
+        """
+        super().server_close()
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """
+    The handler of a single request line of the `CheckServer`.
+    """
+
+    def handle(self) -> None:
+        """
+        Read the request and write the response.
+        """
+        request_line: bytes = self.rfile.readline()
+        response_dict: Dict[str, Any] = {}
+        try:
+            request_dict: Dict[str, Any] = json.loads(
+                request_line.decode('utf-8'))
+            command: str = request_dict[REQUEST_KEY_COMMAND]
+            if command == COMMAND_CHECK:
+                info_list: List[Mapping] = self.server.check(
+                    path=request_dict[REQUEST_KEY_PATH],
+                    options_dict=request_dict.get(REQUEST_KEY_OPTIONS, {}),
+                    code_str=request_dict.get(REQUEST_KEY_CODE_STR))
+                response_dict[RESPONSE_KEY_INFO_LIST] = [
+                    info_dict.to_dict(include_position=True)  # type: ignore
+                    for info_dict in info_list]
+            elif command == COMMAND_SHUTDOWN:
+                self.server.is_shutdown_requested = True
+            elif command != COMMAND_PING:
+                err_msg: str = f'Invalid command is specified: {command}'
+                raise ValueError(err_msg)
+        except Exception as e:
+            response_dict = {RESPONSE_KEY_ERROR: f'{type(e).__name__}: {e}'}
+        response_line: str = json.dumps(response_dict) + '\n'
+        self.wfile.write(response_line.encode('utf-8'))
+
+
+def serve(
+        socket_path: str = DEFAULT_SOCKET_PATH,
+        max_result_num: int = DEFAULT_MAX_RESULT_NUM) -> None:
+    """
+    Start the server and handle the requests until the shutdown
+    command is received.
+
+    Parameters
+    ----------
+    socket_path : str, default DEFAULT_SOCKET_PATH
+        The Unix socket path to listen on.
+    max_result_num : int, default 4096
+        The maximum number of the check results kept in memory.
+
+    Raises
+    ------
+    Exception
+        If the Unix socket is not supported on the platform.
+
+    Notes
+    -----
+    The in-memory cache of the module indexes is enabled while the
+    server is running, so a file checked again with other options is
+    not parsed again.
+    """
+    if not hasattr(socket, 'AF_UNIX'):
+        err_msg: str = 'The server mode requires the Unix socket.'
+        raise Exception(err_msg)
+    server: CheckServer = CheckServer(
+        socket_path=socket_path, max_result_num=max_result_num)
+    is_index_cache_enabled: bool = index_cache.is_index_cache_enabled()
+    if not is_index_cache_enabled:
+        index_cache.enable_index_cache()
+    try:
+        while not server.is_shutdown_requested:
+            server.handle_request()
+    finally:
+        server.server_close()
+        if not is_index_cache_enabled:
+            index_cache.disable_index_cache()
+
+
+def request_check(
+        path: str, socket_path: str = DEFAULT_SOCKET_PATH,
+        code_str: Optional[str] = None,
+        ignore_func_name_prefix_list: List[str] = ['test_'],
+        ignore_info_id_list: List[int] = [],
+        enable_default_or_optional_doc_check: bool = False,
+        skip_decorator_name_list: List[str] = ['Appender'],
+        engine: str = ENGINE_LEGACY,
+        timeout_sec: float = DEFAULT_TIMEOUT_SEC) -> List[Mapping]:
+    """
+    Request the running server to check the file or buffer.
+
+    Parameters
+    ----------
+    path : str
+        Path of target Python module or Jupyter notebook.
+    socket_path : str, default DEFAULT_SOCKET_PATH
+        The Unix socket path of the server.
+    code_str : str or None, default None
+        String of target Python code to check instead of the file
+        content. Not supported for Jupyter notebook.
+    ignore_func_name_prefix_list : list of str, default ['test_']
+        A prefix list of function name conditions to ignore.
+    ignore_info_id_list : list of int, default []
+        List of IDs to ignore lint checking.
+    enable_default_or_optional_doc_check : bool, default False
+        If True specified, the `default` and `optional` string
+        in docstring will be checked.
+    skip_decorator_name_list : list of str, default ['Appender']
+        If a decorator name in this list is set to function, that
+        function will not be checked. Only used for Python modules.
+    engine : str, default 'legacy'
+        The engine to extract functions' information. Only used for
+        Python modules.
+    timeout_sec : float, default 60.0
+        The seconds to wait for the connection and the response of
+        the server.
+
+    Returns
+    -------
+    info_list : list of LintResult or NotebookLintResult
+        A list containing information on check results. The records
+        are the same as the `check_python_module` or the
+        `check_jupyter_notebook`.
+
+    Raises
+    ------
+    IOError
+        If the server is not running or does not respond in time.
+    Exception
+        If the server failed to check the target.
+    """
+    request_dict: Dict[str, Any] = {
+        REQUEST_KEY_COMMAND: COMMAND_CHECK,
+        REQUEST_KEY_PATH: os.path.abspath(path),
+        REQUEST_KEY_OPTIONS: {
+            'ignore_func_name_prefix_list': ignore_func_name_prefix_list,
+            'ignore_info_id_list': ignore_info_id_list,
+            'enable_default_or_optional_doc_check': (
+                enable_default_or_optional_doc_check),
+            'skip_decorator_name_list': skip_decorator_name_list,
+            'engine': engine,
+        },
+    }
+    if code_str is not None:
+        request_dict[REQUEST_KEY_CODE_STR] = code_str
+    response_dict: Dict[str, Any] = _send_request(
+        request_dict=request_dict, socket_path=socket_path,
+        timeout_sec=timeout_sec)
+    info_dict_list: List[dict] = response_dict[RESPONSE_KEY_INFO_LIST]
+    info_list: List[Mapping]
+    if path.endswith('.ipynb'):
+        info_list = [
+            jupyter_notebook.NotebookLintResult(
+                func_name=info_dict[jupyter_notebook.INFO_KEY_FUNC_NAME],
+                info_id=info_dict[jupyter_notebook.INFO_KEY_INFO_ID],
+                info=info_dict[jupyter_notebook.INFO_KEY_INFO],
+                notebook_path=path,
+                code_cell_index=info_dict[
+                    jupyter_notebook.INFO_KEY_CODE_CELL_INDEX],
+                lineno=info_dict[py_module.INFO_KEY_LINENO],
+                end_lineno=info_dict[py_module.INFO_KEY_END_LINENO])
+            for info_dict in info_dict_list]
+        return info_list
+    info_list = [
+        py_module.LintResult(
+            module_path=path,
+            func_name=info_dict[py_module.INFO_KEY_FUNC_NAME],
+            info_id=info_dict[py_module.INFO_KEY_INFO_ID],
+            info=info_dict[py_module.INFO_KEY_INFO],
+            lineno=info_dict[py_module.INFO_KEY_LINENO],
+            end_lineno=info_dict[py_module.INFO_KEY_END_LINENO])
+        for info_dict in info_dict_list]
+    return info_list
+
+
+def request_shutdown(
+        socket_path: str = DEFAULT_SOCKET_PATH,
+        timeout_sec: float = DEFAULT_TIMEOUT_SEC) -> None:
+    """
+    Request the running server to shut down.
+
+    Parameters
+    ----------
+    socket_path : str, default DEFAULT_SOCKET_PATH
+        The Unix socket path of the server.
+    timeout_sec : float, default 60.0
+        The seconds to wait for the connection and the response of
+        the server.
+
+    Raises
+    ------
+    IOError
+        If the server is not running or does not respond in time.
+    """
+    _send_request(
+        request_dict={REQUEST_KEY_COMMAND: COMMAND_SHUTDOWN},
+        socket_path=socket_path, timeout_sec=timeout_sec)
+
+
+def is_server_running(
+        socket_path: str = DEFAULT_SOCKET_PATH,
+        timeout_sec: float = DEFAULT_TIMEOUT_SEC) -> bool:
+    """
+    Get a boolean value of whether the server is running.
+
+    Parameters
+    ----------
+    socket_path : str, default DEFAULT_SOCKET_PATH
+        The Unix socket path of the server.
+    timeout_sec : float, default 60.0
+        The seconds to wait for the connection and the response of
+        the server.
+
+    Returns
+    -------
+    result_bool : bool
+        If the server responds to the ping command in time, True will
+        be set.
+    """
+    try:
+        _send_request(
+            request_dict={REQUEST_KEY_COMMAND: COMMAND_PING},
+            socket_path=socket_path, timeout_sec=timeout_sec)
+    except IOError:
+        return False
+    return True
+
+
+def _send_request(
+        request_dict: Dict[str, Any], socket_path: str,
+        timeout_sec: float = DEFAULT_TIMEOUT_SEC) -> Dict[str, Any]:
+    """
+    Send the request to the server and get the response.
+
+    Parameters
+    ----------
+    request_dict : dict
+        The request dictionary.
+    socket_path : str
+        The Unix socket path of the server.
+    timeout_sec : float, default 60.0
+        The seconds to wait for each of the connection, the sending
+        and the receiving. A stalled server does not block the client
+        beyond this.
+
+    Returns
+    -------
+    response_dict : dict
+        The response dictionary.
+
+    Raises
+    ------
+    IOError
+        - If the server is not running or does not respond in time.
+        - If the per-user socket directory is not private to the
+          current user.
+    Exception
+        If the server returned an error.
+    """
+    if os.path.dirname(socket_path) == _PRIVATE_SOCKET_DIR_PATH \
+            and os.path.isdir(_PRIVATE_SOCKET_DIR_PATH):
+        _check_private_dir(dir_path=_PRIVATE_SOCKET_DIR_PATH)
+    request_line: str = json.dumps(request_dict) + '\n'
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout_sec)
+            sock.connect(socket_path)
+            sock.sendall(request_line.encode('utf-8'))
+            with sock.makefile(mode='rb') as f:
+                response_line: bytes = f.readline()
+    except socket.timeout:
+        err_msg: str = 'Could not connect to the numdoclint server at '\
+            f'{socket_path}: no response in {timeout_sec} seconds'
+        raise IOError(err_msg)
+    except OSError as e:
+        err_msg = 'Could not connect to the numdoclint server at '\
+            f'{socket_path}: {e}'
+        raise IOError(err_msg)
+    response_dict: Dict[str, Any] = json.loads(
+        response_line.decode('utf-8'))
+    if RESPONSE_KEY_ERROR in response_dict:
+        err_msg = 'The numdoclint server failed to check: %s' \
+            % response_dict[RESPONSE_KEY_ERROR]
+        raise Exception(err_msg)
+    return response_dict
+
+
+def _check_private_dir(dir_path: str) -> None:
+    """
+    Check that the directory is owned by the current user and can
+    not be accessed by the other users.
+
+    Parameters
+    ----------
+    dir_path : str
+        Target directory path.
+
+    Raises
+    ------
+    IOError
+        If the directory is owned by another user or can be accessed
+        by the other users.
+    """
+    if not hasattr(os, 'getuid'):
+        return
+    stat_result: os.stat_result = os.stat(dir_path)
+    if stat_result.st_uid != os.getuid():
+        err_msg: str = 'The socket directory is owned by another user: '\
+            f'{dir_path}'
+        raise IOError(err_msg)
+    if stat_result.st_mode & 0o077:
+        err_msg = 'The socket directory can be accessed by the other '\
+            f'users: {dir_path}'
+        raise IOError(err_msg)
+
+
+def _check_target(
+        path: str, options_dict: Dict[str, Any],
+        code_str: Optional[str]) -> List[Mapping]:
+    """
+    Check the Python module or Jupyter notebook.
+
+    Parameters
+    ----------
+    path : str
+        Path of target Python module or Jupyter notebook.
+    options_dict : dict
+        The keyword arguments of the `check_python_module` except
+        the path, verbose and cache settings.
+    code_str : str or None
+        String of target Python code to check instead of the file
+        content.
+
+    Returns
+    -------
+    info_list : list of LintResult or NotebookLintResult
+        A list containing information on check results.
+
+    Raises
+    ------
+    ValueError
+        If a buffer of Jupyter notebook is specified.
+    """
+    if path.endswith('.ipynb'):
+        if code_str is not None:
+            err_msg: str = 'The buffer of Jupyter notebook is not supported.'
+            raise ValueError(err_msg)
+        notebook_options_dict: Dict[str, Any] = {
+            key: value for key, value in options_dict.items()
+            if key in _NOTEBOOK_OPTION_KEY_LIST}
+        info_list: List[Mapping] = jupyter_notebook.check_jupyter_notebook(
+            notebook_path=path, verbose=jupyter_notebook.VERBOSE_DISABLED,
+            **notebook_options_dict)
+        return info_list
+    if code_str is None:
+        info_list = py_module.check_python_module(
+            py_module_path=path, verbose=py_module.VERBOSE_DISABLED,
+            **options_dict)
+        return info_list
+    info_list = py_module.check_python_source(
+        code_str=code_str, virtual_path=path,
+        verbose=py_module.VERBOSE_DISABLED, **options_dict)
+    return info_list
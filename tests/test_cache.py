@@ -0,0 +1,230 @@
+import os
+import shutil
+import time
+from typing import Any, Dict, List, Optional
+
+from numdoclint import cache
+
+TMP_TEST_CACHE_DIR: str = './tests/tmp_cache/'
+
+
+def setup() -> None:
+    """Function to be executed at the start of the test.
+    """
+    shutil.rmtree(TMP_TEST_CACHE_DIR, ignore_errors=True)
+
+
+def teardown() -> None:
+    """Function to be executed at the end of the test.
+    """
+    shutil.rmtree(TMP_TEST_CACHE_DIR, ignore_errors=True)
+
+
+def test_get_options_fingerprint() -> None:
+    fingerprint_1: str = cache.get_options_fingerprint(
+        options_dict={'ignore_info_id_list': [1, 2], 'engine': 'legacy'})
+    fingerprint_2: str = cache.get_options_fingerprint(
+        options_dict={'engine': 'legacy', 'ignore_info_id_list': [1, 2]})
+    assert fingerprint_1 == fingerprint_2
+    fingerprint_2 = cache.get_options_fingerprint(
+        options_dict={'ignore_info_id_list': [1], 'engine': 'legacy'})
+    assert fingerprint_1 != fingerprint_2
+
+
+def test_get_cache_key() -> None:
+    cache_key_1: str = cache.get_cache_key(
+        file_str='def sample_func():\n    pass\n',
+        options_fingerprint='abc')
+    cache_key_2: str = cache.get_cache_key(
+        file_str='def sample_func():\n    pass\n',
+        options_fingerprint='abc')
+    assert cache_key_1 == cache_key_2
+    cache_key_2 = cache.get_cache_key(
+        file_str='def sample_func():\n    pass\n',
+        options_fingerprint='abd')
+    assert cache_key_1 != cache_key_2
+    cache_key_2 = cache.get_cache_key(
+        file_str='def sample_func():\n    return 1\n',
+        options_fingerprint='abc')
+    assert cache_key_1 != cache_key_2
+
+
+def test_get_func_cache_key() -> None:
+    cache_key_1: str = cache.get_func_cache_key(
+        file_path='sample/path.py', options_fingerprint='abc')
+    cache_key_2: str = cache.get_func_cache_key(
+        file_path=os.path.abspath('sample/path.py'),
+        options_fingerprint='abc')
+    assert cache_key_1 == cache_key_2
+    cache_key_2 = cache.get_func_cache_key(
+        file_path='sample/path.py', options_fingerprint='abd')
+    assert cache_key_1 != cache_key_2
+    cache_key_2 = cache.get_func_cache_key(
+        file_path='sample/path_2.py', options_fingerprint='abc')
+    assert cache_key_1 != cache_key_2
+
+
+def test_get_func_fingerprint() -> None:
+    fingerprint_1: str = cache.get_func_fingerprint(
+        func_str='def sample_func():\n    pass')
+    fingerprint_2: str = cache.get_func_fingerprint(
+        func_str='def sample_func():\n    pass')
+    assert fingerprint_1 == fingerprint_2
+    fingerprint_2 = cache.get_func_fingerprint(
+        func_str='def sample_func():\n    pass\n    \n\n')
+    assert fingerprint_1 == fingerprint_2
+    fingerprint_2 = cache.get_func_fingerprint(
+        func_str='def sample_func():\n    return 1')
+    assert fingerprint_1 != fingerprint_2
+
+
+def test__get_cache_file_path() -> None:
+    cache_file_path: str = cache._get_cache_file_path(
+        cache_dir_path='.numdoclint_cache', cache_key='abc')
+    assert cache_file_path == os.path.join('.numdoclint_cache', 'abc.json')
+
+
+def test_read_cache() -> None:
+    info_list: Optional[List[dict]] = cache.read_cache(
+        cache_dir_path=TMP_TEST_CACHE_DIR, cache_key='abc')
+    assert info_list is None
+
+    os.makedirs(TMP_TEST_CACHE_DIR)
+    with open(os.path.join(TMP_TEST_CACHE_DIR, 'abc.json'), 'w') as f:
+        f.write('[{"info_id": 1')
+    info_list = cache.read_cache(
+        cache_dir_path=TMP_TEST_CACHE_DIR, cache_key='abc')
+    assert info_list is None
+
+
+def test_write_cache() -> None:
+    expected_info_list: List[dict] = [{'func_name': 'sample_func'}]
+    cache.write_cache(
+        cache_dir_path=TMP_TEST_CACHE_DIR, cache_key='abc',
+        info_list=expected_info_list)
+    assert sorted(os.listdir(TMP_TEST_CACHE_DIR)) == [
+        '.gitignore', 'abc.json']
+    info_list: Optional[List[dict]] = cache.read_cache(
+        cache_dir_path=TMP_TEST_CACHE_DIR, cache_key='abc')
+    assert info_list == expected_info_list
+
+    cache.write_cache(
+        cache_dir_path=TMP_TEST_CACHE_DIR, cache_key='abc',
+        info_list=[])
+    info_list = cache.read_cache(
+        cache_dir_path=TMP_TEST_CACHE_DIR, cache_key='abc')
+    assert info_list == []
+
+
+def test_read_func_cache() -> None:
+    shutil.rmtree(TMP_TEST_CACHE_DIR, ignore_errors=True)
+    func_info_dict: Optional[Dict[str, List[dict]]] = \
+        cache.read_func_cache(
+            cache_dir_path=TMP_TEST_CACHE_DIR, cache_key='abc')
+    assert func_info_dict is None
+
+
+def test__read_cache_file() -> None:
+    shutil.rmtree(TMP_TEST_CACHE_DIR, ignore_errors=True)
+    cache_data: Any = cache._read_cache_file(
+        cache_dir_path=TMP_TEST_CACHE_DIR, cache_key='abc')
+    assert cache_data is None
+
+    os.makedirs(TMP_TEST_CACHE_DIR, exist_ok=True)
+    cache_file_path: str = os.path.join(TMP_TEST_CACHE_DIR, 'abc.json')
+    with open(cache_file_path, 'w') as f:
+        f.write('{"abc": []}')
+    past_time: float = time.time() - 100
+    os.utime(cache_file_path, (past_time, past_time))
+    cache_data = cache._read_cache_file(
+        cache_dir_path=TMP_TEST_CACHE_DIR, cache_key='abc')
+    assert cache_data == {'abc': []}
+    assert os.path.getmtime(cache_file_path) > past_time
+    shutil.rmtree(TMP_TEST_CACHE_DIR, ignore_errors=True)
+
+
+def test_write_func_cache() -> None:
+    cache.write_func_cache(
+        cache_dir_path=TMP_TEST_CACHE_DIR, cache_key='abc',
+        func_info_dict={
+            'fingerprint_1': [{'func_name': 'sample_func'}],
+            'fingerprint_2': [],
+        })
+    func_info_dict: Optional[Dict[str, List[dict]]] = \
+        cache.read_func_cache(
+            cache_dir_path=TMP_TEST_CACHE_DIR, cache_key='abc')
+    assert func_info_dict == {
+        'fingerprint_1': [{'func_name': 'sample_func'}],
+        'fingerprint_2': [],
+    }
+
+    cache.write_func_cache(
+        cache_dir_path=TMP_TEST_CACHE_DIR, cache_key='abc',
+        func_info_dict={'fingerprint_2': []})
+    func_info_dict = cache.read_func_cache(
+        cache_dir_path=TMP_TEST_CACHE_DIR, cache_key='abc')
+    assert func_info_dict == {'fingerprint_2': []}
+    shutil.rmtree(TMP_TEST_CACHE_DIR, ignore_errors=True)
+
+
+def test__write_cache_file() -> None:
+    cache._write_cache_file(
+        cache_dir_path=TMP_TEST_CACHE_DIR, cache_key='abc',
+        cache_data={'abc': [1, 'a']})
+    assert sorted(os.listdir(TMP_TEST_CACHE_DIR)) == [
+        '.gitignore', 'abc.json']
+    with open(os.path.join(TMP_TEST_CACHE_DIR, 'abc.json')) as f:
+        assert f.read() == '{"abc": [1, "a"]}'
+    shutil.rmtree(TMP_TEST_CACHE_DIR, ignore_errors=True)
+
+    os.makedirs(os.path.join(TMP_TEST_CACHE_DIR, 'abd.json'))
+    cache._write_cache_file(
+        cache_dir_path=TMP_TEST_CACHE_DIR, cache_key='abd',
+        cache_data={'abd': [1]})
+    assert sorted(os.listdir(TMP_TEST_CACHE_DIR)) == ['.gitignore', 'abd.json']
+    shutil.rmtree(TMP_TEST_CACHE_DIR, ignore_errors=True)
+
+    with open(TMP_TEST_CACHE_DIR.rstrip('/'), 'w') as f:
+        f.write('')
+    try:
+        cache._write_cache_file(
+            cache_dir_path=TMP_TEST_CACHE_DIR, cache_key='abc',
+            cache_data={'abc': [1, 'a']})
+        assert cache.read_cache(
+            cache_dir_path=TMP_TEST_CACHE_DIR, cache_key='abc') is None
+    finally:
+        os.remove(TMP_TEST_CACHE_DIR.rstrip('/'))
+
+
+def test_evict_cache() -> None:
+    removed_file_path_list: List[str] = cache.evict_cache(
+        cache_dir_path=os.path.join(TMP_TEST_CACHE_DIR, 'not_exists/'),
+        max_cache_size=0)
+    assert removed_file_path_list == []
+
+    shutil.rmtree(TMP_TEST_CACHE_DIR, ignore_errors=True)
+    info_list: List[dict] = [{'func_name': 'sample_func'}]
+    past_time: float = time.time() - 100
+    for i, cache_key in enumerate(['abc', 'abd', 'abe']):
+        cache.write_cache(
+            cache_dir_path=TMP_TEST_CACHE_DIR, cache_key=cache_key,
+            info_list=info_list)
+        cache_file_path: str = cache._get_cache_file_path(
+            cache_dir_path=TMP_TEST_CACHE_DIR, cache_key=cache_key)
+        os.utime(cache_file_path, (past_time + i, past_time + i))
+    cache.read_cache(cache_dir_path=TMP_TEST_CACHE_DIR, cache_key='abc')
+    cache_file_size: int = os.path.getsize(cache_file_path)
+
+    removed_file_path_list = cache.evict_cache(
+        cache_dir_path=TMP_TEST_CACHE_DIR,
+        max_cache_size=cache_file_size * 3)
+    assert removed_file_path_list == []
+
+    removed_file_path_list = cache.evict_cache(
+        cache_dir_path=TMP_TEST_CACHE_DIR,
+        max_cache_size=cache_file_size * 2)
+    assert removed_file_path_list == [
+        cache._get_cache_file_path(
+            cache_dir_path=TMP_TEST_CACHE_DIR, cache_key='abd')]
+    assert sorted(os.listdir(TMP_TEST_CACHE_DIR)) == [
+        '.gitignore', 'abc.json', 'abe.json']
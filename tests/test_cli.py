@@ -1,12 +1,17 @@
+import json
 import os
 import shutil
-from typing import List
+import sys
+import threading
+import time
+from typing import List, Optional
 
 import pytest
 import six
 from voluptuous import Any, Schema
 
-from numdoclint import cli, jupyter_notebook, py_module
+from numdoclint import (cli, jupyter_notebook, output, profiler, py_module,
+                        server)
 
 TMP_TEST_MODULE_DIR: str = 'tests/tmp_test/'
 TMP_TEST_MODULE_PATH_1: str = os.path.join(
@@ -113,6 +118,24 @@ def test__validate_args() -> None:
         path='sample/path.py',
         ignore_info_id_list=[],
         check_recursively=False)
+    with pytest.raises(Exception):  # type: ignore
+        cli._validate_args(
+            path='sample/path.py',
+            ignore_info_id_list=[],
+            check_recursively=False,
+            since='HEAD')
+    cli._validate_args(
+        path=None,  # type: ignore
+        ignore_info_id_list=[],
+        check_recursively=False,
+        since='HEAD')
+    with pytest.raises(Exception):  # type: ignore
+        cli._validate_args(
+            path=None,  # type: ignore
+            ignore_info_id_list=[],
+            check_recursively=False,
+            since='HEAD',
+            jobs=2)
 
 
 def test__exec_numdoclint() -> None:
@@ -155,7 +178,7 @@ def sample_func_2(price=100):
         },
         required=True)
     for info_dict in info_list:
-        schema(info_dict)
+        schema(info_dict.to_dict())
     info_id_list: List[int] = [
         info_dict[py_module.INFO_KEY_INFO_ID] for info_dict in info_list]
     info_list = cli._exec_numdoclint(
@@ -222,7 +245,7 @@ def sample_func_2(price=100):
         skip_decorator_name_list=[])
     assert info_list
     for info_dict in info_list:
-        schema(info_dict)
+        schema(info_dict.to_dict())
     module_path_list: List[str] = [
         info_dict[py_module.INFO_KEY_MODULE_PATH] for info_dict in info_list]
     module_path_1_exists: bool = False
@@ -288,7 +311,7 @@ def sample_func_2(price=100):
         skip_decorator_name_list=[])
     assert info_list
     for info_dict in info_list:
-        schema(info_dict)
+        schema(info_dict.to_dict())
     info_id_list = [
         info_dict[jupyter_notebook.INFO_KEY_INFO_ID]
         for info_dict in info_list]
@@ -351,7 +374,7 @@ def sample_func_2(price=100):
         required=True)
     assert info_list
     for info_dict in info_list:
-        schema(info_dict)
+        schema(info_dict.to_dict())
     unique_notebook_path_list = [
         info_dict[jupyter_notebook.INFO_KEY_NOTEBOOK_PATH]
         for info_dict in info_list]
@@ -390,6 +413,55 @@ def sample_func_2(price=100):
     _assert_default_value_check_info_id_is_not_in(info_list=info_list)
 
 
+def test__request_check_to_server() -> None:
+    module_str: str = """
+def sample_func_1(price):
+    pass
+    """
+    with open(TMP_TEST_MODULE_PATH_1, 'w') as f:
+        f.write(module_str)
+    socket_path: str = os.path.join(TMP_TEST_MODULE_DIR, 'numdoclint.sock')
+    thread: threading.Thread = threading.Thread(
+        target=server.serve, kwargs={'socket_path': socket_path})
+    thread.start()
+    for _ in range(100):
+        if server.is_server_running(socket_path=socket_path):
+            break
+        time.sleep(0.05)
+    try:
+        info_list: List[dict] = cli._request_check_to_server(
+            path=TMP_TEST_MODULE_PATH_1,
+            check_recursively=False,
+            is_jupyter=False,
+            ignore_func_name_prefix_list=[],
+            ignore_info_id_list=[],
+            enable_default_or_optional_doc_check=False,
+            skip_decorator_name_list=[],
+            engine='legacy',
+            server_socket_path=socket_path)
+        assert info_list
+        assert info_list[0][py_module.INFO_KEY_MODULE_PATH] \
+            == TMP_TEST_MODULE_PATH_1
+
+        info_list = cli._request_check_to_server(
+            path=TMP_TEST_MODULE_DIR,
+            check_recursively=True,
+            is_jupyter=False,
+            ignore_func_name_prefix_list=[],
+            ignore_info_id_list=[],
+            enable_default_or_optional_doc_check=False,
+            skip_decorator_name_list=[],
+            engine='legacy',
+            server_socket_path=socket_path)
+        module_path_list: List[str] = [
+            info_dict[py_module.INFO_KEY_MODULE_PATH]
+            for info_dict in info_list]
+        assert TMP_TEST_MODULE_PATH_1 in module_path_list
+    finally:
+        server.request_shutdown(socket_path=socket_path)
+        thread.join(timeout=5)
+
+
 def test_main() -> None:
     module_str_1: str = """
 def sample_func_1(price):
@@ -407,6 +479,20 @@ def sample_func_1(price):
         ignore_info_id_list: List[int] = []
         enable_default_or_optional_doc_check: bool = True
         skip_decorator_name_list: List[str] = []
+        engine: str = 'legacy'
+        jobs: int = 1
+        no_cache: bool = True
+        cache_dir: str = '.numdoclint_cache'
+        since: Optional[str] = None
+        changed_funcs_only: bool = False
+        server_socket: Optional[str] = None
+        output: Optional[str] = None
+        flush_interval: int = 100
+        format: str = 'text'
+        exclude: List[str] = []
+        combine_cells: bool = False
+        profile: bool = False
+        profile_top: int = 10
 
     args: Args = Args()
     info_list: List[dict] = cli.main(
@@ -422,4 +508,68 @@ def sample_func_1(price):
         },
         required=True)
     for info_dict in info_list:
-        schema(info_dict)
+        schema(info_dict.to_dict())
+
+    cache_dir_path: str = os.path.join(TMP_TEST_MODULE_DIR, 'cache/')
+    args.no_cache = False
+    args.cache_dir = cache_dir_path
+    cached_info_list: List[dict] = cli.main(
+        args=args,  # type: ignore
+        return_list=True)
+    assert cached_info_list == info_list
+    assert os.listdir(cache_dir_path)
+
+    output_path: str = os.path.join(TMP_TEST_MODULE_DIR, 'output.txt')
+    args.no_cache = True
+    args.output = output_path
+    args.flush_interval = 1
+    cli.main(args=args)  # type: ignore
+    with open(output_path) as f:
+        output_str: str = f.read()
+    assert 'sample_func_1' in output_str
+    assert output_str.count(TMP_TEST_MODULE_PATH_1) == len(info_list)
+    assert output.get_output_writer().stream is sys.stdout
+
+    args.format = output.FORMAT_JSONL
+    cli.main(args=args)  # type: ignore
+    with open(output_path) as f:
+        output_dict_list: List[dict] = [
+            json.loads(line) for line in f.read().splitlines()]
+    assert len(output_dict_list) == len(info_list)
+    assert output_dict_list[0] == info_list[0].to_output_dict()
+    assert output_dict_list[0][output.OUTPUT_KEY_LINENO] > 0
+
+    args.format = output.FORMAT_SARIF
+    cli.main(args=args)  # type: ignore
+    with open(output_path) as f:
+        sarif_dict: dict = json.load(f)
+    assert len(sarif_dict['runs'][0]['results']) == len(info_list)
+
+    args.profile = True
+    args.profile_top = 5
+    cli.main(args=args)  # type: ignore
+    assert not profiler.is_profile_enabled()
+    assert TMP_TEST_MODULE_PATH_1 in profiler.get_profile_stats()[
+        profiler.PROFILE_KEY_FILE]
+    profiler.reset_profile_stats()
+
+    socket_path: str = os.path.join(TMP_TEST_MODULE_DIR, 'numdoclint.sock')
+    thread: threading.Thread = threading.Thread(
+        target=server.serve, kwargs={'socket_path': socket_path})
+    thread.start()
+    for _ in range(100):
+        if server.is_server_running(socket_path=socket_path):
+            break
+        time.sleep(0.05)
+
+    class ServeArgs:
+
+        command: str = cli.COMMAND_SERVE
+        socket: str = socket_path
+        max_result_num: int = server.DEFAULT_MAX_RESULT_NUM
+        stop: bool = True
+
+    result = cli.main(args=ServeArgs())  # type: ignore
+    assert result is None
+    thread.join(timeout=5)
+    assert not thread.is_alive()
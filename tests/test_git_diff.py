@@ -0,0 +1,261 @@
+import fnmatch
+import os
+import re
+import shutil
+import subprocess
+from typing import List, Pattern, Tuple
+
+import pytest
+
+from numdoclint import git_diff, jupyter_notebook, py_module
+
+TMP_TEST_GIT_DIR: str = './tests/tmp_git/'
+TMP_TEST_CACHE_DIR: str = './tests/tmp_git_cache/'
+
+MODULE_STR_BEFORE: str = '''
+def sample_func_1(price):
+    return 100
+
+
+def sample_func_2(name):
+    pass
+'''
+
+MODULE_STR_AFTER: str = '''
+def sample_func_1(price):
+    return 100
+
+
+def sample_func_2(name, location_id):
+    pass
+'''
+
+MODULE_STR_APPENDED: str = MODULE_STR_BEFORE + '''
+
+def sample_func_4(price):
+    pass
+'''
+
+NOTEBOOK_STR: str = '''{
+ "cells": [
+  {
+   "cell_type": "code",
+   "execution_count": null,
+   "metadata": {},
+   "outputs": [],
+   "source": [
+    "def sample_func_3(price):\\n",
+    "    pass"
+   ]
+  }
+ ],
+ "metadata": {},
+ "nbformat": 4,
+ "nbformat_minor": 2
+}
+'''
+
+
+def _run_git_command(arg_list: List[str]) -> None:
+    """
+    Run the git command in the temporary repository.
+
+    Parameters
+    ----------
+    arg_list : list of str
+        A list of the git command arguments.
+    """
+    subprocess.run(
+        ['git', '-c', 'user.name=test', '-c', 'user.email=test@example.com']
+        + arg_list,
+        cwd=TMP_TEST_GIT_DIR, check=True, stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE)
+
+
+def setup() -> None:
+    """Function to be executed at the start of the test.
+    """
+    shutil.rmtree(TMP_TEST_GIT_DIR, ignore_errors=True)
+    os.makedirs(os.path.join(TMP_TEST_GIT_DIR, 'sub_dir'))
+    with open(os.path.join(TMP_TEST_GIT_DIR, 'sample.py'), 'w') as f:
+        f.write(MODULE_STR_BEFORE)
+    with open(os.path.join(TMP_TEST_GIT_DIR, 'unchanged.py'), 'w') as f:
+        f.write(MODULE_STR_BEFORE)
+    with open(os.path.join(TMP_TEST_GIT_DIR, 'sub_dir', 'appended.py'),
+              'w') as f:
+        f.write(MODULE_STR_BEFORE)
+    _run_git_command(arg_list=['init', '-q'])
+    _run_git_command(arg_list=['add', '.'])
+    _run_git_command(arg_list=['commit', '-q', '-m', 'Initial commit'])
+
+    with open(os.path.join(TMP_TEST_GIT_DIR, 'sample.py'), 'w') as f:
+        f.write(MODULE_STR_AFTER)
+    with open(os.path.join(TMP_TEST_GIT_DIR, 'sub_dir', 'appended.py'),
+              'w') as f:
+        f.write(MODULE_STR_APPENDED)
+    with open(os.path.join(TMP_TEST_GIT_DIR, 'README.md'), 'w') as f:
+        f.write('sample\n')
+    notebook_path: str = os.path.join(
+        TMP_TEST_GIT_DIR, 'sub_dir', 'sample.ipynb')
+    with open(notebook_path, 'w') as f:
+        f.write(NOTEBOOK_STR)
+    _run_git_command(arg_list=['add', '.'])
+
+
+def teardown() -> None:
+    """Function to be executed at the end of the test.
+    """
+    shutil.rmtree(TMP_TEST_GIT_DIR, ignore_errors=True)
+    shutil.rmtree(TMP_TEST_CACHE_DIR, ignore_errors=True)
+
+
+def test_check_changed_files() -> None:
+    info_list: List[dict] = git_diff.check_changed_files(
+        since_ref='HEAD', dir_path=TMP_TEST_GIT_DIR,
+        verbose=py_module.VERBOSE_DISABLED)
+    module_path_set = {
+        info_dict[py_module.INFO_KEY_MODULE_PATH]
+        for info_dict in info_list
+        if py_module.INFO_KEY_MODULE_PATH in info_dict}
+    assert module_path_set == {
+        os.path.join(TMP_TEST_GIT_DIR, 'sample.py'),
+        os.path.join(TMP_TEST_GIT_DIR, 'sub_dir/appended.py')}
+    notebook_info_list: List[dict] = [
+        info_dict for info_dict in info_list
+        if jupyter_notebook.INFO_KEY_NOTEBOOK_PATH in info_dict]
+    assert notebook_info_list
+    func_name_set = {
+        info_dict[py_module.INFO_KEY_FUNC_NAME] for info_dict in info_list}
+    assert func_name_set == {
+        'sample_func_1', 'sample_func_2', 'sample_func_3', 'sample_func_4'}
+
+    info_list = git_diff.check_changed_files(
+        since_ref='HEAD', dir_path=TMP_TEST_GIT_DIR,
+        verbose=py_module.VERBOSE_DISABLED, changed_funcs_only=True)
+    path_func_name_set = {
+        (info_dict.get(py_module.INFO_KEY_MODULE_PATH, ''),
+         info_dict[py_module.INFO_KEY_FUNC_NAME])
+        for info_dict in info_list}
+    assert path_func_name_set == {
+        (os.path.join(TMP_TEST_GIT_DIR, 'sample.py'), 'sample_func_2'),
+        (os.path.join(TMP_TEST_GIT_DIR, 'sub_dir/appended.py'),
+         'sample_func_4'),
+        ('', 'sample_func_3'),
+    }
+
+    info_list = git_diff.check_changed_files(
+        since_ref='HEAD', dir_path=TMP_TEST_GIT_DIR,
+        verbose=py_module.VERBOSE_DISABLED, exclude_pattern_list=['sub_dir'])
+    func_name_set = {
+        info_dict[py_module.INFO_KEY_FUNC_NAME] for info_dict in info_list}
+    assert func_name_set == {'sample_func_1', 'sample_func_2'}
+
+    shutil.rmtree(TMP_TEST_CACHE_DIR, ignore_errors=True)
+    info_list = git_diff.check_changed_files(
+        since_ref='HEAD', dir_path=TMP_TEST_GIT_DIR,
+        verbose=py_module.VERBOSE_DISABLED,
+        cache_dir_path=TMP_TEST_CACHE_DIR, exclude_pattern_list=['*.ipynb'])
+    assert os.listdir(TMP_TEST_CACHE_DIR)
+    cached_info_list: List[dict] = git_diff.check_changed_files(
+        since_ref='HEAD', dir_path=TMP_TEST_GIT_DIR,
+        verbose=py_module.VERBOSE_DISABLED,
+        cache_dir_path=TMP_TEST_CACHE_DIR, exclude_pattern_list=['*.ipynb'])
+    assert cached_info_list == info_list
+    shutil.rmtree(TMP_TEST_CACHE_DIR, ignore_errors=True)
+
+    with pytest.raises(Exception):  # type: ignore
+        git_diff.check_changed_files(
+            since_ref='not_existing_ref', dir_path=TMP_TEST_GIT_DIR,
+            verbose=py_module.VERBOSE_DISABLED)
+
+
+def test_get_changed_file_path_list() -> None:
+    file_path_list: List[str] = git_diff.get_changed_file_path_list(
+        since_ref='HEAD', dir_path=TMP_TEST_GIT_DIR)
+    assert sorted(file_path_list) == [
+        os.path.join(TMP_TEST_GIT_DIR, 'sample.py'),
+        os.path.join(TMP_TEST_GIT_DIR, 'sub_dir/appended.py'),
+        os.path.join(TMP_TEST_GIT_DIR, 'sub_dir/sample.ipynb'),
+    ]
+
+    file_path_list = git_diff.get_changed_file_path_list(
+        since_ref='HEAD',
+        dir_path=os.path.join(TMP_TEST_GIT_DIR, 'sub_dir/'))
+    assert sorted(file_path_list) == [
+        os.path.join(TMP_TEST_GIT_DIR, 'sub_dir/appended.py'),
+        os.path.join(TMP_TEST_GIT_DIR, 'sub_dir/sample.ipynb')]
+
+
+def test_get_changed_line_range_list() -> None:
+    line_range_list: List[Tuple[int, int]] = \
+        git_diff.get_changed_line_range_list(
+            since_ref='HEAD',
+            file_path=os.path.join(TMP_TEST_GIT_DIR, 'sample.py'))
+    assert line_range_list == [(5, 6)]
+
+    line_range_list = git_diff.get_changed_line_range_list(
+        since_ref='HEAD',
+        file_path=os.path.join(TMP_TEST_GIT_DIR, 'unchanged.py'))
+    assert line_range_list == []
+
+
+def test_filter_info_list_by_line_range() -> None:
+    info_list: List[py_module.LintResult] = [
+        py_module.LintResult(
+            module_path='sample/path.py', func_name='sample_func_1',
+            info_id=1, info='', lineno=2, end_lineno=3),
+        py_module.LintResult(
+            module_path='sample/path.py', func_name='sample_func_2',
+            info_id=1, info='', lineno=6, end_lineno=7),
+        py_module.LintResult(
+            module_path='sample/path.py', func_name='sample_func_3',
+            info_id=1, info=''),
+    ]
+    filtered_info_list: List[py_module.LintResult] = \
+        git_diff.filter_info_list_by_line_range(
+            info_list=info_list, line_range_list=[(5, 6)])
+    assert filtered_info_list == [info_list[1]]
+
+    filtered_info_list = git_diff.filter_info_list_by_line_range(
+        info_list=info_list, line_range_list=[(0, 1), (3, 5)])
+    assert filtered_info_list == []
+
+    filtered_info_list = git_diff.filter_info_list_by_line_range(
+        info_list=info_list, line_range_list=[(2, 3), (6, 7)])
+    assert filtered_info_list == info_list[:2]
+
+    filtered_info_list = git_diff.filter_info_list_by_line_range(
+        info_list=info_list, line_range_list=[(0, 10)])
+    assert filtered_info_list == info_list[:2]
+
+
+def test__is_excluded_path() -> None:
+    exclude_pattern: Pattern = re.compile(pattern=fnmatch.translate('sub'))
+    assert git_diff._is_excluded_path(
+        file_path='./dir/sub/sample.py', dir_path='./dir/',
+        exclude_pattern=exclude_pattern)
+    assert not git_diff._is_excluded_path(
+        file_path='./dir/sub_2/sample.py', dir_path='./dir/',
+        exclude_pattern=exclude_pattern)
+
+    exclude_pattern = re.compile(pattern=fnmatch.translate('./dir/sub'))
+    assert git_diff._is_excluded_path(
+        file_path='./dir/sub/sample.py', dir_path='./dir',
+        exclude_pattern=exclude_pattern)
+    exclude_pattern = re.compile(pattern=fnmatch.translate('*_pb2.py'))
+    assert git_diff._is_excluded_path(
+        file_path='./dir/sample_pb2.py', dir_path='./dir',
+        exclude_pattern=exclude_pattern)
+    assert not git_diff._is_excluded_path(
+        file_path='./dir/sample.py', dir_path='./dir',
+        exclude_pattern=exclude_pattern)
+
+
+def test__run_git_command() -> None:
+    stdout_str: str = git_diff._run_git_command(
+        arg_list=['diff', '--name-only', 'HEAD'], cwd=TMP_TEST_GIT_DIR)
+    assert 'sample.py' in stdout_str
+
+    with pytest.raises(Exception):  # type: ignore
+        git_diff._run_git_command(
+            arg_list=['not_existing_command'], cwd=TMP_TEST_GIT_DIR)
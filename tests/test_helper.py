@@ -1,10 +1,37 @@
-from typing import Dict, List, Match, Optional
+import os
+import shutil
+from typing import Dict, Iterator, List, Match, Optional, Pattern
 
 import pytest
 import six
 from voluptuous import Schema
 
-from numdoclint import helper
+from numdoclint import helper, profiler
+
+TMP_TEST_DIR: str = './tests/tmp_helper/'
+
+
+def setup() -> None:
+    """Function to be executed at the start of the test.
+    """
+    shutil.rmtree(TMP_TEST_DIR, ignore_errors=True)
+    for dir_name in [
+            'pkg/sub', '.git', 'pkg/__pycache__', 'my_env/lib', 'build',
+            'pkg/migrations']:
+        os.makedirs(os.path.join(TMP_TEST_DIR, dir_name))
+    for file_path in [
+            'a.py', 'pkg/b.py', 'pkg/sub/c.py', 'pkg/sub/c_pb2.py',
+            '.git/d.py', 'pkg/__pycache__/e.py', 'my_env/pyvenv.cfg',
+            'my_env/lib/f.py', 'build/g.py', 'pkg/migrations/h.py',
+            'pkg/readme.txt']:
+        with open(os.path.join(TMP_TEST_DIR, file_path), 'w') as f:
+            f.write('')
+
+
+def teardown() -> None:
+    """Function to be executed at the end of the test.
+    """
+    shutil.rmtree(TMP_TEST_DIR, ignore_errors=True)
 
 
 def test_read_file_str() -> None:
@@ -14,6 +41,105 @@ def test_read_file_str() -> None:
     assert 'def' in file_str
 
 
+def test__read_text() -> None:
+    file_str: str = helper._read_text(file_path='./tests/test_helper.py')
+    assert file_str == helper.read_file_str('./tests/test_helper.py')
+    assert 'def test__read_text' in file_str
+
+
+def test_get_file_path_list_recursively() -> None:
+    file_path_list: List[str] = helper.get_file_path_list_recursively(
+        dir_path='./numdoclint/', extension='.py')
+    assert './numdoclint/helper.py' in file_path_list
+    assert './numdoclint/__init__.py' in file_path_list
+    for file_path in file_path_list:
+        assert file_path.endswith('.py')
+
+    file_path_list = helper.get_file_path_list_recursively(
+        dir_path='./tests/', extension='.ipynb')
+    assert file_path_list
+    for file_path in file_path_list:
+        assert file_path.endswith('.ipynb')
+        assert '\\' not in file_path
+
+
+def test_iter_file_path_recursively() -> None:
+    file_path_iterator: Iterator[str] = helper.iter_file_path_recursively(
+        dir_path='./numdoclint/', extension='.py')
+    assert next(file_path_iterator).endswith('.py')
+    file_path_list: List[str] = list(helper.iter_file_path_recursively(
+        dir_path='./numdoclint/', extension='.py'))
+    assert file_path_list == helper.get_file_path_list_recursively(
+        dir_path='./numdoclint/', extension='.py')
+
+    file_path_list = sorted(helper.iter_file_path_recursively(
+        dir_path=TMP_TEST_DIR, extension='.py'))
+    assert file_path_list == [
+        os.path.join(TMP_TEST_DIR, file_path) for file_path in [
+            'a.py', 'build/g.py', 'pkg/b.py', 'pkg/migrations/h.py',
+            'pkg/sub/c.py', 'pkg/sub/c_pb2.py']]
+
+    file_path_list = sorted(helper.iter_file_path_recursively(
+        dir_path=TMP_TEST_DIR, extension='.py',
+        exclude_pattern_list=['build', '*/migrations/', '*_pb2.py']))
+    assert file_path_list == [
+        os.path.join(TMP_TEST_DIR, file_path) for file_path in [
+            'a.py', 'pkg/b.py', 'pkg/sub/c.py']]
+
+    file_path_list = list(helper.iter_file_path_recursively(
+        dir_path=TMP_TEST_DIR, extension='.py',
+        exclude_pattern_list=['pkg']))
+    assert os.path.join(TMP_TEST_DIR, 'pkg/b.py') not in file_path_list
+
+
+def test__scan_dir() -> None:
+    entry_list: List[os.DirEntry] = helper._scan_dir(
+        dir_path=os.path.join(TMP_TEST_DIR, 'pkg'))
+    assert sorted(entry.name for entry in entry_list) == [
+        '__pycache__', 'b.py', 'migrations', 'readme.txt', 'sub']
+
+
+def test__get_exclude_pattern() -> None:
+    assert helper._get_exclude_pattern(exclude_pattern_list=[]) is None
+    exclude_pattern: Optional[Pattern] = helper._get_exclude_pattern(
+        exclude_pattern_list=['build/', '*_pb2.py'])
+    assert exclude_pattern is not None
+    assert exclude_pattern.match('build')
+    assert exclude_pattern.match('sample_pb2.py')
+    assert exclude_pattern.match('./pkg/sample_pb2.py')
+    assert not exclude_pattern.match('build_tools')
+    assert not exclude_pattern.match('sample.py')
+
+
+def test_get_jobs_num() -> None:
+    jobs_num: int = helper.get_jobs_num(jobs=3)
+    assert jobs_num == 3
+
+    jobs_num = helper.get_jobs_num(jobs=0)
+    assert jobs_num == (os.cpu_count() or 1)
+
+    jobs_num = helper.get_jobs_num(jobs=-1)
+    assert jobs_num == (os.cpu_count() or 1)
+
+
+def test_map_in_order() -> None:
+    path_list: List[str] = [
+        'a/apple.py', 'b/orange.py', 'c/melon.py', 'd/banana.py',
+        'e/grape.py']
+    result_list: List[str] = list(helper.map_in_order(
+        func=os.path.basename, path_list=path_list, jobs=1))
+    assert result_list == [
+        'apple.py', 'orange.py', 'melon.py', 'banana.py', 'grape.py']
+
+    parallel_result_list: List[str] = list(helper.map_in_order(
+        func=os.path.basename, path_list=path_list, jobs=2))
+    assert parallel_result_list == result_list
+
+    result_list = list(helper.map_in_order(
+        func=os.path.basename, path_list=[], jobs=2))
+    assert result_list == []
+
+
 def test_get_func_name_list() -> None:
     code_str: str = """
 def sample_func_1():
@@ -57,6 +183,16 @@ sample_str = 'def sample_func_4(a: int) -> None\n    pass'
     assert 'sample_func' in func_name_list
     assert 'sample_func_4' not in func_name_list
 
+    code_str = '''
+def sample_func_1():
+    pass
+
+# >>> def sample_func_1():
+# >>> def sample_func_2():
+    '''
+    func_name_list = helper.get_func_name_list(code_str=code_str)
+    assert func_name_list == ['sample_func_1']
+
 
 def test_get_arg_name_list() -> None:
     py_module_str: str = """
@@ -503,6 +639,210 @@ def test_get_param_docstring() -> None:
     assert param_docstring == expected_docstring
 
 
+_SAMPLE_DOCSTRING: str = """    Sample function.
+
+    Parameters
+    ----------
+    name : str
+        Sample name.
+
+        The second paragraph.
+    price : int, default 100, optional
+        Sample price.
+
+    Returns
+    -------
+    location_id : int
+        Sample id.
+
+    .. versionadded:: 0.0.1
+
+    Notes
+    -----
+    Sample notes."""
+
+
+def test_Docstring() -> None:
+    parsed_docstring: helper.Docstring = helper.Docstring(
+        docstring=_SAMPLE_DOCSTRING)
+    assert parsed_docstring.docstring == _SAMPLE_DOCSTRING
+    assert parsed_docstring.line_splitted_list == tuple(
+        _SAMPLE_DOCSTRING.split('\n'))
+    assert parsed_docstring.section_dict == {
+        'Parameters': (4, 11),
+        'Returns': (13, 18),
+        'Notes': (20, 21),
+    }
+    assert parsed_docstring.description == '    Sample function.'
+    assert parsed_docstring.param_docstring == \
+        helper.get_param_docstring(docstring=_SAMPLE_DOCSTRING)
+    assert len(parsed_docstring.splitted_param_doc_list) == 2
+    assert parsed_docstring.param_info_list == ({
+        helper.DOC_PARAM_INFO_KEY_ARG_NAME: 'name',
+        helper.DOC_PARAM_INFO_KEY_TYPE_NAME: 'str',
+        helper.DOC_PARAM_INFO_KEY_DEFAULT_VAL: '',
+        helper.DOC_PARAM_INFO_KEY_DESCRIPTION: (
+            '        Sample name.\n        The second paragraph.'),
+    }, {
+        helper.DOC_PARAM_INFO_KEY_ARG_NAME: 'price',
+        helper.DOC_PARAM_INFO_KEY_TYPE_NAME: 'int',
+        helper.DOC_PARAM_INFO_KEY_DEFAULT_VAL: '100',
+        helper.DOC_PARAM_INFO_KEY_DESCRIPTION: '        Sample price.',
+    })
+    assert parsed_docstring.optional_arg_name_list == ('price',)
+    assert parsed_docstring.return_value_docstring == \
+        '    location_id : int\n        Sample id.'
+    assert parsed_docstring.return_val_info_list == ({
+        helper.DOC_RETURN_INFO_KEY_NAME: 'location_id',
+        helper.DOC_RETURN_INFO_KEY_TYPE_NAME: 'int',
+        helper.DOC_RETURN_INFO_KEY_DESCRIPTION: '        Sample id.',
+    },)
+
+    with pytest.raises(AttributeError):
+        parsed_docstring.description = ''  # type: ignore
+
+    parsed_docstring = helper.Docstring(docstring='')
+    assert parsed_docstring.section_dict == {}
+    assert parsed_docstring.description == ''
+    assert parsed_docstring.param_info_list == ()
+    assert parsed_docstring.return_value_docstring == ''
+    assert parsed_docstring.return_val_info_list == ()
+
+
+def test_parse_docstring() -> None:
+    parsed_docstring: helper.Docstring = helper.parse_docstring(
+        docstring=_SAMPLE_DOCSTRING)
+    assert isinstance(parsed_docstring, helper.Docstring)
+    assert parsed_docstring.description == '    Sample function.'
+    assert helper.parse_docstring(
+        docstring=_SAMPLE_DOCSTRING) is parsed_docstring
+
+    param_info_list: List[Dict[str, str]] = \
+        helper.get_docstring_param_info_list(docstring=_SAMPLE_DOCSTRING)
+    param_info_list[0][helper.DOC_PARAM_INFO_KEY_ARG_NAME] = 'changed'
+    assert parsed_docstring.param_info_list[0][
+        helper.DOC_PARAM_INFO_KEY_ARG_NAME] == 'name'
+
+
+def test__get_description_from_lines() -> None:
+    func_description: str = helper._get_description_from_lines(
+        line_splitted_list=('',), hyphen_line_idx_list=[])
+    assert func_description == ''
+
+    func_description = helper._get_description_from_lines(
+        line_splitted_list=(
+            'Sample function.', '', '    Parameters', '    ----------'),
+        hyphen_line_idx_list=[3])
+    assert func_description == '    Sample function.'
+
+    func_description = helper._get_description_from_lines(
+        line_splitted_list=('    Parameters', '    ----------'),
+        hyphen_line_idx_list=[1])
+    assert func_description == ''
+
+    func_description = helper._get_description_from_lines(
+        line_splitted_list=('    Sample function.', '    Line 2.'),
+        hyphen_line_idx_list=[])
+    assert func_description == '    Sample function.\n    Line 2.'
+
+
+def test__get_param_line_list() -> None:
+    line_splitted_list: tuple = tuple(_SAMPLE_DOCSTRING.split('\n'))
+    param_line_list: List[str] = helper._get_param_line_list(
+        line_splitted_list=line_splitted_list,
+        hyphen_line_idx_list=[3, 12, 19],
+        param_header_line_idx=2)
+    assert param_line_list == [
+        '    name : str',
+        '        Sample name.',
+        '        The second paragraph.',
+        '    price : int, default 100, optional',
+        '        Sample price.',
+    ]
+
+    param_line_list = helper._get_param_line_list(
+        line_splitted_list=line_splitted_list,
+        hyphen_line_idx_list=[3, 12, 19],
+        param_header_line_idx=-1)
+    assert param_line_list == []
+
+    param_line_list = helper._get_param_line_list(
+        line_splitted_list=(
+            '    Parameters', '    ----------', '    price : int', ''),
+        hyphen_line_idx_list=[1],
+        param_header_line_idx=0)
+    assert param_line_list == ['    price : int', '']
+
+
+def test__split_param_line_list() -> None:
+    splitted_param_doc_list: List[str] = helper._split_param_line_list(
+        param_line_list=[
+            '    name : str',
+            '        Sample name.',
+            '    price : int',
+        ])
+    assert splitted_param_doc_list == [
+        '    name : str\n        Sample name.',
+        '    price : int',
+    ]
+
+    splitted_param_doc_list = helper._split_param_line_list(
+        param_line_list=[])
+    assert splitted_param_doc_list == []
+
+
+def test__get_return_value_span() -> None:
+    line_splitted_list: tuple = tuple(_SAMPLE_DOCSTRING.split('\n'))
+    return_span: Optional[tuple] = helper._get_return_value_span(
+        line_splitted_list=line_splitted_list,
+        hyphen_line_idx_list=[3, 12, 19])
+    assert return_span == (13, 17)
+
+    return_span = helper._get_return_value_span(
+        line_splitted_list=line_splitted_list,
+        hyphen_line_idx_list=[3])
+    assert return_span is None
+
+    return_span = helper._get_return_value_span(
+        line_splitted_list=('    Returns', '    -------', '    int'),
+        hyphen_line_idx_list=[1])
+    assert return_span == (2, 3)
+
+
+def test__join_return_value_lines() -> None:
+    line_list: tuple = (
+        '    int',
+        '        Sample price.',
+        '',
+        '    .. versionadded:: 0.0.1',
+    )
+    return_value_docstring: str = helper._join_return_value_lines(
+        line_list=line_list, drop_additional_info=True)
+    assert return_value_docstring == '    int\n        Sample price.'
+
+    return_value_docstring = helper._join_return_value_lines(
+        line_list=line_list, drop_additional_info=False)
+    assert '.. versionadded:: 0.0.1' in return_value_docstring
+
+    return_value_docstring = helper._join_return_value_lines(
+        line_list=(), drop_additional_info=True)
+    assert return_value_docstring == '    '
+
+
+def test__get_return_val_info_list_from_str() -> None:
+    return_val_info_list: List[Dict[str, str]] = \
+        helper._get_return_val_info_list_from_str(return_value_docstring='')
+    assert return_val_info_list == []
+
+    return_val_info_list = helper._get_return_val_info_list_from_str(
+        return_value_docstring='    price : int\n        Sample price.')
+    assert return_val_info_list == [{
+        helper.DOC_RETURN_INFO_KEY_NAME: 'price',
+        helper.DOC_RETURN_INFO_KEY_TYPE_NAME: 'int',
+        helper.DOC_RETURN_INFO_KEY_DESCRIPTION: '        Sample price.',
+    }]
+
+
 def test_get_splitted_param_doc_list() -> None:
     docstring: str = """
     Sample function.
@@ -793,6 +1133,25 @@ def test__get_args_str() -> None:
     assert args_str == 'price, name'
 
 
+def test_get_arg_name_list_from_args_str() -> None:
+    arg_name_list: List[str] = helper.get_arg_name_list_from_args_str(
+        args_str='')
+    assert arg_name_list == []
+
+    arg_name_list = helper.get_arg_name_list_from_args_str(
+        args_str='self, price: int = 100, *args, **kwargs')
+    assert arg_name_list == ['price']
+
+    arg_name_list = helper.get_arg_name_list_from_args_str(
+        args_str='self, price: int = 100, *args, **kwargs',
+        exclude_ignoring_args=False)
+    assert arg_name_list == ['self', 'price', '*args', '**kwargs']
+
+    arg_name_list = helper.get_arg_name_list_from_args_str(
+        args_str='dict_val: Optional[Dict[str, int]] = None, name')
+    assert arg_name_list == ['dict_val', 'name']
+
+
 def test_get_arg_default_val_info_dict() -> None:
     py_module_str: str = """
     def sample_func_1():
@@ -865,6 +1224,22 @@ def test_get_arg_default_val_info_dict() -> None:
     assert default_val_info_dict == expected_dict
 
 
+def test_get_arg_default_val_info_dict_from_args_str() -> None:
+    default_val_info_dict: Dict[str, str] = \
+        helper.get_arg_default_val_info_dict_from_args_str(args_str='')
+    assert default_val_info_dict == {}
+
+    default_val_info_dict = \
+        helper.get_arg_default_val_info_dict_from_args_str(
+            args_str="price, name: str = 'apple', "
+                     "dict_val: Dict[str, int] = {}")
+    assert default_val_info_dict == {
+        'price': '',
+        'name': "'apple'",
+        'dict_val': '{}',
+    }
+
+
 def test__get_return_value_docstring() -> None:
     docstring: str = """
     Sample docstring.
@@ -1670,6 +2045,30 @@ def sample_func_3(price):
     assert "@Substitution('')" in decorator_names
 
 
+def test_get_decorator_names_by_line_index() -> None:
+    line_splitted_list: List[str] = [
+        'price = 100',
+        '@Appender(',
+        '    sample_value=100,',
+        ')',
+        "@Substitution('')",
+        'def sample_func_1():',
+        '    return 100',
+        '',
+        'def sample_func_2():',
+        '    return 200',
+    ]
+    decorator_names: List[str] = helper.get_decorator_names_by_line_index(
+        line_splitted_list=line_splitted_list,
+        func_start_line_index=5)
+    assert decorator_names == ["@Substitution('')", '@Appender(']
+
+    decorator_names = helper.get_decorator_names_by_line_index(
+        line_splitted_list=line_splitted_list,
+        func_start_line_index=8)
+    assert decorator_names == []
+
+
 def test__get_func_match() -> None:
     py_module_str: str = """
 price = 100
@@ -1722,6 +2121,35 @@ def test__is_additional_info_str() -> None:
     assert not result_bool
 
 
+def test_get_func_pattern() -> None:
+    profiler.reset_profile_stats()
+    profiler.enable_profile()
+    try:
+        pattern: Pattern = helper.get_func_pattern(
+            pattern_str='def sample_func_for_pattern_test')
+        assert helper.get_func_pattern(
+            pattern_str='def sample_func_for_pattern_test') is pattern
+    finally:
+        profiler.disable_profile()
+    assert pattern.search('    def sample_func_for_pattern_test():')
+    cache_dict: Dict[str, Dict[str, int]] = profiler.get_profile_stats()[
+        profiler.PROFILE_KEY_CACHE]
+    assert cache_dict[f'{helper.FUNC_PATTERN_CACHE_NAME}:hit'][
+        profiler.STAT_KEY_COUNT] == 1
+    assert cache_dict[f'{helper.FUNC_PATTERN_CACHE_NAME}:miss'][
+        profiler.STAT_KEY_COUNT] == 1
+    profiler.reset_profile_stats()
+
+    max_size: int = helper._FUNC_PATTERN_CACHE_MAX_SIZE
+    helper._FUNC_PATTERN_CACHE_MAX_SIZE = 1
+    try:
+        helper.get_func_pattern(pattern_str='def sample_func_for_size_test')
+        assert list(helper._func_pattern_dict) == [
+            'def sample_func_for_size_test']
+    finally:
+        helper._FUNC_PATTERN_CACHE_MAX_SIZE = max_size
+
+
 def test_is_interactive_shell_example_line() -> None:
     py_module_str: str = '''
     def sample_func_1():
@@ -1856,34 +2284,6 @@ def test__remove_type_bracket_block_from_args_str() -> None:
     assert result_str == expected_str
 
 
-def test__get_prev_char() -> None:
-    code_str: str = 'import os'
-    char: str = helper._get_prev_char(code_str=code_str, index=0)
-    assert char == ''
-
-    char = helper._get_prev_char(code_str=code_str, index=1)
-    assert char == 'i'
-
-
-def test__get_following_3_chars() -> None:
-    code_str: str = 'import os'
-    three_chars: str = helper._get_following_3_chars(
-        code_str=code_str, index=8)
-    assert three_chars == 's'
-
-    three_chars = helper._get_following_3_chars(
-        code_str=code_str, index=7)
-    assert three_chars == 'os'
-
-    three_chars = helper._get_following_3_chars(
-        code_str=code_str, index=6)
-    assert three_chars == ' os'
-
-    three_chars = helper._get_following_3_chars(
-        code_str=code_str, index=5)
-    assert three_chars == 't o'
-
-
 def test___remove_strs() -> None:
     code_str: str = (
         'import os'
@@ -1907,3 +2307,53 @@ def test___remove_strs() -> None:
         "\ne = "
     )
     assert code_str == expected_str
+
+    code_str = (
+        r"""a = b"\\" + r'C:\dir\\' + 'It\'s'"""
+        '\n'
+        r"""b = f'{c["d"]}' + f"{c["d"]:{width}}" + f'{{e}}'"""
+        '\n'
+        r"""c = Rb'''\\''' + f'{f"{d}"}' + u'\N{BULLET}'"""
+        "\n# It's a comment."
+        '\ndef any_func() -> None: ...'
+    )
+    code_str = helper._remove_strs(code_str=code_str)
+    expected_str = (
+        'a =  +  + '
+        '\nb =  +  + '
+        '\nc =  +  + '
+        "\n# It's a comment."
+        '\ndef any_func() -> None: ...'
+    )
+    assert code_str == expected_str
+
+    code_str = "a = 'b'\nc = '''d\ndef any_func() -> None: ..."
+    code_str = helper._remove_strs(code_str=code_str)
+    assert code_str == 'a = \nc = '
+
+
+def test__get_str_end_idx() -> None:
+    code_str: str = "a = 'b' + c"
+    match: Optional[Match] = helper._STR_OR_COMMENT_START_PATTERN.search(
+        code_str)
+    end_idx: int = helper._get_str_end_idx(
+        code_str=code_str, match=match)  # type: ignore
+    assert end_idx == 7
+
+    code_str = 'a = f"{b["c"]!r:>{d}} {{e}}" + f'
+    match = helper._STR_OR_COMMENT_START_PATTERN.search(code_str)
+    end_idx = helper._get_str_end_idx(
+        code_str=code_str, match=match)  # type: ignore
+    assert end_idx == 28
+
+    code_str = r"a = rf'\{b}\\' + c"
+    match = helper._STR_OR_COMMENT_START_PATTERN.search(code_str)
+    end_idx = helper._get_str_end_idx(
+        code_str=code_str, match=match)  # type: ignore
+    assert end_idx == 14
+
+    code_str = "a = f'{b"
+    match = helper._STR_OR_COMMENT_START_PATTERN.search(code_str)
+    end_idx = helper._get_str_end_idx(
+        code_str=code_str, match=match)  # type: ignore
+    assert end_idx == len(code_str)
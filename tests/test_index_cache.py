@@ -0,0 +1,165 @@
+import os
+import shutil
+from typing import Any, Dict
+
+from numdoclint import index_cache, profiler
+from numdoclint.module_index import (ENGINE_AST, ENGINE_LEGACY,
+                                     AstModuleIndex, ModuleIndex)
+
+TMP_TEST_INDEX_CACHE_DIR: str = './tests/tmp_index_cache/'
+TMP_TEST_MODULE_PATH_1: str = os.path.join(
+    TMP_TEST_INDEX_CACHE_DIR, 'test_module_1.py')
+TMP_TEST_MODULE_PATH_2: str = os.path.join(
+    TMP_TEST_INDEX_CACHE_DIR, 'test_module_2.py')
+
+_MODULE_STR: str = '''
+def sample_func_1(price):
+    """
+    Sample function.
+    """
+    return 100
+'''
+
+
+def setup() -> None:
+    """Function to be executed at the start of the test.
+    """
+    shutil.rmtree(TMP_TEST_INDEX_CACHE_DIR, ignore_errors=True)
+    os.makedirs(TMP_TEST_INDEX_CACHE_DIR)
+    for module_path in [TMP_TEST_MODULE_PATH_1, TMP_TEST_MODULE_PATH_2]:
+        with open(module_path, 'w') as f:
+            f.write(_MODULE_STR)
+
+
+def teardown() -> None:
+    """Function to be executed at the end of the test.
+    """
+    shutil.rmtree(TMP_TEST_INDEX_CACHE_DIR, ignore_errors=True)
+    index_cache.disable_index_cache()
+
+
+def test_enable_index_cache() -> None:
+    index_cache.enable_index_cache()
+    try:
+        assert index_cache.is_index_cache_enabled()
+        index_cache.get_module_index(
+            py_module_path=TMP_TEST_MODULE_PATH_1, engine=ENGINE_LEGACY)
+        assert index_cache.get_cache_size() == len(_MODULE_STR)
+
+        index_cache.enable_index_cache(max_cache_bytes=1)
+        assert index_cache.get_cache_size() == 0
+    finally:
+        index_cache.disable_index_cache()
+
+
+def test_disable_index_cache() -> None:
+    index_cache.enable_index_cache()
+    index_cache.get_module_index(
+        py_module_path=TMP_TEST_MODULE_PATH_1, engine=ENGINE_LEGACY)
+    index_cache.disable_index_cache()
+    assert not index_cache.is_index_cache_enabled()
+    assert index_cache.get_cache_size() == 0
+
+
+def test_is_index_cache_enabled() -> None:
+    assert not index_cache.is_index_cache_enabled()
+
+
+def test_clear_cache() -> None:
+    index_cache.enable_index_cache()
+    try:
+        module_index: ModuleIndex = index_cache.get_module_index(
+            py_module_path=TMP_TEST_MODULE_PATH_1, engine=ENGINE_LEGACY)
+        index_cache.clear_cache()
+        assert index_cache.is_index_cache_enabled()
+        assert index_cache.get_cache_size() == 0
+        assert index_cache.get_module_index(
+            py_module_path=TMP_TEST_MODULE_PATH_1,
+            engine=ENGINE_LEGACY) is not module_index
+    finally:
+        index_cache.disable_index_cache()
+
+
+def test_get_cache_size() -> None:
+    assert index_cache.get_cache_size() == 0
+    index_cache.enable_index_cache()
+    try:
+        index_cache.get_module_index(
+            py_module_path=TMP_TEST_MODULE_PATH_1, engine=ENGINE_LEGACY)
+        index_cache.get_module_index(
+            py_module_path=TMP_TEST_MODULE_PATH_2, engine=ENGINE_LEGACY)
+        assert index_cache.get_cache_size() == len(_MODULE_STR) * 2
+    finally:
+        index_cache.disable_index_cache()
+
+
+def test_get_module_index() -> None:
+    module_index: ModuleIndex = index_cache.get_module_index(
+        py_module_path=TMP_TEST_MODULE_PATH_1, engine=ENGINE_LEGACY)
+    assert module_index.module_str == _MODULE_STR
+    assert index_cache.get_module_index(
+        py_module_path=TMP_TEST_MODULE_PATH_1,
+        engine=ENGINE_LEGACY) is not module_index
+
+    profiler.reset_profile_stats()
+    profiler.enable_profile()
+    index_cache.enable_index_cache()
+    try:
+        module_index = index_cache.get_module_index(
+            py_module_path=TMP_TEST_MODULE_PATH_1, engine=ENGINE_LEGACY)
+        assert index_cache.get_module_index(
+            py_module_path=TMP_TEST_MODULE_PATH_1,
+            engine=ENGINE_LEGACY) is module_index
+        ast_module_index: ModuleIndex = index_cache.get_module_index(
+            py_module_path=TMP_TEST_MODULE_PATH_1, engine=ENGINE_AST)
+        assert isinstance(ast_module_index, AstModuleIndex)
+        assert index_cache.get_cache_size() == len(_MODULE_STR) * 2
+
+        with open(TMP_TEST_MODULE_PATH_1, 'w') as f:
+            f.write(_MODULE_STR + '\n')
+        module_index = index_cache.get_module_index(
+            py_module_path=TMP_TEST_MODULE_PATH_1, engine=ENGINE_LEGACY)
+        assert module_index.module_str == _MODULE_STR + '\n'
+        assert index_cache.get_cache_size() == len(_MODULE_STR) * 2 + 1
+    finally:
+        index_cache.disable_index_cache()
+        profiler.disable_profile()
+        with open(TMP_TEST_MODULE_PATH_1, 'w') as f:
+            f.write(_MODULE_STR)
+    cache_dict: Dict[str, Dict[str, Any]] = profiler.get_profile_stats()[
+        profiler.PROFILE_KEY_CACHE]
+    assert cache_dict[f'{index_cache.INDEX_CACHE_NAME}:hit'][
+        profiler.STAT_KEY_COUNT] == 1
+    assert cache_dict[f'{index_cache.INDEX_CACHE_NAME}:miss'][
+        profiler.STAT_KEY_COUNT] == 3
+    profiler.reset_profile_stats()
+
+
+def test__read_module_index() -> None:
+    module_index: ModuleIndex = index_cache._read_module_index(
+        py_module_path=TMP_TEST_MODULE_PATH_1, engine=ENGINE_AST)
+    assert isinstance(module_index, AstModuleIndex)
+    assert module_index.func_name_list == ['sample_func_1']
+
+
+def test__evict_index_cache() -> None:
+    index_cache.enable_index_cache(max_cache_bytes=len(_MODULE_STR) * 2)
+    try:
+        module_index: ModuleIndex = index_cache.get_module_index(
+            py_module_path=TMP_TEST_MODULE_PATH_1, engine=ENGINE_LEGACY)
+        index_cache.get_module_index(
+            py_module_path=TMP_TEST_MODULE_PATH_2, engine=ENGINE_LEGACY)
+        assert index_cache.get_module_index(
+            py_module_path=TMP_TEST_MODULE_PATH_1,
+            engine=ENGINE_LEGACY) is module_index
+
+        index_cache._max_cache_bytes = len(_MODULE_STR)
+        index_cache._evict_index_cache()
+        assert index_cache.get_cache_size() == len(_MODULE_STR)
+        assert index_cache.get_module_index(
+            py_module_path=TMP_TEST_MODULE_PATH_1,
+            engine=ENGINE_LEGACY) is module_index
+        assert list(index_cache._index_dict) == [
+            (TMP_TEST_MODULE_PATH_1, ENGINE_LEGACY)]
+    finally:
+        index_cache.disable_index_cache()
@@ -1,12 +1,12 @@
 import os
 import shutil
-from typing import List
+from typing import Iterator, List
 
 import pytest
 import six
 from voluptuous import Any, Schema
 
-from numdoclint import jupyter_notebook, py_module
+from numdoclint import jupyter_notebook, output, py_module
 
 TMP_TEST_MODULE_DIR: str = './tests/tmp/'
 TMP_TEST_NOTEBOOK_PATH_1: str = os.path.join(
@@ -106,48 +106,168 @@ def test__get_code_cell_str_list() -> None:
     assert code_str_list[1] == expected_code_str
 
 
-def test__rename_dict_key() -> None:
-    info_list: List[dict] = [{
-        py_module.INFO_KEY_MODULE_PATH: 'sample/path.ipynb',
-        py_module.INFO_KEY_FUNC_NAME: 'sample_func_1',
-        py_module.INFO_KEY_INFO_ID: 1,
-        py_module.INFO_KEY_INFO: 'Sample information 1.',
-    }, {
-        py_module.INFO_KEY_MODULE_PATH: 'sample/path.ipynb',
-        py_module.INFO_KEY_FUNC_NAME: 'sample_func_2',
-        py_module.INFO_KEY_INFO_ID: 2,
-        py_module.INFO_KEY_INFO: 'Sample information 2.',
-    }]
-    info_list = jupyter_notebook._rename_dict_key(
-        info_list=info_list)
-    assert len(info_list) == 2
-    schema: Schema = Schema(
-        schema={
-            jupyter_notebook.INFO_KEY_NOTEBOOK_PATH: 'sample/path.ipynb',
-            jupyter_notebook.INFO_KEY_FUNC_NAME: Any(
-                'sample_func_1', 'sample_func_2'),
-            jupyter_notebook.INFO_KEY_INFO_ID: Any(1, 2),
-            jupyter_notebook.INFO_KEY_INFO: Any(
-                'Sample information 1.', 'Sample information 2.'),
-        },
-        required=True)
-    for info_dict in info_list:
-        schema(info_dict)
+_SAMPLE_NOTEBOOK_BYTES: bytes = b"""{
+ "cells": [
+  {
+   "cell_type": "code",
+   "execution_count": 1,
+   "metadata": {"tags": ["a]}"]},
+   "outputs": [{"data": {"image/png": "iVBORw0KGgo=",
+    "text/plain": ["\\"{[\\\\"]}, "output_type": "display_data"}],
+   "source": ["def sample_func():\\n", "    return \\"\\\\\\"\\""]
+  },
+  {"cell_type": "markdown", "metadata": {}, "source": "# Title"},
+  {"source": "x = 1", "cell_type": "code", "outputs": []}
+ ],
+ "metadata": {},
+ "nbformat": 4
+}"""
+
+
+def test__read_code_cell_str_list() -> None:
+    code_str_list: List[str] = jupyter_notebook._read_code_cell_str_list(
+        notebook_path='./tests/jupyter/test_jupyter_notebook_py3.ipynb')
+    notebook_data_dict: dict = jupyter_notebook._read_notebook_data_dict(
+        notebook_path='./tests/jupyter/test_jupyter_notebook_py3.ipynb')
+    assert code_str_list == jupyter_notebook._get_code_cell_str_list(
+        notebook_data_dict=notebook_data_dict)
 
+    with open(TMP_TEST_NOTEBOOK_PATH_1, 'wb') as f:
+        f.write(b'')
+    with pytest.raises(ValueError):  # type: ignore
+        jupyter_notebook._read_code_cell_str_list(
+            notebook_path=TMP_TEST_NOTEBOOK_PATH_1)
+
+    with open(TMP_TEST_NOTEBOOK_PATH_1, 'wb') as f:
+        f.write(_SAMPLE_NOTEBOOK_BYTES)
+    code_str_list = jupyter_notebook._read_code_cell_str_list(
+        notebook_path=TMP_TEST_NOTEBOOK_PATH_1)
+    assert code_str_list == [
+        'def sample_func():\n    return "\\""', 'x = 1']
+
+    scan_notebook_min_size: int = jupyter_notebook._SCAN_NOTEBOOK_MIN_SIZE
+    jupyter_notebook._SCAN_NOTEBOOK_MIN_SIZE = 0
+    try:
+        code_str_list = jupyter_notebook._read_code_cell_str_list(
+            notebook_path=TMP_TEST_NOTEBOOK_PATH_1)
+        assert code_str_list == [
+            'def sample_func():\n    return "\\""', 'x = 1']
+
+        with open(TMP_TEST_NOTEBOOK_PATH_1, 'wb') as f:
+            f.write(b'{"cells": [{"cell_type": "code"}]}')
+        with pytest.raises(KeyError):  # type: ignore
+            jupyter_notebook._read_code_cell_str_list(
+                notebook_path=TMP_TEST_NOTEBOOK_PATH_1)
+    finally:
+        jupyter_notebook._SCAN_NOTEBOOK_MIN_SIZE = scan_notebook_min_size
+    _delete_test_notebook()
 
-def test__add_code_cell_index() -> None:
-    info_list: List[dict] = [{}, {}]
-    info_list = jupyter_notebook._add_code_cell_index(
-        info_list=info_list,
-        code_cell_idx=5)
-    assert len(info_list) == 2
-    schema: Schema = Schema(
-        schema={
-            jupyter_notebook.INFO_KEY_CODE_CELL_INDEX: 5,
-        },
-        required=True)
-    for info_dict in info_list:
-        schema(info_dict)
+
+def test__scan_code_cell_str_list() -> None:
+    code_str_list: List[str] = jupyter_notebook._scan_code_cell_str_list(
+        buffer=_SAMPLE_NOTEBOOK_BYTES)
+    assert code_str_list == [
+        'def sample_func():\n    return "\\""', 'x = 1']
+
+    code_str_list = jupyter_notebook._scan_code_cell_str_list(
+        buffer=b'{"metadata": {}}')
+    assert code_str_list == []
+
+    with pytest.raises(ValueError):  # type: ignore
+        jupyter_notebook._scan_code_cell_str_list(buffer=b'{"cells": {}}')
+    with pytest.raises(ValueError):  # type: ignore
+        jupyter_notebook._scan_code_cell_str_list(buffer=b'[]')
+
+
+def test__get_json_object_span_dict() -> None:
+    buffer: bytes = b' {"a": [1, {"b": "}"}], "c" : "d", "e": null} '
+    span_dict: dict
+    end_pos: int
+    span_dict, end_pos = jupyter_notebook._get_json_object_span_dict(
+        buffer=buffer, pos=0)
+    assert list(span_dict) == ['a', 'c', 'e']
+    start_pos, value_end_pos = span_dict['a']
+    assert buffer[start_pos:value_end_pos] == b'[1, {"b": "}"}]'
+    start_pos, value_end_pos = span_dict['c']
+    assert buffer[start_pos:value_end_pos] == b'"d"'
+    start_pos, value_end_pos = span_dict['e']
+    assert buffer[start_pos:value_end_pos] == b'null'
+    assert end_pos == len(buffer) - 1
+
+    with pytest.raises(ValueError):  # type: ignore
+        jupyter_notebook._get_json_object_span_dict(
+            buffer=b'{"a" 1}', pos=0)
+    with pytest.raises(ValueError):  # type: ignore
+        jupyter_notebook._get_json_object_span_dict(buffer=b'1', pos=0)
+
+
+def test__skip_json_value() -> None:
+    buffer: bytes = b'[{"a": "]"}, [2]], 3'
+    end_pos: int = jupyter_notebook._skip_json_value(buffer=buffer, pos=0)
+    assert buffer[:end_pos] == b'[{"a": "]"}, [2]]'
+    end_pos = jupyter_notebook._skip_json_value(buffer=buffer, pos=19)
+    assert end_pos == len(buffer)
+    end_pos = jupyter_notebook._skip_json_value(
+        buffer=b'true}', pos=0)
+    assert end_pos == 4
+
+    with pytest.raises(ValueError):  # type: ignore
+        jupyter_notebook._skip_json_value(buffer=b'[[1]', pos=0)
+    with pytest.raises(ValueError):  # type: ignore
+        jupyter_notebook._skip_json_value(buffer=b',', pos=0)
+
+
+def test__skip_json_str() -> None:
+    end_pos: int = jupyter_notebook._skip_json_str(
+        buffer=b'"abc", 1', pos=0)
+    assert end_pos == 5
+    buffer: bytes = b'"a\\"b\\\\", 1'
+    end_pos = jupyter_notebook._skip_json_str(buffer=buffer, pos=0)
+    assert buffer[:end_pos] == b'"a\\"b\\\\"'
+
+    with pytest.raises(ValueError):  # type: ignore
+        jupyter_notebook._skip_json_str(buffer=b'"abc', pos=0)
+
+
+def test__skip_json_whitespace() -> None:
+    end_pos: int = jupyter_notebook._skip_json_whitespace(
+        buffer=b' \n\t {}', pos=0)
+    assert end_pos == 4
+    end_pos = jupyter_notebook._skip_json_whitespace(buffer=b'{}', pos=1)
+    assert end_pos == 1
+
+
+def test__load_json_span() -> None:
+    value: object = jupyter_notebook._load_json_span(
+        buffer='{"a": ["\u3042"]}'.encode('utf-8'), span=(6, 13))
+    assert value == ['\u3042']
+
+
+def test_NotebookLintResult() -> None:
+    lint_result: jupyter_notebook.NotebookLintResult = \
+        jupyter_notebook.NotebookLintResult(
+            func_name='sample_func_1', info_id=1,
+            info='Sample information 1.',
+            notebook_path='sample/path.ipynb', code_cell_index=5)
+    assert lint_result[jupyter_notebook.INFO_KEY_NOTEBOOK_PATH] == \
+        'sample/path.ipynb'
+    assert lint_result.code_cell_index == 5
+    assert not hasattr(lint_result, '__dict__')
+    assert list(lint_result.to_dict()) == [
+        jupyter_notebook.INFO_KEY_FUNC_NAME,
+        jupyter_notebook.INFO_KEY_INFO_ID,
+        jupyter_notebook.INFO_KEY_INFO,
+        jupyter_notebook.INFO_KEY_NOTEBOOK_PATH,
+        jupyter_notebook.INFO_KEY_CODE_CELL_INDEX,
+    ]
+    assert py_module.INFO_KEY_MODULE_PATH not in lint_result
+    assert jupyter_notebook.NotebookLintResult.from_dict(
+        info_dict=lint_result.to_dict()) == lint_result
+    output_dict: dict = lint_result.to_output_dict()
+    assert output_dict[output.OUTPUT_KEY_PATH] == 'sample/path.ipynb'
+    assert output_dict[output.OUTPUT_KEY_CODE_CELL_INDEX] == 5
+    assert output_dict[output.OUTPUT_KEY_LINENO] == 0
+    assert output_dict[output.OUTPUT_KEY_END_LINENO] == 0
 
 
 def test__check_unit_code_cell_str() -> None:
@@ -192,7 +312,7 @@ def sample_func(price):
         enable_default_or_optional_doc_check=False)
     assert info_list
     for info_dict in info_list:
-        schema(info_dict)
+        schema(info_dict.to_dict())
         notebook_path = info_dict[jupyter_notebook.INFO_KEY_NOTEBOOK_PATH]
         assert notebook_path == expected_notebook_path
         code_cell_idx = info_dict[jupyter_notebook.INFO_KEY_CODE_CELL_INDEX]
@@ -299,6 +419,137 @@ schema: Schema = Schema(
     }, required=True)
 
 
+def test__iter_unit_code_cell_info() -> None:
+    code_cell_str: str = '''
+def sample_func_1(price):
+    return 100
+
+
+def sample_func_2(name):
+    pass
+    '''
+    info_iterator: Iterator[dict] = \
+        jupyter_notebook._iter_unit_code_cell_info(
+            notebook_path='sample/path.ipynb',
+            code_cell_idx=3,
+            code_cell_str=code_cell_str,
+            ignore_func_name_prefix_list=[],
+            ignore_info_id_list=[],
+            enable_default_or_optional_doc_check=False)
+    info_dict: dict = next(info_iterator)
+    schema(info_dict.to_dict())
+    assert info_dict[jupyter_notebook.INFO_KEY_FUNC_NAME] == 'sample_func_1'
+    assert info_dict[jupyter_notebook.INFO_KEY_CODE_CELL_INDEX] == 3
+    info_list: List[dict] = [info_dict] + list(info_iterator)
+    assert info_list == jupyter_notebook._check_unit_code_cell_str(
+        notebook_path='sample/path.ipynb',
+        code_cell_idx=3,
+        code_cell_str=code_cell_str,
+        ignore_func_name_prefix_list=[],
+        ignore_info_id_list=[],
+        enable_default_or_optional_doc_check=False)
+
+
+def test__iter_combined_code_cell_info() -> None:
+    code_cell_str_list: List[str] = [
+        'import os',
+        '''
+def sample_func_1(price):
+    return 100''',
+        'x = sample_func_1(price=100)',
+        '''def sample_func_1(name):
+    pass
+
+
+def test_func():
+    pass''',
+    ]
+    info_list: List[dict] = list(
+        jupyter_notebook._iter_combined_code_cell_info(
+            notebook_path='sample/path.ipynb',
+            code_cell_str_list=code_cell_str_list,
+            ignore_func_name_prefix_list=['test_'],
+            ignore_info_id_list=[],
+            enable_default_or_optional_doc_check=False))
+    assert info_list
+    for info_dict in info_list:
+        schema(info_dict.to_dict())
+    position_list: List[tuple] = [
+        (info_dict.code_cell_index, info_dict.lineno)
+        for info_dict in info_list]
+    assert (1, 2) in position_list
+    assert (3, 1) in position_list
+    assert {position[0] for position in position_list} == {1, 3}
+
+    expected_info_list: List[dict] = []
+    for code_cell_idx, code_cell_str in enumerate(code_cell_str_list):
+        expected_info_list.extend(
+            jupyter_notebook._check_unit_code_cell_str(
+                notebook_path='sample/path.ipynb',
+                code_cell_idx=code_cell_idx,
+                code_cell_str=code_cell_str,
+                ignore_func_name_prefix_list=['test_'],
+                ignore_info_id_list=[],
+                enable_default_or_optional_doc_check=False))
+    assert info_list == expected_info_list
+    assert [info_dict.lineno for info_dict in info_list] == [
+        info_dict.lineno for info_dict in expected_info_list]
+    assert [info_dict.end_lineno for info_dict in info_list] == [
+        info_dict.end_lineno for info_dict in expected_info_list]
+    assert (1, 2, 3) in [
+        (info_dict.code_cell_index, info_dict.lineno, info_dict.end_lineno)
+        for info_dict in info_list]
+
+    code_cell_str_list = [
+        "%%bash\necho don't",
+        '''def sample_func_1(price):
+    return 100''',
+        "x = '''abc",
+        '''def sample_func_2(name):
+    pass''',
+    ]
+    info_list = list(
+        jupyter_notebook._iter_combined_code_cell_info(
+            notebook_path='sample/path.ipynb',
+            code_cell_str_list=code_cell_str_list,
+            ignore_func_name_prefix_list=[],
+            ignore_info_id_list=[],
+            enable_default_or_optional_doc_check=False))
+    expected_info_list = []
+    for code_cell_idx, code_cell_str in enumerate(code_cell_str_list):
+        expected_info_list.extend(
+            jupyter_notebook._check_unit_code_cell_str(
+                notebook_path='sample/path.ipynb',
+                code_cell_idx=code_cell_idx,
+                code_cell_str=code_cell_str,
+                ignore_func_name_prefix_list=[],
+                ignore_info_id_list=[],
+                enable_default_or_optional_doc_check=False))
+    assert info_list == expected_info_list
+    assert {info_dict.func_name for info_dict in info_list} == {
+        'sample_func_1', 'sample_func_2'}
+
+
+def test__iter_notebook_info() -> None:
+    notebook_path: str = './tests/jupyter/test_jupyter_notebook_py3.ipynb'
+    info_list: List[dict] = list(jupyter_notebook._iter_notebook_info(
+        notebook_path=notebook_path,
+        ignore_func_name_prefix_list=[],
+        ignore_info_id_list=[],
+        enable_default_or_optional_doc_check=True))
+    assert info_list
+    for info_dict in info_list:
+        schema(info_dict.to_dict())
+
+    notebook_path = './tests/jupyter/test_blank_notebook.ipynb'
+    info_list = list(jupyter_notebook._iter_notebook_info(
+        notebook_path=notebook_path,
+        ignore_func_name_prefix_list=[],
+        ignore_info_id_list=[],
+        enable_default_or_optional_doc_check=True))
+    assert info_list == []
+
+
 def test_check_jupyter_notebook() -> None:
     notebook_path: str = './tests/jupyter/test_jupyter_notebook_py3.ipynb'
     info_list: List[dict] = jupyter_notebook.check_jupyter_notebook(
@@ -309,9 +560,18 @@ def test_check_jupyter_notebook() -> None:
         enable_default_or_optional_doc_check=True)
     assert info_list
     for info_dict in info_list:
-        schema(info_dict)
+        schema(info_dict.to_dict())
     assert len(info_list) >= 10
 
+    combined_info_list: List[dict] = jupyter_notebook.check_jupyter_notebook(
+        notebook_path=notebook_path,
+        verbose=0,
+        ignore_func_name_prefix_list=[],
+        ignore_info_id_list=[],
+        enable_default_or_optional_doc_check=True,
+        combine_code_cells=True)
+    assert combined_info_list == info_list
+
     ignore_info_id_list: List[int] = [
         info_dict[jupyter_notebook.INFO_KEY_INFO_ID]
         for info_dict in info_list]
@@ -361,13 +621,33 @@ def test_check_jupyter_notebook_recursively() -> None:
         enable_default_or_optional_doc_check=True)
     assert info_list
     for info_dict in info_list:
-        schema(info_dict)
+        schema(info_dict.to_dict())
     notebook_path_list: List[str] = [
         info_dict[jupyter_notebook.INFO_KEY_NOTEBOOK_PATH]
         for info_dict in info_list]
     unique_path_list: List[str] = list(set(notebook_path_list))
     assert len(unique_path_list) > 1
 
+    parallel_info_list: List[dict] = \
+        jupyter_notebook.check_jupyter_notebook_recursively(
+            dir_path='./tests/',
+            verbose=jupyter_notebook.VERBOSE_DISABLED,
+            ignore_func_name_prefix_list=[],
+            ignore_info_id_list=[],
+            enable_default_or_optional_doc_check=True,
+            jobs=2)
+    assert parallel_info_list == info_list
+
+    excluded_info_list: List[dict] = \
+        jupyter_notebook.check_jupyter_notebook_recursively(
+            dir_path='./tests/',
+            verbose=jupyter_notebook.VERBOSE_DISABLED,
+            ignore_func_name_prefix_list=[],
+            ignore_info_id_list=[],
+            enable_default_or_optional_doc_check=True,
+            exclude_pattern_list=['*.ipynb'])
+    assert excluded_info_list == []
+
     ignore_info_id_list: List[int] = [
         info_dict[jupyter_notebook.INFO_KEY_INFO_ID]
         for info_dict in info_list]
@@ -387,3 +667,30 @@ def test_check_jupyter_notebook_recursively() -> None:
         ignore_info_id_list=ignore_info_id_list,
         enable_default_or_optional_doc_check=True)
     assert info_list == []
+
+
+def test_iter_check_jupyter_notebooks() -> None:
+    info_iterator: Iterator[dict] = \
+        jupyter_notebook.iter_check_jupyter_notebooks(
+            dir_path='./tests/',
+            verbose=jupyter_notebook.VERBOSE_DISABLED,
+            ignore_func_name_prefix_list=[],
+            ignore_info_id_list=[],
+            enable_default_or_optional_doc_check=True)
+    schema(next(info_iterator).to_dict())
+
+    info_list: List[dict] = list(
+        jupyter_notebook.iter_check_jupyter_notebooks(
+            dir_path='./tests/',
+            verbose=jupyter_notebook.VERBOSE_DISABLED,
+            ignore_func_name_prefix_list=[],
+            ignore_info_id_list=[],
+            enable_default_or_optional_doc_check=True))
+    expected_info_list: List[dict] = \
+        jupyter_notebook.check_jupyter_notebook_recursively(
+            dir_path='./tests/',
+            verbose=jupyter_notebook.VERBOSE_DISABLED,
+            ignore_func_name_prefix_list=[],
+            ignore_info_id_list=[],
+            enable_default_or_optional_doc_check=True)
+    assert info_list == expected_info_list
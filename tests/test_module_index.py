@@ -0,0 +1,551 @@
+import ast
+from typing import Dict, List, Tuple
+
+import pytest
+
+from numdoclint import module_index
+from numdoclint.module_index import (AstFuncEntry, AstModuleIndex,
+                                     CombinedModuleIndex, FuncEntry,
+                                     ModuleIndex)
+
+MODULE_STR: str = '''
+import os
+
+
+def sample_func_1(price, name='apple'):
+    """
+    Sample function.
+
+    Parameters
+    ----------
+    price : int
+        Sample price.
+    name : str, default 'apple'
+        Sample name.
+    """
+
+    def sample_func_2():
+        pass
+
+    return 100
+
+
+class SampleClass:
+
+    @Appender
+    def sample_func_3(self):
+        """
+        Sample method.
+
+        Examples
+        --------
+        >>> def sample_func_4():
+        ...     pass
+        """
+        pass
+
+    def sample_func_1(self):
+        pass
+'''
+
+
+def test_FuncEntry() -> None:
+    func_entry: FuncEntry = FuncEntry(
+        func_name='sample_func', func_str='', start_line_idx=-1,
+        end_line_idx=-1, decorator_names=[])
+    assert func_entry.indent_num == 0
+    assert func_entry.args_str == ''
+    assert func_entry.docstring == ''
+
+    func_str: str = '''    def sample_func(self, price):
+        """
+        Sample method.
+        """
+        return price'''
+    func_entry = FuncEntry(
+        func_name='sample_func', func_str=func_str, start_line_idx=3,
+        end_line_idx=8, decorator_names=['@Appender'])
+    assert 'docstring' not in func_entry.__dict__
+    assert func_entry.indent_num == 2
+    assert func_entry.args_str == 'self, price'
+    assert func_entry.docstring == '    Sample method.'
+    assert func_entry.decorator_names == ['@Appender']
+    assert 'docstring' in func_entry.__dict__
+    assert 'param_info_list' not in func_entry.__dict__
+    assert func_entry.param_info_list == []
+    assert func_entry.return_val_info_list == []
+
+    with pytest.raises(AttributeError):  # type: ignore
+        func_entry.not_existing_fact
+    with pytest.raises(ValueError):  # type: ignore
+        func_entry._compute_fact(fact_name='not_existing_fact')
+
+
+def test_ModuleIndex() -> None:
+    index: ModuleIndex = ModuleIndex(module_str=MODULE_STR)
+    assert index.line_splitted_list == MODULE_STR.split('\n')
+    assert index.func_name_list == [
+        'sample_func_1', 'sample_func_2', 'sample_func_3',
+        'sample_func_1']
+
+
+def test_ModuleIndex_get_func_entry() -> None:
+    index: ModuleIndex = ModuleIndex(module_str=MODULE_STR)
+    func_entry: FuncEntry = index.get_func_entry(func_name='sample_func_1')
+    assert func_entry.start_line_idx == 4
+    assert func_entry.end_line_idx == 22
+    assert func_entry.func_str.startswith(
+        "def sample_func_1(price, name='apple'):")
+    assert func_entry.func_str.rstrip().endswith('return 100')
+    assert func_entry.args_str == "price, name='apple'"
+    assert 'Sample function.' in func_entry.docstring
+    assert func_entry.decorator_names == []
+    assert func_entry.last_line_idx == 19
+    assert index.get_func_entry(func_name='sample_func_1') is func_entry
+
+    func_entry = index.get_func_entry(func_name='sample_func_2')
+    assert func_entry.start_line_idx == 16
+    assert func_entry.end_line_idx == 22
+    assert func_entry.last_line_idx == 17
+    assert func_entry.indent_num == 2
+
+    func_entry = index.get_func_entry(func_name='sample_func_3')
+    assert func_entry.start_line_idx == 25
+    assert func_entry.end_line_idx == 36
+    assert func_entry.last_line_idx == 34
+    assert func_entry.decorator_names == ['@Appender']
+    assert func_entry.indent_num == 2
+    assert 'Sample method.' in func_entry.docstring
+
+    func_entry = index.get_func_entry(func_name='sample_func_4')
+    assert func_entry.start_line_idx == -1
+    assert func_entry.func_str == ''
+    assert func_entry.docstring == ''
+
+
+def test_ModuleIndex_get_func_entry_list() -> None:
+    index: ModuleIndex = ModuleIndex(module_str=MODULE_STR)
+    func_entry_list: List[FuncEntry] = index.get_func_entry_list()
+    assert [func_entry.func_name for func_entry in func_entry_list] == [
+        'sample_func_1', 'sample_func_2', 'sample_func_3',
+        'sample_func_1']
+    assert func_entry_list[0] is func_entry_list[3]
+
+    index = ModuleIndex(module_str=MODULE_STR)
+    func_entry_list = index.get_func_entry_list(
+        skip_decorator_name_list=['Appender'])
+    assert [func_entry.func_name for func_entry in func_entry_list] == [
+        'sample_func_1', 'sample_func_2', 'sample_func_1']
+    assert 'sample_func_3' not in index._func_entry_dict
+
+
+def test_ModuleIndex__get_decorator_names() -> None:
+    index: ModuleIndex = ModuleIndex(module_str=MODULE_STR)
+    decorator_names: List[str] = index._get_decorator_names(
+        func_name='sample_func_3')
+    assert decorator_names == ['@Appender']
+    assert 'sample_func_3' not in index._func_entry_dict
+
+    decorator_names = index._get_decorator_names(func_name='sample_func_1')
+    assert decorator_names == []
+    decorator_names = index._get_decorator_names(func_name='sample_func_4')
+    assert decorator_names == []
+
+
+def test_ModuleIndex__build_func_entry() -> None:
+    index: ModuleIndex = ModuleIndex(module_str=MODULE_STR)
+    func_entry: FuncEntry = index._build_func_entry(
+        func_name='sample_func_1', start_line_idx=36)
+    assert func_entry.func_str == '''    def sample_func_1(self):
+        pass
+'''
+    assert func_entry.start_line_idx == 36
+    assert index.get_func_entry(func_name='sample_func_1').start_line_idx \
+        == 4
+
+    func_entry = index._build_func_entry(
+        func_name='sample_func_5', start_line_idx=-1)
+    assert func_entry.func_str == ''
+    assert func_entry.end_line_idx == -1
+
+
+CODE_CELL_STR_LIST: List[str] = [
+    '''def sample_func_1(price):
+    """
+    Sample function.
+    """
+    return price''',
+    '''x = sample_func_1(price=100)
+y = x''',
+    '''import os''',
+    '''
+def sample_func_1(name):
+    pass''',
+]
+
+
+def test_CombinedModuleIndex() -> None:
+    index: CombinedModuleIndex = CombinedModuleIndex(
+        code_str_list=CODE_CELL_STR_LIST)
+    assert index.cell_start_line_idx_list == [0, 5, 7, 8]
+    assert index.module_str == '\n'.join(CODE_CELL_STR_LIST)
+    assert index.func_name_list == ['sample_func_1', 'sample_func_1']
+    func_entry: FuncEntry = index.get_func_entry(func_name='sample_func_1')
+    assert func_entry.start_line_idx == 0
+    assert func_entry.end_line_idx == 5
+    assert func_entry.return_val_exists
+
+    index = CombinedModuleIndex(code_str_list=[])
+    assert index.func_name_list == []
+    assert index.get_func_entry_list() == []
+
+    index = CombinedModuleIndex(
+        code_str_list=[
+            "%%bash\necho don't",
+            'def sample_func_1(price):\n    return 100',
+            "x = '''abc",
+            'def sample_func_2(name):\n    pass',
+        ])
+    assert index.func_name_list == ['sample_func_1', 'sample_func_2']
+    assert [
+        func_entry.start_line_idx
+        for func_entry in index.get_func_entry_list()] == [2, 5]
+
+
+def test_CombinedModuleIndex_get_func_entry_list() -> None:
+    index: CombinedModuleIndex = CombinedModuleIndex(
+        code_str_list=CODE_CELL_STR_LIST)
+    func_entry_list: List[FuncEntry] = index.get_func_entry_list()
+    assert [func_entry.start_line_idx for func_entry in func_entry_list] \
+        == [0, 9]
+    assert func_entry_list[1].arg_name_list == ['name']
+    assert not func_entry_list[1].return_val_exists
+
+    index = CombinedModuleIndex(
+        code_str_list=['@Appender\ndef sample_func():\n    pass'])
+    assert index.get_func_entry_list(
+        skip_decorator_name_list=['Appender']) == []
+    assert len(index.get_func_entry_list()) == 1
+
+
+def test_CombinedModuleIndex_get_cell_position() -> None:
+    index: CombinedModuleIndex = CombinedModuleIndex(
+        code_str_list=CODE_CELL_STR_LIST)
+    assert index.get_cell_position(line_idx=0) == (0, 0)
+    assert index.get_cell_position(line_idx=4) == (0, 4)
+    assert index.get_cell_position(line_idx=5) == (1, 0)
+    assert index.get_cell_position(line_idx=7) == (2, 0)
+    assert index.get_cell_position(line_idx=9) == (3, 1)
+
+
+def test_ModuleIndex__get_span_end_line_idx() -> None:
+    index: ModuleIndex = ModuleIndex(module_str=MODULE_STR)
+    end_line_idx: int = index._get_span_end_line_idx(start_line_idx=4)
+    assert end_line_idx == 22
+    end_line_idx = index._get_span_end_line_idx(start_line_idx=36)
+    assert end_line_idx == len(index.line_splitted_list)
+
+
+def test__get_def_line_idx_dict() -> None:
+    def_line_idx_dict: Dict[str, int] = module_index._get_def_line_idx_dict(
+        module_str=MODULE_STR)
+    assert def_line_idx_dict == {
+        'sample_func_1': 4,
+        'sample_func_2': 16,
+        'sample_func_3': 25,
+    }
+
+    module_str: str = '''
+def sample_func
+(
+    price
+):
+    pass
+'''
+    def_line_idx_dict = module_index._get_def_line_idx_dict(
+        module_str=module_str)
+    assert def_line_idx_dict == {'sample_func': 1}
+
+
+def test__get_def_line_idx_list_dict() -> None:
+    def_line_idx_list_dict: Dict[str, List[int]] = \
+        module_index._get_def_line_idx_list_dict(module_str=MODULE_STR)
+    assert def_line_idx_list_dict == {
+        'sample_func_1': [4, 36],
+        'sample_func_2': [16],
+        'sample_func_3': [25],
+    }
+
+
+def test__iter_def_line_idx() -> None:
+    def_line_idx_list: List[Tuple[str, int]] = list(
+        module_index._iter_def_line_idx(module_str=MODULE_STR))
+    assert def_line_idx_list == [
+        ('sample_func_1', 4), ('sample_func_2', 16), ('sample_func_3', 25),
+        ('sample_func_1', 36)]
+
+    def_line_idx_list = list(module_index._iter_def_line_idx(
+        module_str=MODULE_STR,
+        is_func_name_to_skip=lambda func_name: func_name == 'sample_func_1'))
+    assert def_line_idx_list == [('sample_func_2', 16), ('sample_func_3', 25)]
+
+
+def test__get_last_line_idx() -> None:
+    func_str: str = '''    def sample_func(
+            price):
+        """
+        Sample method.
+        """
+
+        return price
+
+
+    x = 100'''
+    last_line_idx: int = module_index._get_last_line_idx(
+        func_str=func_str, start_line_idx=10)
+    assert last_line_idx == 16
+
+    last_line_idx = module_index._get_last_line_idx(
+        func_str='def sample_func(): pass', start_line_idx=3)
+    assert last_line_idx == 3
+
+
+def test__get_boundary_list() -> None:
+    line_splitted_list: List[str] = MODULE_STR.split('\n')
+    boundary_list: List[Tuple[int, int]] = module_index._get_boundary_list(
+        line_splitted_list=line_splitted_list)
+    assert boundary_list == [
+        (4, 0), (16, 1), (22, 0), (24, 1), (25, 1), (36, 1)]
+
+
+def test_build_module_index() -> None:
+    with pytest.raises(ValueError):
+        module_index.build_module_index(
+            module_str=MODULE_STR, engine='unknown')
+
+    index: ModuleIndex = module_index.build_module_index(
+        module_str=MODULE_STR)
+    assert type(index) is ModuleIndex
+
+    index = module_index.build_module_index(
+        module_str=MODULE_STR, engine=module_index.ENGINE_AST)
+    assert isinstance(index, AstModuleIndex)
+
+    index = module_index.build_module_index(
+        module_str='def sample_func(:\n    pass\n',
+        engine=module_index.ENGINE_AST)
+    assert type(index) is ModuleIndex
+
+
+def test_AstFuncEntry() -> None:
+    module_str: str = '''
+@Appender
+async def sample_func(price: int, *, name='apple', **kwargs) -> int:
+    """
+    Sample function.
+
+    Parameters
+    ----------
+    price : int
+        Sample price.
+    """
+    return price
+'''
+    module_node: ast.Module = ast.parse(module_str)
+    func_node: ast.AsyncFunctionDef = module_node.body[0]  # type: ignore
+    func_entry: AstFuncEntry = AstFuncEntry(
+        func_node=func_node, line_splitted_list=module_str.split('\n'))
+    assert 'args_str' not in func_entry.__dict__
+    assert func_entry.func_name == 'sample_func'
+    assert func_entry.start_line_idx == 2
+    assert func_entry.end_line_idx == 12
+    assert func_entry.last_line_idx == 11
+    assert func_entry.func_str.startswith('async def sample_func(')
+    assert func_entry.func_str.endswith('    return price')
+    assert func_entry.decorator_names == ['@Appender']
+    assert func_entry.indent_num == 1
+    assert func_entry.args_str == \
+        "price: int, *, name = 'apple', **kwargs"
+    assert func_entry.arg_name_list == ['price', 'name']
+    assert func_entry.default_val_info_dict == {
+        'price': '', '*': '', 'name': "'apple'", '**kwargs': ''}
+    assert func_entry.kwargs_exists
+    assert func_entry.return_val_exists
+    assert func_entry.docstring.startswith('    Sample function.')
+
+
+def test_AstModuleIndex() -> None:
+    index: ModuleIndex = module_index.build_module_index(
+        module_str=MODULE_STR, engine=module_index.ENGINE_AST)
+    assert index.func_name_list == [
+        'sample_func_1', 'sample_func_2', 'sample_func_3',
+        'sample_func_1']
+
+    func_entry_list: List[FuncEntry] = index.get_func_entry_list()
+    assert [func_entry.start_line_idx for func_entry in func_entry_list] \
+        == [4, 16, 25, 36]
+    assert func_entry_list[0] is not func_entry_list[3]
+    assert func_entry_list[3].indent_num == 2
+    assert [func_entry.last_line_idx for func_entry in func_entry_list] \
+        == [19, 17, 34, 37]
+
+    index = module_index.build_module_index(
+        module_str=MODULE_STR, engine=module_index.ENGINE_AST)
+    func_entry_list = index.get_func_entry_list(
+        skip_decorator_name_list=['Appender'])
+    assert [func_entry.start_line_idx for func_entry in func_entry_list] \
+        == [4, 16, 36]
+    assert index._func_entry_list[2] is None  # type: ignore
+
+    func_entry: FuncEntry = index.get_func_entry(func_name='sample_func_1')
+    assert func_entry is func_entry_list[0]
+    assert func_entry.return_val_exists
+    assert func_entry.arg_name_list == ['price', 'name']
+    assert func_entry.default_val_info_dict == {
+        'price': '', 'name': "'apple'"}
+
+    func_entry = index.get_func_entry(func_name='sample_func_3')
+    assert func_entry.decorator_names == ['@Appender']
+    assert func_entry.arg_name_list == []
+    assert not func_entry.return_val_exists
+
+    func_entry = index.get_func_entry(func_name='sample_func_4')
+    assert func_entry.start_line_idx == -1
+    assert func_entry.func_str == ''
+
+
+def test_AstModuleIndex__get_func_entry_by_node_idx() -> None:
+    index: AstModuleIndex = module_index.build_module_index(
+        module_str=MODULE_STR,
+        engine=module_index.ENGINE_AST)  # type: ignore
+    func_entry: FuncEntry = index._get_func_entry_by_node_idx(node_idx=2)
+    assert func_entry.func_name == 'sample_func_3'
+    assert index._get_func_entry_by_node_idx(node_idx=2) is func_entry
+
+
+def test__get_decorator_names() -> None:
+    module_str: str = '''
+@Appender(_doc)
+@property
+def sample_func(price):
+    pass
+'''
+    module_node: ast.Module = ast.parse(module_str)
+    func_node: ast.FunctionDef = module_node.body[0]  # type: ignore
+    decorator_names: List[str] = module_index._get_decorator_names(
+        func_node=func_node, line_splitted_list=module_str.split('\n'))
+    assert decorator_names == ['@Appender(_doc)', '@property']
+
+
+def test_has_decorator_to_skip() -> None:
+    result_bool: bool = module_index.has_decorator_to_skip(
+        decorator_names=['@Appender(_doc)', '@property'],
+        skip_decorator_name_list=['Appender'])
+    assert result_bool
+
+    result_bool = module_index.has_decorator_to_skip(
+        decorator_names=['@property'],
+        skip_decorator_name_list=['Appender'])
+    assert not result_bool
+
+    result_bool = module_index.has_decorator_to_skip(
+        decorator_names=['@Appender'], skip_decorator_name_list=[])
+    assert not result_bool
+
+
+def test__get_node_source() -> None:
+    module_str: str = 'name = "caf\u00e9" + sample_func(price=100)\n'
+    line_splitted_list: List[str] = module_str.split('\n')
+    module_node: ast.Module = ast.parse(module_str)
+    source_str: str = module_index._get_node_source(
+        node=module_node.body[0].value.right,  # type: ignore
+        line_splitted_list=line_splitted_list)
+    assert source_str == 'sample_func(price=100)'
+
+    module_str = 'sample_func(\n    price=100,\n)\n'
+    line_splitted_list = module_str.split('\n')
+    module_node = ast.parse(module_str)
+    source_str = module_index._get_node_source(
+        node=module_node.body[0], line_splitted_list=line_splitted_list)
+    assert source_str == 'sample_func(\n    price=100,\n)'
+
+    node: ast.Name = ast.Name(id='price', ctx=ast.Load())
+    source_str = module_index._get_node_source(
+        node=node, line_splitted_list=line_splitted_list)
+    assert source_str == 'price'
+
+
+def test__get_docstring() -> None:
+    module_str: str = '''
+def sample_func():
+    """
+    Sample function.
+
+    Returns
+    -------
+    price : int
+    """
+    pass
+'''
+    module_node: ast.Module = ast.parse(module_str)
+    docstring: str = module_index._get_docstring(
+        func_node=module_node.body[0])  # type: ignore
+    assert docstring == (
+        '    Sample function.\n\n    Returns\n    -------'
+        '\n    price : int')
+
+    module_node = ast.parse('def sample_func():\n    pass\n')
+    docstring = module_index._get_docstring(
+        func_node=module_node.body[0])  # type: ignore
+    assert docstring == ''
+
+
+def test__get_arg_info_list() -> None:
+    module_str: str = \
+        'def sample_func(a, /, b=1, *args, c, d=(1, 2), **kwargs):\n' \
+        '    pass\n'
+    module_node: ast.Module = ast.parse(module_str)
+    arg_info_list: List[Tuple[str, str, str]] = \
+        module_index._get_arg_info_list(
+            args_node=module_node.body[0].args,  # type: ignore
+            line_splitted_list=module_str.split('\n'))
+    assert arg_info_list == [
+        ('a', 'a', ''),
+        ('b', 'b = 1', '1'),
+        ('*args', '*args', ''),
+        ('c', 'c', ''),
+        ('d', 'd = (1, 2)', '(1, 2)'),
+        ('**kwargs', '**kwargs', ''),
+    ]
+
+    module_str = 'def sample_func(*, a: int):\n    pass\n'
+    module_node = ast.parse(module_str)
+    arg_info_list = module_index._get_arg_info_list(
+        args_node=module_node.body[0].args,  # type: ignore
+        line_splitted_list=module_str.split('\n'))
+    assert arg_info_list == [
+        ('*', '*', ''),
+        ('a', 'a: int', ''),
+    ]
+
+
+def test__return_val_exists() -> None:
+    module_str: str = '''
+def sample_func_1():
+    def sample_func_2():
+        return 100
+    return
+
+
+def sample_func_3(price):
+    if price:
+        return price
+'''
+    module_node: ast.Module = ast.parse(module_str)
+    result_bool: bool = module_index._return_val_exists(
+        func_node=module_node.body[0])  # type: ignore
+    assert not result_bool
+
+    result_bool = module_index._return_val_exists(
+        func_node=module_node.body[1])  # type: ignore
+    assert result_bool
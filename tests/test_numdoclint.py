@@ -8,6 +8,20 @@ def test_interface():
     interface_name_list = [
         'check_python_module',
         'check_python_module_recursively',
+        'iter_check_python_modules',
+        'check_python_source',
+        'check_python_sources',
+        'check_jupyter_notebook',
+        'check_jupyter_notebook_recursively',
+        'iter_check_jupyter_notebooks',
+        'check_changed_files',
+        'get_run_stats',
+        'reset_run_stats',
+        'enable_index_cache',
+        'disable_index_cache',
+        'clear_cache',
+        'LintResult',
+        'NotebookLintResult',
     ]
     for interface_name in interface_name_list:
         assert hasattr(numdoclint, interface_name)
@@ -0,0 +1,307 @@
+import io
+import json
+import os
+import shutil
+import struct
+import sys
+
+import pytest
+
+from numdoclint import output, py_module
+
+TMP_TEST_OUTPUT_DIR: str = './tests/tmp_output/'
+TMP_OUTPUT_PATH: str = os.path.join(TMP_TEST_OUTPUT_DIR, 'output.txt')
+
+
+def setup() -> None:
+    """Function to be executed at the start of the test.
+    """
+    shutil.rmtree(TMP_TEST_OUTPUT_DIR, ignore_errors=True)
+    os.makedirs(TMP_TEST_OUTPUT_DIR)
+
+
+def teardown() -> None:
+    """Function to be executed at the end of the test.
+    """
+    shutil.rmtree(TMP_TEST_OUTPUT_DIR, ignore_errors=True)
+    output.set_output_writer(output_writer=None)
+
+
+def _make_lint_result(
+        lineno: int = 3, end_lineno: int = 0) -> py_module.LintResult:
+    """
+    Make a record of the check result for the tests.
+
+    Parameters
+    ----------
+    lineno : int, default 3
+        The line number of the function.
+    end_lineno : int, default 0
+        The line number of the last line of the function.
+
+    Returns
+    -------
+    lint_result : LintResult
+        The record of the check result.
+    """
+    lint_result: py_module.LintResult = py_module.LintResult(
+        module_path='sample/path.py', func_name='sample_func',
+        info_id=py_module.INFO_ID_LACKED_ARGUMENT,
+        info='Missing docstring argument information: price',
+        lineno=lineno, end_lineno=end_lineno)
+    return lint_result
+
+
+class _CountingStringIO(io.StringIO):
+    """
+    The string stream that counts the number of flushes.
+    """
+
+    flush_num: int = 0
+
+    def flush(self) -> None:
+        """
+        Count the flush.
+        """
+        self.flush_num += 1
+        super().flush()
+
+
+def test_OutputWriter() -> None:
+    stream: _CountingStringIO = _CountingStringIO()
+    output_writer: output.OutputWriter = output.OutputWriter(
+        stream=stream, flush_interval=2)
+    assert output_writer.stream is stream
+    output_writer.write(result_str='sample 1\n')
+    assert stream.flush_num == 0
+    output_writer.write(result_str='sample 2\n')
+    assert stream.flush_num == 1
+    output_writer.write(result_str='sample 3\n')
+    assert stream.flush_num == 1
+    output_writer.close()
+    assert stream.flush_num == 2
+    assert not stream.closed
+    assert stream.getvalue() == 'sample 1\nsample 2\nsample 3\n'
+
+    stream = _CountingStringIO()
+    output_writer = output.OutputWriter(
+        stream=stream, flush_interval=0, close_stream=True)
+    for _ in range(10):
+        output_writer.write(result_str='sample\n')
+    assert stream.flush_num == 0
+    output_writer.close()
+    assert stream.closed
+
+    output_writer = output.OutputWriter()
+    assert output_writer.stream is sys.stdout
+
+    stream = _CountingStringIO()
+    output_writer = output.OutputWriter(stream=stream)
+    output_writer.write_result(
+        info_dict=_make_lint_result(), result_str='sample\n')
+    assert stream.getvalue() == 'sample\n'
+
+
+def test_JsonLinesWriter() -> None:
+    stream: io.StringIO = io.StringIO()
+    output_writer: output.JsonLinesWriter = output.JsonLinesWriter(
+        stream=stream)
+    output_writer.write_result(
+        info_dict=_make_lint_result(), result_str='sample\n')
+    output_writer.write_result(
+        info_dict=_make_lint_result(lineno=10, end_lineno=15),
+        result_str='sample\n')
+    output_writer.close()
+    line_list: list = stream.getvalue().splitlines()
+    assert len(line_list) == 2
+    output_dict: dict = json.loads(line_list[1])
+    assert output_dict == {
+        output.OUTPUT_KEY_PATH: 'sample/path.py',
+        output.OUTPUT_KEY_LINENO: 10,
+        output.OUTPUT_KEY_END_LINENO: 15,
+        output.OUTPUT_KEY_FUNC_NAME: 'sample_func',
+        output.OUTPUT_KEY_INFO_ID: py_module.INFO_ID_LACKED_ARGUMENT,
+        output.OUTPUT_KEY_INFO:
+        'Missing docstring argument information: price',
+        output.OUTPUT_KEY_CODE_CELL_INDEX: None,
+    }
+
+
+def test_SarifWriter() -> None:
+    stream: io.StringIO = io.StringIO()
+    output_writer: output.SarifWriter = output.SarifWriter(stream=stream)
+    output_writer.close()
+    sarif_dict: dict = json.loads(stream.getvalue())
+    assert sarif_dict['version'] == output.SARIF_VERSION
+    assert sarif_dict['$schema'] == output.SARIF_SCHEMA_URI
+    run_dict: dict = sarif_dict['runs'][0]
+    assert run_dict['tool']['driver']['name'] == 'numdoclint'
+    assert run_dict['results'] == []
+
+    stream = io.StringIO()
+    output_writer = output.SarifWriter(stream=stream)
+    for lineno in range(3):
+        output_writer.write_result(
+            info_dict=_make_lint_result(lineno=lineno),
+            result_str='sample\n')
+    output_writer.close()
+    sarif_dict = json.loads(stream.getvalue())
+    result_list: list = sarif_dict['runs'][0]['results']
+    assert len(result_list) == 3
+    assert result_list[2]['ruleId'] == str(
+        py_module.INFO_ID_LACKED_ARGUMENT)
+
+
+def test_MsgpackWriter() -> None:
+    stream: io.BytesIO = io.BytesIO()
+    output_writer: output.MsgpackWriter = output.MsgpackWriter(
+        stream=stream)
+    assert output_writer.stream is stream
+    lint_result: py_module.LintResult = _make_lint_result()
+    output_writer.write_result(info_dict=lint_result, result_str='sample\n')
+    output_writer.close()
+    assert stream.getvalue() == output.pack_msgpack(
+        value=lint_result.to_output_dict())
+
+    output_writer = output.MsgpackWriter()
+    assert output_writer.stream is sys.stdout.buffer
+
+
+def test_get_sarif_result_dict() -> None:
+    output_dict: dict = _make_lint_result(lineno=3).to_output_dict()
+    sarif_result_dict: dict = output.get_sarif_result_dict(
+        output_dict=output_dict)
+    assert sarif_result_dict['ruleId'] == str(
+        py_module.INFO_ID_LACKED_ARGUMENT)
+    assert sarif_result_dict['level'] == 'warning'
+    assert sarif_result_dict['message']['text'] == \
+        'Missing docstring argument information: price'
+    location_dict: dict = sarif_result_dict['locations'][0]
+    physical_location_dict: dict = location_dict['physicalLocation']
+    assert physical_location_dict['artifactLocation']['uri'] == \
+        'sample/path.py'
+    assert physical_location_dict['region']['startLine'] == 3
+    assert 'endLine' not in physical_location_dict['region']
+    assert location_dict['logicalLocations'][0]['name'] == 'sample_func'
+    assert sarif_result_dict['properties'] == output_dict
+
+    output_dict = _make_lint_result(lineno=3, end_lineno=8).to_output_dict()
+    sarif_result_dict = output.get_sarif_result_dict(
+        output_dict=output_dict)
+    assert sarif_result_dict['locations'][0]['physicalLocation'][
+        'region'] == {'startLine': 3, 'endLine': 8}
+
+    output_dict = _make_lint_result(lineno=0).to_output_dict()
+    output_dict[output.OUTPUT_KEY_PATH] = 'sample\\path.py'
+    sarif_result_dict = output.get_sarif_result_dict(
+        output_dict=output_dict)
+    physical_location_dict = \
+        sarif_result_dict['locations'][0]['physicalLocation']
+    assert 'region' not in physical_location_dict
+    assert physical_location_dict['artifactLocation']['uri'] == \
+        'sample/path.py'
+
+
+def test_pack_msgpack() -> None:
+    assert output.pack_msgpack(value=None) == b'\xc0'
+    assert output.pack_msgpack(value=True) == b'\xc3'
+    assert output.pack_msgpack(value=False) == b'\xc2'
+    assert output.pack_msgpack(value=5) == b'\x05'
+    assert output.pack_msgpack(value='abc') == b'\xa3abc'
+    assert output.pack_msgpack(value='a' * 32) == b'\xd9\x20' + b'a' * 32
+    assert output.pack_msgpack(value='あ') == b'\xa3' + 'あ'.encode('utf-8')
+    assert output.pack_msgpack(value=[1, None]) == b'\x92\x01\xc0'
+    assert output.pack_msgpack(value={'a': 1}) == b'\x81\xa1a\x01'
+    assert output.pack_msgpack(value=list(range(16)))[:3] == b'\xdc\x00\x10'
+
+    with pytest.raises(ValueError):
+        output.pack_msgpack(value=1.5)
+
+
+def test__pack_msgpack_int() -> None:
+    assert output._pack_msgpack_int(value=0) == b'\x00'
+    assert output._pack_msgpack_int(value=127) == b'\x7f'
+    assert output._pack_msgpack_int(value=128) == b'\xcc\x80'
+    assert output._pack_msgpack_int(value=65535) == b'\xcd\xff\xff'
+    assert output._pack_msgpack_int(value=65536) == \
+        b'\xce' + struct.pack('>I', 65536)
+    assert output._pack_msgpack_int(value=2 ** 32) == \
+        b'\xcf' + struct.pack('>Q', 2 ** 32)
+    assert output._pack_msgpack_int(value=-1) == b'\xff'
+    assert output._pack_msgpack_int(value=-32) == b'\xe0'
+    assert output._pack_msgpack_int(value=-33) == b'\xd0\xdf'
+    assert output._pack_msgpack_int(value=-129) == \
+        b'\xd1' + struct.pack('>h', -129)
+    assert output._pack_msgpack_int(value=-2 ** 31) == \
+        b'\xd2' + struct.pack('>i', -2 ** 31)
+    assert output._pack_msgpack_int(value=-2 ** 40) == \
+        b'\xd3' + struct.pack('>q', -2 ** 40)
+
+    with pytest.raises(ValueError):
+        output._pack_msgpack_int(value=2 ** 64)
+    with pytest.raises(ValueError):
+        output._pack_msgpack_int(value=-2 ** 63 - 1)
+
+
+def test__pack_msgpack_header() -> None:
+    header_bytes: bytes = output._pack_msgpack_header(
+        length=3, fix_prefix=0xa0, fix_max_length=31,
+        prefix_tuple=(0xd9, 0xda, 0xdb))
+    assert header_bytes == b'\xa3'
+    header_bytes = output._pack_msgpack_header(
+        length=200, fix_prefix=0xa0, fix_max_length=31,
+        prefix_tuple=(0xd9, 0xda, 0xdb))
+    assert header_bytes == b'\xd9\xc8'
+    header_bytes = output._pack_msgpack_header(
+        length=200, fix_prefix=0x90, fix_max_length=15,
+        prefix_tuple=(0, 0xdc, 0xdd))
+    assert header_bytes == b'\xdc\x00\xc8'
+    header_bytes = output._pack_msgpack_header(
+        length=70000, fix_prefix=0x80, fix_max_length=15,
+        prefix_tuple=(0, 0xde, 0xdf))
+    assert header_bytes == b'\xdf' + struct.pack('>I', 70000)
+
+
+def test_open_output_writer() -> None:
+    output_writer: output.OutputWriter = output.open_output_writer(
+        output_path=TMP_OUTPUT_PATH, flush_interval=1)
+    output_writer.write(result_str='sample\n')
+    with open(TMP_OUTPUT_PATH) as f:
+        assert f.read() == 'sample\n'
+    output_writer.close()
+    assert output_writer.stream.closed
+
+    output_writer = output.open_output_writer()
+    assert output_writer.stream is sys.stdout
+
+    output_writer = output.open_output_writer(
+        output_path=TMP_OUTPUT_PATH, output_format=output.FORMAT_MSGPACK)
+    assert isinstance(output_writer, output.MsgpackWriter)
+    output_writer.write_result(
+        info_dict=_make_lint_result(), result_str='sample\n')
+    output_writer.close()
+    with open(TMP_OUTPUT_PATH, 'rb') as f:
+        assert f.read() == output.pack_msgpack(
+            value=_make_lint_result().to_output_dict())
+
+    output_writer = output.open_output_writer(
+        output_format=output.FORMAT_JSONL)
+    assert isinstance(output_writer, output.JsonLinesWriter)
+
+    with pytest.raises(ValueError):
+        output.open_output_writer(output_format='xml')
+
+
+def test_get_output_writer() -> None:
+    output_writer: output.OutputWriter = output.get_output_writer()
+    assert isinstance(output_writer, output.OutputWriter)
+
+
+def test_set_output_writer() -> None:
+    output_writer: output.OutputWriter = output.OutputWriter(
+        stream=io.StringIO())
+    output.set_output_writer(output_writer=output_writer)
+    assert output.get_output_writer() is output_writer
+    output.set_output_writer(output_writer=None)
+    assert output.get_output_writer() is not output_writer
+    assert output.get_output_writer().stream is sys.stdout
@@ -0,0 +1,279 @@
+import functools
+import os
+import shutil
+from typing import Any, Dict, List
+
+from voluptuous import Schema
+
+from numdoclint import helper, profiler, py_module
+
+TMP_TEST_PROFILER_DIR: str = './tests/tmp_profiler/'
+TMP_TEST_MODULE_PATH: str = os.path.join(
+    TMP_TEST_PROFILER_DIR, 'test_module.py')
+
+_MODULE_STR: str = '''
+def sample_func_1(price):
+    """
+    Sample function.
+    """
+    pass
+
+
+def sample_func_2(price):
+    pass
+'''
+
+
+def setup() -> None:
+    """Function to be executed at the start of the test.
+    """
+    shutil.rmtree(TMP_TEST_PROFILER_DIR, ignore_errors=True)
+    os.makedirs(TMP_TEST_PROFILER_DIR)
+    with open(TMP_TEST_MODULE_PATH, 'w') as f:
+        f.write(_MODULE_STR)
+
+
+def teardown() -> None:
+    """Function to be executed at the end of the test.
+    """
+    shutil.rmtree(TMP_TEST_PROFILER_DIR, ignore_errors=True)
+    profiler.disable_profile()
+    profiler.reset_profile_stats()
+
+
+def test_enable_profile() -> None:
+    profiler.enable_profile()
+    try:
+        assert profiler.is_profile_enabled()
+    finally:
+        profiler.disable_profile()
+
+
+def test_disable_profile() -> None:
+    profiler.enable_profile()
+    profiler.disable_profile()
+    assert not profiler.is_profile_enabled()
+
+
+def test_is_profile_enabled() -> None:
+    assert not profiler.is_profile_enabled()
+
+
+def test_reset_profile_stats() -> None:
+    profiler.add_time(
+        profile_key=profiler.PROFILE_KEY_PHASE, name=profiler.PHASE_READ,
+        elapsed_time=0.5)
+    profiler.reset_profile_stats()
+    profile_stat_dict: Dict[str, Dict[str, Dict[str, Any]]] = \
+        profiler.get_profile_stats()
+    assert profile_stat_dict == {
+        profile_key: {} for profile_key in profiler.PROFILE_KEY_LIST}
+
+
+def test_add_time() -> None:
+    profiler.reset_profile_stats()
+    profiler.add_time(
+        profile_key=profiler.PROFILE_KEY_PHASE, name=profiler.PHASE_READ,
+        elapsed_time=0.5)
+    profiler.add_time(
+        profile_key=profiler.PROFILE_KEY_PHASE, name=profiler.PHASE_READ,
+        elapsed_time=0.25, count=2)
+    stat_dict: Dict[str, Any] = profiler.get_profile_stats()[
+        profiler.PROFILE_KEY_PHASE][profiler.PHASE_READ]
+    assert stat_dict == {
+        profiler.STAT_KEY_TIME: 0.75,
+        profiler.STAT_KEY_COUNT: 3,
+    }
+    profiler.reset_profile_stats()
+
+
+def test_add_cache_result() -> None:
+    profiler.reset_profile_stats()
+    profiler.add_cache_result(cache_name='sample_cache', is_hit=True)
+    assert not profiler.get_profile_stats()[profiler.PROFILE_KEY_CACHE]
+
+    profiler.enable_profile()
+    try:
+        profiler.add_cache_result(cache_name='sample_cache', is_hit=True)
+        profiler.add_cache_result(cache_name='sample_cache', is_hit=True)
+        profiler.add_cache_result(cache_name='sample_cache', is_hit=False)
+    finally:
+        profiler.disable_profile()
+    cache_dict: Dict[str, Dict[str, Any]] = profiler.get_profile_stats()[
+        profiler.PROFILE_KEY_CACHE]
+    assert cache_dict == {
+        'sample_cache:hit': {
+            profiler.STAT_KEY_TIME: 0.0, profiler.STAT_KEY_COUNT: 2},
+        'sample_cache:miss': {
+            profiler.STAT_KEY_TIME: 0.0, profiler.STAT_KEY_COUNT: 1},
+    }
+    profiler.reset_profile_stats()
+
+
+def test_get_profile_stats() -> None:
+    profiler.reset_profile_stats()
+    profiler.enable_profile()
+    try:
+        py_module.check_python_module(
+            py_module_path=TMP_TEST_MODULE_PATH, verbose=0)
+    finally:
+        profiler.disable_profile()
+    profile_stat_dict: Dict[str, Dict[str, Dict[str, Any]]] = \
+        profiler.get_profile_stats()
+    assert sorted(profile_stat_dict.keys()) == sorted(
+        profiler.PROFILE_KEY_LIST)
+    stat_schema: Schema = Schema(
+        schema={
+            profiler.STAT_KEY_TIME: float,
+            profiler.STAT_KEY_COUNT: int,
+        },
+        required=True)
+    for name_dict in profile_stat_dict.values():
+        for stat_dict in name_dict.values():
+            stat_schema(stat_dict)
+
+    phase_dict: Dict[str, Dict[str, Any]] = profile_stat_dict[
+        profiler.PROFILE_KEY_PHASE]
+    for phase_name in [
+            profiler.PHASE_READ, profiler.PHASE_INDEX,
+            profiler.PHASE_DISCOVERY, profiler.PHASE_REMOVE_STRS,
+            profiler.PHASE_FACT_PREFIX + 'docstring']:
+        assert phase_dict[phase_name][profiler.STAT_KEY_COUNT] >= 1
+    assert phase_dict[profiler.PHASE_INDEX][profiler.STAT_KEY_COUNT] == 1
+
+    check_dict: Dict[str, Dict[str, Any]] = profile_stat_dict[
+        profiler.PROFILE_KEY_CHECK]
+    assert check_dict['check_lacked_param (ID 1, 2)'][
+        profiler.STAT_KEY_COUNT] == 2
+
+    assert profile_stat_dict[profiler.PROFILE_KEY_FILE][
+        TMP_TEST_MODULE_PATH][profiler.STAT_KEY_COUNT] == 1
+    func_name_list: List[str] = sorted(
+        profile_stat_dict[profiler.PROFILE_KEY_FUNC].keys())
+    assert func_name_list == [
+        f'{TMP_TEST_MODULE_PATH}::sample_func_1',
+        f'{TMP_TEST_MODULE_PATH}::sample_func_2',
+    ]
+    cache_dict: Dict[str, Dict[str, Any]] = profile_stat_dict[
+        profiler.PROFILE_KEY_CACHE]
+    assert f'{helper.FUNC_PATTERN_CACHE_NAME}:hit' in cache_dict
+
+    profiler.reset_profile_stats()
+    py_module.check_python_module(
+        py_module_path=TMP_TEST_MODULE_PATH, verbose=0)
+    assert profiler.get_profile_stats() == {
+        profile_key: {} for profile_key in profiler.PROFILE_KEY_LIST}
+
+
+def test_merge_profile_stats() -> None:
+    profiler.reset_profile_stats()
+    profiler.add_time(
+        profile_key=profiler.PROFILE_KEY_FILE, name='a.py',
+        elapsed_time=0.5)
+    profiler.merge_profile_stats(profile_stats={
+        profiler.PROFILE_KEY_FILE: {'a.py': [0.25, 1], 'b.py': [1.0, 1]},
+    })
+    file_dict: Dict[str, Dict[str, Any]] = profiler.get_profile_stats()[
+        profiler.PROFILE_KEY_FILE]
+    assert file_dict == {
+        'a.py': {profiler.STAT_KEY_TIME: 0.75, profiler.STAT_KEY_COUNT: 2},
+        'b.py': {profiler.STAT_KEY_TIME: 1.0, profiler.STAT_KEY_COUNT: 1},
+    }
+    profiler.reset_profile_stats()
+
+
+def test_call_with_time() -> None:
+    profiler.reset_profile_stats()
+    result: int = profiler.call_with_time(
+        profile_key=profiler.PROFILE_KEY_PHASE, name=profiler.PHASE_READ,
+        func=lambda: 10)
+    assert result == 10
+    assert not profiler.get_profile_stats()[profiler.PROFILE_KEY_PHASE]
+
+    profiler.enable_profile()
+    try:
+        result = profiler.call_with_time(
+            profile_key=profiler.PROFILE_KEY_PHASE,
+            name=profiler.PHASE_READ, func=lambda: 20)
+    finally:
+        profiler.disable_profile()
+    assert result == 20
+    assert profiler.get_profile_stats()[profiler.PROFILE_KEY_PHASE][
+        profiler.PHASE_READ][profiler.STAT_KEY_COUNT] == 1
+    profiler.reset_profile_stats()
+
+
+def test_call_with_profile_stats() -> None:
+    profiler.reset_profile_stats()
+    check_func = functools.partial(
+        py_module.check_python_module, verbose=0)
+    info_list, profile_stats = profiler.call_with_profile_stats(
+        path=TMP_TEST_MODULE_PATH, func=check_func, is_enabled=False)
+    assert len(info_list) == 3
+    assert profile_stats is None
+
+    info_list, profile_stats = profiler.call_with_profile_stats(
+        path=TMP_TEST_MODULE_PATH, func=check_func, is_enabled=True)
+    assert len(info_list) == 3
+    assert profile_stats[profiler.PROFILE_KEY_FILE][
+        TMP_TEST_MODULE_PATH][1] == 1
+    assert profile_stats[profiler.PROFILE_KEY_PHASE][
+        profiler.PHASE_INDEX][1] == 1
+    assert not profiler.is_profile_enabled()
+    assert profiler.get_profile_stats() == {
+        profile_key: {} for profile_key in profiler.PROFILE_KEY_LIST}
+
+
+def test_format_profile_stats() -> None:
+    profiler.reset_profile_stats()
+    profiler.add_time(
+        profile_key=profiler.PROFILE_KEY_PHASE, name=profiler.PHASE_READ,
+        elapsed_time=0.5, count=2)
+    for i in range(3):
+        profiler.add_time(
+            profile_key=profiler.PROFILE_KEY_FILE, name=f'sample_{i}.py',
+            elapsed_time=float(i))
+    profile_str: str = profiler.format_profile_stats(top_n=2)
+    assert 'Phase' in profile_str
+    assert 'Check' in profile_str
+    assert 'Slowest files (top 2)' in profile_str
+    assert 'Slowest functions (top 2)' in profile_str
+    assert 'Cache' in profile_str
+    assert 'read' in profile_str
+    assert 'sample_2.py' in profile_str
+    assert 'sample_1.py' in profile_str
+    assert 'sample_0.py' not in profile_str
+    profiler.reset_profile_stats()
+
+
+def test__format_stat_table() -> None:
+    table_str: str = profiler._format_stat_table(
+        title='Phase',
+        name_dict={'read': [0.5, 2], 'index': [1.0, 1], 'output': [0.0, 0]})
+    line_str_list: List[str] = table_str.split('\n')
+    assert len(line_str_list) == 4
+    assert line_str_list[0].startswith('Phase ')
+    assert line_str_list[1].split() == ['index', '1.0000', '1', '1000.000']
+    assert line_str_list[2].split() == ['read', '0.5000', '2', '250.000']
+    assert line_str_list[3].split() == ['output', '0.0000', '0', '0.000']
+
+    table_str = profiler._format_stat_table(
+        title='Slowest files', name_dict={'a.py': [0.5, 1], 'b.py': [1.0, 1]},
+        top_n=1)
+    line_str_list = table_str.split('\n')
+    assert len(line_str_list) == 2
+    assert line_str_list[1].startswith('b.py')
+
+
+def test__format_cache_table() -> None:
+    table_str: str = profiler._format_cache_table(name_dict={
+        'b_cache:hit': [0.0, 3],
+        'b_cache:miss': [0.0, 1],
+        'a_cache:miss': [0.0, 2],
+    })
+    line_str_list: List[str] = table_str.split('\n')
+    assert len(line_str_list) == 3
+    assert line_str_list[0].split() == [
+        'Cache', 'hits', 'misses', 'hit', 'rate']
+    assert line_str_list[1].split() == ['a_cache', '0', '2', '0.0%']
+    assert line_str_list[2].split() == ['b_cache', '3', '1', '75.0%']
@@ -1,12 +1,14 @@
+import io
 import os
+import pickle
 import shutil
-from typing import Dict, List
+from typing import Dict, Iterator, List
 
 import pytest
 import six
 from voluptuous import Any, Schema
 
-from numdoclint import py_module
+from numdoclint import cache, index_cache, output, profiler, py_module
 from numdoclint.helper import (DOC_PARAM_INFO_KEY_ARG_NAME,
                                DOC_PARAM_INFO_KEY_DEFAULT_VAL,
                                DOC_PARAM_INFO_KEY_DESCRIPTION,
@@ -14,6 +16,7 @@ from numdoclint.helper import (DOC_PARAM_INFO_KEY_ARG_NAME,
                                DOC_RETURN_INFO_KEY_DESCRIPTION,
                                DOC_RETURN_INFO_KEY_NAME,
                                DOC_RETURN_INFO_KEY_TYPE_NAME)
+from numdoclint.module_index import FuncEntry
 
 TMP_TEST_MODULE_DIR: str = './tests/tmp/'
 TMP_TEST_MODULE_PATH: str = os.path.join(
@@ -44,6 +47,61 @@ def test__check_module_exists() -> None:
             py_module_path='test_not_exists_file.py')
 
 
+def test_LintResult() -> None:
+    lint_result: py_module.LintResult = py_module.LintResult(
+        module_path='sample/path.py', func_name='sample_func', info_id=3,
+        info='Sample information.')
+    info_dict: dict = {
+        py_module.INFO_KEY_MODULE_PATH: 'sample/path.py',
+        py_module.INFO_KEY_FUNC_NAME: 'sample_func',
+        py_module.INFO_KEY_INFO_ID: 3,
+        py_module.INFO_KEY_INFO: 'Sample information.',
+    }
+    assert not hasattr(lint_result, '__dict__')
+    assert lint_result.func_name == 'sample_func'
+    assert lint_result[py_module.INFO_KEY_INFO_ID] == 3
+    assert lint_result.get('not_existing_key') is None
+    with pytest.raises(KeyError):  # type: ignore
+        lint_result['not_existing_key']
+    assert len(lint_result) == 4
+    assert lint_result == info_dict
+    assert info_dict == lint_result
+    assert lint_result.to_dict() == info_dict
+    assert list(lint_result.to_dict()) == list(info_dict)
+    assert isinstance(lint_result.to_dict(), dict)
+    assert py_module.LintResult.from_dict(info_dict=info_dict) == info_dict
+    assert 'sample_func' in repr(lint_result)
+    assert pickle.loads(pickle.dumps(lint_result)) == lint_result
+    with pytest.raises(AttributeError):  # type: ignore
+        lint_result.line_num = 10  # type: ignore
+
+    assert lint_result.lineno == 0
+    assert lint_result.end_lineno == 0
+    lint_result.lineno = 12
+    lint_result.end_lineno = 20
+    assert lint_result == info_dict
+    assert lint_result.to_dict(include_position=True) == dict(
+        info_dict, **{
+            py_module.INFO_KEY_LINENO: 12,
+            py_module.INFO_KEY_END_LINENO: 20,
+        })
+    assert pickle.loads(pickle.dumps(lint_result)).lineno == 12
+    assert pickle.loads(pickle.dumps(lint_result)).end_lineno == 20
+    from_dict_result: py_module.LintResult = py_module.LintResult.from_dict(
+        info_dict=lint_result.to_dict(include_position=True))
+    assert from_dict_result.lineno == 12
+    assert from_dict_result.end_lineno == 20
+    assert lint_result.to_output_dict() == {
+        output.OUTPUT_KEY_PATH: 'sample/path.py',
+        output.OUTPUT_KEY_LINENO: 12,
+        output.OUTPUT_KEY_END_LINENO: 20,
+        output.OUTPUT_KEY_FUNC_NAME: 'sample_func',
+        output.OUTPUT_KEY_INFO_ID: 3,
+        output.OUTPUT_KEY_INFO: 'Sample information.',
+        output.OUTPUT_KEY_CODE_CELL_INDEX: None,
+    }
+
+
 def test__make_info_dict() -> None:
     info_dict: dict = py_module._make_info_dict(
         module_path='sample/path/to/module.py',
@@ -59,7 +117,7 @@ def test__make_info_dict() -> None:
             py_module.INFO_KEY_INFO: 'Sample information.',
         },
         required=True)
-    schema(info_dict)
+    schema(info_dict.to_dict())
 
 
 def test__check_lacked_param() -> None:
@@ -92,7 +150,7 @@ def test__check_lacked_param() -> None:
             py_module.INFO_ID_LACKED_ARGUMENT,
             py_module.INFO_KEY_INFO: Any(*six.string_types),
         }, required=True)
-    schema_1(info_list[0])
+    schema_1(info_list[0].to_dict())
     schema_2: Schema = Schema(
         schema={
             py_module.INFO_KEY_MODULE_PATH: expected_module_path,
@@ -102,7 +160,7 @@ def test__check_lacked_param() -> None:
             py_module.INFO_KEY_INFO: Any(*six.string_types),
         },
         required=True)
-    schema_2(info_list[1])
+    schema_2(info_list[1].to_dict())
 
     arg_name_list: List[str] = ['name']
     info_list = py_module._check_lacked_param(
@@ -166,7 +224,7 @@ def test__check_lacked_docstring_param_type() -> None:
             py_module.INFO_KEY_INFO: Any(*six.string_types),
         },
         required=True)
-    schema(info_list[0])
+    schema(info_list[0].to_dict())
 
     param_info_list = [{
         DOC_PARAM_INFO_KEY_ARG_NAME: '*args',
@@ -231,7 +289,7 @@ def test__check_docstring_param_order() -> None:
             py_module.INFO_KEY_INFO: Any(*six.string_types),
         },
         required=True)
-    schema(info_list[0])
+    schema(info_list[0].to_dict())
 
 
 def test__check_func_description() -> None:
@@ -277,7 +335,7 @@ def test__check_func_description() -> None:
             py_module.INFO_KEY_INFO: Any(*six.string_types),
         },
         required=True)
-    schema(info_list[0])
+    schema(info_list[0].to_dict())
 
 
 def test__check_lacked_default_value() -> None:
@@ -326,7 +384,7 @@ def test__check_lacked_default_value() -> None:
             py_module.INFO_KEY_INFO: Any(*six.string_types),
         },
         required=True)
-    schema_1(info_list[0])
+    schema_1(info_list[0].to_dict())
     schema_2: Schema = Schema(
         schema={
             py_module.INFO_KEY_MODULE_PATH: expected_module_path,
@@ -336,7 +394,7 @@ def test__check_lacked_default_value() -> None:
             py_module.INFO_KEY_INFO: Any(*six.string_types),
         },
         required=True)
-    schema_2(info_list[1])
+    schema_2(info_list[1].to_dict())
 
     info_list = py_module._check_lacked_default_value(
         module_path=expected_module_path,
@@ -388,7 +446,7 @@ def test__check_lacked_return() -> None:
             py_module.INFO_KEY_INFO: Any(*six.string_types),
         },
         required=True)
-    schema(info_list[0])
+    schema(info_list[0].to_dict())
 
     info_list = py_module._check_lacked_return(
         module_path=expected_module_path,
@@ -405,7 +463,7 @@ def test__check_lacked_return() -> None:
             py_module.INFO_KEY_INFO: Any(*six.string_types),
         },
         required=True)
-    schema(info_list[0])
+    schema(info_list[0].to_dict())
 
 
 def test__check_lacked_return_docstring_type() -> None:
@@ -446,7 +504,7 @@ def test__check_lacked_return_docstring_type() -> None:
         },
         required=True)
     for info_dict in info_list:
-        schema(info_dict)
+        schema(info_dict.to_dict())
     assert 'price' in info_list[0][py_module.INFO_KEY_INFO]
     assert 'name' in info_list[1][py_module.INFO_KEY_INFO]
 
@@ -494,7 +552,7 @@ def test__check_lacked_docstring_param_description() -> None:
         },
         required=True)
     for info_dict in info_list:
-        schema(info_dict)
+        schema(info_dict.to_dict())
     assert 'price' in info_list[0][py_module.INFO_KEY_INFO]
     assert 'name' in info_list[1][py_module.INFO_KEY_INFO]
 
@@ -537,8 +595,8 @@ def test__check_lacked_return_docstring_description():
             py_module.INFO_KEY_INFO: Any(*six.string_types),
         },
         required=True)
-    schema(info_list[0])
-    schema(info_list[1])
+    schema(info_list[0].to_dict())
+    schema(info_list[1].to_dict())
     assert 'price' in info_list[0][py_module.INFO_KEY_INFO]
     assert 'name' in info_list[1][py_module.INFO_KEY_INFO]
 
@@ -566,7 +624,7 @@ def _check_info_list_schema(info_list: List[dict]) -> None:
         },
         required=True)
     for info_dict in info_list:
-        schema(info_dict)
+        schema(info_dict.to_dict())
 
 
 def _check_info_id_is_in_list(
@@ -938,6 +996,9 @@ def sample_func_1(price):
         py_module_path=TMP_TEST_MODULE_PATH)
     assert len(info_list) > 0
     _check_info_list_schema(info_list=info_list)
+    assert {
+        (info_dict.lineno, info_dict.end_lineno)
+        for info_dict in info_list} == {(2, 6)}
 
     info_list = py_module.check_python_module(
         py_module_path=TMP_TEST_MODULE_PATH,
@@ -953,6 +1014,23 @@ def sample_func_1(price):
         enable_default_or_optional_doc_check=True)
     assert not info_list
 
+    expected_info_list: List[dict] = py_module.check_python_module(
+        py_module_path=TMP_TEST_MODULE_PATH, verbose=0)
+    index_cache.enable_index_cache()
+    try:
+        info_list = py_module.check_python_module(
+            py_module_path=TMP_TEST_MODULE_PATH, verbose=0)
+        assert info_list == expected_info_list
+        info_list = py_module.check_python_module(
+            py_module_path=TMP_TEST_MODULE_PATH, verbose=0,
+            ignore_info_id_list=[py_module.INFO_ID_LACKED_DOCSTRING_PARAM])
+        assert info_list == [
+            info_dict for info_dict in expected_info_list
+            if info_dict.info_id != py_module.INFO_ID_LACKED_DOCSTRING_PARAM]
+        assert len(index_cache._index_dict) == 1
+    finally:
+        index_cache.disable_index_cache()
+
     module_str = '''
 def sample_func_1(price: int=100, name: str='apple') -> int:
     """
@@ -1027,6 +1105,133 @@ def sample_func(price):
         skip_decorator_name_list=[])
     assert len(info_list) != 0
 
+    cache_dir_path: str = os.path.join(TMP_TEST_MODULE_DIR, 'cache/')
+    cached_info_list: List[dict] = py_module.check_python_module(
+        py_module_path=TMP_TEST_MODULE_PATH,
+        enable_default_or_optional_doc_check=False,
+        skip_decorator_name_list=['Appender'],
+        cache_dir_path=cache_dir_path)
+    assert cached_info_list == []
+    cached_info_list = py_module.check_python_module(
+        py_module_path=TMP_TEST_MODULE_PATH,
+        enable_default_or_optional_doc_check=False,
+        skip_decorator_name_list=[],
+        cache_dir_path=cache_dir_path)
+    assert cached_info_list == info_list
+    cached_info_list = py_module.check_python_module(
+        py_module_path=TMP_TEST_MODULE_PATH,
+        enable_default_or_optional_doc_check=False,
+        skip_decorator_name_list=[],
+        cache_dir_path=cache_dir_path)
+    assert cached_info_list == info_list
+
+    with open(TMP_TEST_MODULE_PATH, 'a') as f:
+        f.write('\n\ndef sample_func_2(name):\n    pass\n')
+    info_list = py_module.check_python_module(
+        py_module_path=TMP_TEST_MODULE_PATH,
+        enable_default_or_optional_doc_check=False,
+        skip_decorator_name_list=[])
+    profiler.reset_profile_stats()
+    profiler.enable_profile()
+    try:
+        cached_info_list = py_module.check_python_module(
+            py_module_path=TMP_TEST_MODULE_PATH,
+            enable_default_or_optional_doc_check=False,
+            skip_decorator_name_list=[],
+            cache_dir_path=cache_dir_path)
+    finally:
+        profiler.disable_profile()
+    assert cached_info_list == info_list
+    assert [info_dict.lineno for info_dict in cached_info_list] == [
+        info_dict.lineno for info_dict in info_list]
+    cache_dict: Dict[str, dict] = profiler.get_profile_stats()[
+        profiler.PROFILE_KEY_CACHE]
+    assert cache_dict[f'{py_module.FUNC_RESULT_CACHE_NAME}:hit'][
+        profiler.STAT_KEY_COUNT] == 1
+    assert cache_dict[f'{py_module.FUNC_RESULT_CACHE_NAME}:miss'][
+        profiler.STAT_KEY_COUNT] == 1
+    profiler.reset_profile_stats()
+    shutil.rmtree(cache_dir_path, ignore_errors=True)
+
+    with open(cache_dir_path.rstrip('/'), 'w') as f:
+        f.write('')
+    try:
+        cached_info_list = py_module.check_python_module(
+            py_module_path=TMP_TEST_MODULE_PATH,
+            enable_default_or_optional_doc_check=False,
+            skip_decorator_name_list=[],
+            cache_dir_path=cache_dir_path)
+    finally:
+        os.remove(cache_dir_path.rstrip('/'))
+    assert cached_info_list == info_list
+
+
+def test_check_python_source() -> None:
+    code_str: str = '''
+def sample_func_1(price):
+    return 100
+
+
+def test_sample_func_2(name):
+    pass
+    '''
+    info_list: List[dict] = py_module.check_python_source(
+        code_str=code_str, virtual_path='gen/sample.py',
+        verbose=py_module.VERBOSE_DISABLED)
+    assert info_list
+    _check_info_list_schema(info_list=info_list)
+    for info_dict in info_list:
+        assert info_dict[py_module.INFO_KEY_MODULE_PATH] == 'gen/sample.py'
+        assert info_dict[py_module.INFO_KEY_FUNC_NAME] == 'sample_func_1'
+
+    module_path: str = os.path.join(TMP_TEST_MODULE_DIR, 'source_test.py')
+    with open(module_path, 'w') as f:
+        f.write(code_str)
+    expected_info_list: List[dict] = py_module.check_python_module(
+        py_module_path=module_path, verbose=py_module.VERBOSE_DISABLED,
+        ignore_func_name_prefix_list=[])
+    info_list = py_module.check_python_source(
+        code_str=code_str, virtual_path=module_path,
+        verbose=py_module.VERBOSE_DISABLED,
+        ignore_func_name_prefix_list=[])
+    assert info_list == expected_info_list
+    os.remove(module_path)
+
+    info_list = py_module.check_python_source(
+        code_str=code_str, verbose=py_module.VERBOSE_DISABLED,
+        ignore_info_id_list=py_module.get_info_id_list())
+    assert info_list == []
+
+    with pytest.raises(ValueError):  # type: ignore
+        py_module.check_python_source(
+            code_str=code_str, verbose=py_module.VERBOSE_DISABLED,
+            engine='unknown')
+
+
+def test_check_python_sources() -> None:
+    code_str_1: str = '''
+def sample_func_1(price):
+    return 100
+    '''
+    code_str_2: str = '''
+def sample_func_2(name):
+    pass
+    '''
+    info_list: List[dict] = py_module.check_python_sources(
+        path_and_code_iterable=iter([
+            ('gen/a.py', code_str_1), ('gen/b.py', code_str_2)]),
+        verbose=py_module.VERBOSE_DISABLED)
+    _check_info_list_schema(info_list=info_list)
+    module_path_list: List[str] = [
+        info_dict[py_module.INFO_KEY_MODULE_PATH]
+        for info_dict in info_list]
+    assert module_path_list == sorted(module_path_list)
+    assert set(module_path_list) == {'gen/a.py', 'gen/b.py'}
+
+    info_list = py_module.check_python_sources(
+        path_and_code_iterable=[], verbose=py_module.VERBOSE_DISABLED)
+    assert info_list == []
+
 
 def test_check_python_module_recursively() -> None:
     child_dir_path: str = os.path.join(TMP_TEST_MODULE_DIR, 'child_dir/')
@@ -1095,6 +1300,16 @@ y = 200
     assert module_path_2 in module_path_list
     assert module_path_3 not in module_path_list
 
+    info_list = py_module.check_python_module_recursively(
+        dir_path=TMP_TEST_MODULE_DIR,
+        enable_default_or_optional_doc_check=True,
+        exclude_pattern_list=['child_dir'])
+    module_path_list = [
+        info_dict[py_module.INFO_KEY_MODULE_PATH]
+        for info_dict in info_list]
+    assert TMP_TEST_MODULE_PATH in module_path_list
+    assert module_path_2 not in module_path_list
+
     info_list = py_module.check_python_module_recursively(
         dir_path=TMP_TEST_MODULE_DIR,
         ignore_info_id_list=[
@@ -1154,6 +1369,248 @@ def sample_func_4(price):
         for info_dict in info_list]
     assert module_path_5 in module_path_list
 
+    parallel_info_list: List[dict] = \
+        py_module.check_python_module_recursively(
+            dir_path=TMP_TEST_MODULE_DIR, skip_decorator_name_list=[],
+            jobs=2)
+    assert parallel_info_list == info_list
+
+    for jobs in [1, 2]:
+        py_module.reset_run_stats()
+        py_module.check_python_module_recursively(
+            dir_path=TMP_TEST_MODULE_DIR,
+            skip_decorator_name_list=['Appender'], jobs=jobs)
+        stat_dict: Dict[str, int] = py_module.get_run_stats()
+        assert stat_dict[py_module.RUN_STAT_KEY_SKIPPED_FUNC_NUM] == 1
+
+    cache_dir_path: str = os.path.join(TMP_TEST_MODULE_DIR, 'cache/')
+    for _ in range(2):
+        cached_info_list: List[dict] = \
+            py_module.check_python_module_recursively(
+                dir_path=TMP_TEST_MODULE_DIR, skip_decorator_name_list=[],
+                cache_dir_path=cache_dir_path)
+        assert cached_info_list == info_list
+    shutil.rmtree(cache_dir_path, ignore_errors=True)
+
+
+def test_iter_check_python_modules() -> None:
+    child_dir_path: str = os.path.join(TMP_TEST_MODULE_DIR, 'iter_dir/')
+    os.makedirs(child_dir_path, exist_ok=True)
+    module_str: str = '''
+def sample_func_1(price):
+    return 100
+
+
+def sample_func_2(name):
+    pass
+    '''
+    for module_name in ['test_module_1.py', 'test_module_2.py']:
+        with open(os.path.join(child_dir_path, module_name), 'w') as f:
+            f.write(module_str)
+
+    info_iterator: Iterator[dict] = py_module.iter_check_python_modules(
+        dir_path=child_dir_path, verbose=py_module.VERBOSE_DISABLED)
+    info_dict: dict = next(info_iterator)
+    _check_info_list_schema(info_list=[info_dict])
+    assert info_dict[py_module.INFO_KEY_FUNC_NAME] == 'sample_func_1'
+
+    info_list: List[dict] = list(py_module.iter_check_python_modules(
+        dir_path=child_dir_path, verbose=py_module.VERBOSE_DISABLED))
+    expected_info_list: List[dict] = \
+        py_module.check_python_module_recursively(
+            dir_path=child_dir_path, verbose=py_module.VERBOSE_DISABLED)
+    assert info_list == expected_info_list
+
+    info_list = list(py_module.iter_check_python_modules(
+        dir_path=child_dir_path, verbose=py_module.VERBOSE_DISABLED,
+        ignore_func_name_prefix_list=['sample_']))
+    assert info_list == []
+    shutil.rmtree(child_dir_path, ignore_errors=True)
+
+
+def test__iter_module_info() -> None:
+    module_str: str = '''
+def sample_func_1(price):
+    return 100
+
+
+def sample_func_2(name):
+    pass
+    '''
+    info_iterator: Iterator[dict] = py_module._iter_module_info(
+        py_module_path='sample/path.py', module_str=module_str,
+        ignore_func_name_prefix_list=[], ignore_info_id_list=[],
+        enable_default_or_optional_doc_check=False,
+        skip_decorator_name_list=[], engine='legacy')
+    info_dict: dict = next(info_iterator)
+    _check_info_list_schema(info_list=[info_dict])
+    assert info_dict[py_module.INFO_KEY_MODULE_PATH] == 'sample/path.py'
+    assert info_dict[py_module.INFO_KEY_FUNC_NAME] == 'sample_func_1'
+    func_name_list: List[str] = [
+        info_dict[py_module.INFO_KEY_FUNC_NAME]
+        for info_dict in info_iterator]
+    assert 'sample_func_2' in func_name_list
+
+    info_list: List[dict] = list(py_module._iter_module_info(
+        py_module_path='sample/path.py', module_str='x = 100\n',
+        ignore_func_name_prefix_list=[], ignore_info_id_list=[],
+        enable_default_or_optional_doc_check=False,
+        skip_decorator_name_list=[], engine='legacy'))
+    assert info_list == []
+
+    module_str = '''
+@Appender(_doc)
+def sample_func_1(price):
+    return 100
+
+
+@Substitution(name='apple')
+def sample_func_2(name):
+    pass
+
+
+def sample_func_3(location_id):
+    pass
+    '''
+    for engine in ['legacy', 'ast']:
+        py_module.reset_run_stats()
+        info_list = list(py_module._iter_module_info(
+            py_module_path='sample/path.py', module_str=module_str,
+            ignore_func_name_prefix_list=[], ignore_info_id_list=[],
+            enable_default_or_optional_doc_check=False,
+            skip_decorator_name_list=['Appender', 'Substitution'],
+            engine=engine))
+        func_name_list = [
+            info_dict[py_module.INFO_KEY_FUNC_NAME]
+            for info_dict in info_list]
+        assert set(func_name_list) == {'sample_func_3'}
+        assert py_module.get_run_stats() == {
+            py_module.RUN_STAT_KEY_SKIPPED_FUNC_NUM: 2}
+
+    module_str = '''
+def sample_func_1(price):
+    return 100
+
+
+def sample_func_2(name):
+    pass
+'''
+    func_info_dict: Dict[str, List[dict]] = {}
+    expected_info_list: List[dict] = list(py_module._iter_module_info(
+        py_module_path='sample/path.py', module_str=module_str,
+        ignore_func_name_prefix_list=[], ignore_info_id_list=[],
+        enable_default_or_optional_doc_check=False,
+        skip_decorator_name_list=[], engine='legacy',
+        cached_func_info_dict=None, func_info_dict=func_info_dict))
+    assert len(func_info_dict) == 2
+    func_fingerprint: str = cache.get_func_fingerprint(
+        func_str='def sample_func_2(name):\n    pass\n')
+    assert func_info_dict[func_fingerprint][0][
+        py_module.INFO_KEY_FUNC_NAME] == 'sample_func_2'
+
+    cached_func_info_dict: Dict[str, List[dict]] = {
+        fingerprint: [
+            dict(info_dict, info='Cached information.')
+            for info_dict in unit_info_list]
+        for fingerprint, unit_info_list in func_info_dict.items()}
+    del cached_func_info_dict[func_fingerprint]
+    func_info_dict = {}
+    info_list = list(py_module._iter_module_info(
+        py_module_path='sample/path.py', module_str='\n\n' + module_str,
+        ignore_func_name_prefix_list=[], ignore_info_id_list=[],
+        enable_default_or_optional_doc_check=False,
+        skip_decorator_name_list=[], engine='legacy',
+        cached_func_info_dict=cached_func_info_dict,
+        func_info_dict=func_info_dict))
+    assert len(info_list) == len(expected_info_list)
+    for info_dict, expected_info_dict in zip(info_list, expected_info_list):
+        assert info_dict.lineno == expected_info_dict.lineno + 2
+        if info_dict.func_name == 'sample_func_1':
+            assert info_dict.info == 'Cached information.'
+        else:
+            assert info_dict.info == expected_info_dict.info
+    assert len(func_info_dict) == 2
+
+
+def test__get_info_list_from_func_cache() -> None:
+    func_entry: FuncEntry = FuncEntry(
+        func_name='sample_func', func_str='def sample_func(price):\n    pass',
+        start_line_idx=3, end_line_idx=5, decorator_names=[])
+    info_list: List[py_module.LintResult] = \
+        py_module._get_info_list_from_func_cache(
+            path='sample/path.py', func_entry=func_entry,
+            cached_info_list=[{
+                py_module.INFO_KEY_MODULE_PATH: 'sample/old_path.py',
+                py_module.INFO_KEY_FUNC_NAME: 'sample_func',
+                py_module.INFO_KEY_INFO_ID: 1,
+                py_module.INFO_KEY_INFO: 'Sample information.',
+            }])
+    assert info_list == [py_module.LintResult(
+        module_path='sample/path.py', func_name='sample_func', info_id=1,
+        info='Sample information.', lineno=4, end_lineno=5)]
+    assert info_list[0].end_lineno == 5
+
+    info_list = py_module._get_info_list_from_func_cache(
+        path='sample/path.py', func_entry=func_entry, cached_info_list=[])
+    assert info_list == []
+
+
+def test_get_run_stats() -> None:
+    py_module.reset_run_stats()
+    stat_dict: Dict[str, int] = py_module.get_run_stats()
+    assert stat_dict == {py_module.RUN_STAT_KEY_SKIPPED_FUNC_NUM: 0}
+    stat_dict[py_module.RUN_STAT_KEY_SKIPPED_FUNC_NUM] = 10
+    assert py_module.get_run_stats()[
+        py_module.RUN_STAT_KEY_SKIPPED_FUNC_NUM] == 0
+
+
+def test_reset_run_stats() -> None:
+    py_module._add_run_stats(
+        stat_dict={py_module.RUN_STAT_KEY_SKIPPED_FUNC_NUM: 3})
+    assert py_module.get_run_stats()[
+        py_module.RUN_STAT_KEY_SKIPPED_FUNC_NUM] == 3
+    py_module.reset_run_stats()
+    assert py_module.get_run_stats()[
+        py_module.RUN_STAT_KEY_SKIPPED_FUNC_NUM] == 0
+
+
+def test__add_run_stats() -> None:
+    py_module.reset_run_stats()
+    py_module._add_run_stats(
+        stat_dict={py_module.RUN_STAT_KEY_SKIPPED_FUNC_NUM: 2})
+    py_module._add_run_stats(
+        stat_dict={py_module.RUN_STAT_KEY_SKIPPED_FUNC_NUM: 1})
+    assert py_module.get_run_stats()[
+        py_module.RUN_STAT_KEY_SKIPPED_FUNC_NUM] == 3
+    py_module.reset_run_stats()
+
+
+def test__check_python_module_with_run_stats() -> None:
+    module_str: str = '''
+@Appender
+def sample_func_1(price):
+    pass
+
+
+def sample_func_2(name):
+    pass
+'''
+    with open(TMP_TEST_MODULE_PATH, 'w') as f:
+        f.write(module_str)
+    py_module.reset_run_stats()
+    info_list, stat_dict = py_module._check_python_module_with_run_stats(
+        py_module_path=TMP_TEST_MODULE_PATH, verbose=0,
+        ignore_func_name_prefix_list=[], ignore_info_id_list=[],
+        enable_default_or_optional_doc_check=False,
+        skip_decorator_name_list=['Appender'], engine='legacy',
+        cache_dir_path=None)
+    func_name_list: List[str] = [
+        info_dict[py_module.INFO_KEY_FUNC_NAME] for info_dict in info_list]
+    assert set(func_name_list) == {'sample_func_2'}
+    assert stat_dict == {py_module.RUN_STAT_KEY_SKIPPED_FUNC_NUM: 1}
+    assert py_module.get_run_stats()[
+        py_module.RUN_STAT_KEY_SKIPPED_FUNC_NUM] == 0
+
 
 def test__print_info_list() -> None:
     info_list: List[dict] = [{
@@ -1183,6 +1640,35 @@ def test__print_info_list() -> None:
         assert func_name in printed_str
         assert info in printed_str
 
+    stream: io.StringIO = io.StringIO()
+    output.set_output_writer(
+        output_writer=output.OutputWriter(stream=stream))
+    try:
+        printed_str = py_module._print_info_list(
+            info_list=info_list, verbose=1)
+    finally:
+        output.set_output_writer(output_writer=None)
+    assert stream.getvalue() == printed_str + '\n'
+
+
+def test__write_info_list() -> None:
+    info_list: List[dict] = [{
+        py_module.INFO_KEY_MODULE_PATH: 'sample/module/path_1.py',
+        py_module.INFO_KEY_FUNC_NAME: 'sample_func_1',
+        py_module.INFO_KEY_INFO_ID: 1,
+        py_module.INFO_KEY_INFO: 'Sample information 1.',
+    }]
+    stream: io.StringIO = io.StringIO()
+    output.set_output_writer(
+        output_writer=output.OutputWriter(stream=stream))
+    try:
+        printed_str: str = py_module._write_info_list(info_list=info_list)
+    finally:
+        output.set_output_writer(output_writer=None)
+    assert printed_str == (
+        'sample/module/path_1.py::sample_func_1\nSample information 1.\n')
+    assert stream.getvalue() == printed_str + '\n'
+
 
 def test_is_func_name_to_ignore() -> None:
     ignore_func_name_prefix_list: List[str] = ['test_', 'sample_']
@@ -1202,6 +1688,30 @@ def test_is_func_name_to_ignore() -> None:
     assert not result_bool
 
 
+def test__get_active_check_spec_list() -> None:
+    check_spec_list: List[tuple] = py_module._get_active_check_spec_list(
+        ignore_info_id_tuple=(),
+        enable_default_or_optional_doc_check=True)
+    assert len(check_spec_list) == len(py_module._CHECK_SPEC_LIST)
+
+    check_spec_list = py_module._get_active_check_spec_list(
+        ignore_info_id_tuple=(),
+        enable_default_or_optional_doc_check=False)
+    for _, info_id_list, _ in check_spec_list:
+        assert info_id_list != py_module._DEFAULT_VALUE_INFO_ID_LIST
+
+    check_spec_list = py_module._get_active_check_spec_list(
+        ignore_info_id_tuple=tuple(py_module.get_info_id_list()),
+        enable_default_or_optional_doc_check=True)
+    assert check_spec_list == []
+
+    check_spec_list = py_module._get_active_check_spec_list(
+        ignore_info_id_tuple=(py_module.INFO_ID_LACKED_FUNC_DESCRIPTION,),
+        enable_default_or_optional_doc_check=True)
+    for _, info_id_list, _ in check_spec_list:
+        assert info_id_list != [py_module.INFO_ID_LACKED_FUNC_DESCRIPTION]
+
+
 def test__remove_info_to_ignore_by_id() -> None:
     info_list: List[dict] = py_module._remove_info_to_ignore_by_id(
         info_list=[],
@@ -0,0 +1,237 @@
+import os
+import shutil
+import socket
+import stat
+import tempfile
+import threading
+import time
+from typing import List, Optional
+
+import pytest
+
+from numdoclint import index_cache, jupyter_notebook, py_module, server
+
+TMP_TEST_SERVER_DIR: str = './tests/tmp_server/'
+TMP_SOCKET_PATH: str = os.path.join(TMP_TEST_SERVER_DIR, 'numdoclint.sock')
+TMP_MODULE_PATH: str = os.path.join(TMP_TEST_SERVER_DIR, 'sample.py')
+TMP_NOTEBOOK_PATH: str = os.path.join(TMP_TEST_SERVER_DIR, 'sample.ipynb')
+
+MODULE_STR: str = '''
+def sample_func_1(price):
+    pass
+'''
+
+NOTEBOOK_STR: str = '''{
+ "cells": [
+  {
+   "cell_type": "code",
+   "execution_count": null,
+   "metadata": {},
+   "outputs": [],
+   "source": [
+    "def sample_func_2(price):\\n",
+    "    pass"
+   ]
+  }
+ ],
+ "metadata": {},
+ "nbformat": 4,
+ "nbformat_minor": 2
+}
+'''
+
+
+def setup() -> None:
+    """Function to be executed at the start of the test.
+    """
+    shutil.rmtree(TMP_TEST_SERVER_DIR, ignore_errors=True)
+    os.makedirs(TMP_TEST_SERVER_DIR)
+    with open(TMP_MODULE_PATH, 'w') as f:
+        f.write(MODULE_STR)
+    with open(TMP_NOTEBOOK_PATH, 'w') as f:
+        f.write(NOTEBOOK_STR)
+
+
+def teardown() -> None:
+    """Function to be executed at the end of the test.
+    """
+    shutil.rmtree(TMP_TEST_SERVER_DIR, ignore_errors=True)
+
+
+def _start_server_thread() -> threading.Thread:
+    """
+    Start the server in a thread and wait until it responds.
+
+    Returns
+    -------
+    thread : threading.Thread
+        The thread running the server.
+    """
+    thread: threading.Thread = threading.Thread(
+        target=server.serve, kwargs={'socket_path': TMP_SOCKET_PATH})
+    thread.start()
+    for _ in range(100):
+        if server.is_server_running(socket_path=TMP_SOCKET_PATH):
+            break
+        time.sleep(0.05)
+    return thread
+
+
+def test__get_private_socket_dir_path() -> None:
+    socket_dir_path: str = server._get_private_socket_dir_path()
+    assert os.path.dirname(socket_dir_path) == tempfile.gettempdir()
+    assert os.path.basename(socket_dir_path) == 'numdoclint-%s' % os.getuid()
+
+
+def test__get_default_socket_path() -> None:
+    runtime_dir_path: Optional[str] = os.environ.get('XDG_RUNTIME_DIR')
+    try:
+        os.environ['XDG_RUNTIME_DIR'] = TMP_TEST_SERVER_DIR
+        assert server._get_default_socket_path() == TMP_SOCKET_PATH
+
+        os.environ['XDG_RUNTIME_DIR'] = ''
+        assert server._get_default_socket_path() == os.path.join(
+            server._PRIVATE_SOCKET_DIR_PATH, server.SOCKET_FILE_NAME)
+    finally:
+        if runtime_dir_path is None:
+            del os.environ['XDG_RUNTIME_DIR']
+        else:
+            os.environ['XDG_RUNTIME_DIR'] = runtime_dir_path
+
+
+def test_CheckServer() -> None:
+    check_server: server.CheckServer = server.CheckServer(
+        socket_path=TMP_SOCKET_PATH, max_result_num=1)
+    try:
+        assert stat.S_IMODE(os.stat(TMP_SOCKET_PATH).st_mode) == 0o600
+        options_dict: dict = {'ignore_func_name_prefix_list': []}
+        info_list: List[dict] = check_server.check(
+            path=TMP_MODULE_PATH, options_dict=options_dict)
+        assert info_list
+        assert info_list[0][py_module.INFO_KEY_FUNC_NAME] == 'sample_func_1'
+        cached_info_list: List[dict] = check_server.check(
+            path=TMP_MODULE_PATH, options_dict=options_dict)
+        assert cached_info_list is info_list
+
+        with open(TMP_MODULE_PATH, 'w') as f:
+            f.write(MODULE_STR + '\n\ndef sample_func_3(name):\n    pass\n')
+        info_list = check_server.check(
+            path=TMP_MODULE_PATH, options_dict=options_dict)
+        func_name_list: List[str] = [
+            info_dict[py_module.INFO_KEY_FUNC_NAME]
+            for info_dict in info_list]
+        assert 'sample_func_3' in func_name_list
+
+        info_list = check_server.check(
+            path='buffer.py', options_dict=options_dict,
+            code_str='def sample_func_4(price):\n    pass\n')
+        assert info_list[0][py_module.INFO_KEY_FUNC_NAME] == 'sample_func_4'
+        assert info_list[0][py_module.INFO_KEY_MODULE_PATH] == 'buffer.py'
+        assert len(check_server._result_dict) == 1
+
+        info_list = check_server.check(
+            path=TMP_NOTEBOOK_PATH, options_dict=options_dict)
+        assert info_list[0][jupyter_notebook.INFO_KEY_NOTEBOOK_PATH] \
+            == TMP_NOTEBOOK_PATH
+
+        with pytest.raises(IOError):  # type: ignore
+            check_server.check(
+                path='not/existing/path.py', options_dict=options_dict)
+        with pytest.raises(ValueError):  # type: ignore
+            check_server.check(
+                path=TMP_NOTEBOOK_PATH, options_dict=options_dict,
+                code_str='')
+    finally:
+        check_server.server_close()
+    assert not os.path.exists(TMP_SOCKET_PATH)
+    with open(TMP_MODULE_PATH, 'w') as f:
+        f.write(MODULE_STR)
+
+    with pytest.raises(IOError):  # type: ignore
+        server.CheckServer(socket_path=TMP_MODULE_PATH)
+
+
+def test_serve() -> None:
+    thread: threading.Thread = _start_server_thread()
+    assert server.is_server_running(socket_path=TMP_SOCKET_PATH)
+    with pytest.raises(Exception):  # type: ignore
+        server.CheckServer(socket_path=TMP_SOCKET_PATH)
+    server.request_shutdown(socket_path=TMP_SOCKET_PATH)
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert not os.path.exists(TMP_SOCKET_PATH)
+    assert not index_cache.is_index_cache_enabled()
+
+
+def test_request_check() -> None:
+    thread: threading.Thread = _start_server_thread()
+    try:
+        info_list: List[dict] = server.request_check(
+            path=TMP_MODULE_PATH, socket_path=TMP_SOCKET_PATH,
+            ignore_func_name_prefix_list=[])
+        expected_info_list: List[dict] = py_module.check_python_module(
+            py_module_path=TMP_MODULE_PATH, verbose=0,
+            ignore_func_name_prefix_list=[])
+        assert info_list == expected_info_list
+
+        info_list = server.request_check(
+            path=TMP_NOTEBOOK_PATH, socket_path=TMP_SOCKET_PATH,
+            ignore_func_name_prefix_list=[])
+        expected_info_list = jupyter_notebook.check_jupyter_notebook(
+            notebook_path=TMP_NOTEBOOK_PATH, verbose=0,
+            ignore_func_name_prefix_list=[])
+        assert info_list == expected_info_list
+
+        info_list = server.request_check(
+            path='buffer.py', socket_path=TMP_SOCKET_PATH,
+            code_str='def sample_func_4(price):\n    pass\n')
+        assert info_list[0][py_module.INFO_KEY_MODULE_PATH] == 'buffer.py'
+
+        with pytest.raises(Exception):  # type: ignore
+            server.request_check(
+                path='not/existing/path.py', socket_path=TMP_SOCKET_PATH)
+    finally:
+        server.request_shutdown(socket_path=TMP_SOCKET_PATH)
+        thread.join(timeout=5)
+
+    with pytest.raises(IOError):  # type: ignore
+        server.request_check(
+            path=TMP_MODULE_PATH, socket_path=TMP_SOCKET_PATH)
+
+
+def test_is_server_running() -> None:
+    assert not server.is_server_running(socket_path=TMP_SOCKET_PATH)
+
+
+def test__check_private_dir() -> None:
+    private_dir_path: str = os.path.join(TMP_TEST_SERVER_DIR, 'private')
+    os.makedirs(private_dir_path, mode=0o700)
+    os.chmod(private_dir_path, 0o700)
+    server._check_private_dir(dir_path=private_dir_path)
+
+    os.chmod(private_dir_path, 0o755)
+    with pytest.raises(IOError):  # type: ignore
+        server._check_private_dir(dir_path=private_dir_path)
+
+
+def test__send_request() -> None:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.bind(TMP_SOCKET_PATH)
+        sock.listen(1)
+        start_time: float = time.time()
+        with pytest.raises(IOError):  # type: ignore
+            server._send_request(
+                request_dict={server.REQUEST_KEY_COMMAND: server.COMMAND_PING},
+                socket_path=TMP_SOCKET_PATH, timeout_sec=0.1)
+        assert time.time() - start_time < 5
+    os.remove(TMP_SOCKET_PATH)
+
+    thread: threading.Thread = _start_server_thread()
+    try:
+        response_dict: dict = server._send_request(
+            request_dict={server.REQUEST_KEY_COMMAND: server.COMMAND_PING},
+            socket_path=TMP_SOCKET_PATH)
+        assert server.RESPONSE_KEY_ERROR not in response_dict
+    finally:
+        server.request_shutdown(socket_path=TMP_SOCKET_PATH)
+        thread.join(timeout=5)